@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+"""
+import time and resident memory of pokerpackets.binarypack, with the
+packet modules loaded lazily (default) or all loaded at import
+
+usage: python benchmarks/import_time.py [repeat]
+"""
+
+import subprocess
+import sys
+
+SCRIPT = '''
+import resource, time
+start = time.time()
+from pokerpackets import binarypack, packets
+%s
+elapsed = time.time() - start
+print elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+'''
+
+CASES = (
+    ('lazy', ''),
+    ('load_all', 'packets.load_all()'),
+)
+
+def measure(statement, repeat):
+    "return the best import time (seconds) and max rss (kB) over repeat runs"
+    results = []
+    for _i in xrange(repeat):
+        output = subprocess.check_output([sys.executable, '-c', SCRIPT % statement])
+        elapsed, rss = output.split()
+        results.append((float(elapsed), int(rss)))
+    return min(results)
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    for name, statement in CASES:
+        elapsed, rss = measure(statement, repeat)
+        print '%-10s %8.2f ms %8d kB' % (name, elapsed * 1000, rss)
+
+if __name__ == '__main__':
+    main()
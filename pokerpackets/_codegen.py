@@ -0,0 +1,1163 @@
+"""
+per class code generation used by Packet.infoDeclare
+
+the generated functions are specialized versions of the generic
+codecs, they must always produce the same output.
+"""
+
+from hashlib import md5
+from struct import Struct, error as StructError
+from types import ClassType, InstanceType
+
+from pokerpackets.jsonbackend import backend as json_backend
+
+
+# pylint: disable=C0111
+
+S_B = Struct('!B')
+S_H = Struct('!H')
+S_IB = Struct('!IB')
+S_MONEY = Struct('!IQQQ')
+S_PACKET_HEAD = Struct('!BH')
+
+class StructCache(dict):
+    """maps a list length to a compiled Struct of `prefix` and `length` items of `item_format`"""
+
+    def __init__(self, item_format, prefix=''):
+        dict.__init__(self)
+        self.item_format = item_format
+        self.prefix = prefix
+
+    def __missing__(self, length):
+        struct = self[length] = Struct('!%s%d%s' % (self.prefix, length, self.item_format))
+        return struct
+
+LIST_STRUCTS = {
+    'Bl': StructCache('B'),
+    'Hl': StructCache('H'),
+    'Il': StructCache('I'),
+    'il': StructCache('i'),
+}
+
+# fixed width types: struct format char and expression converting the value
+FIXED_TYPES = {
+    'B': ('B', '%s'),
+    'H': ('H', '%s'),
+    'I': ('I', '%s'),
+    'Q': ('Q', '%s'),
+    'b': ('B', '255 if %s == -1 else %s'),
+    'Bnone': ('B', '255 if %s == None else %s'),
+    'bool': ('B', '1 if %s else 0'),
+    'cbool': ('B', "1 if %s == 'y' else 0"),
+}
+
+# size in bytes of the fixed width types
+FIXED_SIZES = {
+    'B': 1,
+    'b': 1,
+    'Bnone': 1,
+    'bool': 1,
+    'cbool': 1,
+    'H': 2,
+    'I': 4,
+    'c': 4,
+    'Q': 8,
+}
+
+def binarypack_offsets(packet_type):
+    """
+    map the attributes of packet_type with a statically known position
+    to (offset from the start of the packet head, s_type)
+
+    these are the fixed width fields preceding the first variable sized
+    field, and that first variable sized field.
+    """
+    offsets = {}
+    offset = S_PACKET_HEAD.size
+    for attr, s_type in packet_type.binarypack_info:
+        offsets[attr] = (offset, s_type)
+        if s_type not in FIXED_SIZES:
+            break
+        offset += FIXED_SIZES[s_type]
+    return offsets
+
+# precompiled fields and function factories of the packet modules, see
+# packetexport.exportSnapshot and load_snapshot
+SNAPSHOT_FIELDS = {}
+SNAPSHOT_FACTORIES = {}
+snapshot_modules = set()
+
+def load_snapshot(module):
+    """
+    load the snapshot of the packet module `module` (a module of the
+    pokerpackets package), if any
+    """
+    if module in snapshot_modules:
+        return
+    snapshot_modules.add(module)
+    package, _dot, name = module.rpartition('.')
+    if package != 'pokerpackets':
+        return
+    try:
+        snapshot = __import__('pokerpackets._snapshot.' + name, fromlist=['FIELDS'])
+    except ImportError:
+        return
+    SNAPSHOT_FIELDS.update(snapshot.FIELDS)
+    SNAPSHOT_FACTORIES.update(snapshot.FACTORIES)
+
+# number of functions built from the snapshot / compiled from source
+compile_stats = {'snapshot': 0, 'compiled': 0}
+
+# list of (name, source, namespace names) of the compiled functions, if set
+recording = None
+
+def snapshot_key(source, names):
+    "return the key of the snapshot factory of a function source using the namespace names"
+    return md5(source + repr(names)).hexdigest()
+
+def compile_function(name, lines, namespace):
+    """
+    compile the function `name` from source `lines` inside `namespace`
+
+    if the precompiled snapshot (see packetexport.exportSnapshot) has the
+    same source and namespace names, the function is built by its factory instead.
+    """
+    source = '\n'.join(lines) + '\n'
+    names = sorted(key for key in namespace if not key.startswith('__'))
+    if recording is not None:
+        recording.append((name, source, names))
+    factory = SNAPSHOT_FACTORIES.get(snapshot_key(source, names))
+    if factory is not None:
+        compile_stats['snapshot'] += 1
+        namespace[name] = factory(**namespace)
+    else:
+        compile_stats['compiled'] += 1
+        exec source in namespace
+    return namespace[name]
+
+def snapshot_fields(packet_type):
+    """
+    return the precomputed (binarypack_info, msgpack_info,
+    binarypack_offsets) of packet_type, or None if the snapshot has no
+    entry for its info
+    """
+    fields = SNAPSHOT_FIELDS.get((packet_type.__module__, packet_type.__name__))
+    if fields is None or fields[0] != packet_type.info:
+        return None
+    return fields[1:]
+
+def snapshot_factory(factory_name, name, source, names):
+    """
+    return the source lines of a snapshot factory: a function taking the
+    namespace of compile_function as keyword arguments and returning the
+    function `name` defined by `source`
+    """
+    return ['def %s(%s):' % (factory_name, ', '.join(names + ['**_namespace']))] + \
+        ['    ' + line for line in source.splitlines()] + \
+        ['    return %s' % name]
+
+def binarypack_pack_layout(packet_type, type_id):
+    """
+    analyse the binary layout of packet_type for the encoders
+
+    runs of fixed width fields (including the packet head and the length
+    prefixes of variable sized fields) are merged into a single Struct,
+    variable sized data is written between them. returns (namespace,
+    body, segments, length): body computes the local variables used by
+    the segments, a segment is either (Struct, args) or (None, data).
+    """
+    namespace = {
+        'json': json_backend,
+        'S_H_pack': S_H.pack,
+        'S_IB_pack': S_IB.pack,
+        'S_MONEY_pack': S_MONEY.pack,
+    }
+    body = []
+    segments = []
+    struct_format = '!BH'
+    struct_args = [str(type_id), 'length']
+    fixed_length = 0
+    var_lengths = []
+
+    for i, (attr, s_type) in enumerate(packet_type.binarypack_info):
+        v = 'v%d' % i
+        body.append('%s = p.%s' % (v, attr))
+
+        if s_type in FIXED_TYPES:
+            struct_char, expression = FIXED_TYPES[s_type]
+            struct_format += struct_char
+            struct_args.append('(' + expression.replace('%s', v) + ')')
+            continue
+
+        if s_type == 'c':
+            body.append('a%d = 0' % i)
+            body.append('for j in xrange(len(%s) / 2): a%d += %s[j * 2] * %s[j * 2 + 1]' % (v, i, v, v))
+            struct_format += 'I'
+            struct_args.append('a%d' % i)
+            continue
+
+        # variable sized field: its length prefix ends the current struct
+        if s_type in ('s', 'bs', 'j'):
+            if s_type == 'bs':
+                body.append("if %s == True: %s = '_TRUE'" % (v, v))
+                body.append("elif %s == False: %s = '_FALSE'" % (v, v))
+            elif s_type == 'j':
+                body.append('%s = json.dumps(%s)' % (v, v))
+            struct_format += 'H'
+            struct_args.append('len(%s)' % v)
+            data = v
+
+        elif s_type in LIST_STRUCTS:
+            list_structs = 'L_%d' % i
+            namespace[list_structs] = LIST_STRUCTS[s_type]
+            body.append('n%d = len(%s)' % (i, v))
+            body.append('d%d = %s[n%d].pack(*%s)' % (i, list_structs, i, v))
+            struct_format += 'B'
+            struct_args.append('n%d' % i)
+            data = 'd%d' % i
+
+        elif s_type == 'money':
+            body.append("d%d = b''.join([S_MONEY_pack(c, m, g, t) for c, (m, g, t) in %s.iteritems()])" % (i, v))
+            struct_format += 'H'
+            struct_args.append('len(%s)' % v)
+            data = 'd%d' % i
+
+        elif s_type == 'players':
+            body.append("d%d = b''.join([S_H_pack(len(n)) + n + S_IB_pack(c, f) for n, c, f in %s])" % (i, v))
+            struct_format += 'H'
+            struct_args.append('len(%s)' % v)
+            data = 'd%d' % i
+
+        elif s_type == 'pl':
+            body.append("d%d = b''.join([q.__class__.__dict__['binarypack_fast_pack'](q) for q in %s])" % (i, v))
+            struct_format += 'H'
+            struct_args.append('len(%s)' % v)
+            data = 'd%d' % i
+
+        else:
+            raise ValueError('%s: unknown s_type %r for %s' % (packet_type.__name__, s_type, attr))
+
+        struct = Struct(struct_format)
+        segments.append((struct, struct_args))
+        segments.append((None, data))
+        fixed_length += struct.size
+        var_lengths.append('len(%s)' % data)
+        struct_format = '!'
+        struct_args = []
+
+    if struct_args:
+        struct = Struct(struct_format)
+        segments.append((struct, struct_args))
+        fixed_length += struct.size
+
+    # the packet head is not part of the length
+    length = ' + '.join([str(fixed_length - S_PACKET_HEAD.size)] + var_lengths)
+
+    return (namespace, body, segments, length)
+
+def binarypack_pack(packet_type, type_id):
+    """
+    generate the binary encoder of packet_type
+
+    returns a function taking a packet and returning head + content of
+    the packet as binary data.
+    """
+    if not packet_type.binarypack_info and 0 <= type_id <= 255:
+        # constant frame of packets without network fields
+        namespace = {'FRAME': S_PACKET_HEAD.pack(type_id, 0)}
+        return compile_function('binarypack_fast_pack', ['def binarypack_fast_pack(p):', '    return FRAME'], namespace)
+
+    namespace, body, segments, length = binarypack_pack_layout(packet_type, type_id)
+    body.append('length = %s' % length)
+
+    parts = []
+    for i, (struct, data) in enumerate(segments):
+        if struct is None:
+            parts.append(data)
+        else:
+            namespace['S_%d' % i] = struct.pack
+            parts.append('S_%d(%s)' % (i, ', '.join(data)))
+
+    if len(parts) == 1:
+        body.append('return %s' % parts[0])
+    else:
+        body.append("return b''.join([%s])" % ', '.join(parts))
+
+    return compile_function(
+        'binarypack_fast_pack',
+        ['def binarypack_fast_pack(p):'] + ['    ' + line for line in body],
+        namespace
+    )
+
+def reserve(buf, size):
+    "grow the bytearray buf to hold at least size bytes"
+    if not isinstance(buf, bytearray):
+        raise ValueError('buffer too small: %d bytes needed, %d available' % (size, len(buf)))
+    buf.extend(b'\0' * max(size - len(buf), len(buf)))
+
+def binarypack_pack_into(packet_type, type_id):
+    """
+    generate the binary encoder of packet_type writing into a buffer
+
+    returns a function taking a packet, a writable buffer and an offset,
+    writing head + content of the packet at offset and returning the
+    offset following the packet. a bytearray too small is grown.
+    """
+    namespace, body, segments, length = binarypack_pack_layout(packet_type, type_id)
+    namespace['reserve'] = reserve
+    body.append('length = %s' % length)
+    body.append('end = offset + %d + length' % S_PACKET_HEAD.size)
+    body.append('if len(buf) < end: reserve(buf, end)')
+
+    for i, (struct, data) in enumerate(segments):
+        if struct is None:
+            body.append('buf[offset:offset + len(%s)] = %s' % (data, data))
+            if i != len(segments) - 1:
+                body.append('offset += len(%s)' % data)
+        else:
+            namespace['S_%d' % i] = struct.pack_into
+            body.append('S_%d(buf, offset, %s)' % (i, ', '.join(data)))
+            if i != len(segments) - 1:
+                body.append('offset += %d' % struct.size)
+
+    body.append('return end')
+
+    return compile_function(
+        'binarypack_fast_pack_into',
+        ['def binarypack_fast_pack_into(p, buf, offset):'] + ['    ' + line for line in body],
+        namespace
+    )
+
+# fixed width types: expression converting the unpacked value
+FIXED_TYPES_UNPACK = {
+    'B': '%s',
+    'H': '%s',
+    'I': '%s',
+    'Q': '%s',
+    'b': '-1 if %s == 255 else %s',
+    'Bnone': 'None if %s == 255 else %s',
+    'bool': '%s != 0',
+    'cbool': "'y' if %s != 0 else 'n'",
+    'c': '[1, %s] if %s else []',
+}
+
+def binarypack_unpack(packet_type, type_id2type, pool=None):
+    """
+    generate the binary decoder of packet_type
+
+    data is a str, buffer or memoryview (see _binarypack.as_buffer),
+    strings are copied out of it exactly once. data is read with a single
+    unpack_from for every run of fixed width fields (and length prefixes),
+    the instance dictionary is set at once. if pool is given, released
+    instances are reused (see new_instance).
+
+    packets without network fields decode to their shared singleton
+    instance, see Packet.infoDeclare.
+
+    returns a function taking data and the offset of the packet content
+    (after the packet head) and returning (offset, packet).
+    """
+    if 'singleton' in packet_type.__dict__ and not packet_type.binarypack_info:
+        return compile_function(
+            'binarypack_fast_unpack',
+            ['def binarypack_fast_unpack(data, offset):', '    return (offset, singleton)'],
+            {'singleton': packet_type.__dict__['singleton']}
+        )
+
+    namespace = {
+        'packet_type': packet_type,
+        'type_id2type': type_id2type,
+        'json': json_backend,
+        'S_H_unpack_from': S_H.unpack_from,
+        'S_IB_unpack_from': S_IB.unpack_from,
+        'S_MONEY_unpack_from': S_MONEY.unpack_from,
+        'S_PACKET_HEAD_unpack_from': S_PACKET_HEAD.unpack_from,
+    }
+    body = []
+    values = []
+    struct_format = ['!']
+    struct_vars = []
+
+    def flush_struct():
+        struct = Struct(''.join(struct_format))
+        struct_name = 'S_%d' % len(body)
+        namespace[struct_name] = struct.unpack_from
+        body.append('%s, = %s(data, offset)' % (', '.join(struct_vars), struct_name))
+        body.append('offset += %d' % struct.size)
+        del struct_format[1:]
+        del struct_vars[:]
+
+    for i, (attr, s_type) in enumerate(packet_type.binarypack_info):
+        v = 'v%d' % i
+
+        if s_type in FIXED_TYPES_UNPACK:
+            struct_format.append('I' if s_type == 'c' else FIXED_TYPES[s_type][0])
+            struct_vars.append(v)
+            values.append((attr, FIXED_TYPES_UNPACK[s_type].replace('%s', v)))
+            continue
+
+        # variable sized field: its length prefix ends the current struct
+        n = 'n%d' % i
+        struct_format.append('B' if s_type in LIST_STRUCTS else 'H')
+        struct_vars.append(n)
+        flush_struct()
+
+        if s_type in ('s', 'bs', 'j'):
+            body.append('%s = data[offset:offset + %s]' % (v, n))
+            body.append('if %s.__class__ is memoryview: %s = %s.tobytes()' % (v, v, v))
+            body.append('offset += %s' % n)
+            if s_type == 'j':
+                body.append('%s = json.loads(%s)' % (v, v))
+            elif s_type == 'bs':
+                body.append("if %s == '_TRUE': %s = True" % (v, v))
+                body.append("elif %s == '_FALSE': %s = False" % (v, v))
+
+        elif s_type in LIST_STRUCTS:
+            list_structs = 'L_%d' % i
+            namespace[list_structs] = LIST_STRUCTS[s_type]
+            body.append('%s = list(%s[%s].unpack_from(data, offset)) if %s else []' % (v, list_structs, n, n))
+            body.append('offset += %s * %d' % (n, Struct('!' + LIST_STRUCTS[s_type].item_format).size))
+
+        elif s_type == 'money':
+            body.append('%s = {}' % v)
+            body.append('for j in xrange(%s):' % n)
+            body.append('    c, m, g, t = S_MONEY_unpack_from(data, offset)')
+            body.append('    %s[c] = (m, g, t)' % v)
+            body.append('    offset += %d' % S_MONEY.size)
+
+        elif s_type == 'players':
+            body.append('%s = []' % v)
+            body.append('for j in xrange(%s):' % n)
+            body.append('    l, = S_H_unpack_from(data, offset)')
+            body.append('    offset += %d + l' % S_H.size)
+            body.append('    c, f = S_IB_unpack_from(data, offset)')
+            body.append('    n = data[offset - l:offset]')
+            body.append('    if n.__class__ is memoryview: n = n.tobytes()')
+            body.append('    %s.append((n, c, f))' % v)
+            body.append('    offset += %d' % S_IB.size)
+
+        elif s_type == 'pl':
+            body.append('%s = []' % v)
+            body.append('for j in xrange(%s):' % n)
+            body.append('    t, l = S_PACKET_HEAD_unpack_from(data, offset)')
+            body.append('    offset, q = type_id2type[t].binarypack_fast_unpack(data, offset + %d)' % S_PACKET_HEAD.size)
+            body.append('    %s.append(q)' % v)
+
+        else:
+            raise ValueError('%s: unknown s_type %r for %s' % (packet_type.__name__, s_type, attr))
+
+        values.append((attr, v))
+
+    if struct_vars:
+        flush_struct()
+
+    body.extend(new_instance(packet_type, namespace, 'packet_type', values, pool))
+    body.append('return (offset, p)')
+
+    return compile_function(
+        'binarypack_fast_unpack',
+        ['def binarypack_fast_unpack(data, offset):'] + ['    ' + line for line in body],
+        namespace
+    )
+
+# the str of each byte value
+BYTES = [chr(i) for i in xrange(256)]
+
+# integer types encoded as varints by the compact encoding
+VARINT_TYPES = ('H', 'I', 'Q')
+
+# largest value of the integer types, the compact encoding rejects the
+# values the binarypack structs reject
+VARINT_MAXIMUMS = {
+    'H': 0xffff,
+    'I': 0xffffffff,
+    'Q': 0xffffffffffffffff,
+}
+
+def varint(value, maximum=VARINT_MAXIMUMS['Q']):
+    """
+    return the varint encoding of the integer value: 7 bits per byte,
+    least significant first, the high bit is set on every byte but the
+    last. raises struct.error unless 0 <= value <= maximum.
+    """
+    if 0 <= value < 0x80:
+        return BYTES[value]
+    if not 0 <= value <= maximum:
+        raise StructError('varint requires 0 <= number <= %d: %d' % (maximum, value))
+    parts = []
+    while value >= 0x80:
+        parts.append(BYTES[value & 0x7f | 0x80])
+        value >>= 7
+    parts.append(BYTES[value])
+    return b''.join(parts)
+
+def unpack_varint(data, offset, maximum=VARINT_MAXIMUMS['Q']):
+    """
+    decode the varint at offset of data, returns (offset following it,
+    value). raises struct.error if it is longer than 10 bytes (64 bits)
+    or its value is greater than maximum.
+    """
+    byte = ord(data[offset])
+    value = byte & 0x7f
+    shift = 7
+    while byte & 0x80:
+        if shift > 63:
+            raise StructError('varint too long at offset %d' % offset)
+        offset += 1
+        byte = ord(data[offset])
+        value |= (byte & 0x7f) << shift
+        shift += 7
+    if value > maximum:
+        raise StructError('varint greater than %d at offset %d' % (maximum, offset))
+    return (offset + 1, value)
+
+def binarypack_compact_pack(packet_type, type_id, packers):
+    """
+    generate the compact binary encoder of packet_type
+
+    the compact encoding is the binary layout of binarypack_pack except
+    for integers, encoded as varints: 'H', 'I' and 'Q' fields, the amount
+    of 'c' fields, the items of 'Hl' and 'Il' lists, the items of 'il'
+    lists (zigzag encoded: 0, -1, 1, -2 ... as 0, 1, 2, 3 ...), the values
+    of 'money' fields and the chips of 'players' fields. each varint is
+    limited to the range of the struct format binarypack_pack uses for it
+    (VARINT_MAXIMUMS), so both encodings reject the same values. packets
+    of 'pl' fields are encoded by packers, mapping their class to their
+    compact encoder.
+
+    returns a function taking a packet and returning head + content of
+    the packet as compact binary data.
+    """
+    if not packet_type.binarypack_info and 0 <= type_id <= 255:
+        namespace = {'FRAME': S_PACKET_HEAD.pack(type_id, 0)}
+        return compile_function('binarypack_compact_pack', ['def binarypack_compact_pack(p):', '    return FRAME'], namespace)
+
+    namespace = {
+        'packers': packers,
+        'varint': varint,
+        'chips_amount': chips_amount,
+        'json': json_backend,
+        'S_B_pack': S_B.pack,
+        'S_H_pack': S_H.pack,
+        'S_PACKET_HEAD_pack': S_PACKET_HEAD.pack,
+    }
+    body = []
+    parts = []
+    struct_format = ['!']
+    struct_args = []
+
+    def flush_struct():
+        struct_name = 'S_%d' % len(parts)
+        namespace[struct_name] = Struct(''.join(struct_format)).pack
+        parts.append('%s(%s)' % (struct_name, ', '.join(struct_args)))
+        del struct_format[1:]
+        del struct_args[:]
+
+    for i, (attr, s_type) in enumerate(packet_type.binarypack_info):
+        v = 'v%d' % i
+        body.append('%s = p.%s' % (v, attr))
+
+        if s_type in FIXED_TYPES and s_type not in VARINT_TYPES:
+            struct_char, expression = FIXED_TYPES[s_type]
+            struct_format.append(struct_char)
+            struct_args.append('(' + expression.replace('%s', v) + ')')
+            continue
+
+        if struct_args:
+            flush_struct()
+
+        if s_type in VARINT_TYPES:
+            parts.append('varint(%s, %d)' % (v, VARINT_MAXIMUMS[s_type]))
+
+        elif s_type == 'c':
+            parts.append('varint(chips_amount(%s), %d)' % (v, VARINT_MAXIMUMS['I']))
+
+        elif s_type in ('s', 'bs', 'j'):
+            if s_type == 'bs':
+                body.append("if %s == True: %s = '_TRUE'" % (v, v))
+                body.append("elif %s == False: %s = '_FALSE'" % (v, v))
+            elif s_type == 'j':
+                body.append('%s = json.dumps(%s)' % (v, v))
+            parts.extend(['S_H_pack(len(%s))' % v, v])
+
+        elif s_type == 'Bl':
+            list_structs = 'L_%d' % i
+            namespace[list_structs] = LIST_STRUCTS[s_type]
+            parts.extend(['S_B_pack(len(%s))' % v, '%s[len(%s)].pack(*%s)' % (list_structs, v, v)])
+
+        elif s_type in ('Hl', 'Il'):
+            parts.extend(['S_B_pack(len(%s))' % v, "b''.join([varint(x, %d) for x in %s])" % (VARINT_MAXIMUMS[s_type[0]], v)])
+
+        elif s_type == 'il':
+            # the zigzag encoding of the 'i' range is the 'I' range
+            parts.extend([
+                'S_B_pack(len(%s))' % v,
+                "b''.join([varint(x << 1 if x >= 0 else (-x << 1) - 1, %d) for x in %s])" % (VARINT_MAXIMUMS['I'], v),
+            ])
+
+        elif s_type == 'money':
+            parts.extend([
+                'S_H_pack(len(%s))' % v,
+                "b''.join([varint(c, %d) + varint(m) + varint(g) + varint(t) for c, (m, g, t) in %s.iteritems()])" % (VARINT_MAXIMUMS['I'], v),
+            ])
+
+        elif s_type == 'players':
+            parts.extend([
+                'S_H_pack(len(%s))' % v,
+                "b''.join([S_H_pack(len(n)) + n + varint(c, %d) + S_B_pack(f) for n, c, f in %s])" % (VARINT_MAXIMUMS['I'], v),
+            ])
+
+        elif s_type == 'pl':
+            parts.extend(['S_H_pack(len(%s))' % v, "b''.join([packers[q.__class__](q) for q in %s])" % v])
+
+        else:
+            raise ValueError('%s: unknown s_type %r for %s' % (packet_type.__name__, s_type, attr))
+
+    if struct_args:
+        flush_struct()
+
+    body.append("d = b''.join([%s])" % ', '.join(parts))
+    body.append('return S_PACKET_HEAD_pack(%d, len(d)) + d' % type_id)
+
+    return compile_function(
+        'binarypack_compact_pack',
+        ['def binarypack_compact_pack(p):'] + ['    ' + line for line in body],
+        namespace
+    )
+
+def binarypack_compact_unpack(packet_type, unpackers, pool=None):
+    """
+    generate the compact binary decoder of packet_type, see
+    binarypack_compact_pack and binarypack_unpack
+
+    packets of 'pl' fields are decoded by unpackers, mapping their type id
+    to their compact decoder. returns a function taking data and the
+    offset of the packet content (after the packet head) and returning
+    (offset, packet).
+    """
+    if 'singleton' in packet_type.__dict__ and not packet_type.binarypack_info:
+        return compile_function(
+            'binarypack_compact_unpack',
+            ['def binarypack_compact_unpack(data, offset):', '    return (offset, singleton)'],
+            {'singleton': packet_type.__dict__['singleton']}
+        )
+
+    namespace = {
+        'packet_type': packet_type,
+        'unpackers': unpackers,
+        'unpack_varint': unpack_varint,
+        'json': json_backend,
+        'S_B_unpack_from': S_B.unpack_from,
+        'S_H_unpack_from': S_H.unpack_from,
+        'S_PACKET_HEAD_unpack_from': S_PACKET_HEAD.unpack_from,
+    }
+    body = []
+    values = []
+    struct_format = ['!']
+    struct_vars = []
+
+    def flush_struct():
+        struct = Struct(''.join(struct_format))
+        struct_name = 'S_%d' % len(body)
+        namespace[struct_name] = struct.unpack_from
+        body.append('%s, = %s(data, offset)' % (', '.join(struct_vars), struct_name))
+        body.append('offset += %d' % struct.size)
+        del struct_format[1:]
+        del struct_vars[:]
+
+    def read_varint(target, maximum):
+        # single byte varints are decoded inline
+        body.append('%s = ord(data[offset])' % target)
+        body.append('if %s < 128: offset += 1' % target)
+        body.append('else: offset, %s = unpack_varint(data, offset, %d)' % (target, maximum))
+
+    for i, (attr, s_type) in enumerate(packet_type.binarypack_info):
+        v = 'v%d' % i
+
+        if s_type in FIXED_TYPES and s_type not in VARINT_TYPES:
+            struct_format.append(FIXED_TYPES[s_type][0])
+            struct_vars.append(v)
+            values.append((attr, FIXED_TYPES_UNPACK[s_type].replace('%s', v)))
+            continue
+
+        if s_type in VARINT_TYPES or s_type == 'c':
+            if struct_vars:
+                flush_struct()
+            read_varint(v, VARINT_MAXIMUMS['I' if s_type == 'c' else s_type])
+            values.append((attr, FIXED_TYPES_UNPACK[s_type].replace('%s', v)))
+            continue
+
+        # variable sized field: its length prefix ends the current struct
+        n = 'n%d' % i
+        struct_format.append('B' if s_type in LIST_STRUCTS else 'H')
+        struct_vars.append(n)
+        flush_struct()
+
+        if s_type in ('s', 'bs', 'j'):
+            body.append('%s = data[offset:offset + %s]' % (v, n))
+            body.append('if %s.__class__ is memoryview: %s = %s.tobytes()' % (v, v, v))
+            body.append('offset += %s' % n)
+            if s_type == 'j':
+                body.append('%s = json.loads(%s)' % (v, v))
+            elif s_type == 'bs':
+                body.append("if %s == '_TRUE': %s = True" % (v, v))
+                body.append("elif %s == '_FALSE': %s = False" % (v, v))
+
+        elif s_type == 'Bl':
+            list_structs = 'L_%d' % i
+            namespace[list_structs] = LIST_STRUCTS[s_type]
+            body.append('%s = list(%s[%s].unpack_from(data, offset)) if %s else []' % (v, list_structs, n, n))
+            body.append('offset += %s' % n)
+
+        elif s_type in ('Hl', 'Il', 'il'):
+            body.append('%s = []' % v)
+            body.append('for j in xrange(%s):' % n)
+            body.append('    offset, x = unpack_varint(data, offset, %d)' % VARINT_MAXIMUMS['I' if s_type == 'il' else s_type[0]])
+            body.append('    %s.append(%s)' % (v, '(x >> 1) ^ -(x & 1)' if s_type == 'il' else 'x'))
+
+        elif s_type == 'money':
+            body.append('%s = {}' % v)
+            body.append('for j in xrange(%s):' % n)
+            body.append('    offset, c = unpack_varint(data, offset, %d)' % VARINT_MAXIMUMS['I'])
+            body.append('    offset, m = unpack_varint(data, offset)')
+            body.append('    offset, g = unpack_varint(data, offset)')
+            body.append('    offset, t = unpack_varint(data, offset)')
+            body.append('    %s[c] = (m, g, t)' % v)
+
+        elif s_type == 'players':
+            body.append('%s = []' % v)
+            body.append('for j in xrange(%s):' % n)
+            body.append('    l, = S_H_unpack_from(data, offset)')
+            body.append('    offset += %d + l' % S_H.size)
+            body.append('    n = data[offset - l:offset]')
+            body.append('    if n.__class__ is memoryview: n = n.tobytes()')
+            body.append('    offset, c = unpack_varint(data, offset, %d)' % VARINT_MAXIMUMS['I'])
+            body.append('    f, = S_B_unpack_from(data, offset)')
+            body.append('    offset += %d' % S_B.size)
+            body.append('    %s.append((n, c, f))' % v)
+
+        elif s_type == 'pl':
+            body.append('%s = []' % v)
+            body.append('for j in xrange(%s):' % n)
+            body.append('    t, l = S_PACKET_HEAD_unpack_from(data, offset)')
+            body.append('    offset, q = unpackers[t](data, offset + %d)' % S_PACKET_HEAD.size)
+            body.append('    %s.append(q)' % v)
+
+        else:
+            raise ValueError('%s: unknown s_type %r for %s' % (packet_type.__name__, s_type, attr))
+
+        values.append((attr, v))
+
+    if struct_vars:
+        flush_struct()
+
+    body.extend(new_instance(packet_type, namespace, 'packet_type', values, pool))
+    body.append('return (offset, p)')
+
+    return compile_function(
+        'binarypack_compact_unpack',
+        ['def binarypack_compact_unpack(data, offset):'] + ['    ' + line for line in body],
+        namespace
+    )
+
+class Missing(object):
+    "marks a keyword argument not given to a generated __init__"
+
+    def __repr__(self):
+        return 'MISSING'
+
+MISSING = Missing()
+
+def slotted_init(packet_type):
+    """
+    generate the __init__ of the slotted variant of packet_type
+
+    every attribute of info is a keyword argument defaulting to the class
+    default, mutable defaults (lists and dicts) are copied for each
+    instance. other keyword arguments are stored in the instance dict.
+    """
+    namespace = {'MISSING': MISSING}
+    args = []
+    body = []
+    for i, (attr, default, _s_type) in enumerate(packet_type.info):
+        if isinstance(default, (list, dict)):
+            namespace['C_%d' % i] = default.__class__
+            namespace['D_%d' % i] = default
+            args.append('%s=MISSING' % attr)
+            body.append('self.%s = C_%d(D_%d) if %s is MISSING else %s' % (attr, i, i, attr, attr))
+        else:
+            namespace['D_%d' % i] = default
+            args.append('%s=D_%d' % (attr, i))
+            body.append('self.%s = %s' % (attr, attr))
+    body.append('if kw: self.__dict__.update(kw)')
+
+    return compile_function(
+        '__init__',
+        ['def __init__(%s):' % ', '.join(['self'] + args + ['**kw'])] + ['    ' + line for line in body],
+        namespace
+    )
+
+def new_instance(packet_type, namespace, cls, values, pool=None):
+    """
+    return the source lines binding p to a new instance of packet_type
+
+    cls is the expression of the class to instantiate, values a list of
+    (attr, expression) for the instance dictionary. instances of classic
+    classes are created together with their dictionary. if pool is given
+    (see pokerpackets.pool.PacketPool) a released instance is reused when
+    available, its dictionary is updated in place.
+    """
+    items = '{%s}' % ', '.join(['%r: %s' % (attr, value) for attr, value in values])
+    if isinstance(packet_type, ClassType):
+        namespace['instance'] = InstanceType
+        lines = ['p = instance(%s, %s)' % (cls, items)]
+    else:
+        lines = ['p = %s.__new__(%s)' % (cls, cls), 'p.__dict__ = %s' % items]
+
+    if pool is None:
+        return lines
+
+    namespace['pool'] = pool
+    namespace['pool_free'] = pool.free
+    return [
+        'if pool_free:',
+        '    pool.hits += 1',
+        '    p = pool_free.pop()',
+        '    d = p.__dict__',
+    ] + ['    d[%r] = %s' % (attr, value) for attr, value in values] + [
+        'else:',
+        '    pool.misses += 1',
+    ] + ['    ' + line for line in lines]
+
+def make(packet_type, slotted=False, pool=None):
+    """
+    generate the positional constructor of packet_type
+
+    the arguments are the network attributes of info in declaration
+    order, defaulting to the class defaults (list and dict defaults are
+    copied). the instance is built without a keyword arguments dict, the
+    function is meant to be used as a classmethod. if pool is given the
+    function is not a classmethod and reuses released instances of the
+    pool (see new_instance).
+    """
+    namespace = {'MISSING': MISSING, 'packet_type': packet_type}
+    args = []
+    values = []
+    for i, (attr, default, s_type) in enumerate(packet_type.info):
+        mutable = isinstance(default, (list, dict))
+        namespace['D_%d' % i] = default
+        if mutable:
+            namespace['C_%d' % i] = default.__class__
+
+        if s_type == 'no net':
+            if slotted:
+                values.append((attr, 'C_%d(D_%d)' % (i, i) if mutable else 'D_%d' % i))
+            continue
+
+        if mutable:
+            args.append('%s=MISSING' % attr)
+            values.append((attr, 'C_%d(D_%d) if %s is MISSING else %s' % (i, i, attr, attr)))
+        else:
+            args.append('%s=D_%d' % (attr, i))
+            values.append((attr, attr))
+
+    if pool is not None:
+        body = new_instance(packet_type, namespace, 'packet_type', values, pool)
+    elif slotted:
+        body = ['p = cls.__new__(cls)'] + ['p.%s = %s' % (attr, value) for attr, value in values]
+        args.insert(0, 'cls')
+    else:
+        body = new_instance(packet_type, namespace, 'cls', values)
+        args.insert(0, 'cls')
+    body.append('return p')
+
+    return compile_function(
+        'make',
+        ['def make(%s):' % ', '.join(args)] + ['    ' + line for line in body],
+        namespace
+    )
+
+# classes standing for a packet (e.g. binarypack.LazyPacket), mapped to
+# the function returning the packet of an instance
+PROXIES = {}
+
+def proxy_pack(proxy_type, packers):
+    """
+    return the encoder of the instances of proxy_type (see PROXIES): it
+    encodes their packet with the encoder of its class in packers
+    """
+    packet_of = PROXIES[proxy_type]
+
+    def pack_proxy(proxy, *args):
+        packet = packet_of(proxy)
+        return packers[packet.__class__](packet, *args)
+    return pack_proxy
+
+def eq(packet_type, fallback, network_only=False):
+    """
+    generate the __eq__ of packet_type, comparing the attributes of info
+    (or only the network attributes if network_only is set)
+
+    classes which do not share the info of packet_type (undeclared
+    subclasses) are compared by fallback. proxies (see PROXIES) are
+    compared as their packet.
+    """
+    attrs = [attr for attr, _default, s_type in packet_type.info if not network_only or s_type != 'no net']
+    namespace = {'INFO': packet_type.info, 'fallback': fallback, 'PROXIES': PROXIES}
+    mismatch = "other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls)"
+    body = [
+        'cls = self.__class__',
+        'if cls.info is not INFO:',
+        '    return fallback(self, other)',
+        'other_cls = other.__class__',
+        'if %s:' % mismatch,
+        '    if other_cls not in PROXIES:',
+        '        return False',
+        '    other = PROXIES[other_cls](other)',
+        '    other_cls = other.__class__',
+        '    if %s:' % mismatch,
+        '        return False',
+    ]
+    if attrs:
+        body.append('return not (%s)' % ' or '.join('self.%s != other.%s' % (attr, attr) for attr in attrs))
+    else:
+        body.append('return True')
+
+    return compile_function(
+        '__eq__',
+        ['def __eq__(self, other):'] + ['    ' + line for line in body],
+        namespace
+    )
+
+def hash_(packet_type, hashable):
+    """
+    generate the __hash__ of the frozen variant of packet_type, hashing the
+    attributes of info. values which may be lists or dicts are converted
+    by hashable.
+    """
+    namespace = {'hashable': hashable}
+    values = []
+    for attr, _default, s_type in packet_type.info:
+        if s_type in FIXED_TYPES or s_type in ('s', 'bs', 'type'):
+            values.append('self.%s' % attr)
+        else:
+            values.append('hashable(self.%s)' % attr)
+
+    return compile_function(
+        '__hash__',
+        ['def __hash__(self):', '    return hash((%s))' % ''.join(value + ', ' for value in values)],
+        namespace
+    )
+
+def str_(packet_type, fallback):
+    """
+    generate the __str__ of packet_type: "Name(type) attr: repr(value) ..."
+    for the attributes of info. classes which do not share the info of
+    packet_type are formatted by fallback.
+    """
+    namespace = {'INFO': packet_type.info, 'fallback': fallback}
+    attrs = [attr for attr, _default, _s_type in packet_type.info]
+    string_format = '%s(%d)' + ''.join(' %s: %%r' % attr for attr in attrs)
+    body = [
+        'cls = self.__class__',
+        'if cls.info is not INFO:',
+        '    return fallback(self)',
+        'return %r %% (cls.__name__, cls.type%s)' % (string_format, ''.join(', self.%s' % attr for attr in attrs)),
+    ]
+
+    return compile_function(
+        '__str__',
+        ['def __str__(self):'] + ['    ' + line for line in body],
+        namespace
+    )
+
+# msgpack field conversions: expression converting the attribute value to
+# the packed value and the unpacked value to the attribute value, the
+# other types are packed as is
+MSGPACK_PACK = {
+    'bool': 'True if %s else False',
+    'cbool': "%s == 'y'",
+    'c': 'chips_amount(%s)',
+    'j': 'json.dumps(%s)',
+    'pl': '[packers[q.__class__](q) for q in %s]',
+}
+
+MSGPACK_UNPACK = {
+    'cbool': "'y' if %s else 'n'",
+    'c': '[1, %s] if %s else []',
+    'j': 'json.loads(%s)',
+    'pl': '[unpack_array(q) for q in %s]',
+    'money': 'dict([(k, tuple(m)) for k, m in %s.iteritems()])',
+    'players': '[tuple(q) for q in %s]',
+}
+
+def chips_amount(chips):
+    "return the amount of a list of chips (value, count, value, count, ...)"
+    amount = 0
+    for j in xrange(len(chips) / 2):
+        amount += chips[j * 2] * chips[j * 2 + 1]
+    return amount
+
+def msgpack_pack(packet_type, packers):
+    """
+    generate the msgpack encoder of packet_type
+
+    returns a function taking a packet and returning the array packed for
+    it: [type id, value of each attribute of msgpack_info]. packers maps
+    the classes of nested packets to their encoder.
+    """
+    namespace = {'packers': packers, 'chips_amount': chips_amount, 'json': json_backend}
+    values = [str(packet_type.type)]
+    for attr, s_type in packet_type.msgpack_info:
+        values.append(MSGPACK_PACK.get(s_type, '%s').replace('%s', 'p.' + attr))
+
+    return compile_function(
+        'msgpack_fast_pack',
+        ['def msgpack_fast_pack(p):', '    return [%s]' % ', '.join(values)],
+        namespace
+    )
+
+def msgpack_unpack(packet_type, unpack_array):
+    """
+    generate the msgpack decoder of packet_type
+
+    returns a function taking an array packed by msgpack_pack and
+    returning the packet, raises ValueError if the array does not have
+    one value per attribute of msgpack_info. unpack_array decodes the
+    arrays of nested packets.
+    """
+    if 'singleton' in packet_type.__dict__ and not packet_type.msgpack_info:
+        return compile_function(
+            'msgpack_fast_unpack',
+            ['def msgpack_fast_unpack(a):', '    _t, = a', '    return singleton'],
+            {'singleton': packet_type.__dict__['singleton']}
+        )
+
+    namespace = {'packet_type': packet_type, 'unpack_array': unpack_array, 'json': json_backend}
+    names = ['_t']
+    values = []
+    for i, (attr, s_type) in enumerate(packet_type.msgpack_info):
+        v = 'v%d' % i
+        names.append(v)
+        values.append((attr, MSGPACK_UNPACK.get(s_type, '%s').replace('%s', v)))
+
+    body = ['%s, = a' % ', '.join(names)] + new_instance(packet_type, namespace, 'packet_type', values)
+    body.append('return p')
+
+    return compile_function(
+        'msgpack_fast_unpack',
+        ['def msgpack_fast_unpack(a):'] + ['    ' + line for line in body],
+        namespace
+    )
+
+def dictpack_pack(packet_type, type_id, name, pack, pack_money):
+    """
+    generate the dictpack encoder of packet_type
+
+    returns a function taking a packet and numeric_type and returning the
+    dict of the attributes of its info ('no net' attributes included),
+    with the type id (or name if numeric_type is false) of packet_type
+    as 'type'. pack encodes the
+    packets of 'pl' attributes, pack_money the 'money' attributes.
+    """
+    namespace = {'pack': pack, 'pack_money': pack_money, 'NAME': name}
+    items = ["'type': %d if numeric_type else NAME" % type_id]
+    for attr, _default, s_type in packet_type.info:
+        if attr == 'type':
+            continue
+        elif s_type == 'pl':
+            items.append('%r: [pack(q, numeric_type) for q in p.%s]' % (attr, attr))
+        elif s_type == 'money':
+            items.append('%r: pack_money(p.%s)' % (attr, attr))
+        else:
+            items.append('%r: p.%s' % (attr, attr))
+
+    return compile_function(
+        'dictpack_fast_pack',
+        ['def dictpack_fast_pack(p, numeric_type=True):', '    return {%s}' % ', '.join(items)],
+        namespace
+    )
+
+def dictpack_unpack(packet_type, unpack, unpack_money, packet_init):
+    """
+    generate the dictpack decoder of packet_type
+
+    returns a function taking a dict packed by the encoder and returning
+    the packet built from a copy of it, the dict is not modified. unpack
+    decodes the packets of 'pl' attributes, unpack_money the 'money'
+    attributes. packet_init is Packet.__init__: classes using it are
+    instantiated together with their dictionary.
+    """
+    namespace = {'packet_type': packet_type, 'unpack': unpack, 'unpack_money': unpack_money}
+    body = ['values = dict(d)', "del values['type']"]
+    for attr, _default, s_type in packet_type.info:
+        if s_type == 'pl':
+            body.append('if %r in values: values[%r] = [unpack(q)[0] for q in values[%r]]' % (attr, attr, attr))
+        elif s_type == 'money':
+            body.append('if %r in values: values[%r] = unpack_money(values[%r])' % (attr, attr, attr))
+
+    if isinstance(packet_type, ClassType) and packet_type.__init__.im_func is packet_init:
+        namespace['instance'] = InstanceType
+        body.append('return instance(packet_type, values)')
+    else:
+        body.append('return packet_type(**values)')
+
+    return compile_function(
+        'dictpack_fast_unpack',
+        ['def dictpack_fast_unpack(d):'] + ['    ' + line for line in body],
+        namespace
+    )
+
+# json value expressions by s_type, the other types are encoded by dumps
+JSON_INTEGER_TYPES = ('B', 'H', 'I', 'Q', 'b', 'Bnone')
+JSON_STRING_TYPES = ('s', 'bs', 'cbool')
+
+def json_pack(packet_type, type_id, name, pack, string, dumps, pack_money):
+    """
+    generate the JSON encoder of packet_type
+
+    returns a function taking a packet and numeric_type and returning the
+    UTF-8 JSON object of the dictpack dict of the packet (see
+    dictpack_pack) without building it: the keys and separators are
+    rendered once, ints are formatted by str, strings by string and
+    other values by dumps. pack encodes the packets of 'pl' attributes,
+    pack_money converts the 'money' attributes.
+    """
+    namespace = {'pack': pack, 'string': string, 'dumps': dumps, 'pack_money': pack_money}
+    body = []
+    heads = ['{"type":%d' % type_id, '{"type":%s' % string(name)]
+    parts = []
+    fragment = ''
+    for i, (attr, _default, s_type) in enumerate(packet_type.info):
+        if attr == 'type':
+            continue
+        v = 'v%d' % i
+        body.append('%s = p.%s' % (v, attr))
+        fragment += ',"%s":' % attr
+        if parts:
+            parts.append(repr(fragment))
+        else:
+            heads = [head + fragment for head in heads]
+        fragment = ''
+
+        if s_type in JSON_INTEGER_TYPES:
+            parts.append('(str(%s) if %s.__class__ is int else dumps(%s))' % (v, v, v))
+        elif s_type in JSON_STRING_TYPES:
+            parts.append('string(%s)' % v)
+        elif s_type == 'pl':
+            parts.append("'[' + ','.join([pack(q, numeric_type) for q in %s]) + ']'" % v)
+        elif s_type == 'money':
+            parts.append('dumps(pack_money(%s))' % v)
+        else:
+            parts.append('dumps(%s)' % v)
+
+    namespace['HEAD_N'], namespace['HEAD_S'] = heads
+    parts.insert(0, '(HEAD_N if numeric_type else HEAD_S)')
+    parts.append("'}'")
+    body.append("return b''.join([%s])" % ', '.join(parts))
+
+    return compile_function(
+        'json_fast_pack',
+        ['def json_fast_pack(p, numeric_type=True):'] + ['    ' + line for line in body],
+        namespace
+    )
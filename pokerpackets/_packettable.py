@@ -0,0 +1,331 @@
+# generated by python -m pokerpackets.packetexport --type-table, do not edit
+
+TYPE_ID2MODULE = {
+    1: 'pokerpackets.packets',
+    2: 'pokerpackets.packets',
+    3: 'pokerpackets.packets',
+    4: 'pokerpackets.packets',
+    5: 'pokerpackets.packets',
+    6: 'pokerpackets.packets',
+    7: 'pokerpackets.packets',
+    8: 'pokerpackets.packets',
+    9: 'pokerpackets.packets',
+    10: 'pokerpackets.packets',
+    11: 'pokerpackets.packets',
+    12: 'pokerpackets.packets',
+    13: 'pokerpackets.packets',
+    14: 'pokerpackets.packets',
+    15: 'pokerpackets.packets',
+    16: 'pokerpackets.packets',
+    17: 'pokerpackets.packets',
+    18: 'pokerpackets.packets',
+    25: 'pokerpackets.packets',
+    50: 'pokerpackets.networkpackets',
+    51: 'pokerpackets.networkpackets',
+    52: 'pokerpackets.networkpackets',
+    53: 'pokerpackets.networkpackets',
+    54: 'pokerpackets.networkpackets',
+    55: 'pokerpackets.networkpackets',
+    56: 'pokerpackets.networkpackets',
+    57: 'pokerpackets.networkpackets',
+    58: 'pokerpackets.networkpackets',
+    59: 'pokerpackets.networkpackets',
+    60: 'pokerpackets.networkpackets',
+    61: 'pokerpackets.networkpackets',
+    62: 'pokerpackets.networkpackets',
+    63: 'pokerpackets.networkpackets',
+    64: 'pokerpackets.networkpackets',
+    65: 'pokerpackets.networkpackets',
+    66: 'pokerpackets.networkpackets',
+    67: 'pokerpackets.networkpackets',
+    68: 'pokerpackets.networkpackets',
+    69: 'pokerpackets.networkpackets',
+    70: 'pokerpackets.networkpackets',
+    71: 'pokerpackets.networkpackets',
+    72: 'pokerpackets.networkpackets',
+    73: 'pokerpackets.networkpackets',
+    74: 'pokerpackets.networkpackets',
+    75: 'pokerpackets.networkpackets',
+    76: 'pokerpackets.networkpackets',
+    77: 'pokerpackets.networkpackets',
+    78: 'pokerpackets.networkpackets',
+    79: 'pokerpackets.networkpackets',
+    80: 'pokerpackets.networkpackets',
+    81: 'pokerpackets.networkpackets',
+    82: 'pokerpackets.networkpackets',
+    83: 'pokerpackets.networkpackets',
+    84: 'pokerpackets.networkpackets',
+    85: 'pokerpackets.networkpackets',
+    86: 'pokerpackets.networkpackets',
+    87: 'pokerpackets.networkpackets',
+    88: 'pokerpackets.networkpackets',
+    89: 'pokerpackets.networkpackets',
+    90: 'pokerpackets.networkpackets',
+    91: 'pokerpackets.networkpackets',
+    92: 'pokerpackets.networkpackets',
+    93: 'pokerpackets.networkpackets',
+    94: 'pokerpackets.networkpackets',
+    95: 'pokerpackets.networkpackets',
+    96: 'pokerpackets.networkpackets',
+    97: 'pokerpackets.networkpackets',
+    98: 'pokerpackets.networkpackets',
+    99: 'pokerpackets.networkpackets',
+    100: 'pokerpackets.networkpackets',
+    101: 'pokerpackets.networkpackets',
+    102: 'pokerpackets.networkpackets',
+    103: 'pokerpackets.networkpackets',
+    104: 'pokerpackets.networkpackets',
+    105: 'pokerpackets.networkpackets',
+    106: 'pokerpackets.networkpackets',
+    107: 'pokerpackets.networkpackets',
+    108: 'pokerpackets.networkpackets',
+    109: 'pokerpackets.networkpackets',
+    110: 'pokerpackets.networkpackets',
+    111: 'pokerpackets.networkpackets',
+    112: 'pokerpackets.networkpackets',
+    113: 'pokerpackets.networkpackets',
+    114: 'pokerpackets.networkpackets',
+    115: 'pokerpackets.networkpackets',
+    116: 'pokerpackets.networkpackets',
+    117: 'pokerpackets.networkpackets',
+    118: 'pokerpackets.networkpackets',
+    119: 'pokerpackets.networkpackets',
+    120: 'pokerpackets.networkpackets',
+    121: 'pokerpackets.networkpackets',
+    122: 'pokerpackets.networkpackets',
+    123: 'pokerpackets.networkpackets',
+    124: 'pokerpackets.networkpackets',
+    125: 'pokerpackets.networkpackets',
+    126: 'pokerpackets.networkpackets',
+    127: 'pokerpackets.networkpackets',
+    128: 'pokerpackets.networkpackets',
+    129: 'pokerpackets.networkpackets',
+    130: 'pokerpackets.networkpackets',
+    131: 'pokerpackets.networkpackets',
+    132: 'pokerpackets.networkpackets',
+    133: 'pokerpackets.networkpackets',
+    134: 'pokerpackets.networkpackets',
+    135: 'pokerpackets.networkpackets',
+    136: 'pokerpackets.networkpackets',
+    137: 'pokerpackets.networkpackets',
+    140: 'pokerpackets.networkpackets',
+    141: 'pokerpackets.networkpackets',
+    142: 'pokerpackets.networkpackets',
+    143: 'pokerpackets.networkpackets',
+    144: 'pokerpackets.networkpackets',
+    145: 'pokerpackets.networkpackets',
+    146: 'pokerpackets.networkpackets',
+    147: 'pokerpackets.networkpackets',
+    148: 'pokerpackets.networkpackets',
+    149: 'pokerpackets.networkpackets',
+    150: 'pokerpackets.networkpackets',
+    151: 'pokerpackets.networkpackets',
+    152: 'pokerpackets.networkpackets',
+    153: 'pokerpackets.networkpackets',
+    154: 'pokerpackets.networkpackets',
+    155: 'pokerpackets.networkpackets',
+    156: 'pokerpackets.networkpackets',
+    157: 'pokerpackets.networkpackets',
+    158: 'pokerpackets.networkpackets',
+    159: 'pokerpackets.networkpackets',
+    160: 'pokerpackets.networkpackets',
+    161: 'pokerpackets.networkpackets',
+    162: 'pokerpackets.networkpackets',
+    163: 'pokerpackets.networkpackets',
+    164: 'pokerpackets.networkpackets',
+    165: 'pokerpackets.networkpackets',
+    166: 'pokerpackets.networkpackets',
+    167: 'pokerpackets.networkpackets',
+    168: 'pokerpackets.networkpackets',
+    169: 'pokerpackets.networkpackets',
+    170: 'pokerpackets.clientpackets',
+    171: 'pokerpackets.clientpackets',
+    173: 'pokerpackets.clientpackets',
+    174: 'pokerpackets.clientpackets',
+    175: 'pokerpackets.clientpackets',
+    176: 'pokerpackets.clientpackets',
+    177: 'pokerpackets.clientpackets',
+    178: 'pokerpackets.clientpackets',
+    179: 'pokerpackets.clientpackets',
+    180: 'pokerpackets.clientpackets',
+    181: 'pokerpackets.clientpackets',
+    182: 'pokerpackets.clientpackets',
+    184: 'pokerpackets.clientpackets',
+    187: 'pokerpackets.clientpackets',
+    188: 'pokerpackets.clientpackets',
+    189: 'pokerpackets.clientpackets',
+    190: 'pokerpackets.clientpackets',
+    197: 'pokerpackets.clientpackets',
+    198: 'pokerpackets.clientpackets',
+    199: 'pokerpackets.clientpackets',
+    201: 'pokerpackets.clientpackets',
+    204: 'pokerpackets.clientpackets',
+    205: 'pokerpackets.clientpackets',
+    209: 'pokerpackets.clientpackets',
+    210: 'pokerpackets.clientpackets',
+}
+
+NAME2MODULE = {
+    'PacketAck': 'pokerpackets.packets',
+    'PacketAuth': 'pokerpackets.packets',
+    'PacketAuthOk': 'pokerpackets.packets',
+    'PacketAuthRefused': 'pokerpackets.packets',
+    'PacketAuthRequest': 'pokerpackets.packets',
+    'PacketBootstrap': 'pokerpackets.packets',
+    'PacketCompact': 'pokerpackets.packets',
+    'PacketCompactRequest': 'pokerpackets.packets',
+    'PacketError': 'pokerpackets.packets',
+    'PacketInt': 'pokerpackets.packets',
+    'PacketList': 'pokerpackets.packets',
+    'PacketLogin': 'pokerpackets.packets',
+    'PacketLogout': 'pokerpackets.packets',
+    'PacketMessage': 'pokerpackets.packets',
+    'PacketPing': 'pokerpackets.packets',
+    'PacketPokerAllinShowdown': 'pokerpackets.clientpackets',
+    'PacketPokerAnte': 'pokerpackets.networkpackets',
+    'PacketPokerAnteRequest': 'pokerpackets.networkpackets',
+    'PacketPokerAutoBlindAnte': 'pokerpackets.networkpackets',
+    'PacketPokerAutoFold': 'pokerpackets.networkpackets',
+    'PacketPokerAutoMuck': 'pokerpackets.networkpackets',
+    'PacketPokerAutoPlay': 'pokerpackets.networkpackets',
+    'PacketPokerBatchMode': 'pokerpackets.networkpackets',
+    'PacketPokerBeginRound': 'pokerpackets.clientpackets',
+    'PacketPokerBestCards': 'pokerpackets.clientpackets',
+    'PacketPokerBet': 'pokerpackets.networkpackets',
+    'PacketPokerBetLimit': 'pokerpackets.clientpackets',
+    'PacketPokerBetLimits': 'pokerpackets.networkpackets',
+    'PacketPokerBlind': 'pokerpackets.networkpackets',
+    'PacketPokerBlindRequest': 'pokerpackets.networkpackets',
+    'PacketPokerBoardCards': 'pokerpackets.networkpackets',
+    'PacketPokerBuyIn': 'pokerpackets.networkpackets',
+    'PacketPokerBuyInLimits': 'pokerpackets.networkpackets',
+    'PacketPokerCall': 'pokerpackets.networkpackets',
+    'PacketPokerCanceled': 'pokerpackets.networkpackets',
+    'PacketPokerCards': 'pokerpackets.networkpackets',
+    'PacketPokerCashIn': 'pokerpackets.networkpackets',
+    'PacketPokerCashOut': 'pokerpackets.networkpackets',
+    'PacketPokerCashOutCommit': 'pokerpackets.networkpackets',
+    'PacketPokerCashQuery': 'pokerpackets.networkpackets',
+    'PacketPokerChat': 'pokerpackets.networkpackets',
+    'PacketPokerCheck': 'pokerpackets.networkpackets',
+    'PacketPokerChips': 'pokerpackets.networkpackets',
+    'PacketPokerChipsBet2Pot': 'pokerpackets.clientpackets',
+    'PacketPokerChipsBet2player': 'pokerpackets.clientpackets',
+    'PacketPokerChipsPlayer2Bet': 'pokerpackets.clientpackets',
+    'PacketPokerChipsPot2Player': 'pokerpackets.clientpackets',
+    'PacketPokerChipsPotMerge': 'pokerpackets.clientpackets',
+    'PacketPokerChipsPotReset': 'pokerpackets.clientpackets',
+    'PacketPokerClientPlayerChips': 'pokerpackets.clientpackets',
+    'PacketPokerCreateAccount': 'pokerpackets.networkpackets',
+    'PacketPokerCreateTourney': 'pokerpackets.networkpackets',
+    'PacketPokerCurrentGames': 'pokerpackets.clientpackets',
+    'PacketPokerDealCards': 'pokerpackets.clientpackets',
+    'PacketPokerDealer': 'pokerpackets.networkpackets',
+    'PacketPokerEndRound': 'pokerpackets.clientpackets',
+    'PacketPokerEndRoundLast': 'pokerpackets.clientpackets',
+    'PacketPokerError': 'pokerpackets.networkpackets',
+    'PacketPokerExplain': 'pokerpackets.networkpackets',
+    'PacketPokerFold': 'pokerpackets.networkpackets',
+    'PacketPokerGameMessage': 'pokerpackets.networkpackets',
+    'PacketPokerGetPersonalInfo': 'pokerpackets.networkpackets',
+    'PacketPokerGetPlayerInfo': 'pokerpackets.networkpackets',
+    'PacketPokerGetPlayerPlaces': 'pokerpackets.networkpackets',
+    'PacketPokerGetTourneyManager': 'pokerpackets.networkpackets',
+    'PacketPokerGetTourneyPlayerStats': 'pokerpackets.networkpackets',
+    'PacketPokerGetUserInfo': 'pokerpackets.networkpackets',
+    'PacketPokerHandHistory': 'pokerpackets.networkpackets',
+    'PacketPokerHandList': 'pokerpackets.networkpackets',
+    'PacketPokerHandReplay': 'pokerpackets.networkpackets',
+    'PacketPokerHandSelect': 'pokerpackets.networkpackets',
+    'PacketPokerHandSelectAll': 'pokerpackets.networkpackets',
+    'PacketPokerHighestBetIncrease': 'pokerpackets.clientpackets',
+    'PacketPokerId': 'pokerpackets.networkpackets',
+    'PacketPokerInGame': 'pokerpackets.networkpackets',
+    'PacketPokerInt': 'pokerpackets.networkpackets',
+    'PacketPokerLongPoll': 'pokerpackets.networkpackets',
+    'PacketPokerLongPollReturn': 'pokerpackets.networkpackets',
+    'PacketPokerLookCards': 'pokerpackets.networkpackets',
+    'PacketPokerMessage': 'pokerpackets.networkpackets',
+    'PacketPokerMonitor': 'pokerpackets.networkpackets',
+    'PacketPokerMonitorEvent': 'pokerpackets.networkpackets',
+    'PacketPokerMuckAccept': 'pokerpackets.networkpackets',
+    'PacketPokerMuckDeny': 'pokerpackets.networkpackets',
+    'PacketPokerMuckRequest': 'pokerpackets.networkpackets',
+    'PacketPokerNoautoBlindAnte': 'pokerpackets.networkpackets',
+    'PacketPokerPersonalInfo': 'pokerpackets.networkpackets',
+    'PacketPokerPlayerArrive': 'pokerpackets.networkpackets',
+    'PacketPokerPlayerCards': 'pokerpackets.networkpackets',
+    'PacketPokerPlayerChips': 'pokerpackets.networkpackets',
+    'PacketPokerPlayerHandStrength': 'pokerpackets.clientpackets',
+    'PacketPokerPlayerInfo': 'pokerpackets.networkpackets',
+    'PacketPokerPlayerLeave': 'pokerpackets.networkpackets',
+    'PacketPokerPlayerNoCards': 'pokerpackets.clientpackets',
+    'PacketPokerPlayerPlaces': 'pokerpackets.networkpackets',
+    'PacketPokerPlayerSelf': 'pokerpackets.networkpackets',
+    'PacketPokerPlayerStats': 'pokerpackets.networkpackets',
+    'PacketPokerPlayerWin': 'pokerpackets.clientpackets',
+    'PacketPokerPlayersList': 'pokerpackets.networkpackets',
+    'PacketPokerPosition': 'pokerpackets.networkpackets',
+    'PacketPokerPotChips': 'pokerpackets.clientpackets',
+    'PacketPokerProcessingHand': 'pokerpackets.networkpackets',
+    'PacketPokerRaise': 'pokerpackets.networkpackets',
+    'PacketPokerRake': 'pokerpackets.networkpackets',
+    'PacketPokerReadyToPlay': 'pokerpackets.networkpackets',
+    'PacketPokerRebuy': 'pokerpackets.networkpackets',
+    'PacketPokerRoles': 'pokerpackets.networkpackets',
+    'PacketPokerSeat': 'pokerpackets.networkpackets',
+    'PacketPokerSeats': 'pokerpackets.networkpackets',
+    'PacketPokerSelfInPosition': 'pokerpackets.clientpackets',
+    'PacketPokerSelfLostPosition': 'pokerpackets.clientpackets',
+    'PacketPokerSetAccount': 'pokerpackets.networkpackets',
+    'PacketPokerSetLocale': 'pokerpackets.networkpackets',
+    'PacketPokerSetRole': 'pokerpackets.networkpackets',
+    'PacketPokerShowdown': 'pokerpackets.clientpackets',
+    'PacketPokerSit': 'pokerpackets.networkpackets',
+    'PacketPokerSitOut': 'pokerpackets.networkpackets',
+    'PacketPokerSitOutNextTurn': 'pokerpackets.clientpackets',
+    'PacketPokerSitRequest': 'pokerpackets.clientpackets',
+    'PacketPokerStart': 'pokerpackets.networkpackets',
+    'PacketPokerState': 'pokerpackets.networkpackets',
+    'PacketPokerStateInformation': 'pokerpackets.networkpackets',
+    'PacketPokerStats': 'pokerpackets.networkpackets',
+    'PacketPokerStatsQuery': 'pokerpackets.networkpackets',
+    'PacketPokerStreamMode': 'pokerpackets.networkpackets',
+    'PacketPokerTable': 'pokerpackets.networkpackets',
+    'PacketPokerTableDestroy': 'pokerpackets.networkpackets',
+    'PacketPokerTableJoin': 'pokerpackets.networkpackets',
+    'PacketPokerTableList': 'pokerpackets.networkpackets',
+    'PacketPokerTableMove': 'pokerpackets.networkpackets',
+    'PacketPokerTablePicker': 'pokerpackets.networkpackets',
+    'PacketPokerTableQuit': 'pokerpackets.networkpackets',
+    'PacketPokerTableRequestPlayersList': 'pokerpackets.networkpackets',
+    'PacketPokerTableSelect': 'pokerpackets.networkpackets',
+    'PacketPokerTableTourneyBreakBegin': 'pokerpackets.networkpackets',
+    'PacketPokerTableTourneyBreakDone': 'pokerpackets.networkpackets',
+    'PacketPokerTimeoutNotice': 'pokerpackets.networkpackets',
+    'PacketPokerTimeoutWarning': 'pokerpackets.networkpackets',
+    'PacketPokerTourney': 'pokerpackets.networkpackets',
+    'PacketPokerTourneyCancel': 'pokerpackets.networkpackets',
+    'PacketPokerTourneyInfo': 'pokerpackets.networkpackets',
+    'PacketPokerTourneyList': 'pokerpackets.networkpackets',
+    'PacketPokerTourneyManager': 'pokerpackets.networkpackets',
+    'PacketPokerTourneyPlayerStats': 'pokerpackets.networkpackets',
+    'PacketPokerTourneyPlayersList': 'pokerpackets.networkpackets',
+    'PacketPokerTourneyRank': 'pokerpackets.networkpackets',
+    'PacketPokerTourneyRebuy': 'pokerpackets.networkpackets',
+    'PacketPokerTourneyRegister': 'pokerpackets.networkpackets',
+    'PacketPokerTourneyRequestPlayersList': 'pokerpackets.networkpackets',
+    'PacketPokerTourneySelect': 'pokerpackets.networkpackets',
+    'PacketPokerTourneyStart': 'pokerpackets.networkpackets',
+    'PacketPokerTourneyUnregister': 'pokerpackets.networkpackets',
+    'PacketPokerUpdateMoney': 'pokerpackets.networkpackets',
+    'PacketPokerUserInfo': 'pokerpackets.networkpackets',
+    'PacketPokerWaitBigBlind': 'pokerpackets.networkpackets',
+    'PacketPokerWaitFor': 'pokerpackets.networkpackets',
+    'PacketPokerWin': 'pokerpackets.networkpackets',
+    'PacketProtocolError': 'pokerpackets.packets',
+    'PacketQuit': 'pokerpackets.packets',
+    'PacketSerial': 'pokerpackets.packets',
+    'PacketSetOption': 'pokerpackets.networkpackets',
+    'PacketString': 'pokerpackets.packets',
+}
@@ -0,0 +1 @@
+"precompiled packet fields and functions, generated by python -m pokerpackets.packetexport --snapshot"
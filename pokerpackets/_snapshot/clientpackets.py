@@ -0,0 +1,1777 @@
+# generated by python -m pokerpackets.packetexport --snapshot, do not edit
+# pylint: skip-file
+
+FIELDS = {
+    ('pokerpackets.clientpackets', 'PacketPokerBestCards'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('cards', [], 'Bl'), ('side', '', 's'), ('hand', '', 's'), ('bestcards', [], 'Bl'), ('board', [], 'Bl'), ('besthand', 0, 'B')), [('serial', 'I'), ('game_id', 'I'), ('cards', 'Bl'), ('side', 's'), ('hand', 's'), ('bestcards', 'Bl'), ('board', 'Bl'), ('besthand', 'B')], [('serial', 'I'), ('game_id', 'I'), ('cards', 'Bl'), ('side', 's'), ('hand', 's'), ('bestcards', 'Bl'), ('board', 'Bl'), ('besthand', 'B')], {'cards': (11, 'Bl'), 'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.clientpackets', 'PacketPokerPotChips'): ((('game_id', 0, 'I'), ('index', 0, 'B'), ('bet', [], 'c')), [('game_id', 'I'), ('index', 'B'), ('bet', 'c')], [('game_id', 'I'), ('index', 'B'), ('bet', 'c')], {'bet': (8, 'c'), 'game_id': (3, 'I'), 'index': (7, 'B')}),
+    ('pokerpackets.clientpackets', 'PacketPokerBetLimit'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('min', 0, 'I'), ('max', 0, 'I'), ('step', 0, 'I'), ('call', 0, 'I'), ('allin', 0, 'I'), ('pot', 0, 'I')), [('serial', 'I'), ('game_id', 'I'), ('min', 'I'), ('max', 'I'), ('step', 'I'), ('call', 'I'), ('allin', 'I'), ('pot', 'I')], [('serial', 'I'), ('game_id', 'I'), ('min', 'I'), ('max', 'I'), ('step', 'I'), ('call', 'I'), ('allin', 'I'), ('pot', 'I')], {'allin': (27, 'I'), 'call': (23, 'I'), 'game_id': (7, 'I'), 'max': (15, 'I'), 'min': (11, 'I'), 'pot': (31, 'I'), 'serial': (3, 'I'), 'step': (19, 'I')}),
+    ('pokerpackets.clientpackets', 'PacketPokerSitRequest'): ((('serial', 0, 'I'), ('game_id', 0, 'I')), [('serial', 'I'), ('game_id', 'I')], [('serial', 'I'), ('game_id', 'I')], {'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.clientpackets', 'PacketPokerPlayerNoCards'): ((('serial', 0, 'I'), ('game_id', 0, 'I')), [('serial', 'I'), ('game_id', 'I')], [('serial', 'I'), ('game_id', 'I')], {'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.clientpackets', 'PacketPokerChipsPlayer2Bet'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('chips', [], 'c')), [('serial', 'I'), ('game_id', 'I'), ('chips', 'c')], [('serial', 'I'), ('game_id', 'I'), ('chips', 'c')], {'chips': (11, 'c'), 'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.clientpackets', 'PacketPokerChipsBet2Pot'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('chips', [], 'c'), ('pot', -1, 'b')), [('serial', 'I'), ('game_id', 'I'), ('chips', 'c'), ('pot', 'b')], [('serial', 'I'), ('game_id', 'I'), ('chips', 'c'), ('pot', 'b')], {'chips': (11, 'c'), 'game_id': (7, 'I'), 'pot': (15, 'b'), 'serial': (3, 'I')}),
+    ('pokerpackets.clientpackets', 'PacketPokerChipsPot2Player'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('chips', [], 'c'), ('pot', -1, 'b'), ('reason', '', 's')), [('serial', 'I'), ('game_id', 'I'), ('chips', 'c'), ('pot', 'b'), ('reason', 's')], [('serial', 'I'), ('game_id', 'I'), ('chips', 'c'), ('pot', 'b'), ('reason', 's')], {'chips': (11, 'c'), 'game_id': (7, 'I'), 'pot': (15, 'b'), 'reason': (16, 's'), 'serial': (3, 'I')}),
+    ('pokerpackets.clientpackets', 'PacketPokerChipsPotMerge'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('sources', [], 'Bl'), ('destination', 0, 'B')), [('serial', 'I'), ('game_id', 'I'), ('sources', 'Bl'), ('destination', 'B')], [('serial', 'I'), ('game_id', 'I'), ('sources', 'Bl'), ('destination', 'B')], {'game_id': (7, 'I'), 'serial': (3, 'I'), 'sources': (11, 'Bl')}),
+    ('pokerpackets.clientpackets', 'PacketPokerChipsPotReset'): ((('serial', 0, 'I'), ('game_id', 0, 'I')), [('serial', 'I'), ('game_id', 'I')], [('serial', 'I'), ('game_id', 'I')], {'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.clientpackets', 'PacketPokerChipsBet2player'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('chips', [], 'c')), [('serial', 'I'), ('game_id', 'I'), ('chips', 'c')], [('serial', 'I'), ('game_id', 'I'), ('chips', 'c')], {'chips': (11, 'c'), 'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.clientpackets', 'PacketPokerEndRound'): ((('serial', 0, 'I'), ('game_id', 0, 'I')), [('serial', 'I'), ('game_id', 'I')], [('serial', 'I'), ('game_id', 'I')], {'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.clientpackets', 'PacketPokerDealCards'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('numberOfCards', 2, 'B'), ('serials', [], 'Il')), [('serial', 'I'), ('game_id', 'I'), ('numberOfCards', 'B'), ('serials', 'Il')], [('serial', 'I'), ('game_id', 'I'), ('numberOfCards', 'B'), ('serials', 'Il')], {'game_id': (7, 'I'), 'numberOfCards': (11, 'B'), 'serial': (3, 'I'), 'serials': (12, 'Il')}),
+    ('pokerpackets.clientpackets', 'PacketPokerSelfInPosition'): ((('game_id', 0, 'I'), ('position', -1, 'b'), ('serial', 0, 'I')), [('game_id', 'I'), ('position', 'b'), ('serial', 'I')], [('game_id', 'I'), ('position', 'b'), ('serial', 'I')], {'game_id': (3, 'I'), 'position': (7, 'b'), 'serial': (8, 'I')}),
+    ('pokerpackets.clientpackets', 'PacketPokerSelfLostPosition'): ((('game_id', 0, 'I'), ('position', -1, 'b'), ('serial', 0, 'I')), [('game_id', 'I'), ('position', 'b'), ('serial', 'I')], [('game_id', 'I'), ('position', 'b'), ('serial', 'I')], {'game_id': (3, 'I'), 'position': (7, 'b'), 'serial': (8, 'I')}),
+    ('pokerpackets.clientpackets', 'PacketPokerHighestBetIncrease'): ((('serial', 0, 'I'), ('game_id', 0, 'I')), [('serial', 'I'), ('game_id', 'I')], [('serial', 'I'), ('game_id', 'I')], {'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.clientpackets', 'PacketPokerPlayerWin'): ((('serial', 0, 'I'), ('game_id', 0, 'I')), [('serial', 'I'), ('game_id', 'I')], [('serial', 'I'), ('game_id', 'I')], {'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.clientpackets', 'PacketPokerBeginRound'): ((('serial', 0, 'I'), ('game_id', 0, 'I')), [('serial', 'I'), ('game_id', 'I')], [('serial', 'I'), ('game_id', 'I')], {'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.clientpackets', 'PacketPokerCurrentGames'): ((('game_ids', [], 'Il'), ('count', 0, 'B')), [('game_ids', 'Il'), ('count', 'B')], [('game_ids', 'Il'), ('count', 'B')], {'game_ids': (3, 'Il')}),
+    ('pokerpackets.clientpackets', 'PacketPokerEndRoundLast'): ((('serial', 0, 'I'), ('game_id', 0, 'I')), [('serial', 'I'), ('game_id', 'I')], [('serial', 'I'), ('game_id', 'I')], {'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.clientpackets', 'PacketPokerSitOutNextTurn'): ((('serial', 0, 'I'), ('game_id', 0, 'I')), [('serial', 'I'), ('game_id', 'I')], [('serial', 'I'), ('game_id', 'I')], {'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.clientpackets', 'PacketPokerShowdown'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('showdown_stack', {}, 'j')), [('serial', 'I'), ('game_id', 'I'), ('showdown_stack', 'j')], [('serial', 'I'), ('game_id', 'I'), ('showdown_stack', 'j')], {'game_id': (7, 'I'), 'serial': (3, 'I'), 'showdown_stack': (11, 'j')}),
+    ('pokerpackets.clientpackets', 'PacketPokerClientPlayerChips'): ((('game_id', 0, 'I'), ('serial', 0, 'I'), ('bet', [], 'c'), ('money', [], 'c')), [('game_id', 'I'), ('serial', 'I'), ('bet', 'c'), ('money', 'c')], [('game_id', 'I'), ('serial', 'I'), ('bet', 'c'), ('money', 'c')], {'bet': (11, 'c'), 'game_id': (3, 'I'), 'money': (15, 'c'), 'serial': (7, 'I')}),
+    ('pokerpackets.clientpackets', 'PacketPokerAllinShowdown'): ((('game_id', 0, 'I'),), [('game_id', 'I')], [('game_id', 'I')], {'game_id': (3, 'I')}),
+    ('pokerpackets.clientpackets', 'PacketPokerPlayerHandStrength'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('hand', '', 's')), [('serial', 'I'), ('game_id', 'I'), ('hand', 's')], [('serial', 'I'), ('game_id', 'I'), ('hand', 's')], {'game_id': (7, 'I'), 'hand': (11, 's'), 'serial': (3, 'I')}),
+}
+
+def f0(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.cards != other.cards or self.side != other.side or self.hand != other.hand or self.bestcards != other.bestcards or self.board != other.board or self.besthand != other.besthand)
+    return __eq__
+
+def f1(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r cards: %r side: %r hand: %r bestcards: %r board: %r besthand: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.cards, self.side, self.hand, self.bestcards, self.board, self.besthand)
+    return __str__
+
+def f2(C_2, C_5, C_6, D_0, D_1, D_2, D_3, D_4, D_5, D_6, D_7, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, cards=MISSING, side=D_3, hand=D_4, bestcards=MISSING, board=MISSING, besthand=D_7):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'cards': C_2(D_2) if cards is MISSING else cards, 'side': side, 'hand': hand, 'bestcards': C_5(D_5) if bestcards is MISSING else bestcards, 'board': C_6(D_6) if board is MISSING else board, 'besthand': besthand})
+        return p
+    return make
+
+def f3(C_2, C_5, C_6, D_0, D_1, D_2, D_3, D_4, D_5, D_6, D_7, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, cards=MISSING, side=D_3, hand=D_4, bestcards=MISSING, board=MISSING, besthand=D_7):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.cards = C_2(D_2) if cards is MISSING else cards
+        p.side = side
+        p.hand = hand
+        p.bestcards = C_5(D_5) if bestcards is MISSING else bestcards
+        p.board = C_6(D_6) if board is MISSING else board
+        p.besthand = besthand
+        return p
+    return make
+
+def f4(C_2, C_5, C_6, D_0, D_1, D_2, D_3, D_4, D_5, D_6, D_7, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, cards=MISSING, side=D_3, hand=D_4, bestcards=MISSING, board=MISSING, besthand=D_7, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.cards = C_2(D_2) if cards is MISSING else cards
+        self.side = side
+        self.hand = hand
+        self.bestcards = C_5(D_5) if bestcards is MISSING else bestcards
+        self.board = C_6(D_6) if board is MISSING else board
+        self.besthand = besthand
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f5(L_2, L_5, L_6, S_0, S_10, S_2, S_4, S_6, S_8, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.cards
+        n2 = len(v2)
+        d2 = L_2[n2].pack(*v2)
+        v3 = p.side
+        v4 = p.hand
+        v5 = p.bestcards
+        n5 = len(v5)
+        d5 = L_5[n5].pack(*v5)
+        v6 = p.board
+        n6 = len(v6)
+        d6 = L_6[n6].pack(*v6)
+        v7 = p.besthand
+        length = 16 + len(d2) + len(v3) + len(v4) + len(d5) + len(d6)
+        return b''.join([S_0(170, length, (v0), (v1), n2), d2, S_2(len(v3)), v3, S_4(len(v4)), v4, S_6(n5), d5, S_8(n6), d6, S_10((v7))])
+    return binarypack_fast_pack
+
+def f6(L_2, L_5, L_6, S_0, S_10, S_2, S_4, S_6, S_8, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.cards
+        n2 = len(v2)
+        d2 = L_2[n2].pack(*v2)
+        v3 = p.side
+        v4 = p.hand
+        v5 = p.bestcards
+        n5 = len(v5)
+        d5 = L_5[n5].pack(*v5)
+        v6 = p.board
+        n6 = len(v6)
+        d6 = L_6[n6].pack(*v6)
+        v7 = p.besthand
+        length = 16 + len(d2) + len(v3) + len(v4) + len(d5) + len(d6)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 170, length, (v0), (v1), n2)
+        offset += 12
+        buf[offset:offset + len(d2)] = d2
+        offset += len(d2)
+        S_2(buf, offset, len(v3))
+        offset += 2
+        buf[offset:offset + len(v3)] = v3
+        offset += len(v3)
+        S_4(buf, offset, len(v4))
+        offset += 2
+        buf[offset:offset + len(v4)] = v4
+        offset += len(v4)
+        S_6(buf, offset, n5)
+        offset += 1
+        buf[offset:offset + len(d5)] = d5
+        offset += len(d5)
+        S_8(buf, offset, n6)
+        offset += 1
+        buf[offset:offset + len(d6)] = d6
+        offset += len(d6)
+        S_10(buf, offset, (v7))
+        return end
+    return binarypack_fast_pack_into
+
+def f7(L_2, L_5, L_6, S_0, S_14, S_18, S_22, S_4, S_9, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, n2, = S_0(data, offset)
+        offset += 9
+        v2 = list(L_2[n2].unpack_from(data, offset)) if n2 else []
+        offset += n2 * 1
+        n3, = S_4(data, offset)
+        offset += 2
+        v3 = data[offset:offset + n3]
+        if v3.__class__ is memoryview: v3 = v3.tobytes()
+        offset += n3
+        n4, = S_9(data, offset)
+        offset += 2
+        v4 = data[offset:offset + n4]
+        if v4.__class__ is memoryview: v4 = v4.tobytes()
+        offset += n4
+        n5, = S_14(data, offset)
+        offset += 1
+        v5 = list(L_5[n5].unpack_from(data, offset)) if n5 else []
+        offset += n5 * 1
+        n6, = S_18(data, offset)
+        offset += 1
+        v6 = list(L_6[n6].unpack_from(data, offset)) if n6 else []
+        offset += n6 * 1
+        v7, = S_22(data, offset)
+        offset += 1
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'cards': v2, 'side': v3, 'hand': v4, 'bestcards': v5, 'board': v6, 'besthand': v7})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f8(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, hashable(self.cards), self.side, self.hand, hashable(self.bestcards), hashable(self.board), self.besthand, ))
+    return __hash__
+
+def f9(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.game_id != other.game_id or self.index != other.index or self.bet != other.bet)
+    return __eq__
+
+def f10(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) game_id: %r index: %r bet: %r' % (cls.__name__, cls.type, self.game_id, self.index, self.bet)
+    return __str__
+
+def f11(C_2, D_0, D_1, D_2, MISSING, instance, packet_type, **_namespace):
+    def make(cls, game_id=D_0, index=D_1, bet=MISSING):
+        p = instance(cls, {'game_id': game_id, 'index': index, 'bet': C_2(D_2) if bet is MISSING else bet})
+        return p
+    return make
+
+def f12(C_2, D_0, D_1, D_2, MISSING, packet_type, **_namespace):
+    def make(cls, game_id=D_0, index=D_1, bet=MISSING):
+        p = cls.__new__(cls)
+        p.game_id = game_id
+        p.index = index
+        p.bet = C_2(D_2) if bet is MISSING else bet
+        return p
+    return make
+
+def f13(C_2, D_0, D_1, D_2, MISSING, **_namespace):
+    def __init__(self, game_id=D_0, index=D_1, bet=MISSING, **kw):
+        self.game_id = game_id
+        self.index = index
+        self.bet = C_2(D_2) if bet is MISSING else bet
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f14(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.game_id
+        v1 = p.index
+        v2 = p.bet
+        a2 = 0
+        for j in xrange(len(v2) / 2): a2 += v2[j * 2] * v2[j * 2 + 1]
+        length = 9
+        return S_0(171, length, (v0), (v1), a2)
+    return binarypack_fast_pack
+
+def f15(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.game_id
+        v1 = p.index
+        v2 = p.bet
+        a2 = 0
+        for j in xrange(len(v2) / 2): a2 += v2[j * 2] * v2[j * 2 + 1]
+        length = 9
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 171, length, (v0), (v1), a2)
+        return end
+    return binarypack_fast_pack_into
+
+def f16(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, = S_0(data, offset)
+        offset += 9
+        p = instance(packet_type, {'game_id': v0, 'index': v1, 'bet': [1, v2] if v2 else []})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f17(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.game_id, self.index, hashable(self.bet), ))
+    return __hash__
+
+def f18(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.min != other.min or self.max != other.max or self.step != other.step or self.call != other.call or self.allin != other.allin or self.pot != other.pot)
+    return __eq__
+
+def f19(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r min: %r max: %r step: %r call: %r allin: %r pot: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.min, self.max, self.step, self.call, self.allin, self.pot)
+    return __str__
+
+def f20(D_0, D_1, D_2, D_3, D_4, D_5, D_6, D_7, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, min=D_2, max=D_3, step=D_4, call=D_5, allin=D_6, pot=D_7):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'min': min, 'max': max, 'step': step, 'call': call, 'allin': allin, 'pot': pot})
+        return p
+    return make
+
+def f21(D_0, D_1, D_2, D_3, D_4, D_5, D_6, D_7, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, min=D_2, max=D_3, step=D_4, call=D_5, allin=D_6, pot=D_7):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.min = min
+        p.max = max
+        p.step = step
+        p.call = call
+        p.allin = allin
+        p.pot = pot
+        return p
+    return make
+
+def f22(D_0, D_1, D_2, D_3, D_4, D_5, D_6, D_7, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, min=D_2, max=D_3, step=D_4, call=D_5, allin=D_6, pot=D_7, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.min = min
+        self.max = max
+        self.step = step
+        self.call = call
+        self.allin = allin
+        self.pot = pot
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f23(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.min
+        v3 = p.max
+        v4 = p.step
+        v5 = p.call
+        v6 = p.allin
+        v7 = p.pot
+        length = 32
+        return S_0(173, length, (v0), (v1), (v2), (v3), (v4), (v5), (v6), (v7))
+    return binarypack_fast_pack
+
+def f24(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.min
+        v3 = p.max
+        v4 = p.step
+        v5 = p.call
+        v6 = p.allin
+        v7 = p.pot
+        length = 32
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 173, length, (v0), (v1), (v2), (v3), (v4), (v5), (v6), (v7))
+        return end
+    return binarypack_fast_pack_into
+
+def f25(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, v3, v4, v5, v6, v7, = S_0(data, offset)
+        offset += 32
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'min': v2, 'max': v3, 'step': v4, 'call': v5, 'allin': v6, 'pot': v7})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f26(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, self.min, self.max, self.step, self.call, self.allin, self.pot, ))
+    return __hash__
+
+def f27(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id)
+    return __eq__
+
+def f28(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r' % (cls.__name__, cls.type, self.serial, self.game_id)
+    return __str__
+
+def f29(D_0, D_1, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1):
+        p = instance(cls, {'serial': serial, 'game_id': game_id})
+        return p
+    return make
+
+def f30(D_0, D_1, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        return p
+    return make
+
+def f31(D_0, D_1, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f32(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        return S_0(174, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f33(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 174, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f34(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, = S_0(data, offset)
+        offset += 8
+        p = instance(packet_type, {'serial': v0, 'game_id': v1})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f35(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, ))
+    return __hash__
+
+def f36(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        return S_0(175, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f37(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 175, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f38(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.chips != other.chips)
+    return __eq__
+
+def f39(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r chips: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.chips)
+    return __str__
+
+def f40(C_2, D_0, D_1, D_2, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, chips=MISSING):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'chips': C_2(D_2) if chips is MISSING else chips})
+        return p
+    return make
+
+def f41(C_2, D_0, D_1, D_2, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, chips=MISSING):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.chips = C_2(D_2) if chips is MISSING else chips
+        return p
+    return make
+
+def f42(C_2, D_0, D_1, D_2, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, chips=MISSING, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.chips = C_2(D_2) if chips is MISSING else chips
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f43(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.chips
+        a2 = 0
+        for j in xrange(len(v2) / 2): a2 += v2[j * 2] * v2[j * 2 + 1]
+        length = 12
+        return S_0(176, length, (v0), (v1), a2)
+    return binarypack_fast_pack
+
+def f44(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.chips
+        a2 = 0
+        for j in xrange(len(v2) / 2): a2 += v2[j * 2] * v2[j * 2 + 1]
+        length = 12
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 176, length, (v0), (v1), a2)
+        return end
+    return binarypack_fast_pack_into
+
+def f45(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, = S_0(data, offset)
+        offset += 12
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'chips': [1, v2] if v2 else []})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f46(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, hashable(self.chips), ))
+    return __hash__
+
+def f47(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.chips != other.chips or self.pot != other.pot)
+    return __eq__
+
+def f48(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r chips: %r pot: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.chips, self.pot)
+    return __str__
+
+def f49(C_2, D_0, D_1, D_2, D_3, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, chips=MISSING, pot=D_3):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'chips': C_2(D_2) if chips is MISSING else chips, 'pot': pot})
+        return p
+    return make
+
+def f50(C_2, D_0, D_1, D_2, D_3, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, chips=MISSING, pot=D_3):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.chips = C_2(D_2) if chips is MISSING else chips
+        p.pot = pot
+        return p
+    return make
+
+def f51(C_2, D_0, D_1, D_2, D_3, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, chips=MISSING, pot=D_3, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.chips = C_2(D_2) if chips is MISSING else chips
+        self.pot = pot
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f52(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.chips
+        a2 = 0
+        for j in xrange(len(v2) / 2): a2 += v2[j * 2] * v2[j * 2 + 1]
+        v3 = p.pot
+        length = 13
+        return S_0(177, length, (v0), (v1), a2, (255 if v3 == -1 else v3))
+    return binarypack_fast_pack
+
+def f53(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.chips
+        a2 = 0
+        for j in xrange(len(v2) / 2): a2 += v2[j * 2] * v2[j * 2 + 1]
+        v3 = p.pot
+        length = 13
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 177, length, (v0), (v1), a2, (255 if v3 == -1 else v3))
+        return end
+    return binarypack_fast_pack_into
+
+def f54(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, v3, = S_0(data, offset)
+        offset += 13
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'chips': [1, v2] if v2 else [], 'pot': -1 if v3 == 255 else v3})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f55(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, hashable(self.chips), self.pot, ))
+    return __hash__
+
+def f56(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.chips != other.chips or self.pot != other.pot or self.reason != other.reason)
+    return __eq__
+
+def f57(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r chips: %r pot: %r reason: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.chips, self.pot, self.reason)
+    return __str__
+
+def f58(C_2, D_0, D_1, D_2, D_3, D_4, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, chips=MISSING, pot=D_3, reason=D_4):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'chips': C_2(D_2) if chips is MISSING else chips, 'pot': pot, 'reason': reason})
+        return p
+    return make
+
+def f59(C_2, D_0, D_1, D_2, D_3, D_4, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, chips=MISSING, pot=D_3, reason=D_4):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.chips = C_2(D_2) if chips is MISSING else chips
+        p.pot = pot
+        p.reason = reason
+        return p
+    return make
+
+def f60(C_2, D_0, D_1, D_2, D_3, D_4, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, chips=MISSING, pot=D_3, reason=D_4, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.chips = C_2(D_2) if chips is MISSING else chips
+        self.pot = pot
+        self.reason = reason
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f61(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.chips
+        a2 = 0
+        for j in xrange(len(v2) / 2): a2 += v2[j * 2] * v2[j * 2 + 1]
+        v3 = p.pot
+        v4 = p.reason
+        length = 15 + len(v4)
+        return b''.join([S_0(178, length, (v0), (v1), a2, (255 if v3 == -1 else v3), len(v4)), v4])
+    return binarypack_fast_pack
+
+def f62(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.chips
+        a2 = 0
+        for j in xrange(len(v2) / 2): a2 += v2[j * 2] * v2[j * 2 + 1]
+        v3 = p.pot
+        v4 = p.reason
+        length = 15 + len(v4)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 178, length, (v0), (v1), a2, (255 if v3 == -1 else v3), len(v4))
+        offset += 18
+        buf[offset:offset + len(v4)] = v4
+        return end
+    return binarypack_fast_pack_into
+
+def f63(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, v3, n4, = S_0(data, offset)
+        offset += 15
+        v4 = data[offset:offset + n4]
+        if v4.__class__ is memoryview: v4 = v4.tobytes()
+        offset += n4
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'chips': [1, v2] if v2 else [], 'pot': -1 if v3 == 255 else v3, 'reason': v4})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f64(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, hashable(self.chips), self.pot, self.reason, ))
+    return __hash__
+
+def f65(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.sources != other.sources or self.destination != other.destination)
+    return __eq__
+
+def f66(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r sources: %r destination: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.sources, self.destination)
+    return __str__
+
+def f67(C_2, D_0, D_1, D_2, D_3, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, sources=MISSING, destination=D_3):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'sources': C_2(D_2) if sources is MISSING else sources, 'destination': destination})
+        return p
+    return make
+
+def f68(C_2, D_0, D_1, D_2, D_3, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, sources=MISSING, destination=D_3):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.sources = C_2(D_2) if sources is MISSING else sources
+        p.destination = destination
+        return p
+    return make
+
+def f69(C_2, D_0, D_1, D_2, D_3, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, sources=MISSING, destination=D_3, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.sources = C_2(D_2) if sources is MISSING else sources
+        self.destination = destination
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f70(L_2, S_0, S_2, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.sources
+        n2 = len(v2)
+        d2 = L_2[n2].pack(*v2)
+        v3 = p.destination
+        length = 10 + len(d2)
+        return b''.join([S_0(179, length, (v0), (v1), n2), d2, S_2((v3))])
+    return binarypack_fast_pack
+
+def f71(L_2, S_0, S_2, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.sources
+        n2 = len(v2)
+        d2 = L_2[n2].pack(*v2)
+        v3 = p.destination
+        length = 10 + len(d2)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 179, length, (v0), (v1), n2)
+        offset += 12
+        buf[offset:offset + len(d2)] = d2
+        offset += len(d2)
+        S_2(buf, offset, (v3))
+        return end
+    return binarypack_fast_pack_into
+
+def f72(L_2, S_0, S_4, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, n2, = S_0(data, offset)
+        offset += 9
+        v2 = list(L_2[n2].unpack_from(data, offset)) if n2 else []
+        offset += n2 * 1
+        v3, = S_4(data, offset)
+        offset += 1
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'sources': v2, 'destination': v3})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f73(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, hashable(self.sources), self.destination, ))
+    return __hash__
+
+def f74(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        return S_0(180, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f75(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 180, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f76(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.chips
+        a2 = 0
+        for j in xrange(len(v2) / 2): a2 += v2[j * 2] * v2[j * 2 + 1]
+        length = 12
+        return S_0(181, length, (v0), (v1), a2)
+    return binarypack_fast_pack
+
+def f77(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.chips
+        a2 = 0
+        for j in xrange(len(v2) / 2): a2 += v2[j * 2] * v2[j * 2 + 1]
+        length = 12
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 181, length, (v0), (v1), a2)
+        return end
+    return binarypack_fast_pack_into
+
+def f78(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        return S_0(182, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f79(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 182, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f80(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.numberOfCards != other.numberOfCards or self.serials != other.serials)
+    return __eq__
+
+def f81(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r numberOfCards: %r serials: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.numberOfCards, self.serials)
+    return __str__
+
+def f82(C_3, D_0, D_1, D_2, D_3, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, numberOfCards=D_2, serials=MISSING):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'numberOfCards': numberOfCards, 'serials': C_3(D_3) if serials is MISSING else serials})
+        return p
+    return make
+
+def f83(C_3, D_0, D_1, D_2, D_3, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, numberOfCards=D_2, serials=MISSING):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.numberOfCards = numberOfCards
+        p.serials = C_3(D_3) if serials is MISSING else serials
+        return p
+    return make
+
+def f84(C_3, D_0, D_1, D_2, D_3, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, numberOfCards=D_2, serials=MISSING, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.numberOfCards = numberOfCards
+        self.serials = C_3(D_3) if serials is MISSING else serials
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f85(L_3, S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.numberOfCards
+        v3 = p.serials
+        n3 = len(v3)
+        d3 = L_3[n3].pack(*v3)
+        length = 10 + len(d3)
+        return b''.join([S_0(184, length, (v0), (v1), (v2), n3), d3])
+    return binarypack_fast_pack
+
+def f86(L_3, S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.numberOfCards
+        v3 = p.serials
+        n3 = len(v3)
+        d3 = L_3[n3].pack(*v3)
+        length = 10 + len(d3)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 184, length, (v0), (v1), (v2), n3)
+        offset += 13
+        buf[offset:offset + len(d3)] = d3
+        return end
+    return binarypack_fast_pack_into
+
+def f87(L_3, S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, n3, = S_0(data, offset)
+        offset += 10
+        v3 = list(L_3[n3].unpack_from(data, offset)) if n3 else []
+        offset += n3 * 4
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'numberOfCards': v2, 'serials': v3})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f88(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, self.numberOfCards, hashable(self.serials), ))
+    return __hash__
+
+def f89(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.game_id != other.game_id or self.position != other.position or self.serial != other.serial)
+    return __eq__
+
+def f90(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) game_id: %r position: %r serial: %r' % (cls.__name__, cls.type, self.game_id, self.position, self.serial)
+    return __str__
+
+def f91(D_0, D_1, D_2, MISSING, instance, packet_type, **_namespace):
+    def make(cls, game_id=D_0, position=D_1, serial=D_2):
+        p = instance(cls, {'game_id': game_id, 'position': position, 'serial': serial})
+        return p
+    return make
+
+def f92(D_0, D_1, D_2, MISSING, packet_type, **_namespace):
+    def make(cls, game_id=D_0, position=D_1, serial=D_2):
+        p = cls.__new__(cls)
+        p.game_id = game_id
+        p.position = position
+        p.serial = serial
+        return p
+    return make
+
+def f93(D_0, D_1, D_2, MISSING, **_namespace):
+    def __init__(self, game_id=D_0, position=D_1, serial=D_2, **kw):
+        self.game_id = game_id
+        self.position = position
+        self.serial = serial
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f94(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.game_id
+        v1 = p.position
+        v2 = p.serial
+        length = 9
+        return S_0(187, length, (v0), (255 if v1 == -1 else v1), (v2))
+    return binarypack_fast_pack
+
+def f95(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.game_id
+        v1 = p.position
+        v2 = p.serial
+        length = 9
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 187, length, (v0), (255 if v1 == -1 else v1), (v2))
+        return end
+    return binarypack_fast_pack_into
+
+def f96(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, = S_0(data, offset)
+        offset += 9
+        p = instance(packet_type, {'game_id': v0, 'position': -1 if v1 == 255 else v1, 'serial': v2})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f97(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.game_id, self.position, self.serial, ))
+    return __hash__
+
+def f98(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.game_id
+        v1 = p.position
+        v2 = p.serial
+        length = 9
+        return S_0(188, length, (v0), (255 if v1 == -1 else v1), (v2))
+    return binarypack_fast_pack
+
+def f99(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.game_id
+        v1 = p.position
+        v2 = p.serial
+        length = 9
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 188, length, (v0), (255 if v1 == -1 else v1), (v2))
+        return end
+    return binarypack_fast_pack_into
+
+def f100(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        return S_0(189, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f101(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 189, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f102(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        return S_0(190, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f103(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 190, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f104(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        return S_0(197, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f105(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 197, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f106(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.game_ids != other.game_ids or self.count != other.count)
+    return __eq__
+
+def f107(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) game_ids: %r count: %r' % (cls.__name__, cls.type, self.game_ids, self.count)
+    return __str__
+
+def f108(C_0, D_0, D_1, MISSING, instance, packet_type, **_namespace):
+    def make(cls, game_ids=MISSING, count=D_1):
+        p = instance(cls, {'game_ids': C_0(D_0) if game_ids is MISSING else game_ids, 'count': count})
+        return p
+    return make
+
+def f109(C_0, D_0, D_1, MISSING, packet_type, **_namespace):
+    def make(cls, game_ids=MISSING, count=D_1):
+        p = cls.__new__(cls)
+        p.game_ids = C_0(D_0) if game_ids is MISSING else game_ids
+        p.count = count
+        return p
+    return make
+
+def f110(C_0, D_0, D_1, MISSING, **_namespace):
+    def __init__(self, game_ids=MISSING, count=D_1, **kw):
+        self.game_ids = C_0(D_0) if game_ids is MISSING else game_ids
+        self.count = count
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f111(L_0, S_0, S_2, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.game_ids
+        n0 = len(v0)
+        d0 = L_0[n0].pack(*v0)
+        v1 = p.count
+        length = 2 + len(d0)
+        return b''.join([S_0(198, length, n0), d0, S_2((v1))])
+    return binarypack_fast_pack
+
+def f112(L_0, S_0, S_2, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.game_ids
+        n0 = len(v0)
+        d0 = L_0[n0].pack(*v0)
+        v1 = p.count
+        length = 2 + len(d0)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 198, length, n0)
+        offset += 4
+        buf[offset:offset + len(d0)] = d0
+        offset += len(d0)
+        S_2(buf, offset, (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f113(L_0, S_0, S_4, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        n0, = S_0(data, offset)
+        offset += 1
+        v0 = list(L_0[n0].unpack_from(data, offset)) if n0 else []
+        offset += n0 * 4
+        v1, = S_4(data, offset)
+        offset += 1
+        p = instance(packet_type, {'game_ids': v0, 'count': v1})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f114(hashable, **_namespace):
+    def __hash__(self):
+        return hash((hashable(self.game_ids), self.count, ))
+    return __hash__
+
+def f115(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        return S_0(199, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f116(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 199, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f117(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        return S_0(201, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f118(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 201, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f119(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.showdown_stack != other.showdown_stack)
+    return __eq__
+
+def f120(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r showdown_stack: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.showdown_stack)
+    return __str__
+
+def f121(C_2, D_0, D_1, D_2, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, showdown_stack=MISSING):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'showdown_stack': C_2(D_2) if showdown_stack is MISSING else showdown_stack})
+        return p
+    return make
+
+def f122(C_2, D_0, D_1, D_2, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, showdown_stack=MISSING):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.showdown_stack = C_2(D_2) if showdown_stack is MISSING else showdown_stack
+        return p
+    return make
+
+def f123(C_2, D_0, D_1, D_2, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, showdown_stack=MISSING, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.showdown_stack = C_2(D_2) if showdown_stack is MISSING else showdown_stack
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f124(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.showdown_stack
+        v2 = json.dumps(v2)
+        length = 10 + len(v2)
+        return b''.join([S_0(204, length, (v0), (v1), len(v2)), v2])
+    return binarypack_fast_pack
+
+def f125(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.showdown_stack
+        v2 = json.dumps(v2)
+        length = 10 + len(v2)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 204, length, (v0), (v1), len(v2))
+        offset += 13
+        buf[offset:offset + len(v2)] = v2
+        return end
+    return binarypack_fast_pack_into
+
+def f126(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, n2, = S_0(data, offset)
+        offset += 10
+        v2 = data[offset:offset + n2]
+        if v2.__class__ is memoryview: v2 = v2.tobytes()
+        offset += n2
+        v2 = json.loads(v2)
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'showdown_stack': v2})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f127(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, hashable(self.showdown_stack), ))
+    return __hash__
+
+def f128(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.game_id != other.game_id or self.serial != other.serial or self.bet != other.bet or self.money != other.money)
+    return __eq__
+
+def f129(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) game_id: %r serial: %r bet: %r money: %r' % (cls.__name__, cls.type, self.game_id, self.serial, self.bet, self.money)
+    return __str__
+
+def f130(C_2, C_3, D_0, D_1, D_2, D_3, MISSING, instance, packet_type, **_namespace):
+    def make(cls, game_id=D_0, serial=D_1, bet=MISSING, money=MISSING):
+        p = instance(cls, {'game_id': game_id, 'serial': serial, 'bet': C_2(D_2) if bet is MISSING else bet, 'money': C_3(D_3) if money is MISSING else money})
+        return p
+    return make
+
+def f131(C_2, C_3, D_0, D_1, D_2, D_3, MISSING, packet_type, **_namespace):
+    def make(cls, game_id=D_0, serial=D_1, bet=MISSING, money=MISSING):
+        p = cls.__new__(cls)
+        p.game_id = game_id
+        p.serial = serial
+        p.bet = C_2(D_2) if bet is MISSING else bet
+        p.money = C_3(D_3) if money is MISSING else money
+        return p
+    return make
+
+def f132(C_2, C_3, D_0, D_1, D_2, D_3, MISSING, **_namespace):
+    def __init__(self, game_id=D_0, serial=D_1, bet=MISSING, money=MISSING, **kw):
+        self.game_id = game_id
+        self.serial = serial
+        self.bet = C_2(D_2) if bet is MISSING else bet
+        self.money = C_3(D_3) if money is MISSING else money
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f133(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.game_id
+        v1 = p.serial
+        v2 = p.bet
+        a2 = 0
+        for j in xrange(len(v2) / 2): a2 += v2[j * 2] * v2[j * 2 + 1]
+        v3 = p.money
+        a3 = 0
+        for j in xrange(len(v3) / 2): a3 += v3[j * 2] * v3[j * 2 + 1]
+        length = 16
+        return S_0(205, length, (v0), (v1), a2, a3)
+    return binarypack_fast_pack
+
+def f134(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.game_id
+        v1 = p.serial
+        v2 = p.bet
+        a2 = 0
+        for j in xrange(len(v2) / 2): a2 += v2[j * 2] * v2[j * 2 + 1]
+        v3 = p.money
+        a3 = 0
+        for j in xrange(len(v3) / 2): a3 += v3[j * 2] * v3[j * 2 + 1]
+        length = 16
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 205, length, (v0), (v1), a2, a3)
+        return end
+    return binarypack_fast_pack_into
+
+def f135(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, v3, = S_0(data, offset)
+        offset += 16
+        p = instance(packet_type, {'game_id': v0, 'serial': v1, 'bet': [1, v2] if v2 else [], 'money': [1, v3] if v3 else []})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f136(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.game_id, self.serial, hashable(self.bet), hashable(self.money), ))
+    return __hash__
+
+def f137(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.game_id != other.game_id)
+    return __eq__
+
+def f138(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) game_id: %r' % (cls.__name__, cls.type, self.game_id)
+    return __str__
+
+def f139(D_0, MISSING, instance, packet_type, **_namespace):
+    def make(cls, game_id=D_0):
+        p = instance(cls, {'game_id': game_id})
+        return p
+    return make
+
+def f140(D_0, MISSING, packet_type, **_namespace):
+    def make(cls, game_id=D_0):
+        p = cls.__new__(cls)
+        p.game_id = game_id
+        return p
+    return make
+
+def f141(D_0, MISSING, **_namespace):
+    def __init__(self, game_id=D_0, **kw):
+        self.game_id = game_id
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f142(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.game_id
+        length = 4
+        return S_0(209, length, (v0))
+    return binarypack_fast_pack
+
+def f143(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.game_id
+        length = 4
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 209, length, (v0))
+        return end
+    return binarypack_fast_pack_into
+
+def f144(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, = S_0(data, offset)
+        offset += 4
+        p = instance(packet_type, {'game_id': v0})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f145(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.game_id, ))
+    return __hash__
+
+def f146(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.hand != other.hand)
+    return __eq__
+
+def f147(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r hand: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.hand)
+    return __str__
+
+def f148(D_0, D_1, D_2, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, hand=D_2):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'hand': hand})
+        return p
+    return make
+
+def f149(D_0, D_1, D_2, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, hand=D_2):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.hand = hand
+        return p
+    return make
+
+def f150(D_0, D_1, D_2, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, hand=D_2, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.hand = hand
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f151(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.hand
+        length = 10 + len(v2)
+        return b''.join([S_0(210, length, (v0), (v1), len(v2)), v2])
+    return binarypack_fast_pack
+
+def f152(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.hand
+        length = 10 + len(v2)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 210, length, (v0), (v1), len(v2))
+        offset += 13
+        buf[offset:offset + len(v2)] = v2
+        return end
+    return binarypack_fast_pack_into
+
+def f153(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, n2, = S_0(data, offset)
+        offset += 10
+        v2 = data[offset:offset + n2]
+        if v2.__class__ is memoryview: v2 = v2.tobytes()
+        offset += n2
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'hand': v2})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f154(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, self.hand, ))
+    return __hash__
+
+FACTORIES = {
+    'a03104f4dcca8c70ae23c4efb7091485': f0,
+    '12d8f7e4f4b2d2d7bb485598d37ca25f': f1,
+    '8fbd3766e584bbf52e4f4592b4a40351': f2,
+    'd71a3fb94d2b6cdf6f3913fd8ca92a5d': f3,
+    '714e556b13835bce51ef9833ebb7bd7f': f4,
+    '717b978a7dbf702e0bc3c28eddc4b0cb': f5,
+    'a103a318e79882deda2ed0fce845b8ab': f6,
+    'f5b0580c5f1cd36cabd339e2c9cb1ec0': f7,
+    '1e1b019ea02fc0d8966ac7cfdc191828': f8,
+    '5790d81c4ea0e57a45025966a5702073': f9,
+    '48e5d3cd0f588ef5d488106aaad89d55': f10,
+    '79b5a9034fd519cff728521368b0e0e7': f11,
+    '7bda0522e1c769a5cb39be7aa338420b': f12,
+    '4b72233a10a2798a412828a50eec62b1': f13,
+    '6bb7bd9d64d4db5d0286f3a343e0a3cb': f14,
+    'da465994863fb6416a3b325d6bfb7724': f15,
+    'f707f2211455b9b366d5f080a6276360': f16,
+    'd5d1755d6b0bb6c4e0a16e8ce5bff229': f17,
+    'a92c4201af03f8aab7f8549c9be352b5': f18,
+    '6e0e8516002814a3876f5acc8f1cd68a': f19,
+    '7e98eb68c1bcdf769eb60666cf1ed631': f20,
+    '664520fbddf3b69f932fc2aa5cc14309': f21,
+    '0403f84521d1d110b5e52cccb32b0311': f22,
+    'ae3a9ba4f5920fe4ec812f180dd828a9': f23,
+    'd8b41c57f7d093edddcfe5b93d44cf74': f24,
+    '7d787cdd4b662e065ec2567c27f052eb': f25,
+    '2fb4e6a1a3b6014b59bf1765cdb89582': f26,
+    '41924cad4998f6ea98101af8c747e11b': f27,
+    '67a902c434e2f40b9dbe2f7996005b96': f28,
+    'ae837294094c14b80990755714c17c25': f29,
+    '9bd6286fd8c694816df31c98fead07c6': f30,
+    '2101d117ff8bd92817e61ad88148d30d': f31,
+    '95c77907b982a2c4def97a900d0b29ca': f32,
+    '57c3022e57cdab37102b006c87d09090': f33,
+    '1244b84e1596d4afb3ef8f599224fd60': f34,
+    'e8040b99c4f1cfb961703a88125e6fc4': f35,
+    '6f394ec156af2fd9b356a2b27098628f': f36,
+    'c4f0d828b38498f3070525e1e3ac6356': f37,
+    'f83f97e22d7f0190f4e15f9842eb0eae': f38,
+    '6ac18bb6977bc39b9b287cb3fbf4e51a': f39,
+    'cd9ee687b0cdf83fedd4f75dc34a9204': f40,
+    '004d1f460a3abb4154bdf6c71ae86e59': f41,
+    '52c3331949df3ec8134729d63f18fd67': f42,
+    'cdb008bef207487525ce231473be119d': f43,
+    'c09a1b6cfbbfde13125276a5da627e2b': f44,
+    '580a516341db137631784f1ca33be02a': f45,
+    '53e35f44d13b1cfbd9d50cddb388397f': f46,
+    '9b5b8aac7e5549fdbf96301b8831651e': f47,
+    'a23e3eba9051cc0a1d048a18dc2bfe20': f48,
+    '7832d881852821f56363ee5cfc9c1c24': f49,
+    '9bee799b32edd55180e4646d2b344d04': f50,
+    'ffc74c7dec5e2850f614e6b53e9f0677': f51,
+    'f584bb43f8d9ef89d2a6776d654ad71f': f52,
+    '29efc04128e1bc2cfa72911634c75947': f53,
+    '3949ed56da605a91b79975d223fd8018': f54,
+    '00368e594e1ede98c463f21c0b1f87d9': f55,
+    '6e24a68f936d314b89ae2538c3303e31': f56,
+    '1cbd667ff6116c832fecab87264d1c82': f57,
+    '7c615573814ed6a23170f60b6b069927': f58,
+    '12af1b54ba8b91089a42f0ae7972544c': f59,
+    '351e3b44f839f52ab79271bc060e60b2': f60,
+    '850842bb18ad517c622da10fc3724a80': f61,
+    'af115bd275a5dbf6eff91bd0a0be2016': f62,
+    'ea258402285a96973073966ade3755ab': f63,
+    '21a9dd180d2d9e7bdbbea4d4790b9911': f64,
+    'c3f76065f893652dbef08c562f1705ff': f65,
+    '1583842b320d0d329520c66ef1a78ef5': f66,
+    '6515696b98ec81a47e3a89f186a97c26': f67,
+    '8aee2494661f0d9c8ad4ff3653fbf006': f68,
+    'e253f3c623f2c8f59f2f60f8f3828141': f69,
+    '6450bbc6838e5bc02e632514b15a4fb7': f70,
+    '6ceaeadf00dcdc1f2d2be69541d8d0d5': f71,
+    '962e6cdf7efba3a0ebfe1550bf8e98e6': f72,
+    'b3df6344c60e506fb5202a1962b8540e': f73,
+    '37959c61e86d45147a63db5f2ca224ac': f74,
+    'a94c9fadf9afee7c363d415eb4e44371': f75,
+    '7323cf80841b0acd3a9079eeb7b6dd49': f76,
+    '9b54ff1195bf87c75525a9e954074b96': f77,
+    '556060587ff12518fc1aefd493eca30b': f78,
+    '1596db4a883c612497056e429dfb63b8': f79,
+    'c33df4677e2c1f3d85157cdb2172535f': f80,
+    '06301304f5b29a635196908509c5c33f': f81,
+    '86e3d404b0e4ea481d2fac65559f93d5': f82,
+    '5cbb51b7e1c48ddc33155c8169f19a0d': f83,
+    '7b187c9fb77c22b868f27b7042146b83': f84,
+    'b8872153b4a5b8b2142df73f43edf1fd': f85,
+    '676d2d37f607a387d6444d100a40e70e': f86,
+    '6b7b5becc3a0b7f4bdd6290b61478c33': f87,
+    '8f0232bf15e3008b9d19890d0295da59': f88,
+    '1fe7bacba8d971e99bd8fc01879edd80': f89,
+    '14222df4a47e136d11600b890adbd71a': f90,
+    '2544f93191a67def95d52884df3298c2': f91,
+    '9f6cceb065ac6f651669be766f1f42c2': f92,
+    '9fd58607a41b15c431da8be01979f3f4': f93,
+    'dea552f5bac67010f83acbca4b23c57e': f94,
+    'c3c1af52fa33a4c12a2edd8954cd8dfd': f95,
+    '53002ce83320042c0c55b2a8c58edff7': f96,
+    '47c3132b934b91fa8d31c766732b6964': f97,
+    '113bdc72dc512475f47ed140ebcc2cc1': f98,
+    '814abfb3e00da0a29f7ce833b4c54d2e': f99,
+    '078290290ef69f3e1d6a6039540b46f1': f100,
+    '7e7d0812469314fa0c3723c37c72ce6c': f101,
+    '5f3a2ef266d59805f81756d7df82a4dd': f102,
+    '49259e309a7e21db69afa9f31d1ab447': f103,
+    '24087cb58eedc1d5c00e887506c6d0f9': f104,
+    'e7e8793b7f597812df7a71c0c08d70fb': f105,
+    'd1f861e43bcac00db398bcabef60a740': f106,
+    '6e7a0c60d3b582460b6a176b91d9cd25': f107,
+    'd63ff67a3cb2a266beaf6a9a136b051d': f108,
+    '37e1084a45d0bcd6d0cb1f2d29443353': f109,
+    '78ff1ea9a8e88473f87c2a98e7468aee': f110,
+    '5790968900b06f2290e2f52d69807474': f111,
+    'ecff62c2ed9de96ce228b46647b8c4a9': f112,
+    'b4ee5015854d3d2cc914afccc76c872a': f113,
+    'df000c1ea3c3c5aef980e2a153669353': f114,
+    '20a2762c7c6240137e50ce7afe58591c': f115,
+    '3a5e4128e10ba20d4997aa144983b970': f116,
+    '1adac8bcbf6facd3889c6bd33cd27f91': f117,
+    'decce5d7c72274fb97324b72d0d8d696': f118,
+    'a301d006111642cef7e25591ccee77fe': f119,
+    '02dd849288408bdf5a1f13bb5f245fce': f120,
+    'ee1544a81f0dbe28bff345a6986fdfc7': f121,
+    '802e540b3a8a03cb1ae2f9f8c5438d5f': f122,
+    '2f9bf3b876e354c304d3debb95c84093': f123,
+    '258b93f2a4a3be4119c9c956cda3e478': f124,
+    '8f1a97b20c0d422ed6e47128793a6581': f125,
+    'd67c3ea31ced1c47518d66522c317d9e': f126,
+    '9a6bf1f54cae871e9acd9fc577e43011': f127,
+    '78852f1845781573f1a8b3b43b7b5d1c': f128,
+    'ee7076e0aa11a49394b58da211eb6ebc': f129,
+    'b0fe53ba1c2d620e9e4532ad872e0bd4': f130,
+    'ae9fa87cfc8e2ef124a34f0b284311d7': f131,
+    'c508ef213b38a74067ad37d1b9ac5e40': f132,
+    'eaad864932fbdf1d7fb2e281cf7ed850': f133,
+    'd1a136243444c761807f197982a420fd': f134,
+    '68e550fb31fe68a01c5959d04aa7a722': f135,
+    '85395490a51773c4206027c1fa0137f7': f136,
+    '8c2e25cda1abfc1371c25694831a5e70': f137,
+    '3b6e89dddcca2cdd5579db5fddc69fc8': f138,
+    'ab38d9895d6b111114bdb14843855946': f139,
+    'eb0865e5e3eaf56b199ab2d3af5c14f5': f140,
+    '4d16678ad4518be72ea79237c9f2bb38': f141,
+    'e434a10d8bad52bb1c4c9b151bc78ca2': f142,
+    'f21c39c2a9014fa949c6e60bea825584': f143,
+    '76567a2a8a58dab77200bdce4c07e5d5': f144,
+    'bc844a68120bdb9970e61f8168ba7889': f145,
+    '003bfaf278abb7f5d8a89b4c0bc0731a': f146,
+    '17168ae5c5eb7c87c6b0d53cf5a781cb': f147,
+    '69b5b697f979670e5130c223f12489cf': f148,
+    '4305e0e2d9d33da0b388b7e22b2d621f': f149,
+    'd8ba56dbceb15bf59b0cf41da6b3fc9a': f150,
+    '72f35d49c4d5f99572fe67a745c1320a': f151,
+    '958973cb7390d8ea727837f53900ac3b': f152,
+    '9b994f318aabd275614f5566466cad6b': f153,
+    '58c912699484e46c2dde9e5be0cdbec0': f154,
+}
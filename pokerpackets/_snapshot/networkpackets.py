@@ -0,0 +1,8740 @@
+# generated by python -m pokerpackets.packetexport --snapshot, do not edit
+# pylint: skip-file
+
+FIELDS = {
+    ('pokerpackets.networkpackets', 'PacketPokerSeats'): ((('seats', [], 'Il'), ('game_id', 0, 'I')), [('seats', 'Il'), ('game_id', 'I')], [('seats', 'Il'), ('game_id', 'I')], {'seats': (3, 'Il')}),
+    ('pokerpackets.networkpackets', 'PacketPokerId'): ((('serial', 0, 'I'), ('game_id', 0, 'I')), [('serial', 'I'), ('game_id', 'I')], [('serial', 'I'), ('game_id', 'I')], {'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerMessage'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('string', '', 's')), [('serial', 'I'), ('game_id', 'I'), ('string', 's')], [('serial', 'I'), ('game_id', 'I'), ('string', 's')], {'game_id': (7, 'I'), 'serial': (3, 'I'), 'string': (11, 's')}),
+    ('pokerpackets.networkpackets', 'PacketPokerError'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('message', 'no message', 's'), ('code', 0, 'I'), ('other_type', 53, 'B')), [('serial', 'I'), ('game_id', 'I'), ('message', 's'), ('code', 'I'), ('other_type', 'B')], [('serial', 'I'), ('game_id', 'I'), ('message', 's'), ('code', 'I'), ('other_type', 'B')], {'game_id': (7, 'I'), 'message': (11, 's'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerPosition'): ((('game_id', 0, 'I'), ('position', -1, 'b'), ('serial', 0, 'I')), [('game_id', 'I'), ('position', 'b'), ('serial', 'I')], [('game_id', 'I'), ('position', 'b'), ('serial', 'I')], {'game_id': (3, 'I'), 'position': (7, 'b'), 'serial': (8, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerInt'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('amount', 0, 'I')), [('serial', 'I'), ('game_id', 'I'), ('amount', 'I')], [('serial', 'I'), ('game_id', 'I'), ('amount', 'I')], {'amount': (11, 'I'), 'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerBet'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('amount', 0, 'I')), [('serial', 'I'), ('game_id', 'I'), ('amount', 'I')], [('serial', 'I'), ('game_id', 'I'), ('amount', 'I')], {'amount': (11, 'I'), 'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerFold'): ((('serial', 0, 'I'), ('game_id', 0, 'I')), [('serial', 'I'), ('game_id', 'I')], [('serial', 'I'), ('game_id', 'I')], {'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerState'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('string', '', 's')), [('serial', 'I'), ('game_id', 'I'), ('string', 's')], [('serial', 'I'), ('game_id', 'I'), ('string', 's')], {'game_id': (7, 'I'), 'serial': (3, 'I'), 'string': (11, 's')}),
+    ('pokerpackets.networkpackets', 'PacketPokerWin'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('serials', [], 'Il')), [('serial', 'I'), ('game_id', 'I'), ('serials', 'Il')], [('serial', 'I'), ('game_id', 'I'), ('serials', 'Il')], {'game_id': (7, 'I'), 'serial': (3, 'I'), 'serials': (11, 'Il')}),
+    ('pokerpackets.networkpackets', 'PacketPokerCards'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('cards', [], 'Bl')), [('serial', 'I'), ('game_id', 'I'), ('cards', 'Bl')], [('serial', 'I'), ('game_id', 'I'), ('cards', 'Bl')], {'cards': (11, 'Bl'), 'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerPlayerCards'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('cards', [], 'Bl')), [('serial', 'I'), ('game_id', 'I'), ('cards', 'Bl')], [('serial', 'I'), ('game_id', 'I'), ('cards', 'Bl')], {'cards': (11, 'Bl'), 'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerBoardCards'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('cards', [], 'Bl')), [('serial', 'I'), ('game_id', 'I'), ('cards', 'Bl')], [('serial', 'I'), ('game_id', 'I'), ('cards', 'Bl')], {'cards': (11, 'Bl'), 'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerChips'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('bet', 0, 'Q')), [('serial', 'I'), ('game_id', 'I'), ('bet', 'Q')], [('serial', 'I'), ('game_id', 'I'), ('bet', 'Q')], {'bet': (11, 'Q'), 'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerPlayerChips'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('bet', 0, 'Q'), ('money', 0, 'Q')), [('serial', 'I'), ('game_id', 'I'), ('bet', 'Q'), ('money', 'Q')], [('serial', 'I'), ('game_id', 'I'), ('bet', 'Q'), ('money', 'Q')], {'bet': (11, 'Q'), 'game_id': (7, 'I'), 'money': (19, 'Q'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerCheck'): ((('serial', 0, 'I'), ('game_id', 0, 'I')), [('serial', 'I'), ('game_id', 'I')], [('serial', 'I'), ('game_id', 'I')], {'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerStart'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('hands_count', 0, 'I'), ('time', 0, 'I'), ('hand_serial', 0, 'I'), ('level', 0, 'B')), [('serial', 'I'), ('game_id', 'I'), ('hands_count', 'I'), ('time', 'I'), ('hand_serial', 'I'), ('level', 'B')], [('serial', 'I'), ('game_id', 'I'), ('hands_count', 'I'), ('time', 'I'), ('hand_serial', 'I'), ('level', 'B')], {'game_id': (7, 'I'), 'hand_serial': (19, 'I'), 'hands_count': (11, 'I'), 'level': (23, 'B'), 'serial': (3, 'I'), 'time': (15, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerInGame'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('players', [], 'Il')), [('serial', 'I'), ('game_id', 'I'), ('players', 'Il')], [('serial', 'I'), ('game_id', 'I'), ('players', 'Il')], {'game_id': (7, 'I'), 'players': (11, 'Il'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerCall'): ((('serial', 0, 'I'), ('game_id', 0, 'I')), [('serial', 'I'), ('game_id', 'I')], [('serial', 'I'), ('game_id', 'I')], {'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerRaise'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('amount', 0, 'I')), [('serial', 'I'), ('game_id', 'I'), ('amount', 'I')], [('serial', 'I'), ('game_id', 'I'), ('amount', 'I')], {'amount': (11, 'I'), 'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerDealer'): ((('game_id', 0, 'I'), ('dealer', -1, 'b'), ('previous_dealer', -1, 'b')), [('game_id', 'I'), ('dealer', 'b'), ('previous_dealer', 'b')], [('game_id', 'I'), ('dealer', 'b'), ('previous_dealer', 'b')], {'dealer': (7, 'b'), 'game_id': (3, 'I'), 'previous_dealer': (8, 'b')}),
+    ('pokerpackets.networkpackets', 'PacketPokerTableJoin'): ((('serial', 0, 'I'), ('game_id', 0, 'I')), [('serial', 'I'), ('game_id', 'I')], [('serial', 'I'), ('game_id', 'I')], {'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerTableSelect'): ((('string', '', 's'),), [('string', 's')], [('string', 's')], {'string': (3, 's')}),
+    ('pokerpackets.networkpackets', 'PacketPokerTable'): ((('id', 0, 'I'), ('seats', 10, 'B'), ('average_pot', 0, 'I'), ('hands_per_hour', 0, 'H'), ('percent_flop', 0, 'B'), ('players', 0, 'B'), ('observers', 0, 'H'), ('waiting', 0, 'B'), ('player_timeout', 0, 'H'), ('muck_timeout', 0, 'H'), ('currency_serial', 0, 'I'), ('name', 'noname', 's'), ('variant', 'holdem', 's'), ('betting_structure', '1-2_20-200_limit', 's'), ('skin', 'default', 's'), ('reason', '', 's'), ('tourney_serial', 0, 'I'), ('player_seated', -1, 'no net')), [('id', 'I'), ('seats', 'B'), ('average_pot', 'I'), ('hands_per_hour', 'H'), ('percent_flop', 'B'), ('players', 'B'), ('observers', 'H'), ('waiting', 'B'), ('player_timeout', 'H'), ('muck_timeout', 'H'), ('currency_serial', 'I'), ('name', 's'), ('variant', 's'), ('betting_structure', 's'), ('skin', 's'), ('reason', 's'), ('tourney_serial', 'I')], [('id', 'I'), ('seats', 'B'), ('average_pot', 'I'), ('hands_per_hour', 'H'), ('percent_flop', 'B'), ('players', 'B'), ('observers', 'H'), ('waiting', 'B'), ('player_timeout', 'H'), ('muck_timeout', 'H'), ('currency_serial', 'I'), ('name', 's'), ('variant', 's'), ('betting_structure', 's'), ('skin', 's'), ('reason', 's'), ('tourney_serial', 'I')], {'average_pot': (8, 'I'), 'currency_serial': (23, 'I'), 'hands_per_hour': (12, 'H'), 'id': (3, 'I'), 'muck_timeout': (21, 'H'), 'name': (27, 's'), 'observers': (16, 'H'), 'percent_flop': (14, 'B'), 'player_timeout': (19, 'H'), 'players': (15, 'B'), 'seats': (7, 'B'), 'waiting': (18, 'B')}),
+    ('pokerpackets.networkpackets', 'PacketPokerTableList'): ((('packets', [], 'pl'), ('players', 0, 'I'), ('tables', 0, 'I')), [('packets', 'pl'), ('players', 'I'), ('tables', 'I')], [('packets', 'pl'), ('players', 'I'), ('tables', 'I')], {'packets': (3, 'pl')}),
+    ('pokerpackets.networkpackets', 'PacketPokerSit'): ((('serial', 0, 'I'), ('game_id', 0, 'I')), [('serial', 'I'), ('game_id', 'I')], [('serial', 'I'), ('game_id', 'I')], {'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerTableDestroy'): ((('serial', 0, 'I'), ('game_id', 0, 'I')), [('serial', 'I'), ('game_id', 'I')], [('serial', 'I'), ('game_id', 'I')], {'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerTimeoutWarning'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('timeout', 0, 'I'), ('when', -1, 'no net')), [('serial', 'I'), ('game_id', 'I'), ('timeout', 'I')], [('serial', 'I'), ('game_id', 'I'), ('timeout', 'I')], {'game_id': (7, 'I'), 'serial': (3, 'I'), 'timeout': (11, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerTimeoutNotice'): ((('serial', 0, 'I'), ('game_id', 0, 'I')), [('serial', 'I'), ('game_id', 'I')], [('serial', 'I'), ('game_id', 'I')], {'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerSeat'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('seat', -1, 'b')), [('serial', 'I'), ('game_id', 'I'), ('seat', 'b')], [('serial', 'I'), ('game_id', 'I'), ('seat', 'b')], {'game_id': (7, 'I'), 'seat': (11, 'b'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerTableMove'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('seat', -1, 'b'), ('to_game_id', 0, 'I')), [('serial', 'I'), ('game_id', 'I'), ('seat', 'b'), ('to_game_id', 'I')], [('serial', 'I'), ('game_id', 'I'), ('seat', 'b'), ('to_game_id', 'I')], {'game_id': (7, 'I'), 'seat': (11, 'b'), 'serial': (3, 'I'), 'to_game_id': (12, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerPlayerLeave'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('seat', -1, 'b')), [('serial', 'I'), ('game_id', 'I'), ('seat', 'b')], [('serial', 'I'), ('game_id', 'I'), ('seat', 'b')], {'game_id': (7, 'I'), 'seat': (11, 'b'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerSitOut'): ((('serial', 0, 'I'), ('game_id', 0, 'I')), [('serial', 'I'), ('game_id', 'I')], [('serial', 'I'), ('game_id', 'I')], {'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerTableQuit'): ((('serial', 0, 'I'), ('game_id', 0, 'I')), [('serial', 'I'), ('game_id', 'I')], [('serial', 'I'), ('game_id', 'I')], {'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerBuyIn'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('amount', 0, 'I')), [('serial', 'I'), ('game_id', 'I'), ('amount', 'I')], [('serial', 'I'), ('game_id', 'I'), ('amount', 'I')], {'amount': (11, 'I'), 'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerRebuy'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('amount', 0, 'I')), [('serial', 'I'), ('game_id', 'I'), ('amount', 'I')], [('serial', 'I'), ('game_id', 'I'), ('amount', 'I')], {'amount': (11, 'I'), 'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerChat'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('message', '', 's')), [('serial', 'I'), ('game_id', 'I'), ('message', 's')], [('serial', 'I'), ('game_id', 'I'), ('message', 's')], {'game_id': (7, 'I'), 'message': (11, 's'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerPlayerInfo'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('name', 'noname', 's'), ('outfit', '', 's'), ('url', '', 's')), [('serial', 'I'), ('game_id', 'I'), ('name', 's'), ('outfit', 's'), ('url', 's')], [('serial', 'I'), ('game_id', 'I'), ('name', 's'), ('outfit', 's'), ('url', 's')], {'game_id': (7, 'I'), 'name': (11, 's'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerPlayerArrive'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('name', 'noname', 's'), ('outfit', '', 's'), ('url', '', 's'), ('blind', 'late', 'bs'), ('remove_next_turn', False, 'bool'), ('sit_out', True, 'bool'), ('sit_out_next_turn', False, 'bool'), ('auto', False, 'bool'), ('auto_blind_ante', False, 'bool'), ('wait_for', False, 'bool'), ('buy_in_payed', False, 'bool'), ('seat', None, 'Bnone')), [('serial', 'I'), ('game_id', 'I'), ('name', 's'), ('outfit', 's'), ('url', 's'), ('blind', 'bs'), ('remove_next_turn', 'bool'), ('sit_out', 'bool'), ('sit_out_next_turn', 'bool'), ('auto', 'bool'), ('auto_blind_ante', 'bool'), ('wait_for', 'bool'), ('buy_in_payed', 'bool'), ('seat', 'Bnone')], [('serial', 'I'), ('game_id', 'I'), ('name', 's'), ('outfit', 's'), ('url', 's'), ('blind', 'bs'), ('remove_next_turn', 'bool'), ('sit_out', 'bool'), ('sit_out_next_turn', 'bool'), ('auto', 'bool'), ('auto_blind_ante', 'bool'), ('wait_for', 'bool'), ('buy_in_payed', 'bool'), ('seat', 'Bnone')], {'game_id': (7, 'I'), 'name': (11, 's'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerHandSelect'): ((('string', '', 's'), ('start', 0, 'I'), ('count', 50, 'B')), [('string', 's'), ('start', 'I'), ('count', 'B')], [('string', 's'), ('start', 'I'), ('count', 'B')], {'string': (3, 's')}),
+    ('pokerpackets.networkpackets', 'PacketPokerHandList'): ((('string', '', 's'), ('start', 0, 'I'), ('count', 50, 'B'), ('hands', [], 'Il'), ('total', 0, 'I')), [('string', 's'), ('start', 'I'), ('count', 'B'), ('hands', 'Il'), ('total', 'I')], [('string', 's'), ('start', 'I'), ('count', 'B'), ('hands', 'Il'), ('total', 'I')], {'string': (3, 's')}),
+    ('pokerpackets.networkpackets', 'PacketPokerHandSelectAll'): ((('string', '', 's'),), [('string', 's')], [('string', 's')], {'string': (3, 's')}),
+    ('pokerpackets.networkpackets', 'PacketPokerUserInfo'): ((('serial', 0, 'I'), ('rating', 1500, 'I'), ('affiliate', 0, 'I'), ('name', 'unknown', 's'), ('password', '', 's'), ('email', '', 's'), ('money', {}, 'money')), [('serial', 'I'), ('rating', 'I'), ('affiliate', 'I'), ('name', 's'), ('password', 's'), ('email', 's'), ('money', 'money')], [('serial', 'I'), ('rating', 'I'), ('affiliate', 'I'), ('name', 's'), ('password', 's'), ('email', 's'), ('money', 'money')], {'affiliate': (11, 'I'), 'name': (15, 's'), 'rating': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerGetUserInfo'): ((('serial', 0, 'I'),), [('serial', 'I')], [('serial', 'I')], {'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerAnte'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('amount', 0, 'I')), [('serial', 'I'), ('game_id', 'I'), ('amount', 'I')], [('serial', 'I'), ('game_id', 'I'), ('amount', 'I')], {'amount': (11, 'I'), 'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerBlind'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('amount', 0, 'I'), ('dead', 0, 'I')), [('serial', 'I'), ('game_id', 'I'), ('amount', 'I'), ('dead', 'I')], [('serial', 'I'), ('game_id', 'I'), ('amount', 'I'), ('dead', 'I')], {'amount': (11, 'I'), 'dead': (15, 'I'), 'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerWaitBigBlind'): ((('serial', 0, 'I'), ('game_id', 0, 'I')), [('serial', 'I'), ('game_id', 'I')], [('serial', 'I'), ('game_id', 'I')], {'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerAutoBlindAnte'): ((('serial', 0, 'I'), ('game_id', 0, 'I')), [('serial', 'I'), ('game_id', 'I')], [('serial', 'I'), ('game_id', 'I')], {'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerNoautoBlindAnte'): ((('serial', 0, 'I'), ('game_id', 0, 'I')), [('serial', 'I'), ('game_id', 'I')], [('serial', 'I'), ('game_id', 'I')], {'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerCanceled'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('amount', 0, 'I')), [('serial', 'I'), ('game_id', 'I'), ('amount', 'I')], [('serial', 'I'), ('game_id', 'I'), ('amount', 'I')], {'amount': (11, 'I'), 'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerBlindRequest'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('amount', 0, 'I'), ('dead', 0, 'I'), ('state', 'unknown', 's')), [('serial', 'I'), ('game_id', 'I'), ('amount', 'I'), ('dead', 'I'), ('state', 's')], [('serial', 'I'), ('game_id', 'I'), ('amount', 'I'), ('dead', 'I'), ('state', 's')], {'amount': (11, 'I'), 'dead': (15, 'I'), 'game_id': (7, 'I'), 'serial': (3, 'I'), 'state': (19, 's')}),
+    ('pokerpackets.networkpackets', 'PacketPokerAnteRequest'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('amount', 0, 'I')), [('serial', 'I'), ('game_id', 'I'), ('amount', 'I')], [('serial', 'I'), ('game_id', 'I'), ('amount', 'I')], {'amount': (11, 'I'), 'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerAutoFold'): ((('serial', 0, 'I'), ('game_id', 0, 'I')), [('serial', 'I'), ('game_id', 'I')], [('serial', 'I'), ('game_id', 'I')], {'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerWaitFor'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('reason', '', 'bs')), [('serial', 'I'), ('game_id', 'I'), ('reason', 'bs')], [('serial', 'I'), ('game_id', 'I'), ('reason', 'bs')], {'game_id': (7, 'I'), 'reason': (11, 'bs'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerStreamMode'): ((('serial', 0, 'I'), ('game_id', 0, 'I')), [('serial', 'I'), ('game_id', 'I')], [('serial', 'I'), ('game_id', 'I')], {'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerBatchMode'): ((('serial', 0, 'I'), ('game_id', 0, 'I')), [('serial', 'I'), ('game_id', 'I')], [('serial', 'I'), ('game_id', 'I')], {'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerLookCards'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('state', 'on', 'no net')), [('serial', 'I'), ('game_id', 'I')], [('serial', 'I'), ('game_id', 'I')], {'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerTableRequestPlayersList'): ((('serial', 0, 'I'), ('game_id', 0, 'I')), [('serial', 'I'), ('game_id', 'I')], [('serial', 'I'), ('game_id', 'I')], {'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerPlayersList'): ((('game_id', 0, 'I'), ('players', [], 'players')), [('game_id', 'I'), ('players', 'players')], [('game_id', 'I'), ('players', 'players')], {'game_id': (3, 'I'), 'players': (7, 'players')}),
+    ('pokerpackets.networkpackets', 'PacketPokerPersonalInfo'): ((('serial', 0, 'I'), ('rating', 1500, 'I'), ('affiliate', 0, 'I'), ('name', 'unknown', 's'), ('password', '', 's'), ('email', '', 's'), ('money', {}, 'money'), ('firstname', '', 's'), ('lastname', '', 's'), ('addr_street', '', 's'), ('addr_street2', '', 's'), ('addr_zip', '', 's'), ('addr_town', '', 's'), ('addr_state', '', 's'), ('addr_country', '', 's'), ('phone', '', 's'), ('gender', '', 's'), ('birthdate', '', 's')), [('serial', 'I'), ('rating', 'I'), ('affiliate', 'I'), ('name', 's'), ('password', 's'), ('email', 's'), ('money', 'money'), ('firstname', 's'), ('lastname', 's'), ('addr_street', 's'), ('addr_street2', 's'), ('addr_zip', 's'), ('addr_town', 's'), ('addr_state', 's'), ('addr_country', 's'), ('phone', 's'), ('gender', 's'), ('birthdate', 's')], [('serial', 'I'), ('rating', 'I'), ('affiliate', 'I'), ('name', 's'), ('password', 's'), ('email', 's'), ('money', 'money'), ('firstname', 's'), ('lastname', 's'), ('addr_street', 's'), ('addr_street2', 's'), ('addr_zip', 's'), ('addr_town', 's'), ('addr_state', 's'), ('addr_country', 's'), ('phone', 's'), ('gender', 's'), ('birthdate', 's')], {'affiliate': (11, 'I'), 'name': (15, 's'), 'rating': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerGetPersonalInfo'): ((('serial', 0, 'I'),), [('serial', 'I')], [('serial', 'I')], {'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerTourneySelect'): ((('string', '', 's'),), [('string', 's')], [('string', 's')], {'string': (3, 's')}),
+    ('pokerpackets.networkpackets', 'PacketPokerTourney'): ((('serial', 0, 'I'), ('buy_in', 10, 'I'), ('rake', 0, 'I'), ('start_time', 0, 'I'), ('rebuy_time_remaining', 0, 'I'), ('kick_timeout', 0, 'I'), ('sit_n_go', 'y', 'cbool'), ('players_quota', 0, 'H'), ('registered', 0, 'H'), ('currency_serial', 0, 'I'), ('breaks_first', 0, 'H'), ('breaks_interval', 0, 'H'), ('breaks_duration', 0, 'H'), ('description_short', 'nodescription_short', 's'), ('variant', 'holdem', 's'), ('state', 'announced', 's'), ('name', 'noname', 's'), ('skin', 'default', 's'), ('schedule_serial', 0, 'I')), [('serial', 'I'), ('buy_in', 'I'), ('rake', 'I'), ('start_time', 'I'), ('rebuy_time_remaining', 'I'), ('kick_timeout', 'I'), ('sit_n_go', 'cbool'), ('players_quota', 'H'), ('registered', 'H'), ('currency_serial', 'I'), ('breaks_first', 'H'), ('breaks_interval', 'H'), ('breaks_duration', 'H'), ('description_short', 's'), ('variant', 's'), ('state', 's'), ('name', 's'), ('skin', 's'), ('schedule_serial', 'I')], [('serial', 'I'), ('buy_in', 'I'), ('rake', 'I'), ('start_time', 'I'), ('rebuy_time_remaining', 'I'), ('kick_timeout', 'I'), ('sit_n_go', 'cbool'), ('players_quota', 'H'), ('registered', 'H'), ('currency_serial', 'I'), ('breaks_first', 'H'), ('breaks_interval', 'H'), ('breaks_duration', 'H'), ('description_short', 's'), ('variant', 's'), ('state', 's'), ('name', 's'), ('skin', 's'), ('schedule_serial', 'I')], {'breaks_duration': (40, 'H'), 'breaks_first': (36, 'H'), 'breaks_interval': (38, 'H'), 'buy_in': (7, 'I'), 'currency_serial': (32, 'I'), 'description_short': (42, 's'), 'kick_timeout': (23, 'I'), 'players_quota': (28, 'H'), 'rake': (11, 'I'), 'rebuy_time_remaining': (19, 'I'), 'registered': (30, 'H'), 'serial': (3, 'I'), 'sit_n_go': (27, 'cbool'), 'start_time': (15, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerTourneyInfo'): ((('serial', 0, 'I'), ('buy_in', 10, 'I'), ('rake', 0, 'I'), ('start_time', 0, 'I'), ('rebuy_time_remaining', 0, 'I'), ('kick_timeout', 0, 'I'), ('sit_n_go', 'y', 'cbool'), ('players_quota', 0, 'H'), ('registered', 0, 'H'), ('currency_serial', 0, 'I'), ('breaks_first', 0, 'H'), ('breaks_interval', 0, 'H'), ('breaks_duration', 0, 'H'), ('description_short', 'nodescription_short', 's'), ('variant', 'holdem', 's'), ('state', 'announced', 's'), ('name', 'noname', 's'), ('skin', 'default', 's'), ('schedule_serial', 0, 'I'), ('description_long', 'no long description', 's')), [('serial', 'I'), ('buy_in', 'I'), ('rake', 'I'), ('start_time', 'I'), ('rebuy_time_remaining', 'I'), ('kick_timeout', 'I'), ('sit_n_go', 'cbool'), ('players_quota', 'H'), ('registered', 'H'), ('currency_serial', 'I'), ('breaks_first', 'H'), ('breaks_interval', 'H'), ('breaks_duration', 'H'), ('description_short', 's'), ('variant', 's'), ('state', 's'), ('name', 's'), ('skin', 's'), ('schedule_serial', 'I'), ('description_long', 's')], [('serial', 'I'), ('buy_in', 'I'), ('rake', 'I'), ('start_time', 'I'), ('rebuy_time_remaining', 'I'), ('kick_timeout', 'I'), ('sit_n_go', 'cbool'), ('players_quota', 'H'), ('registered', 'H'), ('currency_serial', 'I'), ('breaks_first', 'H'), ('breaks_interval', 'H'), ('breaks_duration', 'H'), ('description_short', 's'), ('variant', 's'), ('state', 's'), ('name', 's'), ('skin', 's'), ('schedule_serial', 'I'), ('description_long', 's')], {'breaks_duration': (40, 'H'), 'breaks_first': (36, 'H'), 'breaks_interval': (38, 'H'), 'buy_in': (7, 'I'), 'currency_serial': (32, 'I'), 'description_short': (42, 's'), 'kick_timeout': (23, 'I'), 'players_quota': (28, 'H'), 'rake': (11, 'I'), 'rebuy_time_remaining': (19, 'I'), 'registered': (30, 'H'), 'serial': (3, 'I'), 'sit_n_go': (27, 'cbool'), 'start_time': (15, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerTourneyList'): ((('packets', [], 'pl'), ('players', 0, 'I'), ('tourneys', 0, 'I')), [('packets', 'pl'), ('players', 'I'), ('tourneys', 'I')], [('packets', 'pl'), ('players', 'I'), ('tourneys', 'I')], {'packets': (3, 'pl')}),
+    ('pokerpackets.networkpackets', 'PacketPokerTourneyRequestPlayersList'): ((('serial', 0, 'I'), ('tourney_serial', 0, 'I')), [('serial', 'I'), ('tourney_serial', 'I')], [('serial', 'I'), ('tourney_serial', 'I')], {'serial': (3, 'I'), 'tourney_serial': (7, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerTourneyRegister'): ((('serial', 0, 'I'), ('tourney_serial', 0, 'I')), [('serial', 'I'), ('tourney_serial', 'I')], [('serial', 'I'), ('tourney_serial', 'I')], {'serial': (3, 'I'), 'tourney_serial': (7, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerTourneyUnregister'): ((('serial', 0, 'I'), ('tourney_serial', 0, 'I')), [('serial', 'I'), ('tourney_serial', 'I')], [('serial', 'I'), ('tourney_serial', 'I')], {'serial': (3, 'I'), 'tourney_serial': (7, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerTourneyPlayersList'): ((('tourney_serial', 0, 'I'), ('players', [], 'players')), [('tourney_serial', 'I'), ('players', 'players')], [('tourney_serial', 'I'), ('players', 'players')], {'players': (7, 'players'), 'tourney_serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerHandHistory'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('history', '', 's'), ('serial2name', '', 's')), [('serial', 'I'), ('game_id', 'I'), ('history', 's'), ('serial2name', 's')], [('serial', 'I'), ('game_id', 'I'), ('history', 's'), ('serial2name', 's')], {'game_id': (7, 'I'), 'history': (11, 's'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerSetAccount'): ((('serial', 0, 'I'), ('rating', 1500, 'I'), ('affiliate', 0, 'I'), ('name', 'unknown', 's'), ('password', '', 's'), ('email', '', 's'), ('money', {}, 'money'), ('firstname', '', 's'), ('lastname', '', 's'), ('addr_street', '', 's'), ('addr_street2', '', 's'), ('addr_zip', '', 's'), ('addr_town', '', 's'), ('addr_state', '', 's'), ('addr_country', '', 's'), ('phone', '', 's'), ('gender', '', 's'), ('birthdate', '', 's')), [('serial', 'I'), ('rating', 'I'), ('affiliate', 'I'), ('name', 's'), ('password', 's'), ('email', 's'), ('money', 'money'), ('firstname', 's'), ('lastname', 's'), ('addr_street', 's'), ('addr_street2', 's'), ('addr_zip', 's'), ('addr_town', 's'), ('addr_state', 's'), ('addr_country', 's'), ('phone', 's'), ('gender', 's'), ('birthdate', 's')], [('serial', 'I'), ('rating', 'I'), ('affiliate', 'I'), ('name', 's'), ('password', 's'), ('email', 's'), ('money', 'money'), ('firstname', 's'), ('lastname', 's'), ('addr_street', 's'), ('addr_street2', 's'), ('addr_zip', 's'), ('addr_town', 's'), ('addr_state', 's'), ('addr_country', 's'), ('phone', 's'), ('gender', 's'), ('birthdate', 's')], {'affiliate': (11, 'I'), 'name': (15, 's'), 'rating': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerCreateAccount'): ((('serial', 0, 'I'), ('rating', 1500, 'I'), ('affiliate', 0, 'I'), ('name', 'unknown', 's'), ('password', '', 's'), ('email', '', 's'), ('money', {}, 'money'), ('firstname', '', 's'), ('lastname', '', 's'), ('addr_street', '', 's'), ('addr_street2', '', 's'), ('addr_zip', '', 's'), ('addr_town', '', 's'), ('addr_state', '', 's'), ('addr_country', '', 's'), ('phone', '', 's'), ('gender', '', 's'), ('birthdate', '', 's')), [('serial', 'I'), ('rating', 'I'), ('affiliate', 'I'), ('name', 's'), ('password', 's'), ('email', 's'), ('money', 'money'), ('firstname', 's'), ('lastname', 's'), ('addr_street', 's'), ('addr_street2', 's'), ('addr_zip', 's'), ('addr_town', 's'), ('addr_state', 's'), ('addr_country', 's'), ('phone', 's'), ('gender', 's'), ('birthdate', 's')], [('serial', 'I'), ('rating', 'I'), ('affiliate', 'I'), ('name', 's'), ('password', 's'), ('email', 's'), ('money', 'money'), ('firstname', 's'), ('lastname', 's'), ('addr_street', 's'), ('addr_street2', 's'), ('addr_zip', 's'), ('addr_town', 's'), ('addr_state', 's'), ('addr_country', 's'), ('phone', 's'), ('gender', 's'), ('birthdate', 's')], {'affiliate': (11, 'I'), 'name': (15, 's'), 'rating': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerPlayerSelf'): ((('serial', 0, 'I'), ('game_id', 0, 'I')), [('serial', 'I'), ('game_id', 'I')], [('serial', 'I'), ('game_id', 'I')], {'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerGetPlayerInfo'): ((), [], [], {}),
+    ('pokerpackets.networkpackets', 'PacketPokerRoles'): ((('serial', 0, 'I'), ('roles', '', 's')), [('serial', 'I'), ('roles', 's')], [('serial', 'I'), ('roles', 's')], {'roles': (7, 's'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerSetRole'): ((('serial', 0, 'I'), ('roles', '', 's')), [('serial', 'I'), ('roles', 's')], [('serial', 'I'), ('roles', 's')], {'roles': (7, 's'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerReadyToPlay'): ((('serial', 0, 'I'), ('game_id', 0, 'I')), [('serial', 'I'), ('game_id', 'I')], [('serial', 'I'), ('game_id', 'I')], {'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerProcessingHand'): ((('serial', 0, 'I'), ('game_id', 0, 'I')), [('serial', 'I'), ('game_id', 'I')], [('serial', 'I'), ('game_id', 'I')], {'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerMuckRequest'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('muckable_serials', [], 'Il')), [('serial', 'I'), ('game_id', 'I'), ('muckable_serials', 'Il')], [('serial', 'I'), ('game_id', 'I'), ('muckable_serials', 'Il')], {'game_id': (7, 'I'), 'muckable_serials': (11, 'Il'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerAutoMuck'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('auto_muck', 255, 'B')), [('serial', 'I'), ('game_id', 'I'), ('auto_muck', 'B')], [('serial', 'I'), ('game_id', 'I'), ('auto_muck', 'B')], {'auto_muck': (11, 'B'), 'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerMuckAccept'): ((('serial', 0, 'I'), ('game_id', 0, 'I')), [('serial', 'I'), ('game_id', 'I')], [('serial', 'I'), ('game_id', 'I')], {'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerMuckDeny'): ((('serial', 0, 'I'), ('game_id', 0, 'I')), [('serial', 'I'), ('game_id', 'I')], [('serial', 'I'), ('game_id', 'I')], {'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerCashIn'): ((('serial', 0, 'I'), ('url', 'UNKNOWN', 's'), ('name', 'UNKNOWN', 's'), ('application_data', '', 's'), ('bserial', 0, 'I'), ('value', 0, 'I')), [('serial', 'I'), ('url', 's'), ('name', 's'), ('application_data', 's'), ('bserial', 'I'), ('value', 'I')], [('serial', 'I'), ('url', 's'), ('name', 's'), ('application_data', 's'), ('bserial', 'I'), ('value', 'I')], {'serial': (3, 'I'), 'url': (7, 's')}),
+    ('pokerpackets.networkpackets', 'PacketPokerCashOut'): ((('serial', 0, 'I'), ('url', 'UNKNOWN', 's'), ('name', 'UNKNOWN', 's'), ('application_data', '', 's'), ('bserial', 0, 'I'), ('value', 0, 'I')), [('serial', 'I'), ('url', 's'), ('name', 's'), ('application_data', 's'), ('bserial', 'I'), ('value', 'I')], [('serial', 'I'), ('url', 's'), ('name', 's'), ('application_data', 's'), ('bserial', 'I'), ('value', 'I')], {'serial': (3, 'I'), 'url': (7, 's')}),
+    ('pokerpackets.networkpackets', 'PacketPokerCashOutCommit'): ((('transaction_id', '', 's'),), [('transaction_id', 's')], [('transaction_id', 's')], {'transaction_id': (3, 's')}),
+    ('pokerpackets.networkpackets', 'PacketPokerCashQuery'): ((('application_data', '', 's'),), [('application_data', 's')], [('application_data', 's')], {'application_data': (3, 's')}),
+    ('pokerpackets.networkpackets', 'PacketPokerRake'): ((('value', 0, 'I'), ('game_id', 0, 'I')), [('value', 'I'), ('game_id', 'I')], [('value', 'I'), ('game_id', 'I')], {'game_id': (7, 'I'), 'value': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerTourneyRank'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('players', 0, 'I'), ('money', 0, 'I'), ('rank', 0, 'I'), ('currency_serial', 0, 'I')), [('serial', 'I'), ('game_id', 'I'), ('players', 'I'), ('money', 'I'), ('rank', 'I'), ('currency_serial', 'I')], [('serial', 'I'), ('game_id', 'I'), ('players', 'I'), ('money', 'I'), ('rank', 'I'), ('currency_serial', 'I')], {'currency_serial': (23, 'I'), 'game_id': (7, 'I'), 'money': (15, 'I'), 'players': (11, 'I'), 'rank': (19, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerHandReplay'): ((('serial', 0, 'I'), ('game_id', 0, 'I')), [('serial', 'I'), ('game_id', 'I')], [('serial', 'I'), ('game_id', 'I')], {'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerGameMessage'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('string', '', 's')), [('serial', 'I'), ('game_id', 'I'), ('string', 's')], [('serial', 'I'), ('game_id', 'I'), ('string', 's')], {'game_id': (7, 'I'), 'serial': (3, 'I'), 'string': (11, 's')}),
+    ('pokerpackets.networkpackets', 'PacketPokerExplain'): ((('value', 0, 'I'),), [('value', 'I')], [('value', 'I')], {'value': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerStatsQuery'): ((('string', '', 's'),), [('string', 's')], [('string', 's')], {'string': (3, 's')}),
+    ('pokerpackets.networkpackets', 'PacketPokerStats'): ((('players', 0, 'I'), ('hands', 0, 'I'), ('bytesin', 0, 'I'), ('bytesout', 0, 'I')), [('players', 'I'), ('hands', 'I'), ('bytesin', 'I'), ('bytesout', 'I')], [('players', 'I'), ('hands', 'I'), ('bytesin', 'I'), ('bytesout', 'I')], {'bytesin': (11, 'I'), 'bytesout': (15, 'I'), 'hands': (7, 'I'), 'players': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerBuyInLimits'): ((('game_id', 0, 'I'), ('min', 0, 'I'), ('max', 0, 'I'), ('best', 0, 'I'), ('rebuy_min', 0, 'I')), [('game_id', 'I'), ('min', 'I'), ('max', 'I'), ('best', 'I'), ('rebuy_min', 'I')], [('game_id', 'I'), ('min', 'I'), ('max', 'I'), ('best', 'I'), ('rebuy_min', 'I')], {'best': (15, 'I'), 'game_id': (3, 'I'), 'max': (11, 'I'), 'min': (7, 'I'), 'rebuy_min': (19, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerMonitor'): ((), [], [], {}),
+    ('pokerpackets.networkpackets', 'PacketPokerMonitorEvent'): ((('event', 0, 'I'), ('param1', 0, 'I'), ('param2', 0, 'I'), ('param3', 0, 'I')), [('event', 'I'), ('param1', 'I'), ('param2', 'I'), ('param3', 'I')], [('event', 'I'), ('param1', 'I'), ('param2', 'I'), ('param3', 'I')], {'event': (3, 'I'), 'param1': (7, 'I'), 'param2': (11, 'I'), 'param3': (15, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerGetTourneyManager'): ((('tourney_serial', 0, 'I'),), [('tourney_serial', 'I')], [('tourney_serial', 'I')], {'tourney_serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerTourneyManager'): ((), [], [], {}),
+    ('pokerpackets.networkpackets', 'PacketPokerAutoPlay'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('auto_play', 0, 'B')), [('serial', 'I'), ('game_id', 'I'), ('auto_play', 'B')], [('serial', 'I'), ('game_id', 'I'), ('auto_play', 'B')], {'auto_play': (11, 'B'), 'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerGetPlayerPlaces'): ((('serial', 0, 'I'), ('name', '', 's')), [('serial', 'I'), ('name', 's')], [('serial', 'I'), ('name', 's')], {'name': (7, 's'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerPlayerPlaces'): ((('serial', 0, 'I'), ('tables', [], 'Il'), ('tourneys', [], 'Il')), [('serial', 'I'), ('tables', 'Il'), ('tourneys', 'Il')], [('serial', 'I'), ('tables', 'Il'), ('tourneys', 'Il')], {'serial': (3, 'I'), 'tables': (7, 'Il')}),
+    ('pokerpackets.networkpackets', 'PacketPokerSetLocale'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('locale', 'en_US', 's')), [('serial', 'I'), ('game_id', 'I'), ('locale', 's')], [('serial', 'I'), ('game_id', 'I'), ('locale', 's')], {'game_id': (7, 'I'), 'locale': (11, 's'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerTableTourneyBreakBegin'): ((('game_id', 0, 'I'), ('resume_time', 0, 'I')), [('game_id', 'I'), ('resume_time', 'I')], [('game_id', 'I'), ('resume_time', 'I')], {'game_id': (3, 'I'), 'resume_time': (7, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerTableTourneyBreakDone'): ((('game_id', 0, 'I'),), [('game_id', 'I')], [('game_id', 'I')], {'game_id': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerTourneyStart'): ((('serial', 0, 'I'), ('tourney_serial', 0, 'I'), ('table_serial', 0, 'I')), [('serial', 'I'), ('tourney_serial', 'I'), ('table_serial', 'I')], [('serial', 'I'), ('tourney_serial', 'I'), ('table_serial', 'I')], {'serial': (3, 'I'), 'table_serial': (11, 'I'), 'tourney_serial': (7, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerGetTourneyPlayerStats'): ((('serial', 0, 'I'), ('tourney_serial', 0, 'I')), [('serial', 'I'), ('tourney_serial', 'I')], [('serial', 'I'), ('tourney_serial', 'I')], {'serial': (3, 'I'), 'tourney_serial': (7, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerTourneyPlayerStats'): ((('serial', 0, 'I'), ('tourney_serial', 0, 'I'), ('rank', 0, 'H'), ('players_active', 0, 'H'), ('chips_avg', 0, 'Q'), ('chips_max', 0, 'Q'), ('player_chips_max_serial', 0, 'I'), ('player_chips_max_name', 'noname', 's'), ('table_count', 0, 'I')), [('serial', 'I'), ('tourney_serial', 'I'), ('rank', 'H'), ('players_active', 'H'), ('chips_avg', 'Q'), ('chips_max', 'Q'), ('player_chips_max_serial', 'I'), ('player_chips_max_name', 's'), ('table_count', 'I')], [('serial', 'I'), ('tourney_serial', 'I'), ('rank', 'H'), ('players_active', 'H'), ('chips_avg', 'Q'), ('chips_max', 'Q'), ('player_chips_max_serial', 'I'), ('player_chips_max_name', 's'), ('table_count', 'I')], {'chips_avg': (15, 'Q'), 'chips_max': (23, 'Q'), 'player_chips_max_name': (35, 's'), 'player_chips_max_serial': (31, 'I'), 'players_active': (13, 'H'), 'rank': (11, 'H'), 'serial': (3, 'I'), 'tourney_serial': (7, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerTourneyCancel'): ((('serial', 0, 'I'), ('tourney_serial', 0, 'I')), [('serial', 'I'), ('tourney_serial', 'I')], [('serial', 'I'), ('tourney_serial', 'I')], {'serial': (3, 'I'), 'tourney_serial': (7, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerStateInformation'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('code', 0, 'I'), ('message', 'no message', 's')), [('serial', 'I'), ('game_id', 'I'), ('code', 'I'), ('message', 's')], [('serial', 'I'), ('game_id', 'I'), ('code', 'I'), ('message', 's')], {'code': (11, 'I'), 'game_id': (7, 'I'), 'message': (15, 's'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerPlayerStats'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('currency_serial', 0, 'I'), ('rank', 0, 'I'), ('percentile', 0, 'I')), [('serial', 'I'), ('game_id', 'I'), ('currency_serial', 'I'), ('rank', 'I'), ('percentile', 'I')], [('serial', 'I'), ('game_id', 'I'), ('currency_serial', 'I'), ('rank', 'I'), ('percentile', 'I')], {'currency_serial': (11, 'I'), 'game_id': (7, 'I'), 'percentile': (19, 'I'), 'rank': (15, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerTourneyRebuy'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('tourney_serial', 0, 'I')), [('serial', 'I'), ('game_id', 'I'), ('tourney_serial', 'I')], [('serial', 'I'), ('game_id', 'I'), ('tourney_serial', 'I')], {'game_id': (7, 'I'), 'serial': (3, 'I'), 'tourney_serial': (11, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerBetLimits'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('min', 0, 'I'), ('max', 0, 'I'), ('step', 0, 'I'), ('cap', 0, 'B'), ('limit', 0, 'B')), [('serial', 'I'), ('game_id', 'I'), ('min', 'I'), ('max', 'I'), ('step', 'I'), ('cap', 'B'), ('limit', 'B')], [('serial', 'I'), ('game_id', 'I'), ('min', 'I'), ('max', 'I'), ('step', 'I'), ('cap', 'B'), ('limit', 'B')], {'cap': (23, 'B'), 'game_id': (7, 'I'), 'limit': (24, 'B'), 'max': (15, 'I'), 'min': (11, 'I'), 'serial': (3, 'I'), 'step': (19, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerUpdateMoney'): ((('game_id', 0, 'I'), ('serials', [], 'Il'), ('chips', [], 'il'), ('absolute', True, 'bool')), [('game_id', 'I'), ('serials', 'Il'), ('chips', 'il'), ('absolute', 'bool')], [('game_id', 'I'), ('serials', 'Il'), ('chips', 'il'), ('absolute', 'bool')], {'game_id': (3, 'I'), 'serials': (7, 'Il')}),
+    ('pokerpackets.networkpackets', 'PacketPokerTablePicker'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('currency_serial', 0, 'I'), ('min_players', 0, 'I'), ('variant', '', 's'), ('betting_structure', '', 's'), ('auto_blind_ante', False, 'bool')), [('serial', 'I'), ('game_id', 'I'), ('currency_serial', 'I'), ('min_players', 'I'), ('variant', 's'), ('betting_structure', 's'), ('auto_blind_ante', 'bool')], [('serial', 'I'), ('game_id', 'I'), ('currency_serial', 'I'), ('min_players', 'I'), ('variant', 's'), ('betting_structure', 's'), ('auto_blind_ante', 'bool')], {'currency_serial': (11, 'I'), 'game_id': (7, 'I'), 'min_players': (15, 'I'), 'serial': (3, 'I'), 'variant': (19, 's')}),
+    ('pokerpackets.networkpackets', 'PacketPokerCreateTourney'): ((('serial', 0, 'I'), ('name', 'noname', 's'), ('description_short', 'nodescription_short', 's'), ('description_long', 'nodescription_long', 's'), ('players_quota', 0, 'I'), ('variant', 'holdem', 's'), ('betting_structure', 'level-001', 's'), ('skin', 'default', 's'), ('seats_per_game', 10, 'I'), ('player_timeout', 60, 'I'), ('currency_serial', 0, 'I'), ('prize_currency', 0, 'I'), ('prize_min', 0, 'I'), ('bailor_serial', 0, 'I'), ('buy_in', 0, 'I'), ('rake', 0, 'I'), ('sit_n_go', 'y', 'cbool'), ('start_time', 0, 'I'), ('players', [], 'Il'), ('breaks_duration', 0, 'I'), ('breaks_first', 7200, 'I'), ('breaks_interval', 3600, 'I'), ('schedule_serial', 0, 'I')), [('serial', 'I'), ('name', 's'), ('description_short', 's'), ('description_long', 's'), ('players_quota', 'I'), ('variant', 's'), ('betting_structure', 's'), ('skin', 's'), ('seats_per_game', 'I'), ('player_timeout', 'I'), ('currency_serial', 'I'), ('prize_currency', 'I'), ('prize_min', 'I'), ('bailor_serial', 'I'), ('buy_in', 'I'), ('rake', 'I'), ('sit_n_go', 'cbool'), ('start_time', 'I'), ('players', 'Il'), ('breaks_duration', 'I'), ('breaks_first', 'I'), ('breaks_interval', 'I'), ('schedule_serial', 'I')], [('serial', 'I'), ('name', 's'), ('description_short', 's'), ('description_long', 's'), ('players_quota', 'I'), ('variant', 's'), ('betting_structure', 's'), ('skin', 's'), ('seats_per_game', 'I'), ('player_timeout', 'I'), ('currency_serial', 'I'), ('prize_currency', 'I'), ('prize_min', 'I'), ('bailor_serial', 'I'), ('buy_in', 'I'), ('rake', 'I'), ('sit_n_go', 'cbool'), ('start_time', 'I'), ('players', 'Il'), ('breaks_duration', 'I'), ('breaks_first', 'I'), ('breaks_interval', 'I'), ('schedule_serial', 'I')], {'name': (7, 's'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerLongPoll'): ((('serial', 0, 'I'), ('game_id', 0, 'I')), [('serial', 'I'), ('game_id', 'I')], [('serial', 'I'), ('game_id', 'I')], {'game_id': (7, 'I'), 'serial': (3, 'I')}),
+    ('pokerpackets.networkpackets', 'PacketPokerLongPollReturn'): ((), [], [], {}),
+    ('pokerpackets.networkpackets', 'PacketSetOption'): ((('serial', 0, 'I'), ('game_id', 0, 'I'), ('option_id', 0, 'B'), ('value', 0, 'B')), [('serial', 'I'), ('game_id', 'I'), ('option_id', 'B'), ('value', 'B')], [('serial', 'I'), ('game_id', 'I'), ('option_id', 'B'), ('value', 'B')], {'game_id': (7, 'I'), 'option_id': (11, 'B'), 'serial': (3, 'I'), 'value': (12, 'B')}),
+}
+
+def f0(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.seats != other.seats or self.game_id != other.game_id)
+    return __eq__
+
+def f1(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) seats: %r game_id: %r' % (cls.__name__, cls.type, self.seats, self.game_id)
+    return __str__
+
+def f2(C_0, D_0, D_1, MISSING, instance, packet_type, **_namespace):
+    def make(cls, seats=MISSING, game_id=D_1):
+        p = instance(cls, {'seats': C_0(D_0) if seats is MISSING else seats, 'game_id': game_id})
+        return p
+    return make
+
+def f3(C_0, D_0, D_1, MISSING, packet_type, **_namespace):
+    def make(cls, seats=MISSING, game_id=D_1):
+        p = cls.__new__(cls)
+        p.seats = C_0(D_0) if seats is MISSING else seats
+        p.game_id = game_id
+        return p
+    return make
+
+def f4(C_0, D_0, D_1, MISSING, **_namespace):
+    def __init__(self, seats=MISSING, game_id=D_1, **kw):
+        self.seats = C_0(D_0) if seats is MISSING else seats
+        self.game_id = game_id
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f5(L_0, S_0, S_2, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.seats
+        n0 = len(v0)
+        d0 = L_0[n0].pack(*v0)
+        v1 = p.game_id
+        length = 5 + len(d0)
+        return b''.join([S_0(50, length, n0), d0, S_2((v1))])
+    return binarypack_fast_pack
+
+def f6(L_0, S_0, S_2, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.seats
+        n0 = len(v0)
+        d0 = L_0[n0].pack(*v0)
+        v1 = p.game_id
+        length = 5 + len(d0)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 50, length, n0)
+        offset += 4
+        buf[offset:offset + len(d0)] = d0
+        offset += len(d0)
+        S_2(buf, offset, (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f7(L_0, S_0, S_4, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        n0, = S_0(data, offset)
+        offset += 1
+        v0 = list(L_0[n0].unpack_from(data, offset)) if n0 else []
+        offset += n0 * 4
+        v1, = S_4(data, offset)
+        offset += 4
+        p = instance(packet_type, {'seats': v0, 'game_id': v1})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f8(hashable, **_namespace):
+    def __hash__(self):
+        return hash((hashable(self.seats), self.game_id, ))
+    return __hash__
+
+def f9(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id)
+    return __eq__
+
+def f10(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r' % (cls.__name__, cls.type, self.serial, self.game_id)
+    return __str__
+
+def f11(D_0, D_1, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1):
+        p = instance(cls, {'serial': serial, 'game_id': game_id})
+        return p
+    return make
+
+def f12(D_0, D_1, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        return p
+    return make
+
+def f13(D_0, D_1, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f14(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        return S_0(51, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f15(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 51, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f16(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, = S_0(data, offset)
+        offset += 8
+        p = instance(packet_type, {'serial': v0, 'game_id': v1})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f17(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, ))
+    return __hash__
+
+def f18(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.string != other.string)
+    return __eq__
+
+def f19(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r string: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.string)
+    return __str__
+
+def f20(D_0, D_1, D_2, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, string=D_2):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'string': string})
+        return p
+    return make
+
+def f21(D_0, D_1, D_2, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, string=D_2):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.string = string
+        return p
+    return make
+
+def f22(D_0, D_1, D_2, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, string=D_2, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.string = string
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f23(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.string
+        length = 10 + len(v2)
+        return b''.join([S_0(52, length, (v0), (v1), len(v2)), v2])
+    return binarypack_fast_pack
+
+def f24(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.string
+        length = 10 + len(v2)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 52, length, (v0), (v1), len(v2))
+        offset += 13
+        buf[offset:offset + len(v2)] = v2
+        return end
+    return binarypack_fast_pack_into
+
+def f25(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, n2, = S_0(data, offset)
+        offset += 10
+        v2 = data[offset:offset + n2]
+        if v2.__class__ is memoryview: v2 = v2.tobytes()
+        offset += n2
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'string': v2})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f26(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, self.string, ))
+    return __hash__
+
+def f27(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.message != other.message or self.code != other.code or self.other_type != other.other_type)
+    return __eq__
+
+def f28(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r message: %r code: %r other_type: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.message, self.code, self.other_type)
+    return __str__
+
+def f29(D_0, D_1, D_2, D_3, D_4, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, message=D_2, code=D_3, other_type=D_4):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'message': message, 'code': code, 'other_type': other_type})
+        return p
+    return make
+
+def f30(D_0, D_1, D_2, D_3, D_4, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, message=D_2, code=D_3, other_type=D_4):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.message = message
+        p.code = code
+        p.other_type = other_type
+        return p
+    return make
+
+def f31(D_0, D_1, D_2, D_3, D_4, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, message=D_2, code=D_3, other_type=D_4, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.message = message
+        self.code = code
+        self.other_type = other_type
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f32(S_0, S_2, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.message
+        v3 = p.code
+        v4 = p.other_type
+        length = 15 + len(v2)
+        return b''.join([S_0(53, length, (v0), (v1), len(v2)), v2, S_2((v3), (v4))])
+    return binarypack_fast_pack
+
+def f33(S_0, S_2, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.message
+        v3 = p.code
+        v4 = p.other_type
+        length = 15 + len(v2)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 53, length, (v0), (v1), len(v2))
+        offset += 13
+        buf[offset:offset + len(v2)] = v2
+        offset += len(v2)
+        S_2(buf, offset, (v3), (v4))
+        return end
+    return binarypack_fast_pack_into
+
+def f34(S_0, S_5, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, n2, = S_0(data, offset)
+        offset += 10
+        v2 = data[offset:offset + n2]
+        if v2.__class__ is memoryview: v2 = v2.tobytes()
+        offset += n2
+        v3, v4, = S_5(data, offset)
+        offset += 5
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'message': v2, 'code': v3, 'other_type': v4})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f35(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, self.message, self.code, self.other_type, ))
+    return __hash__
+
+def f36(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.game_id != other.game_id or self.position != other.position or self.serial != other.serial)
+    return __eq__
+
+def f37(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) game_id: %r position: %r serial: %r' % (cls.__name__, cls.type, self.game_id, self.position, self.serial)
+    return __str__
+
+def f38(D_0, D_1, D_2, MISSING, instance, packet_type, **_namespace):
+    def make(cls, game_id=D_0, position=D_1, serial=D_2):
+        p = instance(cls, {'game_id': game_id, 'position': position, 'serial': serial})
+        return p
+    return make
+
+def f39(D_0, D_1, D_2, MISSING, packet_type, **_namespace):
+    def make(cls, game_id=D_0, position=D_1, serial=D_2):
+        p = cls.__new__(cls)
+        p.game_id = game_id
+        p.position = position
+        p.serial = serial
+        return p
+    return make
+
+def f40(D_0, D_1, D_2, MISSING, **_namespace):
+    def __init__(self, game_id=D_0, position=D_1, serial=D_2, **kw):
+        self.game_id = game_id
+        self.position = position
+        self.serial = serial
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f41(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.game_id
+        v1 = p.position
+        v2 = p.serial
+        length = 9
+        return S_0(54, length, (v0), (255 if v1 == -1 else v1), (v2))
+    return binarypack_fast_pack
+
+def f42(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.game_id
+        v1 = p.position
+        v2 = p.serial
+        length = 9
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 54, length, (v0), (255 if v1 == -1 else v1), (v2))
+        return end
+    return binarypack_fast_pack_into
+
+def f43(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, = S_0(data, offset)
+        offset += 9
+        p = instance(packet_type, {'game_id': v0, 'position': -1 if v1 == 255 else v1, 'serial': v2})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f44(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.game_id, self.position, self.serial, ))
+    return __hash__
+
+def f45(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.amount != other.amount)
+    return __eq__
+
+def f46(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r amount: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.amount)
+    return __str__
+
+def f47(D_0, D_1, D_2, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, amount=D_2):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'amount': amount})
+        return p
+    return make
+
+def f48(D_0, D_1, D_2, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, amount=D_2):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.amount = amount
+        return p
+    return make
+
+def f49(D_0, D_1, D_2, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, amount=D_2, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.amount = amount
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f50(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.amount
+        length = 12
+        return S_0(55, length, (v0), (v1), (v2))
+    return binarypack_fast_pack
+
+def f51(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.amount
+        length = 12
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 55, length, (v0), (v1), (v2))
+        return end
+    return binarypack_fast_pack_into
+
+def f52(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, = S_0(data, offset)
+        offset += 12
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'amount': v2})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f53(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, self.amount, ))
+    return __hash__
+
+def f54(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.amount
+        length = 12
+        return S_0(56, length, (v0), (v1), (v2))
+    return binarypack_fast_pack
+
+def f55(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.amount
+        length = 12
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 56, length, (v0), (v1), (v2))
+        return end
+    return binarypack_fast_pack_into
+
+def f56(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        return S_0(57, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f57(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 57, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f58(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.string
+        length = 10 + len(v2)
+        return b''.join([S_0(58, length, (v0), (v1), len(v2)), v2])
+    return binarypack_fast_pack
+
+def f59(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.string
+        length = 10 + len(v2)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 58, length, (v0), (v1), len(v2))
+        offset += 13
+        buf[offset:offset + len(v2)] = v2
+        return end
+    return binarypack_fast_pack_into
+
+def f60(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.serials != other.serials)
+    return __eq__
+
+def f61(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r serials: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.serials)
+    return __str__
+
+def f62(C_2, D_0, D_1, D_2, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, serials=MISSING):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'serials': C_2(D_2) if serials is MISSING else serials})
+        return p
+    return make
+
+def f63(C_2, D_0, D_1, D_2, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, serials=MISSING):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.serials = C_2(D_2) if serials is MISSING else serials
+        return p
+    return make
+
+def f64(C_2, D_0, D_1, D_2, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, serials=MISSING, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.serials = C_2(D_2) if serials is MISSING else serials
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f65(L_2, S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.serials
+        n2 = len(v2)
+        d2 = L_2[n2].pack(*v2)
+        length = 9 + len(d2)
+        return b''.join([S_0(59, length, (v0), (v1), n2), d2])
+    return binarypack_fast_pack
+
+def f66(L_2, S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.serials
+        n2 = len(v2)
+        d2 = L_2[n2].pack(*v2)
+        length = 9 + len(d2)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 59, length, (v0), (v1), n2)
+        offset += 12
+        buf[offset:offset + len(d2)] = d2
+        return end
+    return binarypack_fast_pack_into
+
+def f67(L_2, S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, n2, = S_0(data, offset)
+        offset += 9
+        v2 = list(L_2[n2].unpack_from(data, offset)) if n2 else []
+        offset += n2 * 4
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'serials': v2})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f68(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, hashable(self.serials), ))
+    return __hash__
+
+def f69(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.cards != other.cards)
+    return __eq__
+
+def f70(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r cards: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.cards)
+    return __str__
+
+def f71(C_2, D_0, D_1, D_2, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, cards=MISSING):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'cards': C_2(D_2) if cards is MISSING else cards})
+        return p
+    return make
+
+def f72(C_2, D_0, D_1, D_2, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, cards=MISSING):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.cards = C_2(D_2) if cards is MISSING else cards
+        return p
+    return make
+
+def f73(C_2, D_0, D_1, D_2, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, cards=MISSING, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.cards = C_2(D_2) if cards is MISSING else cards
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f74(L_2, S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.cards
+        n2 = len(v2)
+        d2 = L_2[n2].pack(*v2)
+        length = 9 + len(d2)
+        return b''.join([S_0(60, length, (v0), (v1), n2), d2])
+    return binarypack_fast_pack
+
+def f75(L_2, S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.cards
+        n2 = len(v2)
+        d2 = L_2[n2].pack(*v2)
+        length = 9 + len(d2)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 60, length, (v0), (v1), n2)
+        offset += 12
+        buf[offset:offset + len(d2)] = d2
+        return end
+    return binarypack_fast_pack_into
+
+def f76(L_2, S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, n2, = S_0(data, offset)
+        offset += 9
+        v2 = list(L_2[n2].unpack_from(data, offset)) if n2 else []
+        offset += n2 * 1
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'cards': v2})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f77(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, hashable(self.cards), ))
+    return __hash__
+
+def f78(L_2, S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.cards
+        n2 = len(v2)
+        d2 = L_2[n2].pack(*v2)
+        length = 9 + len(d2)
+        return b''.join([S_0(61, length, (v0), (v1), n2), d2])
+    return binarypack_fast_pack
+
+def f79(L_2, S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.cards
+        n2 = len(v2)
+        d2 = L_2[n2].pack(*v2)
+        length = 9 + len(d2)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 61, length, (v0), (v1), n2)
+        offset += 12
+        buf[offset:offset + len(d2)] = d2
+        return end
+    return binarypack_fast_pack_into
+
+def f80(L_2, S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.cards
+        n2 = len(v2)
+        d2 = L_2[n2].pack(*v2)
+        length = 9 + len(d2)
+        return b''.join([S_0(62, length, (v0), (v1), n2), d2])
+    return binarypack_fast_pack
+
+def f81(L_2, S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.cards
+        n2 = len(v2)
+        d2 = L_2[n2].pack(*v2)
+        length = 9 + len(d2)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 62, length, (v0), (v1), n2)
+        offset += 12
+        buf[offset:offset + len(d2)] = d2
+        return end
+    return binarypack_fast_pack_into
+
+def f82(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.bet != other.bet)
+    return __eq__
+
+def f83(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r bet: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.bet)
+    return __str__
+
+def f84(D_0, D_1, D_2, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, bet=D_2):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'bet': bet})
+        return p
+    return make
+
+def f85(D_0, D_1, D_2, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, bet=D_2):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.bet = bet
+        return p
+    return make
+
+def f86(D_0, D_1, D_2, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, bet=D_2, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.bet = bet
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f87(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.bet
+        length = 16
+        return S_0(63, length, (v0), (v1), (v2))
+    return binarypack_fast_pack
+
+def f88(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.bet
+        length = 16
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 63, length, (v0), (v1), (v2))
+        return end
+    return binarypack_fast_pack_into
+
+def f89(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, = S_0(data, offset)
+        offset += 16
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'bet': v2})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f90(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, self.bet, ))
+    return __hash__
+
+def f91(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.bet != other.bet or self.money != other.money)
+    return __eq__
+
+def f92(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r bet: %r money: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.bet, self.money)
+    return __str__
+
+def f93(D_0, D_1, D_2, D_3, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, bet=D_2, money=D_3):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'bet': bet, 'money': money})
+        return p
+    return make
+
+def f94(D_0, D_1, D_2, D_3, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, bet=D_2, money=D_3):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.bet = bet
+        p.money = money
+        return p
+    return make
+
+def f95(D_0, D_1, D_2, D_3, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, bet=D_2, money=D_3, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.bet = bet
+        self.money = money
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f96(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.bet
+        v3 = p.money
+        length = 24
+        return S_0(64, length, (v0), (v1), (v2), (v3))
+    return binarypack_fast_pack
+
+def f97(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.bet
+        v3 = p.money
+        length = 24
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 64, length, (v0), (v1), (v2), (v3))
+        return end
+    return binarypack_fast_pack_into
+
+def f98(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, v3, = S_0(data, offset)
+        offset += 24
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'bet': v2, 'money': v3})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f99(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, self.bet, self.money, ))
+    return __hash__
+
+def f100(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        return S_0(65, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f101(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 65, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f102(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.hands_count != other.hands_count or self.time != other.time or self.hand_serial != other.hand_serial or self.level != other.level)
+    return __eq__
+
+def f103(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r hands_count: %r time: %r hand_serial: %r level: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.hands_count, self.time, self.hand_serial, self.level)
+    return __str__
+
+def f104(D_0, D_1, D_2, D_3, D_4, D_5, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, hands_count=D_2, time=D_3, hand_serial=D_4, level=D_5):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'hands_count': hands_count, 'time': time, 'hand_serial': hand_serial, 'level': level})
+        return p
+    return make
+
+def f105(D_0, D_1, D_2, D_3, D_4, D_5, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, hands_count=D_2, time=D_3, hand_serial=D_4, level=D_5):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.hands_count = hands_count
+        p.time = time
+        p.hand_serial = hand_serial
+        p.level = level
+        return p
+    return make
+
+def f106(D_0, D_1, D_2, D_3, D_4, D_5, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, hands_count=D_2, time=D_3, hand_serial=D_4, level=D_5, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.hands_count = hands_count
+        self.time = time
+        self.hand_serial = hand_serial
+        self.level = level
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f107(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.hands_count
+        v3 = p.time
+        v4 = p.hand_serial
+        v5 = p.level
+        length = 21
+        return S_0(66, length, (v0), (v1), (v2), (v3), (v4), (v5))
+    return binarypack_fast_pack
+
+def f108(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.hands_count
+        v3 = p.time
+        v4 = p.hand_serial
+        v5 = p.level
+        length = 21
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 66, length, (v0), (v1), (v2), (v3), (v4), (v5))
+        return end
+    return binarypack_fast_pack_into
+
+def f109(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, v3, v4, v5, = S_0(data, offset)
+        offset += 21
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'hands_count': v2, 'time': v3, 'hand_serial': v4, 'level': v5})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f110(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, self.hands_count, self.time, self.hand_serial, self.level, ))
+    return __hash__
+
+def f111(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.players != other.players)
+    return __eq__
+
+def f112(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r players: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.players)
+    return __str__
+
+def f113(C_2, D_0, D_1, D_2, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, players=MISSING):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'players': C_2(D_2) if players is MISSING else players})
+        return p
+    return make
+
+def f114(C_2, D_0, D_1, D_2, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, players=MISSING):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.players = C_2(D_2) if players is MISSING else players
+        return p
+    return make
+
+def f115(C_2, D_0, D_1, D_2, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, players=MISSING, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.players = C_2(D_2) if players is MISSING else players
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f116(L_2, S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.players
+        n2 = len(v2)
+        d2 = L_2[n2].pack(*v2)
+        length = 9 + len(d2)
+        return b''.join([S_0(67, length, (v0), (v1), n2), d2])
+    return binarypack_fast_pack
+
+def f117(L_2, S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.players
+        n2 = len(v2)
+        d2 = L_2[n2].pack(*v2)
+        length = 9 + len(d2)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 67, length, (v0), (v1), n2)
+        offset += 12
+        buf[offset:offset + len(d2)] = d2
+        return end
+    return binarypack_fast_pack_into
+
+def f118(L_2, S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, n2, = S_0(data, offset)
+        offset += 9
+        v2 = list(L_2[n2].unpack_from(data, offset)) if n2 else []
+        offset += n2 * 4
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'players': v2})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f119(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, hashable(self.players), ))
+    return __hash__
+
+def f120(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        return S_0(68, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f121(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 68, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f122(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.amount
+        length = 12
+        return S_0(69, length, (v0), (v1), (v2))
+    return binarypack_fast_pack
+
+def f123(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.amount
+        length = 12
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 69, length, (v0), (v1), (v2))
+        return end
+    return binarypack_fast_pack_into
+
+def f124(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.game_id != other.game_id or self.dealer != other.dealer or self.previous_dealer != other.previous_dealer)
+    return __eq__
+
+def f125(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) game_id: %r dealer: %r previous_dealer: %r' % (cls.__name__, cls.type, self.game_id, self.dealer, self.previous_dealer)
+    return __str__
+
+def f126(D_0, D_1, D_2, MISSING, instance, packet_type, **_namespace):
+    def make(cls, game_id=D_0, dealer=D_1, previous_dealer=D_2):
+        p = instance(cls, {'game_id': game_id, 'dealer': dealer, 'previous_dealer': previous_dealer})
+        return p
+    return make
+
+def f127(D_0, D_1, D_2, MISSING, packet_type, **_namespace):
+    def make(cls, game_id=D_0, dealer=D_1, previous_dealer=D_2):
+        p = cls.__new__(cls)
+        p.game_id = game_id
+        p.dealer = dealer
+        p.previous_dealer = previous_dealer
+        return p
+    return make
+
+def f128(D_0, D_1, D_2, MISSING, **_namespace):
+    def __init__(self, game_id=D_0, dealer=D_1, previous_dealer=D_2, **kw):
+        self.game_id = game_id
+        self.dealer = dealer
+        self.previous_dealer = previous_dealer
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f129(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.game_id
+        v1 = p.dealer
+        v2 = p.previous_dealer
+        length = 6
+        return S_0(70, length, (v0), (255 if v1 == -1 else v1), (255 if v2 == -1 else v2))
+    return binarypack_fast_pack
+
+def f130(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.game_id
+        v1 = p.dealer
+        v2 = p.previous_dealer
+        length = 6
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 70, length, (v0), (255 if v1 == -1 else v1), (255 if v2 == -1 else v2))
+        return end
+    return binarypack_fast_pack_into
+
+def f131(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, = S_0(data, offset)
+        offset += 6
+        p = instance(packet_type, {'game_id': v0, 'dealer': -1 if v1 == 255 else v1, 'previous_dealer': -1 if v2 == 255 else v2})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f132(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.game_id, self.dealer, self.previous_dealer, ))
+    return __hash__
+
+def f133(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        return S_0(71, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f134(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 71, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f135(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.string != other.string)
+    return __eq__
+
+def f136(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) string: %r' % (cls.__name__, cls.type, self.string)
+    return __str__
+
+def f137(D_0, MISSING, instance, packet_type, **_namespace):
+    def make(cls, string=D_0):
+        p = instance(cls, {'string': string})
+        return p
+    return make
+
+def f138(D_0, MISSING, packet_type, **_namespace):
+    def make(cls, string=D_0):
+        p = cls.__new__(cls)
+        p.string = string
+        return p
+    return make
+
+def f139(D_0, MISSING, **_namespace):
+    def __init__(self, string=D_0, **kw):
+        self.string = string
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f140(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.string
+        length = 2 + len(v0)
+        return b''.join([S_0(72, length, len(v0)), v0])
+    return binarypack_fast_pack
+
+def f141(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.string
+        length = 2 + len(v0)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 72, length, len(v0))
+        offset += 5
+        buf[offset:offset + len(v0)] = v0
+        return end
+    return binarypack_fast_pack_into
+
+def f142(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        n0, = S_0(data, offset)
+        offset += 2
+        v0 = data[offset:offset + n0]
+        if v0.__class__ is memoryview: v0 = v0.tobytes()
+        offset += n0
+        p = instance(packet_type, {'string': v0})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f143(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.string, ))
+    return __hash__
+
+def f144(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.id != other.id or self.seats != other.seats or self.average_pot != other.average_pot or self.hands_per_hour != other.hands_per_hour or self.percent_flop != other.percent_flop or self.players != other.players or self.observers != other.observers or self.waiting != other.waiting or self.player_timeout != other.player_timeout or self.muck_timeout != other.muck_timeout or self.currency_serial != other.currency_serial or self.name != other.name or self.variant != other.variant or self.betting_structure != other.betting_structure or self.skin != other.skin or self.reason != other.reason or self.tourney_serial != other.tourney_serial or self.player_seated != other.player_seated)
+    return __eq__
+
+def f145(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.id != other.id or self.seats != other.seats or self.average_pot != other.average_pot or self.hands_per_hour != other.hands_per_hour or self.percent_flop != other.percent_flop or self.players != other.players or self.observers != other.observers or self.waiting != other.waiting or self.player_timeout != other.player_timeout or self.muck_timeout != other.muck_timeout or self.currency_serial != other.currency_serial or self.name != other.name or self.variant != other.variant or self.betting_structure != other.betting_structure or self.skin != other.skin or self.reason != other.reason or self.tourney_serial != other.tourney_serial)
+    return __eq__
+
+def f146(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) id: %r seats: %r average_pot: %r hands_per_hour: %r percent_flop: %r players: %r observers: %r waiting: %r player_timeout: %r muck_timeout: %r currency_serial: %r name: %r variant: %r betting_structure: %r skin: %r reason: %r tourney_serial: %r player_seated: %r' % (cls.__name__, cls.type, self.id, self.seats, self.average_pot, self.hands_per_hour, self.percent_flop, self.players, self.observers, self.waiting, self.player_timeout, self.muck_timeout, self.currency_serial, self.name, self.variant, self.betting_structure, self.skin, self.reason, self.tourney_serial, self.player_seated)
+    return __str__
+
+def f147(D_0, D_1, D_10, D_11, D_12, D_13, D_14, D_15, D_16, D_17, D_2, D_3, D_4, D_5, D_6, D_7, D_8, D_9, MISSING, instance, packet_type, **_namespace):
+    def make(cls, id=D_0, seats=D_1, average_pot=D_2, hands_per_hour=D_3, percent_flop=D_4, players=D_5, observers=D_6, waiting=D_7, player_timeout=D_8, muck_timeout=D_9, currency_serial=D_10, name=D_11, variant=D_12, betting_structure=D_13, skin=D_14, reason=D_15, tourney_serial=D_16):
+        p = instance(cls, {'id': id, 'seats': seats, 'average_pot': average_pot, 'hands_per_hour': hands_per_hour, 'percent_flop': percent_flop, 'players': players, 'observers': observers, 'waiting': waiting, 'player_timeout': player_timeout, 'muck_timeout': muck_timeout, 'currency_serial': currency_serial, 'name': name, 'variant': variant, 'betting_structure': betting_structure, 'skin': skin, 'reason': reason, 'tourney_serial': tourney_serial})
+        return p
+    return make
+
+def f148(D_0, D_1, D_10, D_11, D_12, D_13, D_14, D_15, D_16, D_17, D_2, D_3, D_4, D_5, D_6, D_7, D_8, D_9, MISSING, packet_type, **_namespace):
+    def make(cls, id=D_0, seats=D_1, average_pot=D_2, hands_per_hour=D_3, percent_flop=D_4, players=D_5, observers=D_6, waiting=D_7, player_timeout=D_8, muck_timeout=D_9, currency_serial=D_10, name=D_11, variant=D_12, betting_structure=D_13, skin=D_14, reason=D_15, tourney_serial=D_16):
+        p = cls.__new__(cls)
+        p.id = id
+        p.seats = seats
+        p.average_pot = average_pot
+        p.hands_per_hour = hands_per_hour
+        p.percent_flop = percent_flop
+        p.players = players
+        p.observers = observers
+        p.waiting = waiting
+        p.player_timeout = player_timeout
+        p.muck_timeout = muck_timeout
+        p.currency_serial = currency_serial
+        p.name = name
+        p.variant = variant
+        p.betting_structure = betting_structure
+        p.skin = skin
+        p.reason = reason
+        p.tourney_serial = tourney_serial
+        p.player_seated = D_17
+        return p
+    return make
+
+def f149(D_0, D_1, D_10, D_11, D_12, D_13, D_14, D_15, D_16, D_17, D_2, D_3, D_4, D_5, D_6, D_7, D_8, D_9, MISSING, **_namespace):
+    def __init__(self, id=D_0, seats=D_1, average_pot=D_2, hands_per_hour=D_3, percent_flop=D_4, players=D_5, observers=D_6, waiting=D_7, player_timeout=D_8, muck_timeout=D_9, currency_serial=D_10, name=D_11, variant=D_12, betting_structure=D_13, skin=D_14, reason=D_15, tourney_serial=D_16, player_seated=D_17, **kw):
+        self.id = id
+        self.seats = seats
+        self.average_pot = average_pot
+        self.hands_per_hour = hands_per_hour
+        self.percent_flop = percent_flop
+        self.players = players
+        self.observers = observers
+        self.waiting = waiting
+        self.player_timeout = player_timeout
+        self.muck_timeout = muck_timeout
+        self.currency_serial = currency_serial
+        self.name = name
+        self.variant = variant
+        self.betting_structure = betting_structure
+        self.skin = skin
+        self.reason = reason
+        self.tourney_serial = tourney_serial
+        self.player_seated = player_seated
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f150(S_0, S_10, S_2, S_4, S_6, S_8, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.id
+        v1 = p.seats
+        v2 = p.average_pot
+        v3 = p.hands_per_hour
+        v4 = p.percent_flop
+        v5 = p.players
+        v6 = p.observers
+        v7 = p.waiting
+        v8 = p.player_timeout
+        v9 = p.muck_timeout
+        v10 = p.currency_serial
+        v11 = p.name
+        v12 = p.variant
+        v13 = p.betting_structure
+        v14 = p.skin
+        v15 = p.reason
+        v16 = p.tourney_serial
+        length = 38 + len(v11) + len(v12) + len(v13) + len(v14) + len(v15)
+        return b''.join([S_0(73, length, (v0), (v1), (v2), (v3), (v4), (v5), (v6), (v7), (v8), (v9), (v10), len(v11)), v11, S_2(len(v12)), v12, S_4(len(v13)), v13, S_6(len(v14)), v14, S_8(len(v15)), v15, S_10((v16))])
+    return binarypack_fast_pack
+
+def f151(S_0, S_10, S_2, S_4, S_6, S_8, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.id
+        v1 = p.seats
+        v2 = p.average_pot
+        v3 = p.hands_per_hour
+        v4 = p.percent_flop
+        v5 = p.players
+        v6 = p.observers
+        v7 = p.waiting
+        v8 = p.player_timeout
+        v9 = p.muck_timeout
+        v10 = p.currency_serial
+        v11 = p.name
+        v12 = p.variant
+        v13 = p.betting_structure
+        v14 = p.skin
+        v15 = p.reason
+        v16 = p.tourney_serial
+        length = 38 + len(v11) + len(v12) + len(v13) + len(v14) + len(v15)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 73, length, (v0), (v1), (v2), (v3), (v4), (v5), (v6), (v7), (v8), (v9), (v10), len(v11))
+        offset += 29
+        buf[offset:offset + len(v11)] = v11
+        offset += len(v11)
+        S_2(buf, offset, len(v12))
+        offset += 2
+        buf[offset:offset + len(v12)] = v12
+        offset += len(v12)
+        S_4(buf, offset, len(v13))
+        offset += 2
+        buf[offset:offset + len(v13)] = v13
+        offset += len(v13)
+        S_6(buf, offset, len(v14))
+        offset += 2
+        buf[offset:offset + len(v14)] = v14
+        offset += len(v14)
+        S_8(buf, offset, len(v15))
+        offset += 2
+        buf[offset:offset + len(v15)] = v15
+        offset += len(v15)
+        S_10(buf, offset, (v16))
+        return end
+    return binarypack_fast_pack_into
+
+def f152(S_0, S_10, S_15, S_20, S_25, S_5, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, v3, v4, v5, v6, v7, v8, v9, v10, n11, = S_0(data, offset)
+        offset += 26
+        v11 = data[offset:offset + n11]
+        if v11.__class__ is memoryview: v11 = v11.tobytes()
+        offset += n11
+        n12, = S_5(data, offset)
+        offset += 2
+        v12 = data[offset:offset + n12]
+        if v12.__class__ is memoryview: v12 = v12.tobytes()
+        offset += n12
+        n13, = S_10(data, offset)
+        offset += 2
+        v13 = data[offset:offset + n13]
+        if v13.__class__ is memoryview: v13 = v13.tobytes()
+        offset += n13
+        n14, = S_15(data, offset)
+        offset += 2
+        v14 = data[offset:offset + n14]
+        if v14.__class__ is memoryview: v14 = v14.tobytes()
+        offset += n14
+        n15, = S_20(data, offset)
+        offset += 2
+        v15 = data[offset:offset + n15]
+        if v15.__class__ is memoryview: v15 = v15.tobytes()
+        offset += n15
+        v16, = S_25(data, offset)
+        offset += 4
+        p = instance(packet_type, {'id': v0, 'seats': v1, 'average_pot': v2, 'hands_per_hour': v3, 'percent_flop': v4, 'players': v5, 'observers': v6, 'waiting': v7, 'player_timeout': v8, 'muck_timeout': v9, 'currency_serial': v10, 'name': v11, 'variant': v12, 'betting_structure': v13, 'skin': v14, 'reason': v15, 'tourney_serial': v16})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f153(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.id, self.seats, self.average_pot, self.hands_per_hour, self.percent_flop, self.players, self.observers, self.waiting, self.player_timeout, self.muck_timeout, self.currency_serial, self.name, self.variant, self.betting_structure, self.skin, self.reason, self.tourney_serial, hashable(self.player_seated), ))
+    return __hash__
+
+def f154(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.packets != other.packets or self.players != other.players or self.tables != other.tables)
+    return __eq__
+
+def f155(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) packets: %r players: %r tables: %r' % (cls.__name__, cls.type, self.packets, self.players, self.tables)
+    return __str__
+
+def f156(C_0, D_0, D_1, D_2, MISSING, instance, packet_type, **_namespace):
+    def make(cls, packets=MISSING, players=D_1, tables=D_2):
+        p = instance(cls, {'packets': C_0(D_0) if packets is MISSING else packets, 'players': players, 'tables': tables})
+        return p
+    return make
+
+def f157(C_0, D_0, D_1, D_2, MISSING, packet_type, **_namespace):
+    def make(cls, packets=MISSING, players=D_1, tables=D_2):
+        p = cls.__new__(cls)
+        p.packets = C_0(D_0) if packets is MISSING else packets
+        p.players = players
+        p.tables = tables
+        return p
+    return make
+
+def f158(C_0, D_0, D_1, D_2, MISSING, **_namespace):
+    def __init__(self, packets=MISSING, players=D_1, tables=D_2, **kw):
+        self.packets = C_0(D_0) if packets is MISSING else packets
+        self.players = players
+        self.tables = tables
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f159(S_0, S_2, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.packets
+        d0 = b''.join([q.__class__.__dict__['binarypack_fast_pack'](q) for q in v0])
+        v1 = p.players
+        v2 = p.tables
+        length = 10 + len(d0)
+        return b''.join([S_0(74, length, len(v0)), d0, S_2((v1), (v2))])
+    return binarypack_fast_pack
+
+def f160(S_0, S_2, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.packets
+        d0 = b''.join([q.__class__.__dict__['binarypack_fast_pack'](q) for q in v0])
+        v1 = p.players
+        v2 = p.tables
+        length = 10 + len(d0)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 74, length, len(v0))
+        offset += 5
+        buf[offset:offset + len(d0)] = d0
+        offset += len(d0)
+        S_2(buf, offset, (v1), (v2))
+        return end
+    return binarypack_fast_pack_into
+
+def f161(S_0, S_7, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        n0, = S_0(data, offset)
+        offset += 2
+        v0 = []
+        for j in xrange(n0):
+            t, l = S_PACKET_HEAD_unpack_from(data, offset)
+            offset, q = type_id2type[t].binarypack_fast_unpack(data, offset + 3)
+            v0.append(q)
+        v1, v2, = S_7(data, offset)
+        offset += 8
+        p = instance(packet_type, {'packets': v0, 'players': v1, 'tables': v2})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f162(hashable, **_namespace):
+    def __hash__(self):
+        return hash((hashable(self.packets), self.players, self.tables, ))
+    return __hash__
+
+def f163(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        return S_0(75, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f164(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 75, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f165(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        return S_0(76, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f166(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 76, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f167(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.timeout != other.timeout or self.when != other.when)
+    return __eq__
+
+def f168(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.timeout != other.timeout)
+    return __eq__
+
+def f169(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r timeout: %r when: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.timeout, self.when)
+    return __str__
+
+def f170(D_0, D_1, D_2, D_3, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, timeout=D_2):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'timeout': timeout})
+        return p
+    return make
+
+def f171(D_0, D_1, D_2, D_3, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, timeout=D_2):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.timeout = timeout
+        p.when = D_3
+        return p
+    return make
+
+def f172(D_0, D_1, D_2, D_3, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, timeout=D_2, when=D_3, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.timeout = timeout
+        self.when = when
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f173(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.timeout
+        length = 12
+        return S_0(77, length, (v0), (v1), (v2))
+    return binarypack_fast_pack
+
+def f174(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.timeout
+        length = 12
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 77, length, (v0), (v1), (v2))
+        return end
+    return binarypack_fast_pack_into
+
+def f175(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, = S_0(data, offset)
+        offset += 12
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'timeout': v2})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f176(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, self.timeout, hashable(self.when), ))
+    return __hash__
+
+def f177(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        return S_0(78, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f178(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 78, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f179(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.seat != other.seat)
+    return __eq__
+
+def f180(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r seat: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.seat)
+    return __str__
+
+def f181(D_0, D_1, D_2, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, seat=D_2):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'seat': seat})
+        return p
+    return make
+
+def f182(D_0, D_1, D_2, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, seat=D_2):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.seat = seat
+        return p
+    return make
+
+def f183(D_0, D_1, D_2, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, seat=D_2, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.seat = seat
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f184(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.seat
+        length = 9
+        return S_0(79, length, (v0), (v1), (255 if v2 == -1 else v2))
+    return binarypack_fast_pack
+
+def f185(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.seat
+        length = 9
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 79, length, (v0), (v1), (255 if v2 == -1 else v2))
+        return end
+    return binarypack_fast_pack_into
+
+def f186(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, = S_0(data, offset)
+        offset += 9
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'seat': -1 if v2 == 255 else v2})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f187(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, self.seat, ))
+    return __hash__
+
+def f188(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.seat != other.seat or self.to_game_id != other.to_game_id)
+    return __eq__
+
+def f189(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r seat: %r to_game_id: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.seat, self.to_game_id)
+    return __str__
+
+def f190(D_0, D_1, D_2, D_3, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, seat=D_2, to_game_id=D_3):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'seat': seat, 'to_game_id': to_game_id})
+        return p
+    return make
+
+def f191(D_0, D_1, D_2, D_3, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, seat=D_2, to_game_id=D_3):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.seat = seat
+        p.to_game_id = to_game_id
+        return p
+    return make
+
+def f192(D_0, D_1, D_2, D_3, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, seat=D_2, to_game_id=D_3, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.seat = seat
+        self.to_game_id = to_game_id
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f193(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.seat
+        v3 = p.to_game_id
+        length = 13
+        return S_0(80, length, (v0), (v1), (255 if v2 == -1 else v2), (v3))
+    return binarypack_fast_pack
+
+def f194(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.seat
+        v3 = p.to_game_id
+        length = 13
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 80, length, (v0), (v1), (255 if v2 == -1 else v2), (v3))
+        return end
+    return binarypack_fast_pack_into
+
+def f195(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, v3, = S_0(data, offset)
+        offset += 13
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'seat': -1 if v2 == 255 else v2, 'to_game_id': v3})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f196(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, self.seat, self.to_game_id, ))
+    return __hash__
+
+def f197(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.seat
+        length = 9
+        return S_0(81, length, (v0), (v1), (255 if v2 == -1 else v2))
+    return binarypack_fast_pack
+
+def f198(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.seat
+        length = 9
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 81, length, (v0), (v1), (255 if v2 == -1 else v2))
+        return end
+    return binarypack_fast_pack_into
+
+def f199(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        return S_0(82, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f200(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 82, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f201(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        return S_0(83, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f202(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 83, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f203(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.amount
+        length = 12
+        return S_0(84, length, (v0), (v1), (v2))
+    return binarypack_fast_pack
+
+def f204(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.amount
+        length = 12
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 84, length, (v0), (v1), (v2))
+        return end
+    return binarypack_fast_pack_into
+
+def f205(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.amount
+        length = 12
+        return S_0(85, length, (v0), (v1), (v2))
+    return binarypack_fast_pack
+
+def f206(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.amount
+        length = 12
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 85, length, (v0), (v1), (v2))
+        return end
+    return binarypack_fast_pack_into
+
+def f207(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.message != other.message)
+    return __eq__
+
+def f208(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r message: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.message)
+    return __str__
+
+def f209(D_0, D_1, D_2, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, message=D_2):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'message': message})
+        return p
+    return make
+
+def f210(D_0, D_1, D_2, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, message=D_2):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.message = message
+        return p
+    return make
+
+def f211(D_0, D_1, D_2, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, message=D_2, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.message = message
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f212(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.message
+        length = 10 + len(v2)
+        return b''.join([S_0(86, length, (v0), (v1), len(v2)), v2])
+    return binarypack_fast_pack
+
+def f213(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.message
+        length = 10 + len(v2)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 86, length, (v0), (v1), len(v2))
+        offset += 13
+        buf[offset:offset + len(v2)] = v2
+        return end
+    return binarypack_fast_pack_into
+
+def f214(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, n2, = S_0(data, offset)
+        offset += 10
+        v2 = data[offset:offset + n2]
+        if v2.__class__ is memoryview: v2 = v2.tobytes()
+        offset += n2
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'message': v2})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f215(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, self.message, ))
+    return __hash__
+
+def f216(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.name != other.name or self.outfit != other.outfit or self.url != other.url)
+    return __eq__
+
+def f217(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r name: %r outfit: %r url: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.name, self.outfit, self.url)
+    return __str__
+
+def f218(D_0, D_1, D_2, D_3, D_4, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, name=D_2, outfit=D_3, url=D_4):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'name': name, 'outfit': outfit, 'url': url})
+        return p
+    return make
+
+def f219(D_0, D_1, D_2, D_3, D_4, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, name=D_2, outfit=D_3, url=D_4):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.name = name
+        p.outfit = outfit
+        p.url = url
+        return p
+    return make
+
+def f220(D_0, D_1, D_2, D_3, D_4, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, name=D_2, outfit=D_3, url=D_4, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.name = name
+        self.outfit = outfit
+        self.url = url
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f221(S_0, S_2, S_4, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.name
+        v3 = p.outfit
+        v4 = p.url
+        length = 14 + len(v2) + len(v3) + len(v4)
+        return b''.join([S_0(87, length, (v0), (v1), len(v2)), v2, S_2(len(v3)), v3, S_4(len(v4)), v4])
+    return binarypack_fast_pack
+
+def f222(S_0, S_2, S_4, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.name
+        v3 = p.outfit
+        v4 = p.url
+        length = 14 + len(v2) + len(v3) + len(v4)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 87, length, (v0), (v1), len(v2))
+        offset += 13
+        buf[offset:offset + len(v2)] = v2
+        offset += len(v2)
+        S_2(buf, offset, len(v3))
+        offset += 2
+        buf[offset:offset + len(v3)] = v3
+        offset += len(v3)
+        S_4(buf, offset, len(v4))
+        offset += 2
+        buf[offset:offset + len(v4)] = v4
+        return end
+    return binarypack_fast_pack_into
+
+def f223(S_0, S_10, S_5, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, n2, = S_0(data, offset)
+        offset += 10
+        v2 = data[offset:offset + n2]
+        if v2.__class__ is memoryview: v2 = v2.tobytes()
+        offset += n2
+        n3, = S_5(data, offset)
+        offset += 2
+        v3 = data[offset:offset + n3]
+        if v3.__class__ is memoryview: v3 = v3.tobytes()
+        offset += n3
+        n4, = S_10(data, offset)
+        offset += 2
+        v4 = data[offset:offset + n4]
+        if v4.__class__ is memoryview: v4 = v4.tobytes()
+        offset += n4
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'name': v2, 'outfit': v3, 'url': v4})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f224(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, self.name, self.outfit, self.url, ))
+    return __hash__
+
+def f225(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.name != other.name or self.outfit != other.outfit or self.url != other.url or self.blind != other.blind or self.remove_next_turn != other.remove_next_turn or self.sit_out != other.sit_out or self.sit_out_next_turn != other.sit_out_next_turn or self.auto != other.auto or self.auto_blind_ante != other.auto_blind_ante or self.wait_for != other.wait_for or self.buy_in_payed != other.buy_in_payed or self.seat != other.seat)
+    return __eq__
+
+def f226(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r name: %r outfit: %r url: %r blind: %r remove_next_turn: %r sit_out: %r sit_out_next_turn: %r auto: %r auto_blind_ante: %r wait_for: %r buy_in_payed: %r seat: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.name, self.outfit, self.url, self.blind, self.remove_next_turn, self.sit_out, self.sit_out_next_turn, self.auto, self.auto_blind_ante, self.wait_for, self.buy_in_payed, self.seat)
+    return __str__
+
+def f227(D_0, D_1, D_10, D_11, D_12, D_13, D_2, D_3, D_4, D_5, D_6, D_7, D_8, D_9, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, name=D_2, outfit=D_3, url=D_4, blind=D_5, remove_next_turn=D_6, sit_out=D_7, sit_out_next_turn=D_8, auto=D_9, auto_blind_ante=D_10, wait_for=D_11, buy_in_payed=D_12, seat=D_13):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'name': name, 'outfit': outfit, 'url': url, 'blind': blind, 'remove_next_turn': remove_next_turn, 'sit_out': sit_out, 'sit_out_next_turn': sit_out_next_turn, 'auto': auto, 'auto_blind_ante': auto_blind_ante, 'wait_for': wait_for, 'buy_in_payed': buy_in_payed, 'seat': seat})
+        return p
+    return make
+
+def f228(D_0, D_1, D_10, D_11, D_12, D_13, D_2, D_3, D_4, D_5, D_6, D_7, D_8, D_9, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, name=D_2, outfit=D_3, url=D_4, blind=D_5, remove_next_turn=D_6, sit_out=D_7, sit_out_next_turn=D_8, auto=D_9, auto_blind_ante=D_10, wait_for=D_11, buy_in_payed=D_12, seat=D_13):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.name = name
+        p.outfit = outfit
+        p.url = url
+        p.blind = blind
+        p.remove_next_turn = remove_next_turn
+        p.sit_out = sit_out
+        p.sit_out_next_turn = sit_out_next_turn
+        p.auto = auto
+        p.auto_blind_ante = auto_blind_ante
+        p.wait_for = wait_for
+        p.buy_in_payed = buy_in_payed
+        p.seat = seat
+        return p
+    return make
+
+def f229(D_0, D_1, D_10, D_11, D_12, D_13, D_2, D_3, D_4, D_5, D_6, D_7, D_8, D_9, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, name=D_2, outfit=D_3, url=D_4, blind=D_5, remove_next_turn=D_6, sit_out=D_7, sit_out_next_turn=D_8, auto=D_9, auto_blind_ante=D_10, wait_for=D_11, buy_in_payed=D_12, seat=D_13, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.name = name
+        self.outfit = outfit
+        self.url = url
+        self.blind = blind
+        self.remove_next_turn = remove_next_turn
+        self.sit_out = sit_out
+        self.sit_out_next_turn = sit_out_next_turn
+        self.auto = auto
+        self.auto_blind_ante = auto_blind_ante
+        self.wait_for = wait_for
+        self.buy_in_payed = buy_in_payed
+        self.seat = seat
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f230(S_0, S_2, S_4, S_6, S_8, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.name
+        v3 = p.outfit
+        v4 = p.url
+        v5 = p.blind
+        if v5 == True: v5 = '_TRUE'
+        elif v5 == False: v5 = '_FALSE'
+        v6 = p.remove_next_turn
+        v7 = p.sit_out
+        v8 = p.sit_out_next_turn
+        v9 = p.auto
+        v10 = p.auto_blind_ante
+        v11 = p.wait_for
+        v12 = p.buy_in_payed
+        v13 = p.seat
+        length = 24 + len(v2) + len(v3) + len(v4) + len(v5)
+        return b''.join([S_0(88, length, (v0), (v1), len(v2)), v2, S_2(len(v3)), v3, S_4(len(v4)), v4, S_6(len(v5)), v5, S_8((1 if v6 else 0), (1 if v7 else 0), (1 if v8 else 0), (1 if v9 else 0), (1 if v10 else 0), (1 if v11 else 0), (1 if v12 else 0), (255 if v13 == None else v13))])
+    return binarypack_fast_pack
+
+def f231(S_0, S_2, S_4, S_6, S_8, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.name
+        v3 = p.outfit
+        v4 = p.url
+        v5 = p.blind
+        if v5 == True: v5 = '_TRUE'
+        elif v5 == False: v5 = '_FALSE'
+        v6 = p.remove_next_turn
+        v7 = p.sit_out
+        v8 = p.sit_out_next_turn
+        v9 = p.auto
+        v10 = p.auto_blind_ante
+        v11 = p.wait_for
+        v12 = p.buy_in_payed
+        v13 = p.seat
+        length = 24 + len(v2) + len(v3) + len(v4) + len(v5)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 88, length, (v0), (v1), len(v2))
+        offset += 13
+        buf[offset:offset + len(v2)] = v2
+        offset += len(v2)
+        S_2(buf, offset, len(v3))
+        offset += 2
+        buf[offset:offset + len(v3)] = v3
+        offset += len(v3)
+        S_4(buf, offset, len(v4))
+        offset += 2
+        buf[offset:offset + len(v4)] = v4
+        offset += len(v4)
+        S_6(buf, offset, len(v5))
+        offset += 2
+        buf[offset:offset + len(v5)] = v5
+        offset += len(v5)
+        S_8(buf, offset, (1 if v6 else 0), (1 if v7 else 0), (1 if v8 else 0), (1 if v9 else 0), (1 if v10 else 0), (1 if v11 else 0), (1 if v12 else 0), (255 if v13 == None else v13))
+        return end
+    return binarypack_fast_pack_into
+
+def f232(S_0, S_10, S_15, S_22, S_5, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, n2, = S_0(data, offset)
+        offset += 10
+        v2 = data[offset:offset + n2]
+        if v2.__class__ is memoryview: v2 = v2.tobytes()
+        offset += n2
+        n3, = S_5(data, offset)
+        offset += 2
+        v3 = data[offset:offset + n3]
+        if v3.__class__ is memoryview: v3 = v3.tobytes()
+        offset += n3
+        n4, = S_10(data, offset)
+        offset += 2
+        v4 = data[offset:offset + n4]
+        if v4.__class__ is memoryview: v4 = v4.tobytes()
+        offset += n4
+        n5, = S_15(data, offset)
+        offset += 2
+        v5 = data[offset:offset + n5]
+        if v5.__class__ is memoryview: v5 = v5.tobytes()
+        offset += n5
+        if v5 == '_TRUE': v5 = True
+        elif v5 == '_FALSE': v5 = False
+        v6, v7, v8, v9, v10, v11, v12, v13, = S_22(data, offset)
+        offset += 8
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'name': v2, 'outfit': v3, 'url': v4, 'blind': v5, 'remove_next_turn': v6 != 0, 'sit_out': v7 != 0, 'sit_out_next_turn': v8 != 0, 'auto': v9 != 0, 'auto_blind_ante': v10 != 0, 'wait_for': v11 != 0, 'buy_in_payed': v12 != 0, 'seat': None if v13 == 255 else v13})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f233(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, self.name, self.outfit, self.url, self.blind, self.remove_next_turn, self.sit_out, self.sit_out_next_turn, self.auto, self.auto_blind_ante, self.wait_for, self.buy_in_payed, self.seat, ))
+    return __hash__
+
+def f234(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.string != other.string or self.start != other.start or self.count != other.count)
+    return __eq__
+
+def f235(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) string: %r start: %r count: %r' % (cls.__name__, cls.type, self.string, self.start, self.count)
+    return __str__
+
+def f236(D_0, D_1, D_2, MISSING, instance, packet_type, **_namespace):
+    def make(cls, string=D_0, start=D_1, count=D_2):
+        p = instance(cls, {'string': string, 'start': start, 'count': count})
+        return p
+    return make
+
+def f237(D_0, D_1, D_2, MISSING, packet_type, **_namespace):
+    def make(cls, string=D_0, start=D_1, count=D_2):
+        p = cls.__new__(cls)
+        p.string = string
+        p.start = start
+        p.count = count
+        return p
+    return make
+
+def f238(D_0, D_1, D_2, MISSING, **_namespace):
+    def __init__(self, string=D_0, start=D_1, count=D_2, **kw):
+        self.string = string
+        self.start = start
+        self.count = count
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f239(S_0, S_2, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.string
+        v1 = p.start
+        v2 = p.count
+        length = 7 + len(v0)
+        return b''.join([S_0(89, length, len(v0)), v0, S_2((v1), (v2))])
+    return binarypack_fast_pack
+
+def f240(S_0, S_2, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.string
+        v1 = p.start
+        v2 = p.count
+        length = 7 + len(v0)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 89, length, len(v0))
+        offset += 5
+        buf[offset:offset + len(v0)] = v0
+        offset += len(v0)
+        S_2(buf, offset, (v1), (v2))
+        return end
+    return binarypack_fast_pack_into
+
+def f241(S_0, S_5, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        n0, = S_0(data, offset)
+        offset += 2
+        v0 = data[offset:offset + n0]
+        if v0.__class__ is memoryview: v0 = v0.tobytes()
+        offset += n0
+        v1, v2, = S_5(data, offset)
+        offset += 5
+        p = instance(packet_type, {'string': v0, 'start': v1, 'count': v2})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f242(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.string, self.start, self.count, ))
+    return __hash__
+
+def f243(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.string != other.string or self.start != other.start or self.count != other.count or self.hands != other.hands or self.total != other.total)
+    return __eq__
+
+def f244(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) string: %r start: %r count: %r hands: %r total: %r' % (cls.__name__, cls.type, self.string, self.start, self.count, self.hands, self.total)
+    return __str__
+
+def f245(C_3, D_0, D_1, D_2, D_3, D_4, MISSING, instance, packet_type, **_namespace):
+    def make(cls, string=D_0, start=D_1, count=D_2, hands=MISSING, total=D_4):
+        p = instance(cls, {'string': string, 'start': start, 'count': count, 'hands': C_3(D_3) if hands is MISSING else hands, 'total': total})
+        return p
+    return make
+
+def f246(C_3, D_0, D_1, D_2, D_3, D_4, MISSING, packet_type, **_namespace):
+    def make(cls, string=D_0, start=D_1, count=D_2, hands=MISSING, total=D_4):
+        p = cls.__new__(cls)
+        p.string = string
+        p.start = start
+        p.count = count
+        p.hands = C_3(D_3) if hands is MISSING else hands
+        p.total = total
+        return p
+    return make
+
+def f247(C_3, D_0, D_1, D_2, D_3, D_4, MISSING, **_namespace):
+    def __init__(self, string=D_0, start=D_1, count=D_2, hands=MISSING, total=D_4, **kw):
+        self.string = string
+        self.start = start
+        self.count = count
+        self.hands = C_3(D_3) if hands is MISSING else hands
+        self.total = total
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f248(L_3, S_0, S_2, S_4, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.string
+        v1 = p.start
+        v2 = p.count
+        v3 = p.hands
+        n3 = len(v3)
+        d3 = L_3[n3].pack(*v3)
+        v4 = p.total
+        length = 12 + len(v0) + len(d3)
+        return b''.join([S_0(90, length, len(v0)), v0, S_2((v1), (v2), n3), d3, S_4((v4))])
+    return binarypack_fast_pack
+
+def f249(L_3, S_0, S_2, S_4, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.string
+        v1 = p.start
+        v2 = p.count
+        v3 = p.hands
+        n3 = len(v3)
+        d3 = L_3[n3].pack(*v3)
+        v4 = p.total
+        length = 12 + len(v0) + len(d3)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 90, length, len(v0))
+        offset += 5
+        buf[offset:offset + len(v0)] = v0
+        offset += len(v0)
+        S_2(buf, offset, (v1), (v2), n3)
+        offset += 6
+        buf[offset:offset + len(d3)] = d3
+        offset += len(d3)
+        S_4(buf, offset, (v4))
+        return end
+    return binarypack_fast_pack_into
+
+def f250(L_3, S_0, S_5, S_9, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        n0, = S_0(data, offset)
+        offset += 2
+        v0 = data[offset:offset + n0]
+        if v0.__class__ is memoryview: v0 = v0.tobytes()
+        offset += n0
+        v1, v2, n3, = S_5(data, offset)
+        offset += 6
+        v3 = list(L_3[n3].unpack_from(data, offset)) if n3 else []
+        offset += n3 * 4
+        v4, = S_9(data, offset)
+        offset += 4
+        p = instance(packet_type, {'string': v0, 'start': v1, 'count': v2, 'hands': v3, 'total': v4})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f251(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.string, self.start, self.count, hashable(self.hands), self.total, ))
+    return __hash__
+
+def f252(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.string
+        length = 2 + len(v0)
+        return b''.join([S_0(91, length, len(v0)), v0])
+    return binarypack_fast_pack
+
+def f253(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.string
+        length = 2 + len(v0)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 91, length, len(v0))
+        offset += 5
+        buf[offset:offset + len(v0)] = v0
+        return end
+    return binarypack_fast_pack_into
+
+def f254(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.rating != other.rating or self.affiliate != other.affiliate or self.name != other.name or self.password != other.password or self.email != other.email or self.money != other.money)
+    return __eq__
+
+def f255(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r rating: %r affiliate: %r name: %r password: %r email: %r money: %r' % (cls.__name__, cls.type, self.serial, self.rating, self.affiliate, self.name, self.password, self.email, self.money)
+    return __str__
+
+def f256(C_6, D_0, D_1, D_2, D_3, D_4, D_5, D_6, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, rating=D_1, affiliate=D_2, name=D_3, password=D_4, email=D_5, money=MISSING):
+        p = instance(cls, {'serial': serial, 'rating': rating, 'affiliate': affiliate, 'name': name, 'password': password, 'email': email, 'money': C_6(D_6) if money is MISSING else money})
+        return p
+    return make
+
+def f257(C_6, D_0, D_1, D_2, D_3, D_4, D_5, D_6, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, rating=D_1, affiliate=D_2, name=D_3, password=D_4, email=D_5, money=MISSING):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.rating = rating
+        p.affiliate = affiliate
+        p.name = name
+        p.password = password
+        p.email = email
+        p.money = C_6(D_6) if money is MISSING else money
+        return p
+    return make
+
+def f258(C_6, D_0, D_1, D_2, D_3, D_4, D_5, D_6, MISSING, **_namespace):
+    def __init__(self, serial=D_0, rating=D_1, affiliate=D_2, name=D_3, password=D_4, email=D_5, money=MISSING, **kw):
+        self.serial = serial
+        self.rating = rating
+        self.affiliate = affiliate
+        self.name = name
+        self.password = password
+        self.email = email
+        self.money = C_6(D_6) if money is MISSING else money
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f259(S_0, S_2, S_4, S_6, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.rating
+        v2 = p.affiliate
+        v3 = p.name
+        v4 = p.password
+        v5 = p.email
+        v6 = p.money
+        d6 = b''.join([S_MONEY_pack(c, m, g, t) for c, (m, g, t) in v6.iteritems()])
+        length = 20 + len(v3) + len(v4) + len(v5) + len(d6)
+        return b''.join([S_0(92, length, (v0), (v1), (v2), len(v3)), v3, S_2(len(v4)), v4, S_4(len(v5)), v5, S_6(len(v6)), d6])
+    return binarypack_fast_pack
+
+def f260(S_0, S_2, S_4, S_6, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.rating
+        v2 = p.affiliate
+        v3 = p.name
+        v4 = p.password
+        v5 = p.email
+        v6 = p.money
+        d6 = b''.join([S_MONEY_pack(c, m, g, t) for c, (m, g, t) in v6.iteritems()])
+        length = 20 + len(v3) + len(v4) + len(v5) + len(d6)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 92, length, (v0), (v1), (v2), len(v3))
+        offset += 17
+        buf[offset:offset + len(v3)] = v3
+        offset += len(v3)
+        S_2(buf, offset, len(v4))
+        offset += 2
+        buf[offset:offset + len(v4)] = v4
+        offset += len(v4)
+        S_4(buf, offset, len(v5))
+        offset += 2
+        buf[offset:offset + len(v5)] = v5
+        offset += len(v5)
+        S_6(buf, offset, len(v6))
+        offset += 2
+        buf[offset:offset + len(d6)] = d6
+        return end
+    return binarypack_fast_pack_into
+
+def f261(S_0, S_10, S_15, S_5, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, n3, = S_0(data, offset)
+        offset += 14
+        v3 = data[offset:offset + n3]
+        if v3.__class__ is memoryview: v3 = v3.tobytes()
+        offset += n3
+        n4, = S_5(data, offset)
+        offset += 2
+        v4 = data[offset:offset + n4]
+        if v4.__class__ is memoryview: v4 = v4.tobytes()
+        offset += n4
+        n5, = S_10(data, offset)
+        offset += 2
+        v5 = data[offset:offset + n5]
+        if v5.__class__ is memoryview: v5 = v5.tobytes()
+        offset += n5
+        n6, = S_15(data, offset)
+        offset += 2
+        v6 = {}
+        for j in xrange(n6):
+            c, m, g, t = S_MONEY_unpack_from(data, offset)
+            v6[c] = (m, g, t)
+            offset += 28
+        p = instance(packet_type, {'serial': v0, 'rating': v1, 'affiliate': v2, 'name': v3, 'password': v4, 'email': v5, 'money': v6})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f262(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.rating, self.affiliate, self.name, self.password, self.email, hashable(self.money), ))
+    return __hash__
+
+def f263(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial)
+    return __eq__
+
+def f264(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r' % (cls.__name__, cls.type, self.serial)
+    return __str__
+
+def f265(D_0, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0):
+        p = instance(cls, {'serial': serial})
+        return p
+    return make
+
+def f266(D_0, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0):
+        p = cls.__new__(cls)
+        p.serial = serial
+        return p
+    return make
+
+def f267(D_0, MISSING, **_namespace):
+    def __init__(self, serial=D_0, **kw):
+        self.serial = serial
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f268(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        length = 4
+        return S_0(93, length, (v0))
+    return binarypack_fast_pack
+
+def f269(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        length = 4
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 93, length, (v0))
+        return end
+    return binarypack_fast_pack_into
+
+def f270(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, = S_0(data, offset)
+        offset += 4
+        p = instance(packet_type, {'serial': v0})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f271(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, ))
+    return __hash__
+
+def f272(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.amount
+        length = 12
+        return S_0(94, length, (v0), (v1), (v2))
+    return binarypack_fast_pack
+
+def f273(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.amount
+        length = 12
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 94, length, (v0), (v1), (v2))
+        return end
+    return binarypack_fast_pack_into
+
+def f274(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.amount != other.amount or self.dead != other.dead)
+    return __eq__
+
+def f275(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r amount: %r dead: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.amount, self.dead)
+    return __str__
+
+def f276(D_0, D_1, D_2, D_3, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, amount=D_2, dead=D_3):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'amount': amount, 'dead': dead})
+        return p
+    return make
+
+def f277(D_0, D_1, D_2, D_3, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, amount=D_2, dead=D_3):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.amount = amount
+        p.dead = dead
+        return p
+    return make
+
+def f278(D_0, D_1, D_2, D_3, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, amount=D_2, dead=D_3, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.amount = amount
+        self.dead = dead
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f279(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.amount
+        v3 = p.dead
+        length = 16
+        return S_0(95, length, (v0), (v1), (v2), (v3))
+    return binarypack_fast_pack
+
+def f280(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.amount
+        v3 = p.dead
+        length = 16
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 95, length, (v0), (v1), (v2), (v3))
+        return end
+    return binarypack_fast_pack_into
+
+def f281(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, v3, = S_0(data, offset)
+        offset += 16
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'amount': v2, 'dead': v3})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f282(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, self.amount, self.dead, ))
+    return __hash__
+
+def f283(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        return S_0(96, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f284(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 96, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f285(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        return S_0(97, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f286(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 97, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f287(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        return S_0(98, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f288(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 98, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f289(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.amount
+        length = 12
+        return S_0(99, length, (v0), (v1), (v2))
+    return binarypack_fast_pack
+
+def f290(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.amount
+        length = 12
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 99, length, (v0), (v1), (v2))
+        return end
+    return binarypack_fast_pack_into
+
+def f291(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.amount != other.amount or self.dead != other.dead or self.state != other.state)
+    return __eq__
+
+def f292(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r amount: %r dead: %r state: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.amount, self.dead, self.state)
+    return __str__
+
+def f293(D_0, D_1, D_2, D_3, D_4, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, amount=D_2, dead=D_3, state=D_4):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'amount': amount, 'dead': dead, 'state': state})
+        return p
+    return make
+
+def f294(D_0, D_1, D_2, D_3, D_4, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, amount=D_2, dead=D_3, state=D_4):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.amount = amount
+        p.dead = dead
+        p.state = state
+        return p
+    return make
+
+def f295(D_0, D_1, D_2, D_3, D_4, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, amount=D_2, dead=D_3, state=D_4, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.amount = amount
+        self.dead = dead
+        self.state = state
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f296(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.amount
+        v3 = p.dead
+        v4 = p.state
+        length = 18 + len(v4)
+        return b''.join([S_0(100, length, (v0), (v1), (v2), (v3), len(v4)), v4])
+    return binarypack_fast_pack
+
+def f297(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.amount
+        v3 = p.dead
+        v4 = p.state
+        length = 18 + len(v4)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 100, length, (v0), (v1), (v2), (v3), len(v4))
+        offset += 21
+        buf[offset:offset + len(v4)] = v4
+        return end
+    return binarypack_fast_pack_into
+
+def f298(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, v3, n4, = S_0(data, offset)
+        offset += 18
+        v4 = data[offset:offset + n4]
+        if v4.__class__ is memoryview: v4 = v4.tobytes()
+        offset += n4
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'amount': v2, 'dead': v3, 'state': v4})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f299(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, self.amount, self.dead, self.state, ))
+    return __hash__
+
+def f300(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.amount
+        length = 12
+        return S_0(101, length, (v0), (v1), (v2))
+    return binarypack_fast_pack
+
+def f301(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.amount
+        length = 12
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 101, length, (v0), (v1), (v2))
+        return end
+    return binarypack_fast_pack_into
+
+def f302(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        return S_0(102, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f303(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 102, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f304(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.reason != other.reason)
+    return __eq__
+
+def f305(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r reason: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.reason)
+    return __str__
+
+def f306(D_0, D_1, D_2, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, reason=D_2):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'reason': reason})
+        return p
+    return make
+
+def f307(D_0, D_1, D_2, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, reason=D_2):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.reason = reason
+        return p
+    return make
+
+def f308(D_0, D_1, D_2, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, reason=D_2, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.reason = reason
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f309(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.reason
+        if v2 == True: v2 = '_TRUE'
+        elif v2 == False: v2 = '_FALSE'
+        length = 10 + len(v2)
+        return b''.join([S_0(103, length, (v0), (v1), len(v2)), v2])
+    return binarypack_fast_pack
+
+def f310(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.reason
+        if v2 == True: v2 = '_TRUE'
+        elif v2 == False: v2 = '_FALSE'
+        length = 10 + len(v2)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 103, length, (v0), (v1), len(v2))
+        offset += 13
+        buf[offset:offset + len(v2)] = v2
+        return end
+    return binarypack_fast_pack_into
+
+def f311(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, n2, = S_0(data, offset)
+        offset += 10
+        v2 = data[offset:offset + n2]
+        if v2.__class__ is memoryview: v2 = v2.tobytes()
+        offset += n2
+        if v2 == '_TRUE': v2 = True
+        elif v2 == '_FALSE': v2 = False
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'reason': v2})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f312(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, self.reason, ))
+    return __hash__
+
+def f313(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        return S_0(104, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f314(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 104, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f315(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        return S_0(105, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f316(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 105, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f317(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.state != other.state)
+    return __eq__
+
+def f318(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r state: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.state)
+    return __str__
+
+def f319(D_0, D_1, D_2, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1):
+        p = instance(cls, {'serial': serial, 'game_id': game_id})
+        return p
+    return make
+
+def f320(D_0, D_1, D_2, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.state = D_2
+        return p
+    return make
+
+def f321(D_0, D_1, D_2, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, state=D_2, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.state = state
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f322(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        return S_0(106, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f323(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 106, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f324(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, hashable(self.state), ))
+    return __hash__
+
+def f325(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        return S_0(107, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f326(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 107, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f327(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.game_id != other.game_id or self.players != other.players)
+    return __eq__
+
+def f328(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) game_id: %r players: %r' % (cls.__name__, cls.type, self.game_id, self.players)
+    return __str__
+
+def f329(C_1, D_0, D_1, MISSING, instance, packet_type, **_namespace):
+    def make(cls, game_id=D_0, players=MISSING):
+        p = instance(cls, {'game_id': game_id, 'players': C_1(D_1) if players is MISSING else players})
+        return p
+    return make
+
+def f330(C_1, D_0, D_1, MISSING, packet_type, **_namespace):
+    def make(cls, game_id=D_0, players=MISSING):
+        p = cls.__new__(cls)
+        p.game_id = game_id
+        p.players = C_1(D_1) if players is MISSING else players
+        return p
+    return make
+
+def f331(C_1, D_0, D_1, MISSING, **_namespace):
+    def __init__(self, game_id=D_0, players=MISSING, **kw):
+        self.game_id = game_id
+        self.players = C_1(D_1) if players is MISSING else players
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f332(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.game_id
+        v1 = p.players
+        d1 = b''.join([S_H_pack(len(n)) + n + S_IB_pack(c, f) for n, c, f in v1])
+        length = 6 + len(d1)
+        return b''.join([S_0(108, length, (v0), len(v1)), d1])
+    return binarypack_fast_pack
+
+def f333(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.game_id
+        v1 = p.players
+        d1 = b''.join([S_H_pack(len(n)) + n + S_IB_pack(c, f) for n, c, f in v1])
+        length = 6 + len(d1)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 108, length, (v0), len(v1))
+        offset += 9
+        buf[offset:offset + len(d1)] = d1
+        return end
+    return binarypack_fast_pack_into
+
+def f334(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, n1, = S_0(data, offset)
+        offset += 6
+        v1 = []
+        for j in xrange(n1):
+            l, = S_H_unpack_from(data, offset)
+            offset += 2 + l
+            c, f = S_IB_unpack_from(data, offset)
+            n = data[offset - l:offset]
+            if n.__class__ is memoryview: n = n.tobytes()
+            v1.append((n, c, f))
+            offset += 5
+        p = instance(packet_type, {'game_id': v0, 'players': v1})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f335(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.game_id, hashable(self.players), ))
+    return __hash__
+
+def f336(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.rating != other.rating or self.affiliate != other.affiliate or self.name != other.name or self.password != other.password or self.email != other.email or self.money != other.money or self.firstname != other.firstname or self.lastname != other.lastname or self.addr_street != other.addr_street or self.addr_street2 != other.addr_street2 or self.addr_zip != other.addr_zip or self.addr_town != other.addr_town or self.addr_state != other.addr_state or self.addr_country != other.addr_country or self.phone != other.phone or self.gender != other.gender or self.birthdate != other.birthdate)
+    return __eq__
+
+def f337(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r rating: %r affiliate: %r name: %r password: %r email: %r money: %r firstname: %r lastname: %r addr_street: %r addr_street2: %r addr_zip: %r addr_town: %r addr_state: %r addr_country: %r phone: %r gender: %r birthdate: %r' % (cls.__name__, cls.type, self.serial, self.rating, self.affiliate, self.name, self.password, self.email, self.money, self.firstname, self.lastname, self.addr_street, self.addr_street2, self.addr_zip, self.addr_town, self.addr_state, self.addr_country, self.phone, self.gender, self.birthdate)
+    return __str__
+
+def f338(C_6, D_0, D_1, D_10, D_11, D_12, D_13, D_14, D_15, D_16, D_17, D_2, D_3, D_4, D_5, D_6, D_7, D_8, D_9, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, rating=D_1, affiliate=D_2, name=D_3, password=D_4, email=D_5, money=MISSING, firstname=D_7, lastname=D_8, addr_street=D_9, addr_street2=D_10, addr_zip=D_11, addr_town=D_12, addr_state=D_13, addr_country=D_14, phone=D_15, gender=D_16, birthdate=D_17):
+        p = instance(cls, {'serial': serial, 'rating': rating, 'affiliate': affiliate, 'name': name, 'password': password, 'email': email, 'money': C_6(D_6) if money is MISSING else money, 'firstname': firstname, 'lastname': lastname, 'addr_street': addr_street, 'addr_street2': addr_street2, 'addr_zip': addr_zip, 'addr_town': addr_town, 'addr_state': addr_state, 'addr_country': addr_country, 'phone': phone, 'gender': gender, 'birthdate': birthdate})
+        return p
+    return make
+
+def f339(C_6, D_0, D_1, D_10, D_11, D_12, D_13, D_14, D_15, D_16, D_17, D_2, D_3, D_4, D_5, D_6, D_7, D_8, D_9, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, rating=D_1, affiliate=D_2, name=D_3, password=D_4, email=D_5, money=MISSING, firstname=D_7, lastname=D_8, addr_street=D_9, addr_street2=D_10, addr_zip=D_11, addr_town=D_12, addr_state=D_13, addr_country=D_14, phone=D_15, gender=D_16, birthdate=D_17):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.rating = rating
+        p.affiliate = affiliate
+        p.name = name
+        p.password = password
+        p.email = email
+        p.money = C_6(D_6) if money is MISSING else money
+        p.firstname = firstname
+        p.lastname = lastname
+        p.addr_street = addr_street
+        p.addr_street2 = addr_street2
+        p.addr_zip = addr_zip
+        p.addr_town = addr_town
+        p.addr_state = addr_state
+        p.addr_country = addr_country
+        p.phone = phone
+        p.gender = gender
+        p.birthdate = birthdate
+        return p
+    return make
+
+def f340(C_6, D_0, D_1, D_10, D_11, D_12, D_13, D_14, D_15, D_16, D_17, D_2, D_3, D_4, D_5, D_6, D_7, D_8, D_9, MISSING, **_namespace):
+    def __init__(self, serial=D_0, rating=D_1, affiliate=D_2, name=D_3, password=D_4, email=D_5, money=MISSING, firstname=D_7, lastname=D_8, addr_street=D_9, addr_street2=D_10, addr_zip=D_11, addr_town=D_12, addr_state=D_13, addr_country=D_14, phone=D_15, gender=D_16, birthdate=D_17, **kw):
+        self.serial = serial
+        self.rating = rating
+        self.affiliate = affiliate
+        self.name = name
+        self.password = password
+        self.email = email
+        self.money = C_6(D_6) if money is MISSING else money
+        self.firstname = firstname
+        self.lastname = lastname
+        self.addr_street = addr_street
+        self.addr_street2 = addr_street2
+        self.addr_zip = addr_zip
+        self.addr_town = addr_town
+        self.addr_state = addr_state
+        self.addr_country = addr_country
+        self.phone = phone
+        self.gender = gender
+        self.birthdate = birthdate
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f341(S_0, S_10, S_12, S_14, S_16, S_18, S_2, S_20, S_22, S_24, S_26, S_28, S_4, S_6, S_8, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.rating
+        v2 = p.affiliate
+        v3 = p.name
+        v4 = p.password
+        v5 = p.email
+        v6 = p.money
+        d6 = b''.join([S_MONEY_pack(c, m, g, t) for c, (m, g, t) in v6.iteritems()])
+        v7 = p.firstname
+        v8 = p.lastname
+        v9 = p.addr_street
+        v10 = p.addr_street2
+        v11 = p.addr_zip
+        v12 = p.addr_town
+        v13 = p.addr_state
+        v14 = p.addr_country
+        v15 = p.phone
+        v16 = p.gender
+        v17 = p.birthdate
+        length = 42 + len(v3) + len(v4) + len(v5) + len(d6) + len(v7) + len(v8) + len(v9) + len(v10) + len(v11) + len(v12) + len(v13) + len(v14) + len(v15) + len(v16) + len(v17)
+        return b''.join([S_0(109, length, (v0), (v1), (v2), len(v3)), v3, S_2(len(v4)), v4, S_4(len(v5)), v5, S_6(len(v6)), d6, S_8(len(v7)), v7, S_10(len(v8)), v8, S_12(len(v9)), v9, S_14(len(v10)), v10, S_16(len(v11)), v11, S_18(len(v12)), v12, S_20(len(v13)), v13, S_22(len(v14)), v14, S_24(len(v15)), v15, S_26(len(v16)), v16, S_28(len(v17)), v17])
+    return binarypack_fast_pack
+
+def f342(S_0, S_10, S_12, S_14, S_16, S_18, S_2, S_20, S_22, S_24, S_26, S_28, S_4, S_6, S_8, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.rating
+        v2 = p.affiliate
+        v3 = p.name
+        v4 = p.password
+        v5 = p.email
+        v6 = p.money
+        d6 = b''.join([S_MONEY_pack(c, m, g, t) for c, (m, g, t) in v6.iteritems()])
+        v7 = p.firstname
+        v8 = p.lastname
+        v9 = p.addr_street
+        v10 = p.addr_street2
+        v11 = p.addr_zip
+        v12 = p.addr_town
+        v13 = p.addr_state
+        v14 = p.addr_country
+        v15 = p.phone
+        v16 = p.gender
+        v17 = p.birthdate
+        length = 42 + len(v3) + len(v4) + len(v5) + len(d6) + len(v7) + len(v8) + len(v9) + len(v10) + len(v11) + len(v12) + len(v13) + len(v14) + len(v15) + len(v16) + len(v17)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 109, length, (v0), (v1), (v2), len(v3))
+        offset += 17
+        buf[offset:offset + len(v3)] = v3
+        offset += len(v3)
+        S_2(buf, offset, len(v4))
+        offset += 2
+        buf[offset:offset + len(v4)] = v4
+        offset += len(v4)
+        S_4(buf, offset, len(v5))
+        offset += 2
+        buf[offset:offset + len(v5)] = v5
+        offset += len(v5)
+        S_6(buf, offset, len(v6))
+        offset += 2
+        buf[offset:offset + len(d6)] = d6
+        offset += len(d6)
+        S_8(buf, offset, len(v7))
+        offset += 2
+        buf[offset:offset + len(v7)] = v7
+        offset += len(v7)
+        S_10(buf, offset, len(v8))
+        offset += 2
+        buf[offset:offset + len(v8)] = v8
+        offset += len(v8)
+        S_12(buf, offset, len(v9))
+        offset += 2
+        buf[offset:offset + len(v9)] = v9
+        offset += len(v9)
+        S_14(buf, offset, len(v10))
+        offset += 2
+        buf[offset:offset + len(v10)] = v10
+        offset += len(v10)
+        S_16(buf, offset, len(v11))
+        offset += 2
+        buf[offset:offset + len(v11)] = v11
+        offset += len(v11)
+        S_18(buf, offset, len(v12))
+        offset += 2
+        buf[offset:offset + len(v12)] = v12
+        offset += len(v12)
+        S_20(buf, offset, len(v13))
+        offset += 2
+        buf[offset:offset + len(v13)] = v13
+        offset += len(v13)
+        S_22(buf, offset, len(v14))
+        offset += 2
+        buf[offset:offset + len(v14)] = v14
+        offset += len(v14)
+        S_24(buf, offset, len(v15))
+        offset += 2
+        buf[offset:offset + len(v15)] = v15
+        offset += len(v15)
+        S_26(buf, offset, len(v16))
+        offset += 2
+        buf[offset:offset + len(v16)] = v16
+        offset += len(v16)
+        S_28(buf, offset, len(v17))
+        offset += 2
+        buf[offset:offset + len(v17)] = v17
+        return end
+    return binarypack_fast_pack_into
+
+def f343(S_0, S_10, S_15, S_22, S_27, S_32, S_37, S_42, S_47, S_5, S_52, S_57, S_62, S_67, S_72, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, n3, = S_0(data, offset)
+        offset += 14
+        v3 = data[offset:offset + n3]
+        if v3.__class__ is memoryview: v3 = v3.tobytes()
+        offset += n3
+        n4, = S_5(data, offset)
+        offset += 2
+        v4 = data[offset:offset + n4]
+        if v4.__class__ is memoryview: v4 = v4.tobytes()
+        offset += n4
+        n5, = S_10(data, offset)
+        offset += 2
+        v5 = data[offset:offset + n5]
+        if v5.__class__ is memoryview: v5 = v5.tobytes()
+        offset += n5
+        n6, = S_15(data, offset)
+        offset += 2
+        v6 = {}
+        for j in xrange(n6):
+            c, m, g, t = S_MONEY_unpack_from(data, offset)
+            v6[c] = (m, g, t)
+            offset += 28
+        n7, = S_22(data, offset)
+        offset += 2
+        v7 = data[offset:offset + n7]
+        if v7.__class__ is memoryview: v7 = v7.tobytes()
+        offset += n7
+        n8, = S_27(data, offset)
+        offset += 2
+        v8 = data[offset:offset + n8]
+        if v8.__class__ is memoryview: v8 = v8.tobytes()
+        offset += n8
+        n9, = S_32(data, offset)
+        offset += 2
+        v9 = data[offset:offset + n9]
+        if v9.__class__ is memoryview: v9 = v9.tobytes()
+        offset += n9
+        n10, = S_37(data, offset)
+        offset += 2
+        v10 = data[offset:offset + n10]
+        if v10.__class__ is memoryview: v10 = v10.tobytes()
+        offset += n10
+        n11, = S_42(data, offset)
+        offset += 2
+        v11 = data[offset:offset + n11]
+        if v11.__class__ is memoryview: v11 = v11.tobytes()
+        offset += n11
+        n12, = S_47(data, offset)
+        offset += 2
+        v12 = data[offset:offset + n12]
+        if v12.__class__ is memoryview: v12 = v12.tobytes()
+        offset += n12
+        n13, = S_52(data, offset)
+        offset += 2
+        v13 = data[offset:offset + n13]
+        if v13.__class__ is memoryview: v13 = v13.tobytes()
+        offset += n13
+        n14, = S_57(data, offset)
+        offset += 2
+        v14 = data[offset:offset + n14]
+        if v14.__class__ is memoryview: v14 = v14.tobytes()
+        offset += n14
+        n15, = S_62(data, offset)
+        offset += 2
+        v15 = data[offset:offset + n15]
+        if v15.__class__ is memoryview: v15 = v15.tobytes()
+        offset += n15
+        n16, = S_67(data, offset)
+        offset += 2
+        v16 = data[offset:offset + n16]
+        if v16.__class__ is memoryview: v16 = v16.tobytes()
+        offset += n16
+        n17, = S_72(data, offset)
+        offset += 2
+        v17 = data[offset:offset + n17]
+        if v17.__class__ is memoryview: v17 = v17.tobytes()
+        offset += n17
+        p = instance(packet_type, {'serial': v0, 'rating': v1, 'affiliate': v2, 'name': v3, 'password': v4, 'email': v5, 'money': v6, 'firstname': v7, 'lastname': v8, 'addr_street': v9, 'addr_street2': v10, 'addr_zip': v11, 'addr_town': v12, 'addr_state': v13, 'addr_country': v14, 'phone': v15, 'gender': v16, 'birthdate': v17})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f344(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.rating, self.affiliate, self.name, self.password, self.email, hashable(self.money), self.firstname, self.lastname, self.addr_street, self.addr_street2, self.addr_zip, self.addr_town, self.addr_state, self.addr_country, self.phone, self.gender, self.birthdate, ))
+    return __hash__
+
+def f345(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        length = 4
+        return S_0(110, length, (v0))
+    return binarypack_fast_pack
+
+def f346(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        length = 4
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 110, length, (v0))
+        return end
+    return binarypack_fast_pack_into
+
+def f347(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.string
+        length = 2 + len(v0)
+        return b''.join([S_0(111, length, len(v0)), v0])
+    return binarypack_fast_pack
+
+def f348(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.string
+        length = 2 + len(v0)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 111, length, len(v0))
+        offset += 5
+        buf[offset:offset + len(v0)] = v0
+        return end
+    return binarypack_fast_pack_into
+
+def f349(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.buy_in != other.buy_in or self.rake != other.rake or self.start_time != other.start_time or self.rebuy_time_remaining != other.rebuy_time_remaining or self.kick_timeout != other.kick_timeout or self.sit_n_go != other.sit_n_go or self.players_quota != other.players_quota or self.registered != other.registered or self.currency_serial != other.currency_serial or self.breaks_first != other.breaks_first or self.breaks_interval != other.breaks_interval or self.breaks_duration != other.breaks_duration or self.description_short != other.description_short or self.variant != other.variant or self.state != other.state or self.name != other.name or self.skin != other.skin or self.schedule_serial != other.schedule_serial)
+    return __eq__
+
+def f350(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r buy_in: %r rake: %r start_time: %r rebuy_time_remaining: %r kick_timeout: %r sit_n_go: %r players_quota: %r registered: %r currency_serial: %r breaks_first: %r breaks_interval: %r breaks_duration: %r description_short: %r variant: %r state: %r name: %r skin: %r schedule_serial: %r' % (cls.__name__, cls.type, self.serial, self.buy_in, self.rake, self.start_time, self.rebuy_time_remaining, self.kick_timeout, self.sit_n_go, self.players_quota, self.registered, self.currency_serial, self.breaks_first, self.breaks_interval, self.breaks_duration, self.description_short, self.variant, self.state, self.name, self.skin, self.schedule_serial)
+    return __str__
+
+def f351(D_0, D_1, D_10, D_11, D_12, D_13, D_14, D_15, D_16, D_17, D_18, D_2, D_3, D_4, D_5, D_6, D_7, D_8, D_9, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, buy_in=D_1, rake=D_2, start_time=D_3, rebuy_time_remaining=D_4, kick_timeout=D_5, sit_n_go=D_6, players_quota=D_7, registered=D_8, currency_serial=D_9, breaks_first=D_10, breaks_interval=D_11, breaks_duration=D_12, description_short=D_13, variant=D_14, state=D_15, name=D_16, skin=D_17, schedule_serial=D_18):
+        p = instance(cls, {'serial': serial, 'buy_in': buy_in, 'rake': rake, 'start_time': start_time, 'rebuy_time_remaining': rebuy_time_remaining, 'kick_timeout': kick_timeout, 'sit_n_go': sit_n_go, 'players_quota': players_quota, 'registered': registered, 'currency_serial': currency_serial, 'breaks_first': breaks_first, 'breaks_interval': breaks_interval, 'breaks_duration': breaks_duration, 'description_short': description_short, 'variant': variant, 'state': state, 'name': name, 'skin': skin, 'schedule_serial': schedule_serial})
+        return p
+    return make
+
+def f352(D_0, D_1, D_10, D_11, D_12, D_13, D_14, D_15, D_16, D_17, D_18, D_2, D_3, D_4, D_5, D_6, D_7, D_8, D_9, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, buy_in=D_1, rake=D_2, start_time=D_3, rebuy_time_remaining=D_4, kick_timeout=D_5, sit_n_go=D_6, players_quota=D_7, registered=D_8, currency_serial=D_9, breaks_first=D_10, breaks_interval=D_11, breaks_duration=D_12, description_short=D_13, variant=D_14, state=D_15, name=D_16, skin=D_17, schedule_serial=D_18):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.buy_in = buy_in
+        p.rake = rake
+        p.start_time = start_time
+        p.rebuy_time_remaining = rebuy_time_remaining
+        p.kick_timeout = kick_timeout
+        p.sit_n_go = sit_n_go
+        p.players_quota = players_quota
+        p.registered = registered
+        p.currency_serial = currency_serial
+        p.breaks_first = breaks_first
+        p.breaks_interval = breaks_interval
+        p.breaks_duration = breaks_duration
+        p.description_short = description_short
+        p.variant = variant
+        p.state = state
+        p.name = name
+        p.skin = skin
+        p.schedule_serial = schedule_serial
+        return p
+    return make
+
+def f353(D_0, D_1, D_10, D_11, D_12, D_13, D_14, D_15, D_16, D_17, D_18, D_2, D_3, D_4, D_5, D_6, D_7, D_8, D_9, MISSING, **_namespace):
+    def __init__(self, serial=D_0, buy_in=D_1, rake=D_2, start_time=D_3, rebuy_time_remaining=D_4, kick_timeout=D_5, sit_n_go=D_6, players_quota=D_7, registered=D_8, currency_serial=D_9, breaks_first=D_10, breaks_interval=D_11, breaks_duration=D_12, description_short=D_13, variant=D_14, state=D_15, name=D_16, skin=D_17, schedule_serial=D_18, **kw):
+        self.serial = serial
+        self.buy_in = buy_in
+        self.rake = rake
+        self.start_time = start_time
+        self.rebuy_time_remaining = rebuy_time_remaining
+        self.kick_timeout = kick_timeout
+        self.sit_n_go = sit_n_go
+        self.players_quota = players_quota
+        self.registered = registered
+        self.currency_serial = currency_serial
+        self.breaks_first = breaks_first
+        self.breaks_interval = breaks_interval
+        self.breaks_duration = breaks_duration
+        self.description_short = description_short
+        self.variant = variant
+        self.state = state
+        self.name = name
+        self.skin = skin
+        self.schedule_serial = schedule_serial
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f354(S_0, S_10, S_2, S_4, S_6, S_8, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.buy_in
+        v2 = p.rake
+        v3 = p.start_time
+        v4 = p.rebuy_time_remaining
+        v5 = p.kick_timeout
+        v6 = p.sit_n_go
+        v7 = p.players_quota
+        v8 = p.registered
+        v9 = p.currency_serial
+        v10 = p.breaks_first
+        v11 = p.breaks_interval
+        v12 = p.breaks_duration
+        v13 = p.description_short
+        v14 = p.variant
+        v15 = p.state
+        v16 = p.name
+        v17 = p.skin
+        v18 = p.schedule_serial
+        length = 53 + len(v13) + len(v14) + len(v15) + len(v16) + len(v17)
+        return b''.join([S_0(112, length, (v0), (v1), (v2), (v3), (v4), (v5), (1 if v6 == 'y' else 0), (v7), (v8), (v9), (v10), (v11), (v12), len(v13)), v13, S_2(len(v14)), v14, S_4(len(v15)), v15, S_6(len(v16)), v16, S_8(len(v17)), v17, S_10((v18))])
+    return binarypack_fast_pack
+
+def f355(S_0, S_10, S_2, S_4, S_6, S_8, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.buy_in
+        v2 = p.rake
+        v3 = p.start_time
+        v4 = p.rebuy_time_remaining
+        v5 = p.kick_timeout
+        v6 = p.sit_n_go
+        v7 = p.players_quota
+        v8 = p.registered
+        v9 = p.currency_serial
+        v10 = p.breaks_first
+        v11 = p.breaks_interval
+        v12 = p.breaks_duration
+        v13 = p.description_short
+        v14 = p.variant
+        v15 = p.state
+        v16 = p.name
+        v17 = p.skin
+        v18 = p.schedule_serial
+        length = 53 + len(v13) + len(v14) + len(v15) + len(v16) + len(v17)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 112, length, (v0), (v1), (v2), (v3), (v4), (v5), (1 if v6 == 'y' else 0), (v7), (v8), (v9), (v10), (v11), (v12), len(v13))
+        offset += 44
+        buf[offset:offset + len(v13)] = v13
+        offset += len(v13)
+        S_2(buf, offset, len(v14))
+        offset += 2
+        buf[offset:offset + len(v14)] = v14
+        offset += len(v14)
+        S_4(buf, offset, len(v15))
+        offset += 2
+        buf[offset:offset + len(v15)] = v15
+        offset += len(v15)
+        S_6(buf, offset, len(v16))
+        offset += 2
+        buf[offset:offset + len(v16)] = v16
+        offset += len(v16)
+        S_8(buf, offset, len(v17))
+        offset += 2
+        buf[offset:offset + len(v17)] = v17
+        offset += len(v17)
+        S_10(buf, offset, (v18))
+        return end
+    return binarypack_fast_pack_into
+
+def f356(S_0, S_10, S_15, S_20, S_25, S_5, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, v3, v4, v5, v6, v7, v8, v9, v10, v11, v12, n13, = S_0(data, offset)
+        offset += 41
+        v13 = data[offset:offset + n13]
+        if v13.__class__ is memoryview: v13 = v13.tobytes()
+        offset += n13
+        n14, = S_5(data, offset)
+        offset += 2
+        v14 = data[offset:offset + n14]
+        if v14.__class__ is memoryview: v14 = v14.tobytes()
+        offset += n14
+        n15, = S_10(data, offset)
+        offset += 2
+        v15 = data[offset:offset + n15]
+        if v15.__class__ is memoryview: v15 = v15.tobytes()
+        offset += n15
+        n16, = S_15(data, offset)
+        offset += 2
+        v16 = data[offset:offset + n16]
+        if v16.__class__ is memoryview: v16 = v16.tobytes()
+        offset += n16
+        n17, = S_20(data, offset)
+        offset += 2
+        v17 = data[offset:offset + n17]
+        if v17.__class__ is memoryview: v17 = v17.tobytes()
+        offset += n17
+        v18, = S_25(data, offset)
+        offset += 4
+        p = instance(packet_type, {'serial': v0, 'buy_in': v1, 'rake': v2, 'start_time': v3, 'rebuy_time_remaining': v4, 'kick_timeout': v5, 'sit_n_go': 'y' if v6 != 0 else 'n', 'players_quota': v7, 'registered': v8, 'currency_serial': v9, 'breaks_first': v10, 'breaks_interval': v11, 'breaks_duration': v12, 'description_short': v13, 'variant': v14, 'state': v15, 'name': v16, 'skin': v17, 'schedule_serial': v18})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f357(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.buy_in, self.rake, self.start_time, self.rebuy_time_remaining, self.kick_timeout, self.sit_n_go, self.players_quota, self.registered, self.currency_serial, self.breaks_first, self.breaks_interval, self.breaks_duration, self.description_short, self.variant, self.state, self.name, self.skin, self.schedule_serial, ))
+    return __hash__
+
+def f358(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.buy_in != other.buy_in or self.rake != other.rake or self.start_time != other.start_time or self.rebuy_time_remaining != other.rebuy_time_remaining or self.kick_timeout != other.kick_timeout or self.sit_n_go != other.sit_n_go or self.players_quota != other.players_quota or self.registered != other.registered or self.currency_serial != other.currency_serial or self.breaks_first != other.breaks_first or self.breaks_interval != other.breaks_interval or self.breaks_duration != other.breaks_duration or self.description_short != other.description_short or self.variant != other.variant or self.state != other.state or self.name != other.name or self.skin != other.skin or self.schedule_serial != other.schedule_serial or self.description_long != other.description_long)
+    return __eq__
+
+def f359(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r buy_in: %r rake: %r start_time: %r rebuy_time_remaining: %r kick_timeout: %r sit_n_go: %r players_quota: %r registered: %r currency_serial: %r breaks_first: %r breaks_interval: %r breaks_duration: %r description_short: %r variant: %r state: %r name: %r skin: %r schedule_serial: %r description_long: %r' % (cls.__name__, cls.type, self.serial, self.buy_in, self.rake, self.start_time, self.rebuy_time_remaining, self.kick_timeout, self.sit_n_go, self.players_quota, self.registered, self.currency_serial, self.breaks_first, self.breaks_interval, self.breaks_duration, self.description_short, self.variant, self.state, self.name, self.skin, self.schedule_serial, self.description_long)
+    return __str__
+
+def f360(D_0, D_1, D_10, D_11, D_12, D_13, D_14, D_15, D_16, D_17, D_18, D_19, D_2, D_3, D_4, D_5, D_6, D_7, D_8, D_9, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, buy_in=D_1, rake=D_2, start_time=D_3, rebuy_time_remaining=D_4, kick_timeout=D_5, sit_n_go=D_6, players_quota=D_7, registered=D_8, currency_serial=D_9, breaks_first=D_10, breaks_interval=D_11, breaks_duration=D_12, description_short=D_13, variant=D_14, state=D_15, name=D_16, skin=D_17, schedule_serial=D_18, description_long=D_19):
+        p = instance(cls, {'serial': serial, 'buy_in': buy_in, 'rake': rake, 'start_time': start_time, 'rebuy_time_remaining': rebuy_time_remaining, 'kick_timeout': kick_timeout, 'sit_n_go': sit_n_go, 'players_quota': players_quota, 'registered': registered, 'currency_serial': currency_serial, 'breaks_first': breaks_first, 'breaks_interval': breaks_interval, 'breaks_duration': breaks_duration, 'description_short': description_short, 'variant': variant, 'state': state, 'name': name, 'skin': skin, 'schedule_serial': schedule_serial, 'description_long': description_long})
+        return p
+    return make
+
+def f361(D_0, D_1, D_10, D_11, D_12, D_13, D_14, D_15, D_16, D_17, D_18, D_19, D_2, D_3, D_4, D_5, D_6, D_7, D_8, D_9, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, buy_in=D_1, rake=D_2, start_time=D_3, rebuy_time_remaining=D_4, kick_timeout=D_5, sit_n_go=D_6, players_quota=D_7, registered=D_8, currency_serial=D_9, breaks_first=D_10, breaks_interval=D_11, breaks_duration=D_12, description_short=D_13, variant=D_14, state=D_15, name=D_16, skin=D_17, schedule_serial=D_18, description_long=D_19):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.buy_in = buy_in
+        p.rake = rake
+        p.start_time = start_time
+        p.rebuy_time_remaining = rebuy_time_remaining
+        p.kick_timeout = kick_timeout
+        p.sit_n_go = sit_n_go
+        p.players_quota = players_quota
+        p.registered = registered
+        p.currency_serial = currency_serial
+        p.breaks_first = breaks_first
+        p.breaks_interval = breaks_interval
+        p.breaks_duration = breaks_duration
+        p.description_short = description_short
+        p.variant = variant
+        p.state = state
+        p.name = name
+        p.skin = skin
+        p.schedule_serial = schedule_serial
+        p.description_long = description_long
+        return p
+    return make
+
+def f362(D_0, D_1, D_10, D_11, D_12, D_13, D_14, D_15, D_16, D_17, D_18, D_19, D_2, D_3, D_4, D_5, D_6, D_7, D_8, D_9, MISSING, **_namespace):
+    def __init__(self, serial=D_0, buy_in=D_1, rake=D_2, start_time=D_3, rebuy_time_remaining=D_4, kick_timeout=D_5, sit_n_go=D_6, players_quota=D_7, registered=D_8, currency_serial=D_9, breaks_first=D_10, breaks_interval=D_11, breaks_duration=D_12, description_short=D_13, variant=D_14, state=D_15, name=D_16, skin=D_17, schedule_serial=D_18, description_long=D_19, **kw):
+        self.serial = serial
+        self.buy_in = buy_in
+        self.rake = rake
+        self.start_time = start_time
+        self.rebuy_time_remaining = rebuy_time_remaining
+        self.kick_timeout = kick_timeout
+        self.sit_n_go = sit_n_go
+        self.players_quota = players_quota
+        self.registered = registered
+        self.currency_serial = currency_serial
+        self.breaks_first = breaks_first
+        self.breaks_interval = breaks_interval
+        self.breaks_duration = breaks_duration
+        self.description_short = description_short
+        self.variant = variant
+        self.state = state
+        self.name = name
+        self.skin = skin
+        self.schedule_serial = schedule_serial
+        self.description_long = description_long
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f363(S_0, S_10, S_2, S_4, S_6, S_8, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.buy_in
+        v2 = p.rake
+        v3 = p.start_time
+        v4 = p.rebuy_time_remaining
+        v5 = p.kick_timeout
+        v6 = p.sit_n_go
+        v7 = p.players_quota
+        v8 = p.registered
+        v9 = p.currency_serial
+        v10 = p.breaks_first
+        v11 = p.breaks_interval
+        v12 = p.breaks_duration
+        v13 = p.description_short
+        v14 = p.variant
+        v15 = p.state
+        v16 = p.name
+        v17 = p.skin
+        v18 = p.schedule_serial
+        v19 = p.description_long
+        length = 55 + len(v13) + len(v14) + len(v15) + len(v16) + len(v17) + len(v19)
+        return b''.join([S_0(113, length, (v0), (v1), (v2), (v3), (v4), (v5), (1 if v6 == 'y' else 0), (v7), (v8), (v9), (v10), (v11), (v12), len(v13)), v13, S_2(len(v14)), v14, S_4(len(v15)), v15, S_6(len(v16)), v16, S_8(len(v17)), v17, S_10((v18), len(v19)), v19])
+    return binarypack_fast_pack
+
+def f364(S_0, S_10, S_2, S_4, S_6, S_8, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.buy_in
+        v2 = p.rake
+        v3 = p.start_time
+        v4 = p.rebuy_time_remaining
+        v5 = p.kick_timeout
+        v6 = p.sit_n_go
+        v7 = p.players_quota
+        v8 = p.registered
+        v9 = p.currency_serial
+        v10 = p.breaks_first
+        v11 = p.breaks_interval
+        v12 = p.breaks_duration
+        v13 = p.description_short
+        v14 = p.variant
+        v15 = p.state
+        v16 = p.name
+        v17 = p.skin
+        v18 = p.schedule_serial
+        v19 = p.description_long
+        length = 55 + len(v13) + len(v14) + len(v15) + len(v16) + len(v17) + len(v19)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 113, length, (v0), (v1), (v2), (v3), (v4), (v5), (1 if v6 == 'y' else 0), (v7), (v8), (v9), (v10), (v11), (v12), len(v13))
+        offset += 44
+        buf[offset:offset + len(v13)] = v13
+        offset += len(v13)
+        S_2(buf, offset, len(v14))
+        offset += 2
+        buf[offset:offset + len(v14)] = v14
+        offset += len(v14)
+        S_4(buf, offset, len(v15))
+        offset += 2
+        buf[offset:offset + len(v15)] = v15
+        offset += len(v15)
+        S_6(buf, offset, len(v16))
+        offset += 2
+        buf[offset:offset + len(v16)] = v16
+        offset += len(v16)
+        S_8(buf, offset, len(v17))
+        offset += 2
+        buf[offset:offset + len(v17)] = v17
+        offset += len(v17)
+        S_10(buf, offset, (v18), len(v19))
+        offset += 6
+        buf[offset:offset + len(v19)] = v19
+        return end
+    return binarypack_fast_pack_into
+
+def f365(S_0, S_10, S_15, S_20, S_25, S_5, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, v3, v4, v5, v6, v7, v8, v9, v10, v11, v12, n13, = S_0(data, offset)
+        offset += 41
+        v13 = data[offset:offset + n13]
+        if v13.__class__ is memoryview: v13 = v13.tobytes()
+        offset += n13
+        n14, = S_5(data, offset)
+        offset += 2
+        v14 = data[offset:offset + n14]
+        if v14.__class__ is memoryview: v14 = v14.tobytes()
+        offset += n14
+        n15, = S_10(data, offset)
+        offset += 2
+        v15 = data[offset:offset + n15]
+        if v15.__class__ is memoryview: v15 = v15.tobytes()
+        offset += n15
+        n16, = S_15(data, offset)
+        offset += 2
+        v16 = data[offset:offset + n16]
+        if v16.__class__ is memoryview: v16 = v16.tobytes()
+        offset += n16
+        n17, = S_20(data, offset)
+        offset += 2
+        v17 = data[offset:offset + n17]
+        if v17.__class__ is memoryview: v17 = v17.tobytes()
+        offset += n17
+        v18, n19, = S_25(data, offset)
+        offset += 6
+        v19 = data[offset:offset + n19]
+        if v19.__class__ is memoryview: v19 = v19.tobytes()
+        offset += n19
+        p = instance(packet_type, {'serial': v0, 'buy_in': v1, 'rake': v2, 'start_time': v3, 'rebuy_time_remaining': v4, 'kick_timeout': v5, 'sit_n_go': 'y' if v6 != 0 else 'n', 'players_quota': v7, 'registered': v8, 'currency_serial': v9, 'breaks_first': v10, 'breaks_interval': v11, 'breaks_duration': v12, 'description_short': v13, 'variant': v14, 'state': v15, 'name': v16, 'skin': v17, 'schedule_serial': v18, 'description_long': v19})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f366(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.buy_in, self.rake, self.start_time, self.rebuy_time_remaining, self.kick_timeout, self.sit_n_go, self.players_quota, self.registered, self.currency_serial, self.breaks_first, self.breaks_interval, self.breaks_duration, self.description_short, self.variant, self.state, self.name, self.skin, self.schedule_serial, self.description_long, ))
+    return __hash__
+
+def f367(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.packets != other.packets or self.players != other.players or self.tourneys != other.tourneys)
+    return __eq__
+
+def f368(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) packets: %r players: %r tourneys: %r' % (cls.__name__, cls.type, self.packets, self.players, self.tourneys)
+    return __str__
+
+def f369(C_0, D_0, D_1, D_2, MISSING, instance, packet_type, **_namespace):
+    def make(cls, packets=MISSING, players=D_1, tourneys=D_2):
+        p = instance(cls, {'packets': C_0(D_0) if packets is MISSING else packets, 'players': players, 'tourneys': tourneys})
+        return p
+    return make
+
+def f370(C_0, D_0, D_1, D_2, MISSING, packet_type, **_namespace):
+    def make(cls, packets=MISSING, players=D_1, tourneys=D_2):
+        p = cls.__new__(cls)
+        p.packets = C_0(D_0) if packets is MISSING else packets
+        p.players = players
+        p.tourneys = tourneys
+        return p
+    return make
+
+def f371(C_0, D_0, D_1, D_2, MISSING, **_namespace):
+    def __init__(self, packets=MISSING, players=D_1, tourneys=D_2, **kw):
+        self.packets = C_0(D_0) if packets is MISSING else packets
+        self.players = players
+        self.tourneys = tourneys
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f372(S_0, S_2, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.packets
+        d0 = b''.join([q.__class__.__dict__['binarypack_fast_pack'](q) for q in v0])
+        v1 = p.players
+        v2 = p.tourneys
+        length = 10 + len(d0)
+        return b''.join([S_0(114, length, len(v0)), d0, S_2((v1), (v2))])
+    return binarypack_fast_pack
+
+def f373(S_0, S_2, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.packets
+        d0 = b''.join([q.__class__.__dict__['binarypack_fast_pack'](q) for q in v0])
+        v1 = p.players
+        v2 = p.tourneys
+        length = 10 + len(d0)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 114, length, len(v0))
+        offset += 5
+        buf[offset:offset + len(d0)] = d0
+        offset += len(d0)
+        S_2(buf, offset, (v1), (v2))
+        return end
+    return binarypack_fast_pack_into
+
+def f374(S_0, S_7, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        n0, = S_0(data, offset)
+        offset += 2
+        v0 = []
+        for j in xrange(n0):
+            t, l = S_PACKET_HEAD_unpack_from(data, offset)
+            offset, q = type_id2type[t].binarypack_fast_unpack(data, offset + 3)
+            v0.append(q)
+        v1, v2, = S_7(data, offset)
+        offset += 8
+        p = instance(packet_type, {'packets': v0, 'players': v1, 'tourneys': v2})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f375(hashable, **_namespace):
+    def __hash__(self):
+        return hash((hashable(self.packets), self.players, self.tourneys, ))
+    return __hash__
+
+def f376(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.tourney_serial != other.tourney_serial)
+    return __eq__
+
+def f377(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r tourney_serial: %r' % (cls.__name__, cls.type, self.serial, self.tourney_serial)
+    return __str__
+
+def f378(D_0, D_1, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, tourney_serial=D_1):
+        p = instance(cls, {'serial': serial, 'tourney_serial': tourney_serial})
+        return p
+    return make
+
+def f379(D_0, D_1, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, tourney_serial=D_1):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.tourney_serial = tourney_serial
+        return p
+    return make
+
+def f380(D_0, D_1, MISSING, **_namespace):
+    def __init__(self, serial=D_0, tourney_serial=D_1, **kw):
+        self.serial = serial
+        self.tourney_serial = tourney_serial
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f381(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.tourney_serial
+        length = 8
+        return S_0(115, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f382(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.tourney_serial
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 115, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f383(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, = S_0(data, offset)
+        offset += 8
+        p = instance(packet_type, {'serial': v0, 'tourney_serial': v1})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f384(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.tourney_serial, ))
+    return __hash__
+
+def f385(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.tourney_serial
+        length = 8
+        return S_0(116, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f386(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.tourney_serial
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 116, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f387(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.tourney_serial
+        length = 8
+        return S_0(117, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f388(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.tourney_serial
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 117, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f389(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.tourney_serial != other.tourney_serial or self.players != other.players)
+    return __eq__
+
+def f390(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) tourney_serial: %r players: %r' % (cls.__name__, cls.type, self.tourney_serial, self.players)
+    return __str__
+
+def f391(C_1, D_0, D_1, MISSING, instance, packet_type, **_namespace):
+    def make(cls, tourney_serial=D_0, players=MISSING):
+        p = instance(cls, {'tourney_serial': tourney_serial, 'players': C_1(D_1) if players is MISSING else players})
+        return p
+    return make
+
+def f392(C_1, D_0, D_1, MISSING, packet_type, **_namespace):
+    def make(cls, tourney_serial=D_0, players=MISSING):
+        p = cls.__new__(cls)
+        p.tourney_serial = tourney_serial
+        p.players = C_1(D_1) if players is MISSING else players
+        return p
+    return make
+
+def f393(C_1, D_0, D_1, MISSING, **_namespace):
+    def __init__(self, tourney_serial=D_0, players=MISSING, **kw):
+        self.tourney_serial = tourney_serial
+        self.players = C_1(D_1) if players is MISSING else players
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f394(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.tourney_serial
+        v1 = p.players
+        d1 = b''.join([S_H_pack(len(n)) + n + S_IB_pack(c, f) for n, c, f in v1])
+        length = 6 + len(d1)
+        return b''.join([S_0(118, length, (v0), len(v1)), d1])
+    return binarypack_fast_pack
+
+def f395(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.tourney_serial
+        v1 = p.players
+        d1 = b''.join([S_H_pack(len(n)) + n + S_IB_pack(c, f) for n, c, f in v1])
+        length = 6 + len(d1)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 118, length, (v0), len(v1))
+        offset += 9
+        buf[offset:offset + len(d1)] = d1
+        return end
+    return binarypack_fast_pack_into
+
+def f396(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, n1, = S_0(data, offset)
+        offset += 6
+        v1 = []
+        for j in xrange(n1):
+            l, = S_H_unpack_from(data, offset)
+            offset += 2 + l
+            c, f = S_IB_unpack_from(data, offset)
+            n = data[offset - l:offset]
+            if n.__class__ is memoryview: n = n.tobytes()
+            v1.append((n, c, f))
+            offset += 5
+        p = instance(packet_type, {'tourney_serial': v0, 'players': v1})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f397(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.tourney_serial, hashable(self.players), ))
+    return __hash__
+
+def f398(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.history != other.history or self.serial2name != other.serial2name)
+    return __eq__
+
+def f399(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r history: %r serial2name: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.history, self.serial2name)
+    return __str__
+
+def f400(D_0, D_1, D_2, D_3, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, history=D_2, serial2name=D_3):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'history': history, 'serial2name': serial2name})
+        return p
+    return make
+
+def f401(D_0, D_1, D_2, D_3, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, history=D_2, serial2name=D_3):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.history = history
+        p.serial2name = serial2name
+        return p
+    return make
+
+def f402(D_0, D_1, D_2, D_3, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, history=D_2, serial2name=D_3, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.history = history
+        self.serial2name = serial2name
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f403(S_0, S_2, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.history
+        v3 = p.serial2name
+        length = 12 + len(v2) + len(v3)
+        return b''.join([S_0(119, length, (v0), (v1), len(v2)), v2, S_2(len(v3)), v3])
+    return binarypack_fast_pack
+
+def f404(S_0, S_2, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.history
+        v3 = p.serial2name
+        length = 12 + len(v2) + len(v3)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 119, length, (v0), (v1), len(v2))
+        offset += 13
+        buf[offset:offset + len(v2)] = v2
+        offset += len(v2)
+        S_2(buf, offset, len(v3))
+        offset += 2
+        buf[offset:offset + len(v3)] = v3
+        return end
+    return binarypack_fast_pack_into
+
+def f405(S_0, S_5, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, n2, = S_0(data, offset)
+        offset += 10
+        v2 = data[offset:offset + n2]
+        if v2.__class__ is memoryview: v2 = v2.tobytes()
+        offset += n2
+        n3, = S_5(data, offset)
+        offset += 2
+        v3 = data[offset:offset + n3]
+        if v3.__class__ is memoryview: v3 = v3.tobytes()
+        offset += n3
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'history': v2, 'serial2name': v3})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f406(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, self.history, self.serial2name, ))
+    return __hash__
+
+def f407(S_0, S_10, S_12, S_14, S_16, S_18, S_2, S_20, S_22, S_24, S_26, S_28, S_4, S_6, S_8, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.rating
+        v2 = p.affiliate
+        v3 = p.name
+        v4 = p.password
+        v5 = p.email
+        v6 = p.money
+        d6 = b''.join([S_MONEY_pack(c, m, g, t) for c, (m, g, t) in v6.iteritems()])
+        v7 = p.firstname
+        v8 = p.lastname
+        v9 = p.addr_street
+        v10 = p.addr_street2
+        v11 = p.addr_zip
+        v12 = p.addr_town
+        v13 = p.addr_state
+        v14 = p.addr_country
+        v15 = p.phone
+        v16 = p.gender
+        v17 = p.birthdate
+        length = 42 + len(v3) + len(v4) + len(v5) + len(d6) + len(v7) + len(v8) + len(v9) + len(v10) + len(v11) + len(v12) + len(v13) + len(v14) + len(v15) + len(v16) + len(v17)
+        return b''.join([S_0(120, length, (v0), (v1), (v2), len(v3)), v3, S_2(len(v4)), v4, S_4(len(v5)), v5, S_6(len(v6)), d6, S_8(len(v7)), v7, S_10(len(v8)), v8, S_12(len(v9)), v9, S_14(len(v10)), v10, S_16(len(v11)), v11, S_18(len(v12)), v12, S_20(len(v13)), v13, S_22(len(v14)), v14, S_24(len(v15)), v15, S_26(len(v16)), v16, S_28(len(v17)), v17])
+    return binarypack_fast_pack
+
+def f408(S_0, S_10, S_12, S_14, S_16, S_18, S_2, S_20, S_22, S_24, S_26, S_28, S_4, S_6, S_8, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.rating
+        v2 = p.affiliate
+        v3 = p.name
+        v4 = p.password
+        v5 = p.email
+        v6 = p.money
+        d6 = b''.join([S_MONEY_pack(c, m, g, t) for c, (m, g, t) in v6.iteritems()])
+        v7 = p.firstname
+        v8 = p.lastname
+        v9 = p.addr_street
+        v10 = p.addr_street2
+        v11 = p.addr_zip
+        v12 = p.addr_town
+        v13 = p.addr_state
+        v14 = p.addr_country
+        v15 = p.phone
+        v16 = p.gender
+        v17 = p.birthdate
+        length = 42 + len(v3) + len(v4) + len(v5) + len(d6) + len(v7) + len(v8) + len(v9) + len(v10) + len(v11) + len(v12) + len(v13) + len(v14) + len(v15) + len(v16) + len(v17)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 120, length, (v0), (v1), (v2), len(v3))
+        offset += 17
+        buf[offset:offset + len(v3)] = v3
+        offset += len(v3)
+        S_2(buf, offset, len(v4))
+        offset += 2
+        buf[offset:offset + len(v4)] = v4
+        offset += len(v4)
+        S_4(buf, offset, len(v5))
+        offset += 2
+        buf[offset:offset + len(v5)] = v5
+        offset += len(v5)
+        S_6(buf, offset, len(v6))
+        offset += 2
+        buf[offset:offset + len(d6)] = d6
+        offset += len(d6)
+        S_8(buf, offset, len(v7))
+        offset += 2
+        buf[offset:offset + len(v7)] = v7
+        offset += len(v7)
+        S_10(buf, offset, len(v8))
+        offset += 2
+        buf[offset:offset + len(v8)] = v8
+        offset += len(v8)
+        S_12(buf, offset, len(v9))
+        offset += 2
+        buf[offset:offset + len(v9)] = v9
+        offset += len(v9)
+        S_14(buf, offset, len(v10))
+        offset += 2
+        buf[offset:offset + len(v10)] = v10
+        offset += len(v10)
+        S_16(buf, offset, len(v11))
+        offset += 2
+        buf[offset:offset + len(v11)] = v11
+        offset += len(v11)
+        S_18(buf, offset, len(v12))
+        offset += 2
+        buf[offset:offset + len(v12)] = v12
+        offset += len(v12)
+        S_20(buf, offset, len(v13))
+        offset += 2
+        buf[offset:offset + len(v13)] = v13
+        offset += len(v13)
+        S_22(buf, offset, len(v14))
+        offset += 2
+        buf[offset:offset + len(v14)] = v14
+        offset += len(v14)
+        S_24(buf, offset, len(v15))
+        offset += 2
+        buf[offset:offset + len(v15)] = v15
+        offset += len(v15)
+        S_26(buf, offset, len(v16))
+        offset += 2
+        buf[offset:offset + len(v16)] = v16
+        offset += len(v16)
+        S_28(buf, offset, len(v17))
+        offset += 2
+        buf[offset:offset + len(v17)] = v17
+        return end
+    return binarypack_fast_pack_into
+
+def f409(S_0, S_10, S_12, S_14, S_16, S_18, S_2, S_20, S_22, S_24, S_26, S_28, S_4, S_6, S_8, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.rating
+        v2 = p.affiliate
+        v3 = p.name
+        v4 = p.password
+        v5 = p.email
+        v6 = p.money
+        d6 = b''.join([S_MONEY_pack(c, m, g, t) for c, (m, g, t) in v6.iteritems()])
+        v7 = p.firstname
+        v8 = p.lastname
+        v9 = p.addr_street
+        v10 = p.addr_street2
+        v11 = p.addr_zip
+        v12 = p.addr_town
+        v13 = p.addr_state
+        v14 = p.addr_country
+        v15 = p.phone
+        v16 = p.gender
+        v17 = p.birthdate
+        length = 42 + len(v3) + len(v4) + len(v5) + len(d6) + len(v7) + len(v8) + len(v9) + len(v10) + len(v11) + len(v12) + len(v13) + len(v14) + len(v15) + len(v16) + len(v17)
+        return b''.join([S_0(121, length, (v0), (v1), (v2), len(v3)), v3, S_2(len(v4)), v4, S_4(len(v5)), v5, S_6(len(v6)), d6, S_8(len(v7)), v7, S_10(len(v8)), v8, S_12(len(v9)), v9, S_14(len(v10)), v10, S_16(len(v11)), v11, S_18(len(v12)), v12, S_20(len(v13)), v13, S_22(len(v14)), v14, S_24(len(v15)), v15, S_26(len(v16)), v16, S_28(len(v17)), v17])
+    return binarypack_fast_pack
+
+def f410(S_0, S_10, S_12, S_14, S_16, S_18, S_2, S_20, S_22, S_24, S_26, S_28, S_4, S_6, S_8, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.rating
+        v2 = p.affiliate
+        v3 = p.name
+        v4 = p.password
+        v5 = p.email
+        v6 = p.money
+        d6 = b''.join([S_MONEY_pack(c, m, g, t) for c, (m, g, t) in v6.iteritems()])
+        v7 = p.firstname
+        v8 = p.lastname
+        v9 = p.addr_street
+        v10 = p.addr_street2
+        v11 = p.addr_zip
+        v12 = p.addr_town
+        v13 = p.addr_state
+        v14 = p.addr_country
+        v15 = p.phone
+        v16 = p.gender
+        v17 = p.birthdate
+        length = 42 + len(v3) + len(v4) + len(v5) + len(d6) + len(v7) + len(v8) + len(v9) + len(v10) + len(v11) + len(v12) + len(v13) + len(v14) + len(v15) + len(v16) + len(v17)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 121, length, (v0), (v1), (v2), len(v3))
+        offset += 17
+        buf[offset:offset + len(v3)] = v3
+        offset += len(v3)
+        S_2(buf, offset, len(v4))
+        offset += 2
+        buf[offset:offset + len(v4)] = v4
+        offset += len(v4)
+        S_4(buf, offset, len(v5))
+        offset += 2
+        buf[offset:offset + len(v5)] = v5
+        offset += len(v5)
+        S_6(buf, offset, len(v6))
+        offset += 2
+        buf[offset:offset + len(d6)] = d6
+        offset += len(d6)
+        S_8(buf, offset, len(v7))
+        offset += 2
+        buf[offset:offset + len(v7)] = v7
+        offset += len(v7)
+        S_10(buf, offset, len(v8))
+        offset += 2
+        buf[offset:offset + len(v8)] = v8
+        offset += len(v8)
+        S_12(buf, offset, len(v9))
+        offset += 2
+        buf[offset:offset + len(v9)] = v9
+        offset += len(v9)
+        S_14(buf, offset, len(v10))
+        offset += 2
+        buf[offset:offset + len(v10)] = v10
+        offset += len(v10)
+        S_16(buf, offset, len(v11))
+        offset += 2
+        buf[offset:offset + len(v11)] = v11
+        offset += len(v11)
+        S_18(buf, offset, len(v12))
+        offset += 2
+        buf[offset:offset + len(v12)] = v12
+        offset += len(v12)
+        S_20(buf, offset, len(v13))
+        offset += 2
+        buf[offset:offset + len(v13)] = v13
+        offset += len(v13)
+        S_22(buf, offset, len(v14))
+        offset += 2
+        buf[offset:offset + len(v14)] = v14
+        offset += len(v14)
+        S_24(buf, offset, len(v15))
+        offset += 2
+        buf[offset:offset + len(v15)] = v15
+        offset += len(v15)
+        S_26(buf, offset, len(v16))
+        offset += 2
+        buf[offset:offset + len(v16)] = v16
+        offset += len(v16)
+        S_28(buf, offset, len(v17))
+        offset += 2
+        buf[offset:offset + len(v17)] = v17
+        return end
+    return binarypack_fast_pack_into
+
+def f411(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        return S_0(122, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f412(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 122, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f413(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return True
+    return __eq__
+
+def f414(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d)' % (cls.__name__, cls.type)
+    return __str__
+
+def f415(MISSING, instance, packet_type, **_namespace):
+    def make(cls):
+        p = instance(cls, {})
+        return p
+    return make
+
+def f416(MISSING, packet_type, **_namespace):
+    def make(cls):
+        p = cls.__new__(cls)
+        return p
+    return make
+
+def f417(MISSING, **_namespace):
+    def __init__(self, **kw):
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f418(FRAME, **_namespace):
+    def binarypack_fast_pack(p):
+        return FRAME
+    return binarypack_fast_pack
+
+def f419(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        length = 0
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 123, length)
+        return end
+    return binarypack_fast_pack_into
+
+def f420(singleton, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        return (offset, singleton)
+    return binarypack_fast_unpack
+
+def f421(hashable, **_namespace):
+    def __hash__(self):
+        return hash(())
+    return __hash__
+
+def f422(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.roles != other.roles)
+    return __eq__
+
+def f423(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r roles: %r' % (cls.__name__, cls.type, self.serial, self.roles)
+    return __str__
+
+def f424(D_0, D_1, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, roles=D_1):
+        p = instance(cls, {'serial': serial, 'roles': roles})
+        return p
+    return make
+
+def f425(D_0, D_1, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, roles=D_1):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.roles = roles
+        return p
+    return make
+
+def f426(D_0, D_1, MISSING, **_namespace):
+    def __init__(self, serial=D_0, roles=D_1, **kw):
+        self.serial = serial
+        self.roles = roles
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f427(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.roles
+        length = 6 + len(v1)
+        return b''.join([S_0(124, length, (v0), len(v1)), v1])
+    return binarypack_fast_pack
+
+def f428(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.roles
+        length = 6 + len(v1)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 124, length, (v0), len(v1))
+        offset += 9
+        buf[offset:offset + len(v1)] = v1
+        return end
+    return binarypack_fast_pack_into
+
+def f429(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, n1, = S_0(data, offset)
+        offset += 6
+        v1 = data[offset:offset + n1]
+        if v1.__class__ is memoryview: v1 = v1.tobytes()
+        offset += n1
+        p = instance(packet_type, {'serial': v0, 'roles': v1})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f430(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.roles, ))
+    return __hash__
+
+def f431(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.roles
+        length = 6 + len(v1)
+        return b''.join([S_0(125, length, (v0), len(v1)), v1])
+    return binarypack_fast_pack
+
+def f432(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.roles
+        length = 6 + len(v1)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 125, length, (v0), len(v1))
+        offset += 9
+        buf[offset:offset + len(v1)] = v1
+        return end
+    return binarypack_fast_pack_into
+
+def f433(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        return S_0(126, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f434(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 126, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f435(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        return S_0(127, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f436(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 127, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f437(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.muckable_serials != other.muckable_serials)
+    return __eq__
+
+def f438(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r muckable_serials: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.muckable_serials)
+    return __str__
+
+def f439(C_2, D_0, D_1, D_2, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, muckable_serials=MISSING):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'muckable_serials': C_2(D_2) if muckable_serials is MISSING else muckable_serials})
+        return p
+    return make
+
+def f440(C_2, D_0, D_1, D_2, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, muckable_serials=MISSING):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.muckable_serials = C_2(D_2) if muckable_serials is MISSING else muckable_serials
+        return p
+    return make
+
+def f441(C_2, D_0, D_1, D_2, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, muckable_serials=MISSING, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.muckable_serials = C_2(D_2) if muckable_serials is MISSING else muckable_serials
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f442(L_2, S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.muckable_serials
+        n2 = len(v2)
+        d2 = L_2[n2].pack(*v2)
+        length = 9 + len(d2)
+        return b''.join([S_0(128, length, (v0), (v1), n2), d2])
+    return binarypack_fast_pack
+
+def f443(L_2, S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.muckable_serials
+        n2 = len(v2)
+        d2 = L_2[n2].pack(*v2)
+        length = 9 + len(d2)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 128, length, (v0), (v1), n2)
+        offset += 12
+        buf[offset:offset + len(d2)] = d2
+        return end
+    return binarypack_fast_pack_into
+
+def f444(L_2, S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, n2, = S_0(data, offset)
+        offset += 9
+        v2 = list(L_2[n2].unpack_from(data, offset)) if n2 else []
+        offset += n2 * 4
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'muckable_serials': v2})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f445(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, hashable(self.muckable_serials), ))
+    return __hash__
+
+def f446(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.auto_muck != other.auto_muck)
+    return __eq__
+
+def f447(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r auto_muck: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.auto_muck)
+    return __str__
+
+def f448(D_0, D_1, D_2, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, auto_muck=D_2):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'auto_muck': auto_muck})
+        return p
+    return make
+
+def f449(D_0, D_1, D_2, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, auto_muck=D_2):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.auto_muck = auto_muck
+        return p
+    return make
+
+def f450(D_0, D_1, D_2, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, auto_muck=D_2, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.auto_muck = auto_muck
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f451(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.auto_muck
+        length = 9
+        return S_0(129, length, (v0), (v1), (v2))
+    return binarypack_fast_pack
+
+def f452(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.auto_muck
+        length = 9
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 129, length, (v0), (v1), (v2))
+        return end
+    return binarypack_fast_pack_into
+
+def f453(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, = S_0(data, offset)
+        offset += 9
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'auto_muck': v2})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f454(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, self.auto_muck, ))
+    return __hash__
+
+def f455(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        return S_0(130, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f456(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 130, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f457(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        return S_0(131, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f458(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 131, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f459(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.url != other.url or self.name != other.name or self.application_data != other.application_data or self.bserial != other.bserial or self.value != other.value)
+    return __eq__
+
+def f460(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r url: %r name: %r application_data: %r bserial: %r value: %r' % (cls.__name__, cls.type, self.serial, self.url, self.name, self.application_data, self.bserial, self.value)
+    return __str__
+
+def f461(D_0, D_1, D_2, D_3, D_4, D_5, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, url=D_1, name=D_2, application_data=D_3, bserial=D_4, value=D_5):
+        p = instance(cls, {'serial': serial, 'url': url, 'name': name, 'application_data': application_data, 'bserial': bserial, 'value': value})
+        return p
+    return make
+
+def f462(D_0, D_1, D_2, D_3, D_4, D_5, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, url=D_1, name=D_2, application_data=D_3, bserial=D_4, value=D_5):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.url = url
+        p.name = name
+        p.application_data = application_data
+        p.bserial = bserial
+        p.value = value
+        return p
+    return make
+
+def f463(D_0, D_1, D_2, D_3, D_4, D_5, MISSING, **_namespace):
+    def __init__(self, serial=D_0, url=D_1, name=D_2, application_data=D_3, bserial=D_4, value=D_5, **kw):
+        self.serial = serial
+        self.url = url
+        self.name = name
+        self.application_data = application_data
+        self.bserial = bserial
+        self.value = value
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f464(S_0, S_2, S_4, S_6, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.url
+        v2 = p.name
+        v3 = p.application_data
+        v4 = p.bserial
+        v5 = p.value
+        length = 18 + len(v1) + len(v2) + len(v3)
+        return b''.join([S_0(132, length, (v0), len(v1)), v1, S_2(len(v2)), v2, S_4(len(v3)), v3, S_6((v4), (v5))])
+    return binarypack_fast_pack
+
+def f465(S_0, S_2, S_4, S_6, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.url
+        v2 = p.name
+        v3 = p.application_data
+        v4 = p.bserial
+        v5 = p.value
+        length = 18 + len(v1) + len(v2) + len(v3)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 132, length, (v0), len(v1))
+        offset += 9
+        buf[offset:offset + len(v1)] = v1
+        offset += len(v1)
+        S_2(buf, offset, len(v2))
+        offset += 2
+        buf[offset:offset + len(v2)] = v2
+        offset += len(v2)
+        S_4(buf, offset, len(v3))
+        offset += 2
+        buf[offset:offset + len(v3)] = v3
+        offset += len(v3)
+        S_6(buf, offset, (v4), (v5))
+        return end
+    return binarypack_fast_pack_into
+
+def f466(S_0, S_10, S_15, S_5, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, n1, = S_0(data, offset)
+        offset += 6
+        v1 = data[offset:offset + n1]
+        if v1.__class__ is memoryview: v1 = v1.tobytes()
+        offset += n1
+        n2, = S_5(data, offset)
+        offset += 2
+        v2 = data[offset:offset + n2]
+        if v2.__class__ is memoryview: v2 = v2.tobytes()
+        offset += n2
+        n3, = S_10(data, offset)
+        offset += 2
+        v3 = data[offset:offset + n3]
+        if v3.__class__ is memoryview: v3 = v3.tobytes()
+        offset += n3
+        v4, v5, = S_15(data, offset)
+        offset += 8
+        p = instance(packet_type, {'serial': v0, 'url': v1, 'name': v2, 'application_data': v3, 'bserial': v4, 'value': v5})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f467(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.url, self.name, self.application_data, self.bserial, self.value, ))
+    return __hash__
+
+def f468(S_0, S_2, S_4, S_6, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.url
+        v2 = p.name
+        v3 = p.application_data
+        v4 = p.bserial
+        v5 = p.value
+        length = 18 + len(v1) + len(v2) + len(v3)
+        return b''.join([S_0(133, length, (v0), len(v1)), v1, S_2(len(v2)), v2, S_4(len(v3)), v3, S_6((v4), (v5))])
+    return binarypack_fast_pack
+
+def f469(S_0, S_2, S_4, S_6, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.url
+        v2 = p.name
+        v3 = p.application_data
+        v4 = p.bserial
+        v5 = p.value
+        length = 18 + len(v1) + len(v2) + len(v3)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 133, length, (v0), len(v1))
+        offset += 9
+        buf[offset:offset + len(v1)] = v1
+        offset += len(v1)
+        S_2(buf, offset, len(v2))
+        offset += 2
+        buf[offset:offset + len(v2)] = v2
+        offset += len(v2)
+        S_4(buf, offset, len(v3))
+        offset += 2
+        buf[offset:offset + len(v3)] = v3
+        offset += len(v3)
+        S_6(buf, offset, (v4), (v5))
+        return end
+    return binarypack_fast_pack_into
+
+def f470(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.transaction_id != other.transaction_id)
+    return __eq__
+
+def f471(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) transaction_id: %r' % (cls.__name__, cls.type, self.transaction_id)
+    return __str__
+
+def f472(D_0, MISSING, instance, packet_type, **_namespace):
+    def make(cls, transaction_id=D_0):
+        p = instance(cls, {'transaction_id': transaction_id})
+        return p
+    return make
+
+def f473(D_0, MISSING, packet_type, **_namespace):
+    def make(cls, transaction_id=D_0):
+        p = cls.__new__(cls)
+        p.transaction_id = transaction_id
+        return p
+    return make
+
+def f474(D_0, MISSING, **_namespace):
+    def __init__(self, transaction_id=D_0, **kw):
+        self.transaction_id = transaction_id
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f475(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.transaction_id
+        length = 2 + len(v0)
+        return b''.join([S_0(134, length, len(v0)), v0])
+    return binarypack_fast_pack
+
+def f476(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.transaction_id
+        length = 2 + len(v0)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 134, length, len(v0))
+        offset += 5
+        buf[offset:offset + len(v0)] = v0
+        return end
+    return binarypack_fast_pack_into
+
+def f477(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        n0, = S_0(data, offset)
+        offset += 2
+        v0 = data[offset:offset + n0]
+        if v0.__class__ is memoryview: v0 = v0.tobytes()
+        offset += n0
+        p = instance(packet_type, {'transaction_id': v0})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f478(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.transaction_id, ))
+    return __hash__
+
+def f479(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.application_data != other.application_data)
+    return __eq__
+
+def f480(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) application_data: %r' % (cls.__name__, cls.type, self.application_data)
+    return __str__
+
+def f481(D_0, MISSING, instance, packet_type, **_namespace):
+    def make(cls, application_data=D_0):
+        p = instance(cls, {'application_data': application_data})
+        return p
+    return make
+
+def f482(D_0, MISSING, packet_type, **_namespace):
+    def make(cls, application_data=D_0):
+        p = cls.__new__(cls)
+        p.application_data = application_data
+        return p
+    return make
+
+def f483(D_0, MISSING, **_namespace):
+    def __init__(self, application_data=D_0, **kw):
+        self.application_data = application_data
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f484(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.application_data
+        length = 2 + len(v0)
+        return b''.join([S_0(135, length, len(v0)), v0])
+    return binarypack_fast_pack
+
+def f485(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.application_data
+        length = 2 + len(v0)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 135, length, len(v0))
+        offset += 5
+        buf[offset:offset + len(v0)] = v0
+        return end
+    return binarypack_fast_pack_into
+
+def f486(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        n0, = S_0(data, offset)
+        offset += 2
+        v0 = data[offset:offset + n0]
+        if v0.__class__ is memoryview: v0 = v0.tobytes()
+        offset += n0
+        p = instance(packet_type, {'application_data': v0})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f487(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.application_data, ))
+    return __hash__
+
+def f488(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.value != other.value or self.game_id != other.game_id)
+    return __eq__
+
+def f489(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) value: %r game_id: %r' % (cls.__name__, cls.type, self.value, self.game_id)
+    return __str__
+
+def f490(D_0, D_1, MISSING, instance, packet_type, **_namespace):
+    def make(cls, value=D_0, game_id=D_1):
+        p = instance(cls, {'value': value, 'game_id': game_id})
+        return p
+    return make
+
+def f491(D_0, D_1, MISSING, packet_type, **_namespace):
+    def make(cls, value=D_0, game_id=D_1):
+        p = cls.__new__(cls)
+        p.value = value
+        p.game_id = game_id
+        return p
+    return make
+
+def f492(D_0, D_1, MISSING, **_namespace):
+    def __init__(self, value=D_0, game_id=D_1, **kw):
+        self.value = value
+        self.game_id = game_id
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f493(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.value
+        v1 = p.game_id
+        length = 8
+        return S_0(136, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f494(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.value
+        v1 = p.game_id
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 136, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f495(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, = S_0(data, offset)
+        offset += 8
+        p = instance(packet_type, {'value': v0, 'game_id': v1})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f496(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.value, self.game_id, ))
+    return __hash__
+
+def f497(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.players != other.players or self.money != other.money or self.rank != other.rank or self.currency_serial != other.currency_serial)
+    return __eq__
+
+def f498(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r players: %r money: %r rank: %r currency_serial: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.players, self.money, self.rank, self.currency_serial)
+    return __str__
+
+def f499(D_0, D_1, D_2, D_3, D_4, D_5, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, players=D_2, money=D_3, rank=D_4, currency_serial=D_5):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'players': players, 'money': money, 'rank': rank, 'currency_serial': currency_serial})
+        return p
+    return make
+
+def f500(D_0, D_1, D_2, D_3, D_4, D_5, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, players=D_2, money=D_3, rank=D_4, currency_serial=D_5):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.players = players
+        p.money = money
+        p.rank = rank
+        p.currency_serial = currency_serial
+        return p
+    return make
+
+def f501(D_0, D_1, D_2, D_3, D_4, D_5, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, players=D_2, money=D_3, rank=D_4, currency_serial=D_5, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.players = players
+        self.money = money
+        self.rank = rank
+        self.currency_serial = currency_serial
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f502(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.players
+        v3 = p.money
+        v4 = p.rank
+        v5 = p.currency_serial
+        length = 24
+        return S_0(137, length, (v0), (v1), (v2), (v3), (v4), (v5))
+    return binarypack_fast_pack
+
+def f503(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.players
+        v3 = p.money
+        v4 = p.rank
+        v5 = p.currency_serial
+        length = 24
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 137, length, (v0), (v1), (v2), (v3), (v4), (v5))
+        return end
+    return binarypack_fast_pack_into
+
+def f504(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, v3, v4, v5, = S_0(data, offset)
+        offset += 24
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'players': v2, 'money': v3, 'rank': v4, 'currency_serial': v5})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f505(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, self.players, self.money, self.rank, self.currency_serial, ))
+    return __hash__
+
+def f506(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        return S_0(140, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f507(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 140, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f508(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.string
+        length = 10 + len(v2)
+        return b''.join([S_0(141, length, (v0), (v1), len(v2)), v2])
+    return binarypack_fast_pack
+
+def f509(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.string
+        length = 10 + len(v2)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 141, length, (v0), (v1), len(v2))
+        offset += 13
+        buf[offset:offset + len(v2)] = v2
+        return end
+    return binarypack_fast_pack_into
+
+def f510(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.value != other.value)
+    return __eq__
+
+def f511(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) value: %r' % (cls.__name__, cls.type, self.value)
+    return __str__
+
+def f512(D_0, MISSING, instance, packet_type, **_namespace):
+    def make(cls, value=D_0):
+        p = instance(cls, {'value': value})
+        return p
+    return make
+
+def f513(D_0, MISSING, packet_type, **_namespace):
+    def make(cls, value=D_0):
+        p = cls.__new__(cls)
+        p.value = value
+        return p
+    return make
+
+def f514(D_0, MISSING, **_namespace):
+    def __init__(self, value=D_0, **kw):
+        self.value = value
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f515(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.value
+        length = 4
+        return S_0(142, length, (v0))
+    return binarypack_fast_pack
+
+def f516(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.value
+        length = 4
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 142, length, (v0))
+        return end
+    return binarypack_fast_pack_into
+
+def f517(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, = S_0(data, offset)
+        offset += 4
+        p = instance(packet_type, {'value': v0})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f518(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.value, ))
+    return __hash__
+
+def f519(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.string
+        length = 2 + len(v0)
+        return b''.join([S_0(143, length, len(v0)), v0])
+    return binarypack_fast_pack
+
+def f520(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.string
+        length = 2 + len(v0)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 143, length, len(v0))
+        offset += 5
+        buf[offset:offset + len(v0)] = v0
+        return end
+    return binarypack_fast_pack_into
+
+def f521(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.players != other.players or self.hands != other.hands or self.bytesin != other.bytesin or self.bytesout != other.bytesout)
+    return __eq__
+
+def f522(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) players: %r hands: %r bytesin: %r bytesout: %r' % (cls.__name__, cls.type, self.players, self.hands, self.bytesin, self.bytesout)
+    return __str__
+
+def f523(D_0, D_1, D_2, D_3, MISSING, instance, packet_type, **_namespace):
+    def make(cls, players=D_0, hands=D_1, bytesin=D_2, bytesout=D_3):
+        p = instance(cls, {'players': players, 'hands': hands, 'bytesin': bytesin, 'bytesout': bytesout})
+        return p
+    return make
+
+def f524(D_0, D_1, D_2, D_3, MISSING, packet_type, **_namespace):
+    def make(cls, players=D_0, hands=D_1, bytesin=D_2, bytesout=D_3):
+        p = cls.__new__(cls)
+        p.players = players
+        p.hands = hands
+        p.bytesin = bytesin
+        p.bytesout = bytesout
+        return p
+    return make
+
+def f525(D_0, D_1, D_2, D_3, MISSING, **_namespace):
+    def __init__(self, players=D_0, hands=D_1, bytesin=D_2, bytesout=D_3, **kw):
+        self.players = players
+        self.hands = hands
+        self.bytesin = bytesin
+        self.bytesout = bytesout
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f526(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.players
+        v1 = p.hands
+        v2 = p.bytesin
+        v3 = p.bytesout
+        length = 16
+        return S_0(144, length, (v0), (v1), (v2), (v3))
+    return binarypack_fast_pack
+
+def f527(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.players
+        v1 = p.hands
+        v2 = p.bytesin
+        v3 = p.bytesout
+        length = 16
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 144, length, (v0), (v1), (v2), (v3))
+        return end
+    return binarypack_fast_pack_into
+
+def f528(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, v3, = S_0(data, offset)
+        offset += 16
+        p = instance(packet_type, {'players': v0, 'hands': v1, 'bytesin': v2, 'bytesout': v3})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f529(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.players, self.hands, self.bytesin, self.bytesout, ))
+    return __hash__
+
+def f530(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.game_id != other.game_id or self.min != other.min or self.max != other.max or self.best != other.best or self.rebuy_min != other.rebuy_min)
+    return __eq__
+
+def f531(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) game_id: %r min: %r max: %r best: %r rebuy_min: %r' % (cls.__name__, cls.type, self.game_id, self.min, self.max, self.best, self.rebuy_min)
+    return __str__
+
+def f532(D_0, D_1, D_2, D_3, D_4, MISSING, instance, packet_type, **_namespace):
+    def make(cls, game_id=D_0, min=D_1, max=D_2, best=D_3, rebuy_min=D_4):
+        p = instance(cls, {'game_id': game_id, 'min': min, 'max': max, 'best': best, 'rebuy_min': rebuy_min})
+        return p
+    return make
+
+def f533(D_0, D_1, D_2, D_3, D_4, MISSING, packet_type, **_namespace):
+    def make(cls, game_id=D_0, min=D_1, max=D_2, best=D_3, rebuy_min=D_4):
+        p = cls.__new__(cls)
+        p.game_id = game_id
+        p.min = min
+        p.max = max
+        p.best = best
+        p.rebuy_min = rebuy_min
+        return p
+    return make
+
+def f534(D_0, D_1, D_2, D_3, D_4, MISSING, **_namespace):
+    def __init__(self, game_id=D_0, min=D_1, max=D_2, best=D_3, rebuy_min=D_4, **kw):
+        self.game_id = game_id
+        self.min = min
+        self.max = max
+        self.best = best
+        self.rebuy_min = rebuy_min
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f535(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.game_id
+        v1 = p.min
+        v2 = p.max
+        v3 = p.best
+        v4 = p.rebuy_min
+        length = 20
+        return S_0(145, length, (v0), (v1), (v2), (v3), (v4))
+    return binarypack_fast_pack
+
+def f536(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.game_id
+        v1 = p.min
+        v2 = p.max
+        v3 = p.best
+        v4 = p.rebuy_min
+        length = 20
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 145, length, (v0), (v1), (v2), (v3), (v4))
+        return end
+    return binarypack_fast_pack_into
+
+def f537(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, v3, v4, = S_0(data, offset)
+        offset += 20
+        p = instance(packet_type, {'game_id': v0, 'min': v1, 'max': v2, 'best': v3, 'rebuy_min': v4})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f538(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.game_id, self.min, self.max, self.best, self.rebuy_min, ))
+    return __hash__
+
+def f539(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        length = 0
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 146, length)
+        return end
+    return binarypack_fast_pack_into
+
+def f540(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.event != other.event or self.param1 != other.param1 or self.param2 != other.param2 or self.param3 != other.param3)
+    return __eq__
+
+def f541(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) event: %r param1: %r param2: %r param3: %r' % (cls.__name__, cls.type, self.event, self.param1, self.param2, self.param3)
+    return __str__
+
+def f542(D_0, D_1, D_2, D_3, MISSING, instance, packet_type, **_namespace):
+    def make(cls, event=D_0, param1=D_1, param2=D_2, param3=D_3):
+        p = instance(cls, {'event': event, 'param1': param1, 'param2': param2, 'param3': param3})
+        return p
+    return make
+
+def f543(D_0, D_1, D_2, D_3, MISSING, packet_type, **_namespace):
+    def make(cls, event=D_0, param1=D_1, param2=D_2, param3=D_3):
+        p = cls.__new__(cls)
+        p.event = event
+        p.param1 = param1
+        p.param2 = param2
+        p.param3 = param3
+        return p
+    return make
+
+def f544(D_0, D_1, D_2, D_3, MISSING, **_namespace):
+    def __init__(self, event=D_0, param1=D_1, param2=D_2, param3=D_3, **kw):
+        self.event = event
+        self.param1 = param1
+        self.param2 = param2
+        self.param3 = param3
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f545(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.event
+        v1 = p.param1
+        v2 = p.param2
+        v3 = p.param3
+        length = 16
+        return S_0(147, length, (v0), (v1), (v2), (v3))
+    return binarypack_fast_pack
+
+def f546(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.event
+        v1 = p.param1
+        v2 = p.param2
+        v3 = p.param3
+        length = 16
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 147, length, (v0), (v1), (v2), (v3))
+        return end
+    return binarypack_fast_pack_into
+
+def f547(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, v3, = S_0(data, offset)
+        offset += 16
+        p = instance(packet_type, {'event': v0, 'param1': v1, 'param2': v2, 'param3': v3})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f548(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.event, self.param1, self.param2, self.param3, ))
+    return __hash__
+
+def f549(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.tourney_serial != other.tourney_serial)
+    return __eq__
+
+def f550(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) tourney_serial: %r' % (cls.__name__, cls.type, self.tourney_serial)
+    return __str__
+
+def f551(D_0, MISSING, instance, packet_type, **_namespace):
+    def make(cls, tourney_serial=D_0):
+        p = instance(cls, {'tourney_serial': tourney_serial})
+        return p
+    return make
+
+def f552(D_0, MISSING, packet_type, **_namespace):
+    def make(cls, tourney_serial=D_0):
+        p = cls.__new__(cls)
+        p.tourney_serial = tourney_serial
+        return p
+    return make
+
+def f553(D_0, MISSING, **_namespace):
+    def __init__(self, tourney_serial=D_0, **kw):
+        self.tourney_serial = tourney_serial
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f554(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.tourney_serial
+        length = 4
+        return S_0(148, length, (v0))
+    return binarypack_fast_pack
+
+def f555(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.tourney_serial
+        length = 4
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 148, length, (v0))
+        return end
+    return binarypack_fast_pack_into
+
+def f556(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, = S_0(data, offset)
+        offset += 4
+        p = instance(packet_type, {'tourney_serial': v0})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f557(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.tourney_serial, ))
+    return __hash__
+
+def f558(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        length = 0
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 149, length)
+        return end
+    return binarypack_fast_pack_into
+
+def f559(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.auto_play != other.auto_play)
+    return __eq__
+
+def f560(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r auto_play: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.auto_play)
+    return __str__
+
+def f561(D_0, D_1, D_2, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, auto_play=D_2):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'auto_play': auto_play})
+        return p
+    return make
+
+def f562(D_0, D_1, D_2, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, auto_play=D_2):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.auto_play = auto_play
+        return p
+    return make
+
+def f563(D_0, D_1, D_2, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, auto_play=D_2, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.auto_play = auto_play
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f564(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.auto_play
+        length = 9
+        return S_0(150, length, (v0), (v1), (v2))
+    return binarypack_fast_pack
+
+def f565(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.auto_play
+        length = 9
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 150, length, (v0), (v1), (v2))
+        return end
+    return binarypack_fast_pack_into
+
+def f566(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, = S_0(data, offset)
+        offset += 9
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'auto_play': v2})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f567(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, self.auto_play, ))
+    return __hash__
+
+def f568(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.name != other.name)
+    return __eq__
+
+def f569(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r name: %r' % (cls.__name__, cls.type, self.serial, self.name)
+    return __str__
+
+def f570(D_0, D_1, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, name=D_1):
+        p = instance(cls, {'serial': serial, 'name': name})
+        return p
+    return make
+
+def f571(D_0, D_1, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, name=D_1):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.name = name
+        return p
+    return make
+
+def f572(D_0, D_1, MISSING, **_namespace):
+    def __init__(self, serial=D_0, name=D_1, **kw):
+        self.serial = serial
+        self.name = name
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f573(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.name
+        length = 6 + len(v1)
+        return b''.join([S_0(151, length, (v0), len(v1)), v1])
+    return binarypack_fast_pack
+
+def f574(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.name
+        length = 6 + len(v1)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 151, length, (v0), len(v1))
+        offset += 9
+        buf[offset:offset + len(v1)] = v1
+        return end
+    return binarypack_fast_pack_into
+
+def f575(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, n1, = S_0(data, offset)
+        offset += 6
+        v1 = data[offset:offset + n1]
+        if v1.__class__ is memoryview: v1 = v1.tobytes()
+        offset += n1
+        p = instance(packet_type, {'serial': v0, 'name': v1})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f576(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.name, ))
+    return __hash__
+
+def f577(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.tables != other.tables or self.tourneys != other.tourneys)
+    return __eq__
+
+def f578(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r tables: %r tourneys: %r' % (cls.__name__, cls.type, self.serial, self.tables, self.tourneys)
+    return __str__
+
+def f579(C_1, C_2, D_0, D_1, D_2, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, tables=MISSING, tourneys=MISSING):
+        p = instance(cls, {'serial': serial, 'tables': C_1(D_1) if tables is MISSING else tables, 'tourneys': C_2(D_2) if tourneys is MISSING else tourneys})
+        return p
+    return make
+
+def f580(C_1, C_2, D_0, D_1, D_2, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, tables=MISSING, tourneys=MISSING):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.tables = C_1(D_1) if tables is MISSING else tables
+        p.tourneys = C_2(D_2) if tourneys is MISSING else tourneys
+        return p
+    return make
+
+def f581(C_1, C_2, D_0, D_1, D_2, MISSING, **_namespace):
+    def __init__(self, serial=D_0, tables=MISSING, tourneys=MISSING, **kw):
+        self.serial = serial
+        self.tables = C_1(D_1) if tables is MISSING else tables
+        self.tourneys = C_2(D_2) if tourneys is MISSING else tourneys
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f582(L_1, L_2, S_0, S_2, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.tables
+        n1 = len(v1)
+        d1 = L_1[n1].pack(*v1)
+        v2 = p.tourneys
+        n2 = len(v2)
+        d2 = L_2[n2].pack(*v2)
+        length = 6 + len(d1) + len(d2)
+        return b''.join([S_0(152, length, (v0), n1), d1, S_2(n2), d2])
+    return binarypack_fast_pack
+
+def f583(L_1, L_2, S_0, S_2, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.tables
+        n1 = len(v1)
+        d1 = L_1[n1].pack(*v1)
+        v2 = p.tourneys
+        n2 = len(v2)
+        d2 = L_2[n2].pack(*v2)
+        length = 6 + len(d1) + len(d2)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 152, length, (v0), n1)
+        offset += 8
+        buf[offset:offset + len(d1)] = d1
+        offset += len(d1)
+        S_2(buf, offset, n2)
+        offset += 1
+        buf[offset:offset + len(d2)] = d2
+        return end
+    return binarypack_fast_pack_into
+
+def f584(L_1, L_2, S_0, S_4, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, n1, = S_0(data, offset)
+        offset += 5
+        v1 = list(L_1[n1].unpack_from(data, offset)) if n1 else []
+        offset += n1 * 4
+        n2, = S_4(data, offset)
+        offset += 1
+        v2 = list(L_2[n2].unpack_from(data, offset)) if n2 else []
+        offset += n2 * 4
+        p = instance(packet_type, {'serial': v0, 'tables': v1, 'tourneys': v2})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f585(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, hashable(self.tables), hashable(self.tourneys), ))
+    return __hash__
+
+def f586(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.locale != other.locale)
+    return __eq__
+
+def f587(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r locale: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.locale)
+    return __str__
+
+def f588(D_0, D_1, D_2, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, locale=D_2):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'locale': locale})
+        return p
+    return make
+
+def f589(D_0, D_1, D_2, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, locale=D_2):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.locale = locale
+        return p
+    return make
+
+def f590(D_0, D_1, D_2, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, locale=D_2, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.locale = locale
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f591(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.locale
+        length = 10 + len(v2)
+        return b''.join([S_0(153, length, (v0), (v1), len(v2)), v2])
+    return binarypack_fast_pack
+
+def f592(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.locale
+        length = 10 + len(v2)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 153, length, (v0), (v1), len(v2))
+        offset += 13
+        buf[offset:offset + len(v2)] = v2
+        return end
+    return binarypack_fast_pack_into
+
+def f593(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, n2, = S_0(data, offset)
+        offset += 10
+        v2 = data[offset:offset + n2]
+        if v2.__class__ is memoryview: v2 = v2.tobytes()
+        offset += n2
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'locale': v2})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f594(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, self.locale, ))
+    return __hash__
+
+def f595(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.game_id != other.game_id or self.resume_time != other.resume_time)
+    return __eq__
+
+def f596(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) game_id: %r resume_time: %r' % (cls.__name__, cls.type, self.game_id, self.resume_time)
+    return __str__
+
+def f597(D_0, D_1, MISSING, instance, packet_type, **_namespace):
+    def make(cls, game_id=D_0, resume_time=D_1):
+        p = instance(cls, {'game_id': game_id, 'resume_time': resume_time})
+        return p
+    return make
+
+def f598(D_0, D_1, MISSING, packet_type, **_namespace):
+    def make(cls, game_id=D_0, resume_time=D_1):
+        p = cls.__new__(cls)
+        p.game_id = game_id
+        p.resume_time = resume_time
+        return p
+    return make
+
+def f599(D_0, D_1, MISSING, **_namespace):
+    def __init__(self, game_id=D_0, resume_time=D_1, **kw):
+        self.game_id = game_id
+        self.resume_time = resume_time
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f600(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.game_id
+        v1 = p.resume_time
+        length = 8
+        return S_0(154, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f601(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.game_id
+        v1 = p.resume_time
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 154, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f602(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, = S_0(data, offset)
+        offset += 8
+        p = instance(packet_type, {'game_id': v0, 'resume_time': v1})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f603(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.game_id, self.resume_time, ))
+    return __hash__
+
+def f604(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.game_id != other.game_id)
+    return __eq__
+
+def f605(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) game_id: %r' % (cls.__name__, cls.type, self.game_id)
+    return __str__
+
+def f606(D_0, MISSING, instance, packet_type, **_namespace):
+    def make(cls, game_id=D_0):
+        p = instance(cls, {'game_id': game_id})
+        return p
+    return make
+
+def f607(D_0, MISSING, packet_type, **_namespace):
+    def make(cls, game_id=D_0):
+        p = cls.__new__(cls)
+        p.game_id = game_id
+        return p
+    return make
+
+def f608(D_0, MISSING, **_namespace):
+    def __init__(self, game_id=D_0, **kw):
+        self.game_id = game_id
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f609(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.game_id
+        length = 4
+        return S_0(155, length, (v0))
+    return binarypack_fast_pack
+
+def f610(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.game_id
+        length = 4
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 155, length, (v0))
+        return end
+    return binarypack_fast_pack_into
+
+def f611(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, = S_0(data, offset)
+        offset += 4
+        p = instance(packet_type, {'game_id': v0})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f612(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.game_id, ))
+    return __hash__
+
+def f613(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.tourney_serial != other.tourney_serial or self.table_serial != other.table_serial)
+    return __eq__
+
+def f614(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r tourney_serial: %r table_serial: %r' % (cls.__name__, cls.type, self.serial, self.tourney_serial, self.table_serial)
+    return __str__
+
+def f615(D_0, D_1, D_2, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, tourney_serial=D_1, table_serial=D_2):
+        p = instance(cls, {'serial': serial, 'tourney_serial': tourney_serial, 'table_serial': table_serial})
+        return p
+    return make
+
+def f616(D_0, D_1, D_2, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, tourney_serial=D_1, table_serial=D_2):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.tourney_serial = tourney_serial
+        p.table_serial = table_serial
+        return p
+    return make
+
+def f617(D_0, D_1, D_2, MISSING, **_namespace):
+    def __init__(self, serial=D_0, tourney_serial=D_1, table_serial=D_2, **kw):
+        self.serial = serial
+        self.tourney_serial = tourney_serial
+        self.table_serial = table_serial
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f618(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.tourney_serial
+        v2 = p.table_serial
+        length = 12
+        return S_0(156, length, (v0), (v1), (v2))
+    return binarypack_fast_pack
+
+def f619(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.tourney_serial
+        v2 = p.table_serial
+        length = 12
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 156, length, (v0), (v1), (v2))
+        return end
+    return binarypack_fast_pack_into
+
+def f620(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, = S_0(data, offset)
+        offset += 12
+        p = instance(packet_type, {'serial': v0, 'tourney_serial': v1, 'table_serial': v2})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f621(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.tourney_serial, self.table_serial, ))
+    return __hash__
+
+def f622(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.tourney_serial
+        length = 8
+        return S_0(157, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f623(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.tourney_serial
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 157, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f624(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.tourney_serial != other.tourney_serial or self.rank != other.rank or self.players_active != other.players_active or self.chips_avg != other.chips_avg or self.chips_max != other.chips_max or self.player_chips_max_serial != other.player_chips_max_serial or self.player_chips_max_name != other.player_chips_max_name or self.table_count != other.table_count)
+    return __eq__
+
+def f625(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r tourney_serial: %r rank: %r players_active: %r chips_avg: %r chips_max: %r player_chips_max_serial: %r player_chips_max_name: %r table_count: %r' % (cls.__name__, cls.type, self.serial, self.tourney_serial, self.rank, self.players_active, self.chips_avg, self.chips_max, self.player_chips_max_serial, self.player_chips_max_name, self.table_count)
+    return __str__
+
+def f626(D_0, D_1, D_2, D_3, D_4, D_5, D_6, D_7, D_8, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, tourney_serial=D_1, rank=D_2, players_active=D_3, chips_avg=D_4, chips_max=D_5, player_chips_max_serial=D_6, player_chips_max_name=D_7, table_count=D_8):
+        p = instance(cls, {'serial': serial, 'tourney_serial': tourney_serial, 'rank': rank, 'players_active': players_active, 'chips_avg': chips_avg, 'chips_max': chips_max, 'player_chips_max_serial': player_chips_max_serial, 'player_chips_max_name': player_chips_max_name, 'table_count': table_count})
+        return p
+    return make
+
+def f627(D_0, D_1, D_2, D_3, D_4, D_5, D_6, D_7, D_8, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, tourney_serial=D_1, rank=D_2, players_active=D_3, chips_avg=D_4, chips_max=D_5, player_chips_max_serial=D_6, player_chips_max_name=D_7, table_count=D_8):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.tourney_serial = tourney_serial
+        p.rank = rank
+        p.players_active = players_active
+        p.chips_avg = chips_avg
+        p.chips_max = chips_max
+        p.player_chips_max_serial = player_chips_max_serial
+        p.player_chips_max_name = player_chips_max_name
+        p.table_count = table_count
+        return p
+    return make
+
+def f628(D_0, D_1, D_2, D_3, D_4, D_5, D_6, D_7, D_8, MISSING, **_namespace):
+    def __init__(self, serial=D_0, tourney_serial=D_1, rank=D_2, players_active=D_3, chips_avg=D_4, chips_max=D_5, player_chips_max_serial=D_6, player_chips_max_name=D_7, table_count=D_8, **kw):
+        self.serial = serial
+        self.tourney_serial = tourney_serial
+        self.rank = rank
+        self.players_active = players_active
+        self.chips_avg = chips_avg
+        self.chips_max = chips_max
+        self.player_chips_max_serial = player_chips_max_serial
+        self.player_chips_max_name = player_chips_max_name
+        self.table_count = table_count
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f629(S_0, S_2, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.tourney_serial
+        v2 = p.rank
+        v3 = p.players_active
+        v4 = p.chips_avg
+        v5 = p.chips_max
+        v6 = p.player_chips_max_serial
+        v7 = p.player_chips_max_name
+        v8 = p.table_count
+        length = 38 + len(v7)
+        return b''.join([S_0(158, length, (v0), (v1), (v2), (v3), (v4), (v5), (v6), len(v7)), v7, S_2((v8))])
+    return binarypack_fast_pack
+
+def f630(S_0, S_2, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.tourney_serial
+        v2 = p.rank
+        v3 = p.players_active
+        v4 = p.chips_avg
+        v5 = p.chips_max
+        v6 = p.player_chips_max_serial
+        v7 = p.player_chips_max_name
+        v8 = p.table_count
+        length = 38 + len(v7)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 158, length, (v0), (v1), (v2), (v3), (v4), (v5), (v6), len(v7))
+        offset += 37
+        buf[offset:offset + len(v7)] = v7
+        offset += len(v7)
+        S_2(buf, offset, (v8))
+        return end
+    return binarypack_fast_pack_into
+
+def f631(S_0, S_5, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, v3, v4, v5, v6, n7, = S_0(data, offset)
+        offset += 34
+        v7 = data[offset:offset + n7]
+        if v7.__class__ is memoryview: v7 = v7.tobytes()
+        offset += n7
+        v8, = S_5(data, offset)
+        offset += 4
+        p = instance(packet_type, {'serial': v0, 'tourney_serial': v1, 'rank': v2, 'players_active': v3, 'chips_avg': v4, 'chips_max': v5, 'player_chips_max_serial': v6, 'player_chips_max_name': v7, 'table_count': v8})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f632(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.tourney_serial, self.rank, self.players_active, self.chips_avg, self.chips_max, self.player_chips_max_serial, self.player_chips_max_name, self.table_count, ))
+    return __hash__
+
+def f633(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.tourney_serial
+        length = 8
+        return S_0(159, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f634(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.tourney_serial
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 159, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f635(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.code != other.code or self.message != other.message)
+    return __eq__
+
+def f636(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r code: %r message: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.code, self.message)
+    return __str__
+
+def f637(D_0, D_1, D_2, D_3, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, code=D_2, message=D_3):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'code': code, 'message': message})
+        return p
+    return make
+
+def f638(D_0, D_1, D_2, D_3, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, code=D_2, message=D_3):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.code = code
+        p.message = message
+        return p
+    return make
+
+def f639(D_0, D_1, D_2, D_3, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, code=D_2, message=D_3, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.code = code
+        self.message = message
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f640(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.code
+        v3 = p.message
+        length = 14 + len(v3)
+        return b''.join([S_0(160, length, (v0), (v1), (v2), len(v3)), v3])
+    return binarypack_fast_pack
+
+def f641(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.code
+        v3 = p.message
+        length = 14 + len(v3)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 160, length, (v0), (v1), (v2), len(v3))
+        offset += 17
+        buf[offset:offset + len(v3)] = v3
+        return end
+    return binarypack_fast_pack_into
+
+def f642(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, n3, = S_0(data, offset)
+        offset += 14
+        v3 = data[offset:offset + n3]
+        if v3.__class__ is memoryview: v3 = v3.tobytes()
+        offset += n3
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'code': v2, 'message': v3})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f643(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, self.code, self.message, ))
+    return __hash__
+
+def f644(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.currency_serial != other.currency_serial or self.rank != other.rank or self.percentile != other.percentile)
+    return __eq__
+
+def f645(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r currency_serial: %r rank: %r percentile: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.currency_serial, self.rank, self.percentile)
+    return __str__
+
+def f646(D_0, D_1, D_2, D_3, D_4, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, currency_serial=D_2, rank=D_3, percentile=D_4):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'currency_serial': currency_serial, 'rank': rank, 'percentile': percentile})
+        return p
+    return make
+
+def f647(D_0, D_1, D_2, D_3, D_4, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, currency_serial=D_2, rank=D_3, percentile=D_4):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.currency_serial = currency_serial
+        p.rank = rank
+        p.percentile = percentile
+        return p
+    return make
+
+def f648(D_0, D_1, D_2, D_3, D_4, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, currency_serial=D_2, rank=D_3, percentile=D_4, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.currency_serial = currency_serial
+        self.rank = rank
+        self.percentile = percentile
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f649(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.currency_serial
+        v3 = p.rank
+        v4 = p.percentile
+        length = 20
+        return S_0(161, length, (v0), (v1), (v2), (v3), (v4))
+    return binarypack_fast_pack
+
+def f650(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.currency_serial
+        v3 = p.rank
+        v4 = p.percentile
+        length = 20
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 161, length, (v0), (v1), (v2), (v3), (v4))
+        return end
+    return binarypack_fast_pack_into
+
+def f651(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, v3, v4, = S_0(data, offset)
+        offset += 20
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'currency_serial': v2, 'rank': v3, 'percentile': v4})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f652(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, self.currency_serial, self.rank, self.percentile, ))
+    return __hash__
+
+def f653(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.tourney_serial != other.tourney_serial)
+    return __eq__
+
+def f654(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r tourney_serial: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.tourney_serial)
+    return __str__
+
+def f655(D_0, D_1, D_2, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, tourney_serial=D_2):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'tourney_serial': tourney_serial})
+        return p
+    return make
+
+def f656(D_0, D_1, D_2, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, tourney_serial=D_2):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.tourney_serial = tourney_serial
+        return p
+    return make
+
+def f657(D_0, D_1, D_2, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, tourney_serial=D_2, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.tourney_serial = tourney_serial
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f658(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.tourney_serial
+        length = 12
+        return S_0(162, length, (v0), (v1), (v2))
+    return binarypack_fast_pack
+
+def f659(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.tourney_serial
+        length = 12
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 162, length, (v0), (v1), (v2))
+        return end
+    return binarypack_fast_pack_into
+
+def f660(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, = S_0(data, offset)
+        offset += 12
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'tourney_serial': v2})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f661(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, self.tourney_serial, ))
+    return __hash__
+
+def f662(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.min != other.min or self.max != other.max or self.step != other.step or self.cap != other.cap or self.limit != other.limit)
+    return __eq__
+
+def f663(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r min: %r max: %r step: %r cap: %r limit: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.min, self.max, self.step, self.cap, self.limit)
+    return __str__
+
+def f664(D_0, D_1, D_2, D_3, D_4, D_5, D_6, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, min=D_2, max=D_3, step=D_4, cap=D_5, limit=D_6):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'min': min, 'max': max, 'step': step, 'cap': cap, 'limit': limit})
+        return p
+    return make
+
+def f665(D_0, D_1, D_2, D_3, D_4, D_5, D_6, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, min=D_2, max=D_3, step=D_4, cap=D_5, limit=D_6):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.min = min
+        p.max = max
+        p.step = step
+        p.cap = cap
+        p.limit = limit
+        return p
+    return make
+
+def f666(D_0, D_1, D_2, D_3, D_4, D_5, D_6, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, min=D_2, max=D_3, step=D_4, cap=D_5, limit=D_6, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.min = min
+        self.max = max
+        self.step = step
+        self.cap = cap
+        self.limit = limit
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f667(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.min
+        v3 = p.max
+        v4 = p.step
+        v5 = p.cap
+        v6 = p.limit
+        length = 22
+        return S_0(163, length, (v0), (v1), (v2), (v3), (v4), (v5), (v6))
+    return binarypack_fast_pack
+
+def f668(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.min
+        v3 = p.max
+        v4 = p.step
+        v5 = p.cap
+        v6 = p.limit
+        length = 22
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 163, length, (v0), (v1), (v2), (v3), (v4), (v5), (v6))
+        return end
+    return binarypack_fast_pack_into
+
+def f669(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, v3, v4, v5, v6, = S_0(data, offset)
+        offset += 22
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'min': v2, 'max': v3, 'step': v4, 'cap': v5, 'limit': v6})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f670(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, self.min, self.max, self.step, self.cap, self.limit, ))
+    return __hash__
+
+def f671(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.game_id != other.game_id or self.serials != other.serials or self.chips != other.chips or self.absolute != other.absolute)
+    return __eq__
+
+def f672(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) game_id: %r serials: %r chips: %r absolute: %r' % (cls.__name__, cls.type, self.game_id, self.serials, self.chips, self.absolute)
+    return __str__
+
+def f673(C_1, C_2, D_0, D_1, D_2, D_3, MISSING, instance, packet_type, **_namespace):
+    def make(cls, game_id=D_0, serials=MISSING, chips=MISSING, absolute=D_3):
+        p = instance(cls, {'game_id': game_id, 'serials': C_1(D_1) if serials is MISSING else serials, 'chips': C_2(D_2) if chips is MISSING else chips, 'absolute': absolute})
+        return p
+    return make
+
+def f674(C_1, C_2, D_0, D_1, D_2, D_3, MISSING, packet_type, **_namespace):
+    def make(cls, game_id=D_0, serials=MISSING, chips=MISSING, absolute=D_3):
+        p = cls.__new__(cls)
+        p.game_id = game_id
+        p.serials = C_1(D_1) if serials is MISSING else serials
+        p.chips = C_2(D_2) if chips is MISSING else chips
+        p.absolute = absolute
+        return p
+    return make
+
+def f675(C_1, C_2, D_0, D_1, D_2, D_3, MISSING, **_namespace):
+    def __init__(self, game_id=D_0, serials=MISSING, chips=MISSING, absolute=D_3, **kw):
+        self.game_id = game_id
+        self.serials = C_1(D_1) if serials is MISSING else serials
+        self.chips = C_2(D_2) if chips is MISSING else chips
+        self.absolute = absolute
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f676(L_1, L_2, S_0, S_2, S_4, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.game_id
+        v1 = p.serials
+        n1 = len(v1)
+        d1 = L_1[n1].pack(*v1)
+        v2 = p.chips
+        n2 = len(v2)
+        d2 = L_2[n2].pack(*v2)
+        v3 = p.absolute
+        length = 7 + len(d1) + len(d2)
+        return b''.join([S_0(164, length, (v0), n1), d1, S_2(n2), d2, S_4((1 if v3 else 0))])
+    return binarypack_fast_pack
+
+def f677(L_1, L_2, S_0, S_2, S_4, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.game_id
+        v1 = p.serials
+        n1 = len(v1)
+        d1 = L_1[n1].pack(*v1)
+        v2 = p.chips
+        n2 = len(v2)
+        d2 = L_2[n2].pack(*v2)
+        v3 = p.absolute
+        length = 7 + len(d1) + len(d2)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 164, length, (v0), n1)
+        offset += 8
+        buf[offset:offset + len(d1)] = d1
+        offset += len(d1)
+        S_2(buf, offset, n2)
+        offset += 1
+        buf[offset:offset + len(d2)] = d2
+        offset += len(d2)
+        S_4(buf, offset, (1 if v3 else 0))
+        return end
+    return binarypack_fast_pack_into
+
+def f678(L_1, L_2, S_0, S_4, S_8, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, n1, = S_0(data, offset)
+        offset += 5
+        v1 = list(L_1[n1].unpack_from(data, offset)) if n1 else []
+        offset += n1 * 4
+        n2, = S_4(data, offset)
+        offset += 1
+        v2 = list(L_2[n2].unpack_from(data, offset)) if n2 else []
+        offset += n2 * 4
+        v3, = S_8(data, offset)
+        offset += 1
+        p = instance(packet_type, {'game_id': v0, 'serials': v1, 'chips': v2, 'absolute': v3 != 0})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f679(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.game_id, hashable(self.serials), hashable(self.chips), self.absolute, ))
+    return __hash__
+
+def f680(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.currency_serial != other.currency_serial or self.min_players != other.min_players or self.variant != other.variant or self.betting_structure != other.betting_structure or self.auto_blind_ante != other.auto_blind_ante)
+    return __eq__
+
+def f681(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r currency_serial: %r min_players: %r variant: %r betting_structure: %r auto_blind_ante: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.currency_serial, self.min_players, self.variant, self.betting_structure, self.auto_blind_ante)
+    return __str__
+
+def f682(D_0, D_1, D_2, D_3, D_4, D_5, D_6, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, currency_serial=D_2, min_players=D_3, variant=D_4, betting_structure=D_5, auto_blind_ante=D_6):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'currency_serial': currency_serial, 'min_players': min_players, 'variant': variant, 'betting_structure': betting_structure, 'auto_blind_ante': auto_blind_ante})
+        return p
+    return make
+
+def f683(D_0, D_1, D_2, D_3, D_4, D_5, D_6, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, currency_serial=D_2, min_players=D_3, variant=D_4, betting_structure=D_5, auto_blind_ante=D_6):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.currency_serial = currency_serial
+        p.min_players = min_players
+        p.variant = variant
+        p.betting_structure = betting_structure
+        p.auto_blind_ante = auto_blind_ante
+        return p
+    return make
+
+def f684(D_0, D_1, D_2, D_3, D_4, D_5, D_6, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, currency_serial=D_2, min_players=D_3, variant=D_4, betting_structure=D_5, auto_blind_ante=D_6, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.currency_serial = currency_serial
+        self.min_players = min_players
+        self.variant = variant
+        self.betting_structure = betting_structure
+        self.auto_blind_ante = auto_blind_ante
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f685(S_0, S_2, S_4, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.currency_serial
+        v3 = p.min_players
+        v4 = p.variant
+        v5 = p.betting_structure
+        v6 = p.auto_blind_ante
+        length = 21 + len(v4) + len(v5)
+        return b''.join([S_0(165, length, (v0), (v1), (v2), (v3), len(v4)), v4, S_2(len(v5)), v5, S_4((1 if v6 else 0))])
+    return binarypack_fast_pack
+
+def f686(S_0, S_2, S_4, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.currency_serial
+        v3 = p.min_players
+        v4 = p.variant
+        v5 = p.betting_structure
+        v6 = p.auto_blind_ante
+        length = 21 + len(v4) + len(v5)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 165, length, (v0), (v1), (v2), (v3), len(v4))
+        offset += 21
+        buf[offset:offset + len(v4)] = v4
+        offset += len(v4)
+        S_2(buf, offset, len(v5))
+        offset += 2
+        buf[offset:offset + len(v5)] = v5
+        offset += len(v5)
+        S_4(buf, offset, (1 if v6 else 0))
+        return end
+    return binarypack_fast_pack_into
+
+def f687(S_0, S_10, S_5, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, v3, n4, = S_0(data, offset)
+        offset += 18
+        v4 = data[offset:offset + n4]
+        if v4.__class__ is memoryview: v4 = v4.tobytes()
+        offset += n4
+        n5, = S_5(data, offset)
+        offset += 2
+        v5 = data[offset:offset + n5]
+        if v5.__class__ is memoryview: v5 = v5.tobytes()
+        offset += n5
+        v6, = S_10(data, offset)
+        offset += 1
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'currency_serial': v2, 'min_players': v3, 'variant': v4, 'betting_structure': v5, 'auto_blind_ante': v6 != 0})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f688(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, self.currency_serial, self.min_players, self.variant, self.betting_structure, self.auto_blind_ante, ))
+    return __hash__
+
+def f689(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.name != other.name or self.description_short != other.description_short or self.description_long != other.description_long or self.players_quota != other.players_quota or self.variant != other.variant or self.betting_structure != other.betting_structure or self.skin != other.skin or self.seats_per_game != other.seats_per_game or self.player_timeout != other.player_timeout or self.currency_serial != other.currency_serial or self.prize_currency != other.prize_currency or self.prize_min != other.prize_min or self.bailor_serial != other.bailor_serial or self.buy_in != other.buy_in or self.rake != other.rake or self.sit_n_go != other.sit_n_go or self.start_time != other.start_time or self.players != other.players or self.breaks_duration != other.breaks_duration or self.breaks_first != other.breaks_first or self.breaks_interval != other.breaks_interval or self.schedule_serial != other.schedule_serial)
+    return __eq__
+
+def f690(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r name: %r description_short: %r description_long: %r players_quota: %r variant: %r betting_structure: %r skin: %r seats_per_game: %r player_timeout: %r currency_serial: %r prize_currency: %r prize_min: %r bailor_serial: %r buy_in: %r rake: %r sit_n_go: %r start_time: %r players: %r breaks_duration: %r breaks_first: %r breaks_interval: %r schedule_serial: %r' % (cls.__name__, cls.type, self.serial, self.name, self.description_short, self.description_long, self.players_quota, self.variant, self.betting_structure, self.skin, self.seats_per_game, self.player_timeout, self.currency_serial, self.prize_currency, self.prize_min, self.bailor_serial, self.buy_in, self.rake, self.sit_n_go, self.start_time, self.players, self.breaks_duration, self.breaks_first, self.breaks_interval, self.schedule_serial)
+    return __str__
+
+def f691(C_18, D_0, D_1, D_10, D_11, D_12, D_13, D_14, D_15, D_16, D_17, D_18, D_19, D_2, D_20, D_21, D_22, D_3, D_4, D_5, D_6, D_7, D_8, D_9, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, name=D_1, description_short=D_2, description_long=D_3, players_quota=D_4, variant=D_5, betting_structure=D_6, skin=D_7, seats_per_game=D_8, player_timeout=D_9, currency_serial=D_10, prize_currency=D_11, prize_min=D_12, bailor_serial=D_13, buy_in=D_14, rake=D_15, sit_n_go=D_16, start_time=D_17, players=MISSING, breaks_duration=D_19, breaks_first=D_20, breaks_interval=D_21, schedule_serial=D_22):
+        p = instance(cls, {'serial': serial, 'name': name, 'description_short': description_short, 'description_long': description_long, 'players_quota': players_quota, 'variant': variant, 'betting_structure': betting_structure, 'skin': skin, 'seats_per_game': seats_per_game, 'player_timeout': player_timeout, 'currency_serial': currency_serial, 'prize_currency': prize_currency, 'prize_min': prize_min, 'bailor_serial': bailor_serial, 'buy_in': buy_in, 'rake': rake, 'sit_n_go': sit_n_go, 'start_time': start_time, 'players': C_18(D_18) if players is MISSING else players, 'breaks_duration': breaks_duration, 'breaks_first': breaks_first, 'breaks_interval': breaks_interval, 'schedule_serial': schedule_serial})
+        return p
+    return make
+
+def f692(C_18, D_0, D_1, D_10, D_11, D_12, D_13, D_14, D_15, D_16, D_17, D_18, D_19, D_2, D_20, D_21, D_22, D_3, D_4, D_5, D_6, D_7, D_8, D_9, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, name=D_1, description_short=D_2, description_long=D_3, players_quota=D_4, variant=D_5, betting_structure=D_6, skin=D_7, seats_per_game=D_8, player_timeout=D_9, currency_serial=D_10, prize_currency=D_11, prize_min=D_12, bailor_serial=D_13, buy_in=D_14, rake=D_15, sit_n_go=D_16, start_time=D_17, players=MISSING, breaks_duration=D_19, breaks_first=D_20, breaks_interval=D_21, schedule_serial=D_22):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.name = name
+        p.description_short = description_short
+        p.description_long = description_long
+        p.players_quota = players_quota
+        p.variant = variant
+        p.betting_structure = betting_structure
+        p.skin = skin
+        p.seats_per_game = seats_per_game
+        p.player_timeout = player_timeout
+        p.currency_serial = currency_serial
+        p.prize_currency = prize_currency
+        p.prize_min = prize_min
+        p.bailor_serial = bailor_serial
+        p.buy_in = buy_in
+        p.rake = rake
+        p.sit_n_go = sit_n_go
+        p.start_time = start_time
+        p.players = C_18(D_18) if players is MISSING else players
+        p.breaks_duration = breaks_duration
+        p.breaks_first = breaks_first
+        p.breaks_interval = breaks_interval
+        p.schedule_serial = schedule_serial
+        return p
+    return make
+
+def f693(C_18, D_0, D_1, D_10, D_11, D_12, D_13, D_14, D_15, D_16, D_17, D_18, D_19, D_2, D_20, D_21, D_22, D_3, D_4, D_5, D_6, D_7, D_8, D_9, MISSING, **_namespace):
+    def __init__(self, serial=D_0, name=D_1, description_short=D_2, description_long=D_3, players_quota=D_4, variant=D_5, betting_structure=D_6, skin=D_7, seats_per_game=D_8, player_timeout=D_9, currency_serial=D_10, prize_currency=D_11, prize_min=D_12, bailor_serial=D_13, buy_in=D_14, rake=D_15, sit_n_go=D_16, start_time=D_17, players=MISSING, breaks_duration=D_19, breaks_first=D_20, breaks_interval=D_21, schedule_serial=D_22, **kw):
+        self.serial = serial
+        self.name = name
+        self.description_short = description_short
+        self.description_long = description_long
+        self.players_quota = players_quota
+        self.variant = variant
+        self.betting_structure = betting_structure
+        self.skin = skin
+        self.seats_per_game = seats_per_game
+        self.player_timeout = player_timeout
+        self.currency_serial = currency_serial
+        self.prize_currency = prize_currency
+        self.prize_min = prize_min
+        self.bailor_serial = bailor_serial
+        self.buy_in = buy_in
+        self.rake = rake
+        self.sit_n_go = sit_n_go
+        self.start_time = start_time
+        self.players = C_18(D_18) if players is MISSING else players
+        self.breaks_duration = breaks_duration
+        self.breaks_first = breaks_first
+        self.breaks_interval = breaks_interval
+        self.schedule_serial = schedule_serial
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f694(L_18, S_0, S_10, S_12, S_14, S_2, S_4, S_6, S_8, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.name
+        v2 = p.description_short
+        v3 = p.description_long
+        v4 = p.players_quota
+        v5 = p.variant
+        v6 = p.betting_structure
+        v7 = p.skin
+        v8 = p.seats_per_game
+        v9 = p.player_timeout
+        v10 = p.currency_serial
+        v11 = p.prize_currency
+        v12 = p.prize_min
+        v13 = p.bailor_serial
+        v14 = p.buy_in
+        v15 = p.rake
+        v16 = p.sit_n_go
+        v17 = p.start_time
+        v18 = p.players
+        n18 = len(v18)
+        d18 = L_18[n18].pack(*v18)
+        v19 = p.breaks_duration
+        v20 = p.breaks_first
+        v21 = p.breaks_interval
+        v22 = p.schedule_serial
+        length = 74 + len(v1) + len(v2) + len(v3) + len(v5) + len(v6) + len(v7) + len(d18)
+        return b''.join([S_0(166, length, (v0), len(v1)), v1, S_2(len(v2)), v2, S_4(len(v3)), v3, S_6((v4), len(v5)), v5, S_8(len(v6)), v6, S_10(len(v7)), v7, S_12((v8), (v9), (v10), (v11), (v12), (v13), (v14), (v15), (1 if v16 == 'y' else 0), (v17), n18), d18, S_14((v19), (v20), (v21), (v22))])
+    return binarypack_fast_pack
+
+def f695(L_18, S_0, S_10, S_12, S_14, S_2, S_4, S_6, S_8, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.name
+        v2 = p.description_short
+        v3 = p.description_long
+        v4 = p.players_quota
+        v5 = p.variant
+        v6 = p.betting_structure
+        v7 = p.skin
+        v8 = p.seats_per_game
+        v9 = p.player_timeout
+        v10 = p.currency_serial
+        v11 = p.prize_currency
+        v12 = p.prize_min
+        v13 = p.bailor_serial
+        v14 = p.buy_in
+        v15 = p.rake
+        v16 = p.sit_n_go
+        v17 = p.start_time
+        v18 = p.players
+        n18 = len(v18)
+        d18 = L_18[n18].pack(*v18)
+        v19 = p.breaks_duration
+        v20 = p.breaks_first
+        v21 = p.breaks_interval
+        v22 = p.schedule_serial
+        length = 74 + len(v1) + len(v2) + len(v3) + len(v5) + len(v6) + len(v7) + len(d18)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 166, length, (v0), len(v1))
+        offset += 9
+        buf[offset:offset + len(v1)] = v1
+        offset += len(v1)
+        S_2(buf, offset, len(v2))
+        offset += 2
+        buf[offset:offset + len(v2)] = v2
+        offset += len(v2)
+        S_4(buf, offset, len(v3))
+        offset += 2
+        buf[offset:offset + len(v3)] = v3
+        offset += len(v3)
+        S_6(buf, offset, (v4), len(v5))
+        offset += 6
+        buf[offset:offset + len(v5)] = v5
+        offset += len(v5)
+        S_8(buf, offset, len(v6))
+        offset += 2
+        buf[offset:offset + len(v6)] = v6
+        offset += len(v6)
+        S_10(buf, offset, len(v7))
+        offset += 2
+        buf[offset:offset + len(v7)] = v7
+        offset += len(v7)
+        S_12(buf, offset, (v8), (v9), (v10), (v11), (v12), (v13), (v14), (v15), (1 if v16 == 'y' else 0), (v17), n18)
+        offset += 38
+        buf[offset:offset + len(d18)] = d18
+        offset += len(d18)
+        S_14(buf, offset, (v19), (v20), (v21), (v22))
+        return end
+    return binarypack_fast_pack_into
+
+def f696(L_18, S_0, S_10, S_15, S_20, S_25, S_30, S_34, S_5, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, n1, = S_0(data, offset)
+        offset += 6
+        v1 = data[offset:offset + n1]
+        if v1.__class__ is memoryview: v1 = v1.tobytes()
+        offset += n1
+        n2, = S_5(data, offset)
+        offset += 2
+        v2 = data[offset:offset + n2]
+        if v2.__class__ is memoryview: v2 = v2.tobytes()
+        offset += n2
+        n3, = S_10(data, offset)
+        offset += 2
+        v3 = data[offset:offset + n3]
+        if v3.__class__ is memoryview: v3 = v3.tobytes()
+        offset += n3
+        v4, n5, = S_15(data, offset)
+        offset += 6
+        v5 = data[offset:offset + n5]
+        if v5.__class__ is memoryview: v5 = v5.tobytes()
+        offset += n5
+        n6, = S_20(data, offset)
+        offset += 2
+        v6 = data[offset:offset + n6]
+        if v6.__class__ is memoryview: v6 = v6.tobytes()
+        offset += n6
+        n7, = S_25(data, offset)
+        offset += 2
+        v7 = data[offset:offset + n7]
+        if v7.__class__ is memoryview: v7 = v7.tobytes()
+        offset += n7
+        v8, v9, v10, v11, v12, v13, v14, v15, v16, v17, n18, = S_30(data, offset)
+        offset += 38
+        v18 = list(L_18[n18].unpack_from(data, offset)) if n18 else []
+        offset += n18 * 4
+        v19, v20, v21, v22, = S_34(data, offset)
+        offset += 16
+        p = instance(packet_type, {'serial': v0, 'name': v1, 'description_short': v2, 'description_long': v3, 'players_quota': v4, 'variant': v5, 'betting_structure': v6, 'skin': v7, 'seats_per_game': v8, 'player_timeout': v9, 'currency_serial': v10, 'prize_currency': v11, 'prize_min': v12, 'bailor_serial': v13, 'buy_in': v14, 'rake': v15, 'sit_n_go': 'y' if v16 != 0 else 'n', 'start_time': v17, 'players': v18, 'breaks_duration': v19, 'breaks_first': v20, 'breaks_interval': v21, 'schedule_serial': v22})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f697(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.name, self.description_short, self.description_long, self.players_quota, self.variant, self.betting_structure, self.skin, self.seats_per_game, self.player_timeout, self.currency_serial, self.prize_currency, self.prize_min, self.bailor_serial, self.buy_in, self.rake, self.sit_n_go, self.start_time, hashable(self.players), self.breaks_duration, self.breaks_first, self.breaks_interval, self.schedule_serial, ))
+    return __hash__
+
+def f698(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        return S_0(167, length, (v0), (v1))
+    return binarypack_fast_pack
+
+def f699(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        length = 8
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 167, length, (v0), (v1))
+        return end
+    return binarypack_fast_pack_into
+
+def f700(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        length = 0
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 168, length)
+        return end
+    return binarypack_fast_pack_into
+
+def f701(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial or self.game_id != other.game_id or self.option_id != other.option_id or self.value != other.value)
+    return __eq__
+
+def f702(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r game_id: %r option_id: %r value: %r' % (cls.__name__, cls.type, self.serial, self.game_id, self.option_id, self.value)
+    return __str__
+
+def f703(D_0, D_1, D_2, D_3, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, option_id=D_2, value=D_3):
+        p = instance(cls, {'serial': serial, 'game_id': game_id, 'option_id': option_id, 'value': value})
+        return p
+    return make
+
+def f704(D_0, D_1, D_2, D_3, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0, game_id=D_1, option_id=D_2, value=D_3):
+        p = cls.__new__(cls)
+        p.serial = serial
+        p.game_id = game_id
+        p.option_id = option_id
+        p.value = value
+        return p
+    return make
+
+def f705(D_0, D_1, D_2, D_3, MISSING, **_namespace):
+    def __init__(self, serial=D_0, game_id=D_1, option_id=D_2, value=D_3, **kw):
+        self.serial = serial
+        self.game_id = game_id
+        self.option_id = option_id
+        self.value = value
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f706(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.option_id
+        v3 = p.value
+        length = 10
+        return S_0(169, length, (v0), (v1), (v2), (v3))
+    return binarypack_fast_pack
+
+def f707(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        v1 = p.game_id
+        v2 = p.option_id
+        v3 = p.value
+        length = 10
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 169, length, (v0), (v1), (v2), (v3))
+        return end
+    return binarypack_fast_pack_into
+
+def f708(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, v1, v2, v3, = S_0(data, offset)
+        offset += 10
+        p = instance(packet_type, {'serial': v0, 'game_id': v1, 'option_id': v2, 'value': v3})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f709(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, self.game_id, self.option_id, self.value, ))
+    return __hash__
+
+FACTORIES = {
+    '7b94c397d8d5c766e022558b6f74c799': f0,
+    'ad43bc81577567038228c6dda7def63a': f1,
+    '2982cdfd38d89b8a5f8c45864e65ba4b': f2,
+    'ce8177c106a11b0cf88e69f5285196ff': f3,
+    '94642b97c541b18868ed69045f131c3b': f4,
+    '8bb61e3a932c95c3e9b0c2fe71cf2735': f5,
+    '45e987bc6b929e260dd4ec7edf7001d2': f6,
+    '8e4da23b6ef38512186500a1d50dedad': f7,
+    'a75788887a841bf349872fd5c6a1e7a9': f8,
+    '41924cad4998f6ea98101af8c747e11b': f9,
+    '67a902c434e2f40b9dbe2f7996005b96': f10,
+    'ae837294094c14b80990755714c17c25': f11,
+    '9bd6286fd8c694816df31c98fead07c6': f12,
+    '2101d117ff8bd92817e61ad88148d30d': f13,
+    '35c8f9654b874654e5e2f4006b57a8c9': f14,
+    '17bee52424191cb9120bd4c01ae7ebf1': f15,
+    '1244b84e1596d4afb3ef8f599224fd60': f16,
+    'e8040b99c4f1cfb961703a88125e6fc4': f17,
+    '2c55910b659028f2cf7bfa5e5a9cf574': f18,
+    '260dc080adab2ffe80d39de4c1ff112d': f19,
+    'a2771587394db2f0d05df1a1317d7182': f20,
+    '221a08fbfb3636a0f9c81a51f113680f': f21,
+    '48140f5465ad8f24fa9f91214683bca8': f22,
+    '7d44274958acdd4105b95e5ec2acc4b2': f23,
+    'ba52da740c6f58e9ad0b6578360acb38': f24,
+    'b0696e807ce6bf4eb555ce1ea7401eed': f25,
+    '65a144f2c36177639cc7a962dc7a490b': f26,
+    '77c4df9b57baac9c43627d663df50f1b': f27,
+    'ba7b5a0eba28b8301b65116c0e211aa6': f28,
+    '9b4a156e9049dd27839d3ce71b931f53': f29,
+    '087a30b3c02218cc25d81c2ce3982d0a': f30,
+    '2c66a11cbbb167a9e2957937f663714a': f31,
+    'cff38a9f64a2bfaa05662eaa3147ca6c': f32,
+    '2c25b65b25da93be705e119f34261b56': f33,
+    'c430458e07ae8c1c3ef14837c553056a': f34,
+    '5fa5428098df4b415ab29d87b87df001': f35,
+    '1fe7bacba8d971e99bd8fc01879edd80': f36,
+    '14222df4a47e136d11600b890adbd71a': f37,
+    '2544f93191a67def95d52884df3298c2': f38,
+    '9f6cceb065ac6f651669be766f1f42c2': f39,
+    '9fd58607a41b15c431da8be01979f3f4': f40,
+    '611bb9d3be73d1ab14a30dd8454c9773': f41,
+    'c937c1769f9073a964ec5f03d4913047': f42,
+    '53002ce83320042c0c55b2a8c58edff7': f43,
+    '47c3132b934b91fa8d31c766732b6964': f44,
+    '44620c803de0760e968fef4d03980d3a': f45,
+    '7a0264bc697eeb15385fa1483fb75910': f46,
+    'f169c81d14530e1eae0e9600518b6af0': f47,
+    'dec3d912f799256d18f74a13d9e831f4': f48,
+    'efc34a29c074ff4d3c26849da4c662ea': f49,
+    '0f86587288177094692da5283672fada': f50,
+    '439ba1c4d8a5305be3472465b8315f4f': f51,
+    '6315a37b7134fdd539adbc9f532da906': f52,
+    'b6122dcf00d067355c47870573271db4': f53,
+    '79a8fc473d99adf4e5baf1bb16037938': f54,
+    '9e2895187878ac5f0a3bcaa524880109': f55,
+    '0c7e01951d8fc0776aba95070682fd3c': f56,
+    '46a972d281fdfda59656bd043e164cf1': f57,
+    '75b76bbfce04c6046c40d5430f8e2ece': f58,
+    '31a78c21fb92518dcf59d191fff0341b': f59,
+    '2f826130943fa2b2d5dbecf0c3407dfd': f60,
+    'bebb7b910208586724e971474ba924b7': f61,
+    '6a8b0e14b18248f9da6c27141af52740': f62,
+    'f970e9fd59c3acf77188cc536b9239c1': f63,
+    'c37b6b28e94051720d0e9acda6e54b8d': f64,
+    '25a7adaa6610b1aae2d78177dc90784f': f65,
+    'f65e32ddc1d422952d0015e1a97fab2d': f66,
+    'e3623b486dcd96728c2d3c474378c573': f67,
+    'c7f87d19714cda53635e896596feca59': f68,
+    'ed9710578e3fef0310683b4ab1e23177': f69,
+    '5d1b5888ab2ad1fb25fe5c5502136b2b': f70,
+    '021588faa4e2004c47443f063acdd633': f71,
+    '2664e676e4ede45c661d302b09fb296e': f72,
+    '7fc855547ba9df2b65f2ad18fe2c3bef': f73,
+    'aa3eb0ed38fec9198d005321431ca82a': f74,
+    'c8eb4d61b97ce6c77aa02fc5413674f5': f75,
+    '4e0fc2e1c796ad08bb1a0591f5e375a4': f76,
+    'c2d700465d6f4c03c8276530c51efdf0': f77,
+    '8111b5c4b338cb6bfa76a61e2f4c6651': f78,
+    'd9dbb3fdd25accf0c5e3774e09bffa1c': f79,
+    '159c74bdde7d1d678327e6630b1e1751': f80,
+    '63e8e139de600870395adf6f41d2b3f0': f81,
+    '86aecc02244f015921a5f714b383c790': f82,
+    'd2c52e3069ae195f3a225ab679198923': f83,
+    'a7125fe8d26ca3dbf0520f6cd7e8a58d': f84,
+    'ce01179e79c869cb5cd9d58420be8e21': f85,
+    'be4590efaeea4234c0165de4d88270be': f86,
+    '90fcdd608c7b6fbf64948d079c16eb8f': f87,
+    '13cbe516e1127837e7f4a3bc24808b4c': f88,
+    '087a614b1d03c05b7466a4dbd799e529': f89,
+    'b30c3f8ee9f4de6a6dec1166919921bc': f90,
+    '16eb70bc8bae31d72d375f6bc46d9353': f91,
+    '3258238040fea385e3514ef4988c4ea4': f92,
+    'c0490038b28944972a7ca487eb8c6089': f93,
+    'bc33a92ac5593d50e978f890ff937eaa': f94,
+    '125c2222615013aff609f52ce271f382': f95,
+    'af5f49369ba2e9fc8b7902a48f715ecb': f96,
+    '7012cdf4f0a3d7a0d7975b878d319cf7': f97,
+    'da4e0fc2ce0579461c03bce78bedab88': f98,
+    'd690b28951c7ce7b9c10f73a04e039ac': f99,
+    '6752a045349482f947d152f74c3e8d95': f100,
+    'e4a3722f8ffac729206c1b12267b68c9': f101,
+    '117da81717ed5624bee0217f8280b08f': f102,
+    'b60be1c9dd2296ba3dcd8a9c103224d3': f103,
+    '2720966f004b75422a609a6719406dd7': f104,
+    'a1296734abc0a1533151133856cc604a': f105,
+    'b67a44dc86c16c34db25fba0f0d6354f': f106,
+    'e88e2731c4fe6acbe7546293276771cc': f107,
+    '62d38090254c3a796b1609632cbbdc0f': f108,
+    '3b18ae4f4d84f36ed412bf88678abcf4': f109,
+    'da56a195338ec0608a8faa449aa016fd': f110,
+    '55ad24fd254f048505cd29ede4492289': f111,
+    '66c7bcc6961aafc173d3cae80a7504df': f112,
+    'bc1691f1f6fa9a31c72d8bf07798a87b': f113,
+    'f08930dfdf71f1506b19b049b202843b': f114,
+    'e0f65f35fcaee7d0bc10fc04c0208ab5': f115,
+    '61111cf160aec44f89e04a972bcf068c': f116,
+    'e2632ce1445f9850f29f408bf9a46382': f117,
+    'fb381b87713b67428ad85d5ede2eafed': f118,
+    'c5c4f8958d92aaf632e86b40e4965e0d': f119,
+    '59ab6d9bcd935914c1e45cab04bb3926': f120,
+    '643f546c7c1fe3e22ce6a30286fb9412': f121,
+    'eacd7d27bc32f5d42cccc00537ebfe58': f122,
+    '121bb80ad52ad6ed23629147aa80db7c': f123,
+    'cb5dcd2a0675b170d504b6e752e47e8a': f124,
+    'fc3119535c58e2f53838d0b87150072d': f125,
+    'ae8a7060f67a3c2036640ce6474f9558': f126,
+    '0868b26f7ed366ab2a67d586c669bba4': f127,
+    'c782e1165ea1c38f4a14fdb38b3cb9b9': f128,
+    'ddc639fae93b153b3292dfda3d41f534': f129,
+    '17dfb126955aa436409cab4b43bb67ef': f130,
+    '96a61574de6c199ed893fd27ec0b37bf': f131,
+    '9e01697139ee7ce1752268ea2afa8798': f132,
+    '5260bbbf6cf179082619273e59180581': f133,
+    '1c7fc6d5b3c0fd4906454f8d1563880c': f134,
+    '4e36b308de1141b0703b0f652ad4f389': f135,
+    '3376916d08f4821c0ff951a9731a2a3f': f136,
+    'b71d8c3441da91ef1417685e251e7cf7': f137,
+    'fa4d37dabb469c0492938f1adfcd8be4': f138,
+    'fe05a3f3cd891c380083ecd7a5940a70': f139,
+    'fa79b8752daae744ef61dc81c6ab68a8': f140,
+    'f92cefa8b0c24f12808ddc6932b3d4e6': f141,
+    'dee0e8066366481e411a4469f6236c75': f142,
+    '6caebd28765baa88fdde08469f72ddf9': f143,
+    '436903cf47774d65d811d8e1ba2513f4': f144,
+    '36ca8c2c9a0e6064e24c68965029e2ce': f145,
+    'd184eae82d71e8d376d19b821136d602': f146,
+    'e1fbc041c6c8a8b0240da721ec007cda': f147,
+    '7f2020640be846f2464eab8afa7b3331': f148,
+    'a96072e2c2ec37cb66aedc781219c56c': f149,
+    '121773f232c473b62f731fba24b8c375': f150,
+    '77c72c33c8447edd9eac0041e7915140': f151,
+    '6c296ec6ea512eb19571786ddd94ca50': f152,
+    'b6cad732f7967db5bac2fa57db01ec9a': f153,
+    '594ec416578132a3dec3d9138becd6bc': f154,
+    'e495d6aef5e748c24497d2f93228df36': f155,
+    '4604491e34e8fe467b549d792209cb63': f156,
+    '44fa10b750ddf57a3509fa147a7dfcdb': f157,
+    '43f2752b4798910feb1b64fd1f1a6208': f158,
+    '97291fdb7bbcd5cb76bfb851c40a26b1': f159,
+    '1de433f06acf9e0be3d4400ec69011d8': f160,
+    'b89cb968f355cf8b211cb5d4598326b7': f161,
+    'b9237d60286bd9fdd39d445f301094ba': f162,
+    '05c0057b66da759b57542e330a4a59a0': f163,
+    '57e9f27dc8bc1c22afebffef45fbbe38': f164,
+    '33277d2e0233cdf967ac6f0ce373c53d': f165,
+    '774402fce52ae57088db2f884be94b56': f166,
+    '58139e17cc7a30f73bcb261ad1f6f78d': f167,
+    '338d4adb1a91771649fccf871c38a36b': f168,
+    '61a0628e456c045c92397b36e1cea116': f169,
+    '0afb24b4bb17cf9675d140ad25f504dc': f170,
+    '17a67fe3906e0898fee4985e04033124': f171,
+    'b48794712fceabab593c048150402d90': f172,
+    '41927ec8fc1af742173e0e648bc69c81': f173,
+    '8b56577390576896c69c9e869afaa809': f174,
+    '7f49d15358e437084a3e9713b3ae212d': f175,
+    'aa48af4f6a965481c5da14fdd72eea2e': f176,
+    'f57dbbf60cedc8c6417009cb2d22ac26': f177,
+    '2e5697e4891cdc7af34864cffe4446f6': f178,
+    '7e8d9bf052e7d934492a83622056c096': f179,
+    'f4b8f84d2577a6b7e72da62ff70f54e4': f180,
+    'cb803a51dcfa7b54f17a04c465e0d048': f181,
+    '4d229dddb7c129c21d11b958dcbdef50': f182,
+    'ab0150f0de7ef274610e64c57892e8db': f183,
+    '7e560676a1f77156e7b14dad6e59861d': f184,
+    '37ea2fb9302b66e9c729d7c00ddc88d0': f185,
+    'f7baec07fbcbac4d51d01500d6e99ecb': f186,
+    '4063436e50454c9f181eeaab4b857d71': f187,
+    '4e7f05e1f66529055688d3a814d5bfcb': f188,
+    '9f9cd4606fd85a607522443be1c58b91': f189,
+    '09f6830414ab9fa76fe6f6e83d2b5651': f190,
+    '85d3b4f842a4cc2491a82f6e31bf5058': f191,
+    'd3d55f60000a05819b323ed93f6e7671': f192,
+    'e7df9976cde54114cbb60596d0d4010b': f193,
+    '49402b6dad9326585a3096fdef8dda9d': f194,
+    '57d88312ac8445d30b13f24d65ac8149': f195,
+    '6978bd5f4d99cac1a76ed302ae8a0025': f196,
+    '62154f49a50ecce7d8595210fbdc9f92': f197,
+    'd8685786aa8a0bb0a822f914b69a4b3f': f198,
+    '932bcd90ca3f0d9d7f54f8f65ed305c8': f199,
+    'cacaa69218c980b0b1e1affae1ee16e2': f200,
+    '1f203bf9da8260788a48f0218945c5ab': f201,
+    '98e2ac8f5457be06b093afce69c10da4': f202,
+    '23e5470a41dab3d40d38dc8ed07f1d1a': f203,
+    'e53a16d06810f351fb8895dac17b4218': f204,
+    'e14c6a83edf1f9211a24cd328f432bc6': f205,
+    '39a500dd3b9a7facb6957d6d3ee89bd4': f206,
+    'f21ca6ab891574db42e0f0f4ef853f8e': f207,
+    '2edaf455e85ec5682dc8fbc064bec055': f208,
+    'b8f81c4591a7c09657fcab9121ee2eae': f209,
+    'bd285a4cff8c1a1cbe8108e4878c4a78': f210,
+    'c4620d05351c2a3fa0b04f5f65de9732': f211,
+    '498ae6ba3bb9e2c62c2964d450c15ac6': f212,
+    '49778eeb0680692f0301ed82f41851ce': f213,
+    '93a470f761e474a8dd10957f7c13dda6': f214,
+    '68d49d1a2923d3625eb54a847e52bab0': f215,
+    'ec5543556fa7a70820ac2dc7b19b4cb9': f216,
+    '25c0537923c31b21956b0da15311b641': f217,
+    '5fb7e692b0f5641939756838ddfd9931': f218,
+    '674412c3b77fd6bbcddf00e46701b633': f219,
+    'ab7a1732c96a5c2ec51472b8d43a844c': f220,
+    'f14457ad7d4b40921f5c910c9a60c08d': f221,
+    '85b0c7f30a9e6fa398c81851c7dbd277': f222,
+    '86e39ebefc3531728965cc50f1999191': f223,
+    '43ca9561442c7df47b911dff451fec7d': f224,
+    '5ddf8c170f4960d3815ec539cba2360b': f225,
+    'f71a67519fb2ace653e16f7cdf48bd84': f226,
+    'ede0589c90dd56cd5c894b89e9d54a9e': f227,
+    'e1ad127835a0bb344c92f6d45849b412': f228,
+    '5d7c5382ce9795e193fd4f9d1c54d5a1': f229,
+    'aef8f04232ed55c55bd8811c0b9f3755': f230,
+    '91c0a094dc947e3795b104e0de492360': f231,
+    '79377f5dc48dbf67136b4fab9d46cbaf': f232,
+    'cbc8f47915c41f8f4c733b7ca78b667e': f233,
+    'c3647da5f5a75f4ff8c48f4998ab2444': f234,
+    '6c805a3da4330f15a2cfaf8f7faf1ac6': f235,
+    '70601ffcf21f8d8e9510168ef14ea4c1': f236,
+    '6a18f710a6657a0ebda876b5f736ec53': f237,
+    '0d4cc4698f1476eb7f22efb0a43fc9d4': f238,
+    '6a909fa087f2e6730c49913240778a83': f239,
+    '7d202f3c3e487a9ed06c7af6a7fc5c55': f240,
+    '6390aebb0a7dc5ebd85360679ae727da': f241,
+    '24158415ed05b5059f2a27eb89e242ce': f242,
+    'f849cc8daa0173f1ecaa37c0def5b19b': f243,
+    'dbaf1baaddd3fea1f72705c5ec9c1335': f244,
+    'd25e00f732455c9b57545ff26515ceef': f245,
+    '75400496dccbf36d7feff016690dcc39': f246,
+    '8266c4cbb1bb479f3af233b4142dc2ed': f247,
+    'd971276f3e7a1dfb0846663bac3f14b2': f248,
+    'a4daca146baf91e28c3cc547c4e08bd0': f249,
+    '717c2349bba5d08f4216d4649c927d60': f250,
+    '5ab8914615d190a903ca42051b7f486f': f251,
+    '83ef3098ed92d63978305ddb3b33ab59': f252,
+    '30c4f9bffa8cc0674fcb915a37a087cc': f253,
+    '6acd1da9dba10a5541af5ff24b6239b7': f254,
+    'ab53c415379df26e9554d7084cd8653d': f255,
+    'f9e329d003feb2eb9db07c12dc31f699': f256,
+    'd0d6f499350670d2a2dd36e5d503cbcc': f257,
+    '8a3223e19e37e1097c016ee1851e651e': f258,
+    '4974c8445d54786f68ca692272dad1cf': f259,
+    'a067024f5192875b46bca28b21dcf4a2': f260,
+    'd0b4b492fade4c7c65d2ce69fd2b0fd1': f261,
+    '5fa207ab77c8a0488f06ee24b090ad58': f262,
+    'b5cea4140d6037e396604e0c3a0096e4': f263,
+    'bcb6f7d6e95d2617c1ff739d65520e7b': f264,
+    '5dae77fe96ba69ef9386424580cde5c8': f265,
+    '858f0146195ff4703bd7544b52d1b7d6': f266,
+    'bde0ba7709c4afd1717a8d2b2c98b0fa': f267,
+    '08199cf52aec56730c4f47fc93b3b592': f268,
+    'b742bb3131d331a5bdf73d04633fdd7b': f269,
+    '7e674c36eb13df7da5464bb9818bd054': f270,
+    '0bb669dcf4635f35a17b807b219259de': f271,
+    '87d2be9f92b330283b744036dbc7d95d': f272,
+    '3344ef4dea699d3d61d42666a4ff2526': f273,
+    '29ec6856249c7be99b5ffdd6ea919ce1': f274,
+    'fee9a2de0a54218bfc21ce9e40f97bfe': f275,
+    '6b5c6c1f09fbc5a716df9f6621780c55': f276,
+    'fc38ee353c3155cd3d8520f722a0415f': f277,
+    'a4fd21525c0eef7e18c3b7735857f091': f278,
+    '334832e3b3dd28addfba09924bfaca8d': f279,
+    '0e05b7397e9dc940aa5027c5b7a00a60': f280,
+    '6fcd3351bc3ad8dea959a94130074d97': f281,
+    '9727917e832e8e856b67683905e8c882': f282,
+    '0612c0bd29ebb1ced21c504c300eac4a': f283,
+    '2582942683059d612b0db6d74373a259': f284,
+    'e6d21c7797d9bd8acfe73b5984db5599': f285,
+    'cb5406f5007bddb45f95201bea8af9f2': f286,
+    '2a4adb20f5d34b52289500173eb022c6': f287,
+    '52bad56027fd9df825ede7bf07afe07f': f288,
+    '9d828906030fb6d8f1d1e55c733da393': f289,
+    '0923d609acdf1ce75b670887c72945bb': f290,
+    'bcaa7f98d81dbd1c01b72c7b3b683e85': f291,
+    '5a62f26740f788a299fa0e5b378cd3b2': f292,
+    'eb483dd04bed1c2d6ab6afa25b5dfcd1': f293,
+    '8b360324ae99a98f6d2ecfd806b421bc': f294,
+    'b2cc94e1a8dd88a9a9e4abf4d61301a2': f295,
+    'acab4e70a2a5559efce9b63069a07a4c': f296,
+    'b2fb8e147ed4648dd1db616ca681cd56': f297,
+    '194731ecec1510474d53145cbcf246c1': f298,
+    '2fecee619d2c52fc06173d167c2525ae': f299,
+    '577ce8e40dcd4066d0afca2320fffcd0': f300,
+    '38f088859f3f5928e6316aa4fae0e96d': f301,
+    'a7adc0704e21847f0a9956c2620d2a1b': f302,
+    '1429e47b10a8e7830d176f871b9e3a31': f303,
+    'c5c834cfec3864bbcd703c25ec6a1e74': f304,
+    '00d9b65794f3028472aa52bba7389c6c': f305,
+    '0b207df48452e5d31411745948f986f2': f306,
+    'a74150e8cc1df9f6e13c2d7058cc8cea': f307,
+    '3ca43882dededb8c6e9edf11653cad37': f308,
+    '71b5c5428ced1ddfcafe121f6a3fbfef': f309,
+    'b5093ec2d937022ef575433f6532c88e': f310,
+    '7f98ede1f9acfea3bb393c065c0a239c': f311,
+    'a62475f435cbd89452fc3ad7170984a4': f312,
+    '3fff008d30af56e13901838262a0b21c': f313,
+    '8563ef9ebbbc4dd9d24e5b94c166bd81': f314,
+    '89a2c24c9b62d45b80b6687b34aa821b': f315,
+    '46d33be086050501af6b47e3e0306366': f316,
+    '3cd0698fefe52a1353b06a9cedaa8f47': f317,
+    '6618fa0e5bb743af1defe875f2cb4aed': f318,
+    '0a77a7905d9e6e0a17b55dba1ec215ef': f319,
+    '3643025f869f110ed862331b42f450bd': f320,
+    '82b31711fd951e7a1fa8faf423b06d35': f321,
+    '7aad59c1d510696d6ca7ae2f4b1c1aff': f322,
+    '16ace70f68a06760dc1655c33f1cb329': f323,
+    'd38dfdeea78fb6eca21821c92a724810': f324,
+    '1379b6c2bc8689a2e7961c89da2b8ebd': f325,
+    '5bcd5b14eb3b60f3a9ba6b7b292fa4ef': f326,
+    'bc13f8089301fee52ce7c3fdd7400980': f327,
+    'bc152bce1e4c030f744a682671d9418e': f328,
+    'dc31461a27fd79155b926a2dca46ccdc': f329,
+    '58183b443288ba7ef265640275fadc49': f330,
+    'fed1bd8724c51f9ac6c6db5d7ff9c780': f331,
+    'dd614c30aaace464f326c593ffb67cb3': f332,
+    'f79216efc78a4c9175ed42f04d1be660': f333,
+    '7e74e08465fd86f1e09e7a4213f09c0a': f334,
+    '28f43ffd44ed4d1f996760f4f04cf29d': f335,
+    '2eb12677e7d987ec9fadd846857f2487': f336,
+    '2008ebb90707d102cfcb012a39a85ce8': f337,
+    'b6e34550a1ce058a71c6a0d15d3f27ca': f338,
+    'efeafa08830337ed0deee39431206ad1': f339,
+    '5c549e22d89119c282379b7b80036dbf': f340,
+    '67bb473a8527d5e0ba16c382bd5729cc': f341,
+    '37d31cd8c3c6b0052bffbd097bc59b08': f342,
+    'ad13a945a76b25b85223177ace4cf621': f343,
+    'd1069ffd72d28a6b9ee020bacf95f9ac': f344,
+    'a59a34d9531d15162b8e3e6494dcd50a': f345,
+    '26a7b25bcccfbb75f48e54f3269daeaa': f346,
+    '0157491f88951d88962e34e6e37516fc': f347,
+    '6553861cb7712ffb22f48a908382198e': f348,
+    '50bed24cb298b16c0ec54fa8551d7394': f349,
+    'd364a52571739073b2e4519e64cfd57d': f350,
+    '20564d9360e81218b95209156da58f5b': f351,
+    'a15647980446742a7eae744dd308a41a': f352,
+    'cf8a4190b8fa9f132464127ebc06e75e': f353,
+    '918fa112ee106217fdca91df181d0208': f354,
+    '746e863dff8168977cf86a68888625d4': f355,
+    '25122ca8f256bb2d1cd1c095bf4193cc': f356,
+    'b650330dc765a091c1ea6b1d5eb58224': f357,
+    '3d5dbb81e87003ebabbb41760133dbb1': f358,
+    'a356f933fb73bcc36a21d0b9991a6197': f359,
+    '3841f3c069efe8e2779e1e6838d6bb41': f360,
+    'ca5e51667cd3e7939f7d52ac41232c12': f361,
+    'aa51a2b9a4f043776b790f9fb6baf206': f362,
+    'a09e26f6b212fb037fbad239eb813e06': f363,
+    'f4e7735a7c82b143eb1d3b7a8517f634': f364,
+    '0a9deb338f4a36417717f0afc170d001': f365,
+    '4db31ca259c77eec04afd0a25579e108': f366,
+    '7cc83679472046b2950ff5b7363b24fa': f367,
+    '18ebd9e464abb62c750329d24acdf010': f368,
+    'e7747b93d18f473fb8042f132ca75728': f369,
+    '9535ca3a56938d7f0358dc974e6986cf': f370,
+    '850c9612742094cb33d450061b35ee48': f371,
+    'ecbe0bb02359e66988c698b866e216f5': f372,
+    'e118388d52ffa41d9fb4a04325364c9d': f373,
+    'f920b9dc53d382b3f2b4171f5c7dd9fa': f374,
+    '90369207b2e4ade4c423ca7ed4459278': f375,
+    '0f2ae2006c9c9dcbbc3e03fb7373e58c': f376,
+    'd6f9eddde459594399fa2c1e1677aa81': f377,
+    '60fa6449a4a13198bed8a99298e9b0d0': f378,
+    '07add85712b850c58f90b8576e66e481': f379,
+    'b9da51adc23a519bf9ed818d1089815a': f380,
+    '3874444cb355db5cf893b018148d9012': f381,
+    'e58298067fcf2f94655d1aac9d8132d0': f382,
+    '59d0ded93d6cb4e27a441db4eeec610a': f383,
+    '1715d7bec544f83a22149d58514a1f47': f384,
+    '98b082e922e7b90671316e6fca9e3d90': f385,
+    'ad4d479ba1b76408ec9e43e4f0c78f2b': f386,
+    '9928141c77d738fd5a188cbbaf5a3b71': f387,
+    'da35ec5786c97b2fd37e5bf72e05f63c': f388,
+    'ea8b2902e4a6fe0ffc42dc5022d873df': f389,
+    '21aede27cc6a33f937b830c291bb8aab': f390,
+    'bcbb5d67b83d2b0879ae29402874152d': f391,
+    'ecb57f3a82b4e823b49c52b3852a47bc': f392,
+    'e5e1224ded99a62017f2b5582122bd1c': f393,
+    '885754cfc1085044c6f452ce6b034ce0': f394,
+    '2d44e2f5ceff1d0232adb2855fe431d4': f395,
+    'e6f00a44bf781db4f3e48a564c26c020': f396,
+    '00bd11ee894aaad56324ae2684a502f1': f397,
+    '4f94adf7825ff7ef6dcc16e7b97a8dc8': f398,
+    '007b7d715700c2ff0663b192292f490e': f399,
+    '9dd6385c8a792d2cb6e43de630a3d3cf': f400,
+    '6c5e66b5dd53054792b6fc54d37ca96e': f401,
+    'ca01e68e119aa3e64acec933599cba33': f402,
+    '593039fd45e42fbb0c2aa58d28458ea4': f403,
+    'b878b24d7f381de13b15034faf830f4f': f404,
+    '27e28dd98a01226f12d1863950365d3e': f405,
+    '2e380d54448c10cf158d40cad3b32159': f406,
+    '1bd3240c44e4ed65d819808cebf88ae5': f407,
+    '6d1ad480fafb28ecb2daf77f5de1b8ab': f408,
+    '69da459aaf3ed4a259122a4ce54f2abf': f409,
+    'a8fbc16811e94af2e9c74ec9cb922d25': f410,
+    '78b0714df473a981e0ea0490e5a0c7ed': f411,
+    'a35b24ab3d14521aa0aa980b8f73436c': f412,
+    '5a69dd64c2c76cc6779acfefb96a986f': f413,
+    'b067a92839866d219576fae9c8145f11': f414,
+    '1697c34976a3eff06170a5fcecd19c05': f415,
+    'ec8817c957dd93748eaf8dcff2c4e85f': f416,
+    '4d453bc3fcc1dfbae4d4a2471c5a5188': f417,
+    'cf21842b12b0295ed886dc88ab28524b': f418,
+    'a732588ebd1e0f3ab278b22b03a49a02': f419,
+    'cb267ab3db604e113598ee6fc895e62d': f420,
+    'd43d53d21a4222c79f136a478e1c9bb4': f421,
+    'b29f8ea62028932e200771675046e71c': f422,
+    '9d683e99182924ed5919e552380ba1ef': f423,
+    'e815d12c5f2f9156c453b8c0f470de4f': f424,
+    'c56678d4e292716bb830c6eac6e37b06': f425,
+    '6e5b1e82904540eb9c55c2d06eb9e54a': f426,
+    'abad205508a9f48f12f1e4725838764a': f427,
+    'a07d50d1e397a76282e319bc6bdcf3f4': f428,
+    'f64ca2e23d438ad27465103dcbf48437': f429,
+    '4aacef9b64ed2fb841b0ffb53c5b3edb': f430,
+    'e7b0cad52fa1ada628a470157832e821': f431,
+    '5dfafdae250afef0fc2192e81496acfb': f432,
+    '79cb25c31b7f571e8d27bd2941a2ef2f': f433,
+    '73a7fe2986367551a68e948e61224887': f434,
+    '6d1659892b56f845b27634501164d2ac': f435,
+    '947f9f5550e96671105e81d0cfb38cf7': f436,
+    '29faa1cce2dc273cf77b2b4ee1ce51e0': f437,
+    '9673d0c8fee99ba77b792568529d2683': f438,
+    'ca2e054e37fe323ab13a05c4edd8ced6': f439,
+    '938d1e98da6f175f8f713c1d38e9e3ae': f440,
+    '9a26645b64e48f24859e315c7bede8be': f441,
+    '122b8e8dba58e17ce4616ff96455e195': f442,
+    '5a98e778663fa452c6376490c63ccc12': f443,
+    'df66c1d6ea583fff9956d4a1eef426a2': f444,
+    '52bacec3174aed0963aa6d5ee0b76213': f445,
+    '8df0b16ea5335b9129722fc16864802c': f446,
+    '8f8de675ded919abb97563e8e49bbf92': f447,
+    '47b0ef7d69d60e55dfde6a6b3e524d50': f448,
+    'bf42ed842afe8e800531aac7e8c882a7': f449,
+    '1ac8b9b47384ba5395a0c3df0900a1ae': f450,
+    'f85b14bec73617ce973d8a102da37056': f451,
+    '0032fbcf949fe0328d2541ad94fe08d4': f452,
+    'cb3b16293a3951f47ce328be7a25295b': f453,
+    '238afc7eef32dd2258a6ae18356c8bb7': f454,
+    '6fc3fcef722510c3cd2484991ef90751': f455,
+    '47ea9862d039b24f00a29463bc732873': f456,
+    'c3dcf7fdb68fe711d5debb1a187c17c5': f457,
+    '560e68735b033a55707bd5982712b04a': f458,
+    'f5c9e40c7048ca039e5d41d12e1dc97c': f459,
+    '846dd37a4af683eeedcbae86df232a7b': f460,
+    '4ba3f25989ddb6794d863d97b312058b': f461,
+    '654728da8f088cce93277032b06452d5': f462,
+    'f13da67b3f451382e5b6c594090082f8': f463,
+    '66979fd5638245502996bf5165ee1b68': f464,
+    'ea5116fabc7d6d7bf791d02b65e542ba': f465,
+    'af88ddddcb509fd06a3000b34a70acd2': f466,
+    'b084b0aa7e51ee58857aa18908b19f8b': f467,
+    'ac96b010a424f36c61c46dc9ba4fe091': f468,
+    '77cb84be3d62ee7e88785ee5fb487dc0': f469,
+    '2861630385fdc895f999107b032fddf9': f470,
+    '317db2b1cce3741f213c5e0d21a9df67': f471,
+    'eca61e4b1b34c68adba039cd1a2fec49': f472,
+    'a1a62f43bb742973635f61d353ff46e9': f473,
+    '083e27003ab9ff3667498f55d79df1ea': f474,
+    '3c618014f61d0292dc5a99bb61d920a7': f475,
+    'de4c1b34f3a21dc26486c13f9764753c': f476,
+    'd1949fc39163e37a4495b761cb0832d8': f477,
+    'd1dbe291070136e645ada6ff1ae9df1a': f478,
+    'd29b5546c2eea5fb3ad33632639b39cf': f479,
+    'cbf3b61e51a7087090d58a5b9eab6ca8': f480,
+    '694ab27bbc8e9dd5b82eff6f22779d52': f481,
+    '430ece82dfa7aa1e9c2e3eff37ffdb76': f482,
+    '414187538593158a960d9400d874b7bb': f483,
+    'f85f50019c7e82859deb982124feeeee': f484,
+    'fce29b799d6f4ca65bf8861157f2cc60': f485,
+    '11a2e4e4958873b977f29ef371023c7e': f486,
+    '99f5fc9b160a137ac0eeab8693da225f': f487,
+    'a4580a10e34fc7ac9b11abd342791890': f488,
+    'e96d2705fb395d0a7d495410dfb0cb9a': f489,
+    'b44121b45d1d86c8d843df751145a53f': f490,
+    'a003cab0034344af369addb1a954b828': f491,
+    'd95f959a9b8f4c7cc793832bf2827038': f492,
+    '90c9895edec6f7d42518c08a6273480e': f493,
+    '98b0235f1ddc2168d923e703aece7b65': f494,
+    'ce7e060a8133721722ae394a09a820c6': f495,
+    '74f43f1ac5b99945a4ba719c6b373b19': f496,
+    '0c21eca375446dd05fb09b83f94f3cb4': f497,
+    'a7764ebaee056a92b331a0aa07be4131': f498,
+    'c787ba50c50deff542aff8791463b4b8': f499,
+    '6d17111af529d8ba69418042cf4e08b4': f500,
+    '3a5c57b93bbd051179f47f0277c4f928': f501,
+    '5249908b637093d62acd5e4dff68debe': f502,
+    'ee54fb634054afc3a30a5bc6254ee2a9': f503,
+    '6bedbef65f7860dea0d5742f78f13903': f504,
+    'ab738f128f73c9d1270fdb578df8395f': f505,
+    'a6bc17bd001fd5ca5f23c7b0bb6dd104': f506,
+    '1d55f8965453a964a8ac79f6c9c07206': f507,
+    'afe5dc3ed2b352026092af513e0b1767': f508,
+    'b42a13dbb11d68617fc61616ecb545c7': f509,
+    'e49a0bb94494d7f2c8a49ad1301a617d': f510,
+    'cba15f40e6011ea09d190b5c7990e01c': f511,
+    'bae3c1146a01b11a5618c19c930eb355': f512,
+    '224303c42ee96f81ded1e13055c5311c': f513,
+    'b1aa1b027f39716cccb673997b536db8': f514,
+    '860c08b0f728f7699377a999e40aa47a': f515,
+    '7205973b57c37ebabe86b95e8388fbca': f516,
+    '53e3f3f26a6ad8e82f419c016858e42c': f517,
+    'bd837a6f25e6744fc53bc23b3106f13d': f518,
+    'bd4ac7a9370ca41cb3e2f7070090639b': f519,
+    'f416c14a7daf8aab0cac2077bed588d7': f520,
+    'bd63b842e0136c1e295d649187b13345': f521,
+    '8948589f03516ad2a493f4f95b30f91e': f522,
+    '23ac608af55c9f801d0766ffe9ac816c': f523,
+    '4f4cc2e4fdc9103172ecb96836e06c13': f524,
+    '897df1775ab0ef42ffbc05c086622941': f525,
+    '819febc0920bb79367860493a4d913f0': f526,
+    'a356593b4ce2ef1ca201e28168ee663b': f527,
+    '9766598c6b1d3a001ff1370c0e5d2e72': f528,
+    '82b961bbd2e804625a7c8cb18b4c9c72': f529,
+    'acd218750059e38b8c4ebcede115b2c5': f530,
+    'fd614ee03373baf05af95a1123156382': f531,
+    '1b256b8f2aaadb7409ded040f4f8e2c9': f532,
+    '4eabc44fd9e740d854905a36758c3722': f533,
+    '1473bc67828ce28ce3dedb9e226f0f37': f534,
+    'bc4afb274b0686f0b28cecdb8320da95': f535,
+    '7ea3507b3e008046f34f88c43ca44e8e': f536,
+    '66b4e38bd17c4308b2062e4066f2c18b': f537,
+    '754adf9b083954dedec8c1f376df9565': f538,
+    '3838cdeee1f1d6185cf35ceb29d908bf': f539,
+    '1e48f2d3674df9673f3495648653f70c': f540,
+    '24a30997a034eee2d783801872b688a8': f541,
+    '37390f07aac832b023b50fcdba3d45f5': f542,
+    '6a8a23a6c83bad65d30e70662a9cfd83': f543,
+    '3e468d7c4106666a04e96bff89ab419c': f544,
+    '2d197e48a7410fa490f6db367ee41c19': f545,
+    'a833d7b2b615ff07af6f407ae239c2c1': f546,
+    '4375d1f1f8cd0be2b9256acf32d536f2': f547,
+    '00f2ab88366c49cb3bfa9b67a9dbb314': f548,
+    '2e2872e3ed54dfa45aa0f02cbaf63a5c': f549,
+    '6d5bc84cdb99412fd77d04b44fc16f11': f550,
+    '8c1f4588ac159af422336acec29de1f8': f551,
+    'e2f7daf68b31d740e233b5cf68449516': f552,
+    '33678518d14bc4fe9bdcd9629fadbdf4': f553,
+    'cb3caad10cc67e1897b7f7c6be419b1f': f554,
+    'adc235794551ad160ba55488ad95d949': f555,
+    '7a95a39b9f7447f2c8102a0956f3259c': f556,
+    '7fa609afa3f46d444dca58cf10dc981a': f557,
+    'c93aa898323b415cd89045fa1b64cdf5': f558,
+    '8a32517d3c971183c0d7b1e4d61195a1': f559,
+    '32bfa4ec4d28a5374f712ecf0e4df078': f560,
+    'a5b814d635c6e2db45f76fedba95edea': f561,
+    'e33603ab2fd31c6a11e243aba78b0078': f562,
+    '795bad5afcee7365571db12903bf3bf9': f563,
+    '5fa996ba220e4f3b393d159085fd7375': f564,
+    '42ca948ea937ab7be308573c1f8143a6': f565,
+    'cb741fb56d9c127f635d4831001ba641': f566,
+    '7f461b6d98110208837dd0c842a33fd8': f567,
+    '9bd77f110646aa99a6287ee59cf2b74b': f568,
+    '69df63b9a8c133b8a49c0705b8bf4d86': f569,
+    'e2c5dc03c86e05d334f131737b879a58': f570,
+    '6183f6c28bb804a0c36b4ac2dbb70a2c': f571,
+    'd2d877bce47051a8dc12e054e18770b3': f572,
+    'cf593aadad4cfa565585814675d3c347': f573,
+    '746051530ac95dcb8893cba80176f1e0': f574,
+    '89be7ac0b5db3f9492e390c7244d6ed5': f575,
+    'c99f35ed42d5147befbc9d598829f8b5': f576,
+    '0b514c8d71b56fa7d1aa0479490e1e9d': f577,
+    '6d8cfba7612fc3396f2191ca143d998d': f578,
+    '248e515246182705a5282a34aead5ea9': f579,
+    'f87a9041ae3695c00861fd3c0f747a48': f580,
+    '0532157e40edcca55b5cd87038404bf1': f581,
+    '14043d102ef686ceae032ca0d3b844fa': f582,
+    '740df244401f98860752e843bce05710': f583,
+    'ba428c0ab7f9c15ad8ceb059ef5fc2f8': f584,
+    'f57402aec0908dc4190079a6cb11c807': f585,
+    '5ad04a10c9062c6422d6561220fc8daf': f586,
+    '2b82e69d74b666f91e2dc5b6706d150a': f587,
+    '7e391925ea5d9b14e248bb973657ec8a': f588,
+    '7118dad23fb99c2bf3bfff5e8725dd4f': f589,
+    'd7a6d4b41b277f3aead3dfbc8060c087': f590,
+    '7158feb41ee5b913e5332853df88e547': f591,
+    '822440e38a4a7430015f198cb3c9d3f1': f592,
+    '1724d039fc095c6075d9d54e243dea78': f593,
+    'd9aa84818c2f56a6ead176cfd2ac4bae': f594,
+    'dfc55f1e9fd9fb9734503c7d3e35fdff': f595,
+    '06b4ca0355bd5e9dfa2b26bdb7c1f2aa': f596,
+    '173f7ce7dc80e55caa2837488e125494': f597,
+    'd16bba2fe63763b4bb07fc11bd53d14f': f598,
+    'd3aa51857cd47a2a6c180ad5128d56d6': f599,
+    'ff6447b4a4b51835281dbc3f7f93df8e': f600,
+    '53ac0325870dddc93d4436a4b1cf0b48': f601,
+    '0e610e7c52e0aac515d1a1c7e2566893': f602,
+    '65b691e54f6d8660df434e6a22593b28': f603,
+    '8c2e25cda1abfc1371c25694831a5e70': f604,
+    '3b6e89dddcca2cdd5579db5fddc69fc8': f605,
+    'ab38d9895d6b111114bdb14843855946': f606,
+    'eb0865e5e3eaf56b199ab2d3af5c14f5': f607,
+    '4d16678ad4518be72ea79237c9f2bb38': f608,
+    '38a789d504cda164517227eceb7fb35a': f609,
+    '05ea2a596dbddef91fa425c0cc1ad0e7': f610,
+    '76567a2a8a58dab77200bdce4c07e5d5': f611,
+    'bc844a68120bdb9970e61f8168ba7889': f612,
+    'e00d60372c658fda4d25c0cf9c490863': f613,
+    'ff5cedf0203dad1111a721806e58ce3b': f614,
+    'd78ffe5b7d2ba45226464f66bbadf633': f615,
+    '7fbe6250fc26c55f73f55ab3913629d2': f616,
+    '5666e1fd8b7dc2db2751d5e423c969fb': f617,
+    '4799da5b4ce6e3d777fb5a635533c87f': f618,
+    'f0f224fd6477a4834a1ec2d73be1d04e': f619,
+    'db2ef6650541f7300e312dac44d9d7d2': f620,
+    'b9583f3ee45c51cf45557ff88624c7cc': f621,
+    'fc27f079a3d95dd5fbf4027f3fbc2544': f622,
+    '2544e976265b7a0f50656fd1d5d70911': f623,
+    'e8f6e0ad399276d804adfc693d30e3db': f624,
+    'f983b276e1c105745b9308149c70ad0b': f625,
+    '2bcce22179a2cc026100516ecb21a29e': f626,
+    '66a6d962d92626960a31de25dd74e099': f627,
+    'afe12c02829a53ba85d017b0f447917d': f628,
+    '1b4a02ea8a2a52a66756bbbb08a453c0': f629,
+    '94d8891dc1a8ef5a925761f78f07ac57': f630,
+    '04a312c7c7891df536031e26acf77ee7': f631,
+    'fe5bd5f8886a7ee4337c7fcf57559551': f632,
+    '83ce64480aa426fea8faef4834e1f7f7': f633,
+    'fada34ceaeba9e8b2b4f9835a96ac2d7': f634,
+    '2bd97bd4b6303f987357c12c0cf585df': f635,
+    'bf021f842e348202fd045f9404317b7e': f636,
+    '9551b73a68ec51bf30aa97dbaacda29a': f637,
+    '9061ce3286dea63c07c2643a2fe86e72': f638,
+    '5f52ae0a54fa41687efbfc550a2f419a': f639,
+    '34c7705c1f98b1a2c9d6a36a1ec316ed': f640,
+    'a3a29949c8719801f7468e7b23153185': f641,
+    '09404601de79db46adca371c945a785e': f642,
+    'cdb4182f9a2227629f417b08b44be1fb': f643,
+    '67fe5f7f738df59783eb778a59cf9468': f644,
+    'a33b443013a8df432770e7b544fed60f': f645,
+    'acdd8cde4b6dfbcb54b86ae8a774d6d4': f646,
+    '86535744e5dfdcdb1fdef2184380a6db': f647,
+    '783139998c75643bdce907f909158370': f648,
+    '7d5c95b1baae7af68b2a0abf9c287030': f649,
+    '947983d5278866d256adabc8987e9ecf': f650,
+    'e055bcfc6ecf4d9ebc98876496d6809c': f651,
+    '73b21493ad3fa756fd94436ad21dd78b': f652,
+    'fbc00481c681b5f2a27f25d80be84890': f653,
+    '41c1d5554728a9d65b757c4d64269e91': f654,
+    'e8177ac28eb6e23c3bdea9e82169e9af': f655,
+    '081016a1581e2f4c264f7781559d8c93': f656,
+    '577645d674d6d11c55693c0048ce965c': f657,
+    'a366ef216ed8ff51822d94cfc879a035': f658,
+    'c3d3046d8c948ec16000d0598989f92e': f659,
+    'bd2d3ecd64150080c6d5b258ebbee943': f660,
+    '45b4ef73fecad6e31de84dd3bafa3c83': f661,
+    '4b3b56a4fe97b81f5735b19dd74db08d': f662,
+    'cad2b496dc05f9bd38082ff1570c1940': f663,
+    '745eec0a7a8c045bf202ffe7b7df7f59': f664,
+    '11f28bedb0142fea99cf714e76c7c7e8': f665,
+    'bc13f8f88cc71c7e79cb0d23e088be59': f666,
+    'b588e3b694df92d9b59fef4ed8ef5f07': f667,
+    'cedff59d3737a1911acd7ec31a7a4bb5': f668,
+    '8bf7d16c9a81143b326e14b0bb7146bd': f669,
+    '02adf0fe78701f9c1683387751e893b3': f670,
+    '174ca88f9fe037f01ff4c2e7c0bb05aa': f671,
+    'c8b3ac65ce1c9687ae12a4db3d2a1760': f672,
+    'e514f2cfba7603102f4243c3744becde': f673,
+    '986884fc571b25545af33803fe993287': f674,
+    'ad63f1ff8d85a3e9f3b4b5ff98666abd': f675,
+    '6665ecdb82a60ed046756735ece02de2': f676,
+    '7acd7377880cb7d59b30e3277e23e7ad': f677,
+    '68f7320f16978caa51ac14674d606910': f678,
+    'b249df4ad2128e7eb301b5522ae4cdaa': f679,
+    'ca36fbb21bc0743deeb9bf85ff577fcc': f680,
+    'f5275277d6eefe76937996d4e8989845': f681,
+    '865d568d208d0b3baffc483e329a84b0': f682,
+    'a995ed97745c7b9bfbc6ccdf16aff355': f683,
+    'dcb7dc5e7df762df2bc0890b9b3a9cb6': f684,
+    'eaed541fc761d3301c1ddee8e2a1dc67': f685,
+    '21943ebbb2398bdd7d2719c95fe6ac39': f686,
+    '86ce76ec517e1b5d56301017731ca0fb': f687,
+    '859f12c91db869b86553530cbaec71ef': f688,
+    'cee079dc92673077523a013c12bff6d8': f689,
+    '57794d0dc31fe6552ba5ac603d4a1e1b': f690,
+    '58baa8121d6599eee8548afb16943d38': f691,
+    'a60836d1cf18cf51332c6c7e621e3173': f692,
+    '411e3a1ed4428c70ba9a406bf15efaa8': f693,
+    '10b863b4d9b612d8b10a5c4c04b14260': f694,
+    '5bbcda0995be4d7f50d12a3d43bc4cae': f695,
+    'bbd66371b2a05923dc286da2fa73c000': f696,
+    'a404fe64d58606da7e21699a2c8fc68c': f697,
+    'a218c5db11895f83075828ee62f7fc6e': f698,
+    'a143267f15b1c14acd6b4be57866c578': f699,
+    'f71ba7e604fee76f9106ea69fe650b51': f700,
+    'c738722e8c027e712186bef876f36883': f701,
+    '699b8477d86dc1ec1d58aceb582a57c8': f702,
+    '491ae57bc2a380a185c370a70da3b8d9': f703,
+    '3f3802bd7ac01914fa5e688c521bb13b': f704,
+    'd714526ff027cdd583ab4ffc58c4a929': f705,
+    '031380217e1d35ef234e06cd497bcd98': f706,
+    'e441da7d87e4a54c2899b17c9a83e947': f707,
+    'b764b5ee30955d198cdbfb32b93bcb74': f708,
+    'c7550eec6f9dd6de6d6da67f8e33e9a5': f709,
+}
@@ -0,0 +1,886 @@
+# generated by python -m pokerpackets.packetexport --snapshot, do not edit
+# pylint: skip-file
+
+FIELDS = {
+    ('pokerpackets.packets', 'PacketString'): ((('string', '', 's'),), [('string', 's')], [('string', 's')], {'string': (3, 's')}),
+    ('pokerpackets.packets', 'PacketInt'): ((('value', 0, 'I'),), [('value', 'I')], [('value', 'I')], {'value': (3, 'I')}),
+    ('pokerpackets.packets', 'PacketError'): ((('message', 'no message', 's'), ('code', 0, 'I'), ('other_type', 3, 'B')), [('message', 's'), ('code', 'I'), ('other_type', 'B')], [('message', 's'), ('code', 'I'), ('other_type', 'B')], {'message': (3, 's')}),
+    ('pokerpackets.packets', 'PacketAck'): ((), [], [], {}),
+    ('pokerpackets.packets', 'PacketPing'): ((), [], [], {}),
+    ('pokerpackets.packets', 'PacketSerial'): ((('serial', 0, 'I'),), [('serial', 'I')], [('serial', 'I')], {'serial': (3, 'I')}),
+    ('pokerpackets.packets', 'PacketQuit'): ((), [], [], {}),
+    ('pokerpackets.packets', 'PacketAuthOk'): ((), [], [], {}),
+    ('pokerpackets.packets', 'PacketAuthRefused'): ((('message', 'no message', 's'), ('code', 0, 'I'), ('other_type', 3, 'B')), [('message', 's'), ('code', 'I'), ('other_type', 'B')], [('message', 's'), ('code', 'I'), ('other_type', 'B')], {'message': (3, 's')}),
+    ('pokerpackets.packets', 'PacketLogin'): ((('name', 'unknown', 's'), ('password', 'unknown', 's')), [('name', 's'), ('password', 's')], [('name', 's'), ('password', 's')], {'name': (3, 's')}),
+    ('pokerpackets.packets', 'PacketAuthRequest'): ((), [], [], {}),
+    ('pokerpackets.packets', 'PacketList'): ((('packets', [], 'pl'),), [('packets', 'pl')], [('packets', 'pl')], {'packets': (3, 'pl')}),
+    ('pokerpackets.packets', 'PacketLogout'): ((), [], [], {}),
+    ('pokerpackets.packets', 'PacketBootstrap'): ((), [], [], {}),
+    ('pokerpackets.packets', 'PacketProtocolError'): ((('message', 'no message', 's'), ('code', 0, 'I'), ('other_type', 3, 'B')), [('message', 's'), ('code', 'I'), ('other_type', 'B')], [('message', 's'), ('code', 'I'), ('other_type', 'B')], {'message': (3, 's')}),
+    ('pokerpackets.packets', 'PacketMessage'): ((('string', '', 's'),), [('string', 's')], [('string', 's')], {'string': (3, 's')}),
+    ('pokerpackets.packets', 'PacketCompactRequest'): ((), [], [], {}),
+    ('pokerpackets.packets', 'PacketCompact'): ((), [], [], {}),
+    ('pokerpackets.packets', 'PacketAuth'): ((('auth', 'unknown', 's'),), [('auth', 's')], [('auth', 's')], {'auth': (3, 's')}),
+}
+
+def f0(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.string != other.string)
+    return __eq__
+
+def f1(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) string: %r' % (cls.__name__, cls.type, self.string)
+    return __str__
+
+def f2(D_0, MISSING, instance, packet_type, **_namespace):
+    def make(cls, string=D_0):
+        p = instance(cls, {'string': string})
+        return p
+    return make
+
+def f3(D_0, MISSING, packet_type, **_namespace):
+    def make(cls, string=D_0):
+        p = cls.__new__(cls)
+        p.string = string
+        return p
+    return make
+
+def f4(D_0, MISSING, **_namespace):
+    def __init__(self, string=D_0, **kw):
+        self.string = string
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f5(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.string
+        length = 2 + len(v0)
+        return b''.join([S_0(1, length, len(v0)), v0])
+    return binarypack_fast_pack
+
+def f6(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.string
+        length = 2 + len(v0)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 1, length, len(v0))
+        offset += 5
+        buf[offset:offset + len(v0)] = v0
+        return end
+    return binarypack_fast_pack_into
+
+def f7(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        n0, = S_0(data, offset)
+        offset += 2
+        v0 = data[offset:offset + n0]
+        if v0.__class__ is memoryview: v0 = v0.tobytes()
+        offset += n0
+        p = instance(packet_type, {'string': v0})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f8(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.string, ))
+    return __hash__
+
+def f9(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.value != other.value)
+    return __eq__
+
+def f10(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) value: %r' % (cls.__name__, cls.type, self.value)
+    return __str__
+
+def f11(D_0, MISSING, instance, packet_type, **_namespace):
+    def make(cls, value=D_0):
+        p = instance(cls, {'value': value})
+        return p
+    return make
+
+def f12(D_0, MISSING, packet_type, **_namespace):
+    def make(cls, value=D_0):
+        p = cls.__new__(cls)
+        p.value = value
+        return p
+    return make
+
+def f13(D_0, MISSING, **_namespace):
+    def __init__(self, value=D_0, **kw):
+        self.value = value
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f14(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.value
+        length = 4
+        return S_0(2, length, (v0))
+    return binarypack_fast_pack
+
+def f15(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.value
+        length = 4
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 2, length, (v0))
+        return end
+    return binarypack_fast_pack_into
+
+def f16(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, = S_0(data, offset)
+        offset += 4
+        p = instance(packet_type, {'value': v0})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f17(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.value, ))
+    return __hash__
+
+def f18(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.message != other.message or self.code != other.code or self.other_type != other.other_type)
+    return __eq__
+
+def f19(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) message: %r code: %r other_type: %r' % (cls.__name__, cls.type, self.message, self.code, self.other_type)
+    return __str__
+
+def f20(D_0, D_1, D_2, MISSING, packet_type, **_namespace):
+    def make(cls, message=D_0, code=D_1, other_type=D_2):
+        p = cls.__new__(cls)
+        p.__dict__ = {'message': message, 'code': code, 'other_type': other_type}
+        return p
+    return make
+
+def f21(D_0, D_1, D_2, MISSING, packet_type, **_namespace):
+    def make(cls, message=D_0, code=D_1, other_type=D_2):
+        p = cls.__new__(cls)
+        p.message = message
+        p.code = code
+        p.other_type = other_type
+        return p
+    return make
+
+def f22(D_0, D_1, D_2, MISSING, **_namespace):
+    def __init__(self, message=D_0, code=D_1, other_type=D_2, **kw):
+        self.message = message
+        self.code = code
+        self.other_type = other_type
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f23(S_0, S_2, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.message
+        v1 = p.code
+        v2 = p.other_type
+        length = 7 + len(v0)
+        return b''.join([S_0(3, length, len(v0)), v0, S_2((v1), (v2))])
+    return binarypack_fast_pack
+
+def f24(S_0, S_2, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.message
+        v1 = p.code
+        v2 = p.other_type
+        length = 7 + len(v0)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 3, length, len(v0))
+        offset += 5
+        buf[offset:offset + len(v0)] = v0
+        offset += len(v0)
+        S_2(buf, offset, (v1), (v2))
+        return end
+    return binarypack_fast_pack_into
+
+def f25(S_0, S_5, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        n0, = S_0(data, offset)
+        offset += 2
+        v0 = data[offset:offset + n0]
+        if v0.__class__ is memoryview: v0 = v0.tobytes()
+        offset += n0
+        v1, v2, = S_5(data, offset)
+        offset += 5
+        p = packet_type.__new__(packet_type)
+        p.__dict__ = {'message': v0, 'code': v1, 'other_type': v2}
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f26(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.message, self.code, self.other_type, ))
+    return __hash__
+
+def f27(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return True
+    return __eq__
+
+def f28(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d)' % (cls.__name__, cls.type)
+    return __str__
+
+def f29(MISSING, instance, packet_type, **_namespace):
+    def make(cls):
+        p = instance(cls, {})
+        return p
+    return make
+
+def f30(MISSING, packet_type, **_namespace):
+    def make(cls):
+        p = cls.__new__(cls)
+        return p
+    return make
+
+def f31(MISSING, **_namespace):
+    def __init__(self, **kw):
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f32(FRAME, **_namespace):
+    def binarypack_fast_pack(p):
+        return FRAME
+    return binarypack_fast_pack
+
+def f33(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        length = 0
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 4, length)
+        return end
+    return binarypack_fast_pack_into
+
+def f34(singleton, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        return (offset, singleton)
+    return binarypack_fast_unpack
+
+def f35(hashable, **_namespace):
+    def __hash__(self):
+        return hash(())
+    return __hash__
+
+def f36(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        length = 0
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 5, length)
+        return end
+    return binarypack_fast_pack_into
+
+def f37(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.serial != other.serial)
+    return __eq__
+
+def f38(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) serial: %r' % (cls.__name__, cls.type, self.serial)
+    return __str__
+
+def f39(D_0, MISSING, instance, packet_type, **_namespace):
+    def make(cls, serial=D_0):
+        p = instance(cls, {'serial': serial})
+        return p
+    return make
+
+def f40(D_0, MISSING, packet_type, **_namespace):
+    def make(cls, serial=D_0):
+        p = cls.__new__(cls)
+        p.serial = serial
+        return p
+    return make
+
+def f41(D_0, MISSING, **_namespace):
+    def __init__(self, serial=D_0, **kw):
+        self.serial = serial
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f42(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.serial
+        length = 4
+        return S_0(6, length, (v0))
+    return binarypack_fast_pack
+
+def f43(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.serial
+        length = 4
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 6, length, (v0))
+        return end
+    return binarypack_fast_pack_into
+
+def f44(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        v0, = S_0(data, offset)
+        offset += 4
+        p = instance(packet_type, {'serial': v0})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f45(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.serial, ))
+    return __hash__
+
+def f46(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        length = 0
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 7, length)
+        return end
+    return binarypack_fast_pack_into
+
+def f47(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        length = 0
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 8, length)
+        return end
+    return binarypack_fast_pack_into
+
+def f48(S_0, S_2, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.message
+        v1 = p.code
+        v2 = p.other_type
+        length = 7 + len(v0)
+        return b''.join([S_0(9, length, len(v0)), v0, S_2((v1), (v2))])
+    return binarypack_fast_pack
+
+def f49(S_0, S_2, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.message
+        v1 = p.code
+        v2 = p.other_type
+        length = 7 + len(v0)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 9, length, len(v0))
+        offset += 5
+        buf[offset:offset + len(v0)] = v0
+        offset += len(v0)
+        S_2(buf, offset, (v1), (v2))
+        return end
+    return binarypack_fast_pack_into
+
+def f50(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.name != other.name or self.password != other.password)
+    return __eq__
+
+def f51(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) name: %r password: %r' % (cls.__name__, cls.type, self.name, self.password)
+    return __str__
+
+def f52(D_0, D_1, MISSING, instance, packet_type, **_namespace):
+    def make(cls, name=D_0, password=D_1):
+        p = instance(cls, {'name': name, 'password': password})
+        return p
+    return make
+
+def f53(D_0, D_1, MISSING, packet_type, **_namespace):
+    def make(cls, name=D_0, password=D_1):
+        p = cls.__new__(cls)
+        p.name = name
+        p.password = password
+        return p
+    return make
+
+def f54(D_0, D_1, MISSING, **_namespace):
+    def __init__(self, name=D_0, password=D_1, **kw):
+        self.name = name
+        self.password = password
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f55(S_0, S_2, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.name
+        v1 = p.password
+        length = 4 + len(v0) + len(v1)
+        return b''.join([S_0(10, length, len(v0)), v0, S_2(len(v1)), v1])
+    return binarypack_fast_pack
+
+def f56(S_0, S_2, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.name
+        v1 = p.password
+        length = 4 + len(v0) + len(v1)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 10, length, len(v0))
+        offset += 5
+        buf[offset:offset + len(v0)] = v0
+        offset += len(v0)
+        S_2(buf, offset, len(v1))
+        offset += 2
+        buf[offset:offset + len(v1)] = v1
+        return end
+    return binarypack_fast_pack_into
+
+def f57(S_0, S_5, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        n0, = S_0(data, offset)
+        offset += 2
+        v0 = data[offset:offset + n0]
+        if v0.__class__ is memoryview: v0 = v0.tobytes()
+        offset += n0
+        n1, = S_5(data, offset)
+        offset += 2
+        v1 = data[offset:offset + n1]
+        if v1.__class__ is memoryview: v1 = v1.tobytes()
+        offset += n1
+        p = instance(packet_type, {'name': v0, 'password': v1})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f58(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.name, self.password, ))
+    return __hash__
+
+def f59(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        length = 0
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 11, length)
+        return end
+    return binarypack_fast_pack_into
+
+def f60(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.packets != other.packets)
+    return __eq__
+
+def f61(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) packets: %r' % (cls.__name__, cls.type, self.packets)
+    return __str__
+
+def f62(C_0, D_0, MISSING, instance, packet_type, **_namespace):
+    def make(cls, packets=MISSING):
+        p = instance(cls, {'packets': C_0(D_0) if packets is MISSING else packets})
+        return p
+    return make
+
+def f63(C_0, D_0, MISSING, packet_type, **_namespace):
+    def make(cls, packets=MISSING):
+        p = cls.__new__(cls)
+        p.packets = C_0(D_0) if packets is MISSING else packets
+        return p
+    return make
+
+def f64(C_0, D_0, MISSING, **_namespace):
+    def __init__(self, packets=MISSING, **kw):
+        self.packets = C_0(D_0) if packets is MISSING else packets
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f65(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.packets
+        d0 = b''.join([q.__class__.__dict__['binarypack_fast_pack'](q) for q in v0])
+        length = 2 + len(d0)
+        return b''.join([S_0(12, length, len(v0)), d0])
+    return binarypack_fast_pack
+
+def f66(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.packets
+        d0 = b''.join([q.__class__.__dict__['binarypack_fast_pack'](q) for q in v0])
+        length = 2 + len(d0)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 12, length, len(v0))
+        offset += 5
+        buf[offset:offset + len(d0)] = d0
+        return end
+    return binarypack_fast_pack_into
+
+def f67(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        n0, = S_0(data, offset)
+        offset += 2
+        v0 = []
+        for j in xrange(n0):
+            t, l = S_PACKET_HEAD_unpack_from(data, offset)
+            offset, q = type_id2type[t].binarypack_fast_unpack(data, offset + 3)
+            v0.append(q)
+        p = instance(packet_type, {'packets': v0})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f68(hashable, **_namespace):
+    def __hash__(self):
+        return hash((hashable(self.packets), ))
+    return __hash__
+
+def f69(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        length = 0
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 13, length)
+        return end
+    return binarypack_fast_pack_into
+
+def f70(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        length = 0
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 14, length)
+        return end
+    return binarypack_fast_pack_into
+
+def f71(S_0, S_2, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.message
+        v1 = p.code
+        v2 = p.other_type
+        length = 7 + len(v0)
+        return b''.join([S_0(15, length, len(v0)), v0, S_2((v1), (v2))])
+    return binarypack_fast_pack
+
+def f72(S_0, S_2, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.message
+        v1 = p.code
+        v2 = p.other_type
+        length = 7 + len(v0)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 15, length, len(v0))
+        offset += 5
+        buf[offset:offset + len(v0)] = v0
+        offset += len(v0)
+        S_2(buf, offset, (v1), (v2))
+        return end
+    return binarypack_fast_pack_into
+
+def f73(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.string
+        length = 2 + len(v0)
+        return b''.join([S_0(16, length, len(v0)), v0])
+    return binarypack_fast_pack
+
+def f74(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.string
+        length = 2 + len(v0)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 16, length, len(v0))
+        offset += 5
+        buf[offset:offset + len(v0)] = v0
+        return end
+    return binarypack_fast_pack_into
+
+def f75(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        length = 0
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 17, length)
+        return end
+    return binarypack_fast_pack_into
+
+def f76(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        length = 0
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 18, length)
+        return end
+    return binarypack_fast_pack_into
+
+def f77(INFO, PROXIES, fallback, **_namespace):
+    def __eq__(self, other):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self, other)
+        other_cls = other.__class__
+        if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+            if other_cls not in PROXIES:
+                return False
+            other = PROXIES[other_cls](other)
+            other_cls = other.__class__
+            if other_cls is not cls and cls.__dict__.get('variant_of', cls) is not other_cls.__dict__.get('variant_of', other_cls):
+                return False
+        return not (self.auth != other.auth)
+    return __eq__
+
+def f78(INFO, fallback, **_namespace):
+    def __str__(self):
+        cls = self.__class__
+        if cls.info is not INFO:
+            return fallback(self)
+        return '%s(%d) auth: %r' % (cls.__name__, cls.type, self.auth)
+    return __str__
+
+def f79(D_0, MISSING, instance, packet_type, **_namespace):
+    def make(cls, auth=D_0):
+        p = instance(cls, {'auth': auth})
+        return p
+    return make
+
+def f80(D_0, MISSING, packet_type, **_namespace):
+    def make(cls, auth=D_0):
+        p = cls.__new__(cls)
+        p.auth = auth
+        return p
+    return make
+
+def f81(D_0, MISSING, **_namespace):
+    def __init__(self, auth=D_0, **kw):
+        self.auth = auth
+        if kw: self.__dict__.update(kw)
+    return __init__
+
+def f82(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, **_namespace):
+    def binarypack_fast_pack(p):
+        v0 = p.auth
+        length = 2 + len(v0)
+        return b''.join([S_0(25, length, len(v0)), v0])
+    return binarypack_fast_pack
+
+def f83(S_0, S_H_pack, S_IB_pack, S_MONEY_pack, json, reserve, **_namespace):
+    def binarypack_fast_pack_into(p, buf, offset):
+        v0 = p.auth
+        length = 2 + len(v0)
+        end = offset + 3 + length
+        if len(buf) < end: reserve(buf, end)
+        S_0(buf, offset, 25, length, len(v0))
+        offset += 5
+        buf[offset:offset + len(v0)] = v0
+        return end
+    return binarypack_fast_pack_into
+
+def f84(S_0, S_H_unpack_from, S_IB_unpack_from, S_MONEY_unpack_from, S_PACKET_HEAD_unpack_from, instance, json, packet_type, type_id2type, **_namespace):
+    def binarypack_fast_unpack(data, offset):
+        n0, = S_0(data, offset)
+        offset += 2
+        v0 = data[offset:offset + n0]
+        if v0.__class__ is memoryview: v0 = v0.tobytes()
+        offset += n0
+        p = instance(packet_type, {'auth': v0})
+        return (offset, p)
+    return binarypack_fast_unpack
+
+def f85(hashable, **_namespace):
+    def __hash__(self):
+        return hash((self.auth, ))
+    return __hash__
+
+FACTORIES = {
+    '4e36b308de1141b0703b0f652ad4f389': f0,
+    '3376916d08f4821c0ff951a9731a2a3f': f1,
+    'b71d8c3441da91ef1417685e251e7cf7': f2,
+    'fa4d37dabb469c0492938f1adfcd8be4': f3,
+    'fe05a3f3cd891c380083ecd7a5940a70': f4,
+    '4e473019b08f3b18793de42a533be63c': f5,
+    '737a9345790eb139054f91d5572cef9f': f6,
+    'dee0e8066366481e411a4469f6236c75': f7,
+    '6caebd28765baa88fdde08469f72ddf9': f8,
+    'e49a0bb94494d7f2c8a49ad1301a617d': f9,
+    'cba15f40e6011ea09d190b5c7990e01c': f10,
+    'bae3c1146a01b11a5618c19c930eb355': f11,
+    '224303c42ee96f81ded1e13055c5311c': f12,
+    'b1aa1b027f39716cccb673997b536db8': f13,
+    '91ef09865c5021eb5ba53a65a5a7d96f': f14,
+    '16f8bcbae38222d84c012daf8e456eb2': f15,
+    '53e3f3f26a6ad8e82f419c016858e42c': f16,
+    'bd837a6f25e6744fc53bc23b3106f13d': f17,
+    '9413d581ea28184eee93c1dc2e1605f0': f18,
+    'd2f3fe6e7fee62de4c585b9b9ace1fbf': f19,
+    '82a63d7aa27f4612b7201b1842bb5cd5': f20,
+    '84f7e54a76d98e90449cdff7d008122c': f21,
+    'ef31f488d98ad0c101653dbb426373e3': f22,
+    '6bc73ead4659e2efa2c4a27ebc9a3bb6': f23,
+    '71c81f0fc93d3827c0bb710a671ec053': f24,
+    'b5bc0eb12a71736205e179310b0f0587': f25,
+    '2732557c24392cf47f184a635f9c9317': f26,
+    '5a69dd64c2c76cc6779acfefb96a986f': f27,
+    'b067a92839866d219576fae9c8145f11': f28,
+    '1697c34976a3eff06170a5fcecd19c05': f29,
+    'ec8817c957dd93748eaf8dcff2c4e85f': f30,
+    '4d453bc3fcc1dfbae4d4a2471c5a5188': f31,
+    'cf21842b12b0295ed886dc88ab28524b': f32,
+    '4bcd83fe91a424bc0af3d7be9632442d': f33,
+    'cb267ab3db604e113598ee6fc895e62d': f34,
+    'd43d53d21a4222c79f136a478e1c9bb4': f35,
+    'da190bc1e6a84e4bd379ff0add1f4177': f36,
+    'b5cea4140d6037e396604e0c3a0096e4': f37,
+    'bcb6f7d6e95d2617c1ff739d65520e7b': f38,
+    '5dae77fe96ba69ef9386424580cde5c8': f39,
+    '858f0146195ff4703bd7544b52d1b7d6': f40,
+    'bde0ba7709c4afd1717a8d2b2c98b0fa': f41,
+    '892cfa6398e099e4e14716f15c8b50fa': f42,
+    '0a8ee8f0c0938d7859218ecdaf48439c': f43,
+    '7e674c36eb13df7da5464bb9818bd054': f44,
+    '0bb669dcf4635f35a17b807b219259de': f45,
+    'c4d1c4af70ec453262b77565ba74eaaf': f46,
+    '50f92b25a52b11730ee801b4498bdca9': f47,
+    'c2d5db78c6bf0ebf97e49edb467c4b04': f48,
+    '0ede424ec3e59da22617da0a50ee1bb1': f49,
+    'dbb8c9cbfd29f2b680b456fb27be73ea': f50,
+    '760ec3e0c50c122c2ba26db76a33ef77': f51,
+    'd20b243e98366c7f629385d0558e9c01': f52,
+    '17cb4885fe89dd2a9fe4fb4ffea4091a': f53,
+    'c49ff20eda4045ae6841612a2d06c32b': f54,
+    '506f6710ecfce6704ebd7bf13d214a80': f55,
+    'd80a0967277307e1a7c4dd3867a5e0dd': f56,
+    '08c8b885207c5b044e5bb5e1313fe2e7': f57,
+    '93209d77f563edc7110e8544f77bfa39': f58,
+    '796e071e7993c9fe858ea139a1c72860': f59,
+    '59cbfb4f753833fe982cb9da5d915c73': f60,
+    '9ef95fefe7be63a0340970f9de3ae73e': f61,
+    'fdb8d0c5cd2ff2ca42d7594982763906': f62,
+    'c2b46e84149e143d57e8d36b7482e109': f63,
+    '35c3a6e4b31d9bd63944152811202ccc': f64,
+    'a73150f9339da6a8ab70f13800c86253': f65,
+    '6e76c95e7c8cd8d97b572d5d08606846': f66,
+    '83de1b4bfc43829138d500b9a88225cb': f67,
+    'a26c586240ebe837b53b237e7a574a80': f68,
+    'a4dd99622b76734334b8ba420ad5f946': f69,
+    '96241f1be510e22c0721100f1eb15cdc': f70,
+    '15e6dde4539ff10ed32b6fdf5cd2e285': f71,
+    '69778cb402403999324a4525f3aaaeac': f72,
+    '56dd906a94bfe47e2deb02d2d2699b11': f73,
+    '0a6fc4031f3bded63b0a90feafab1f0d': f74,
+    '5187d79a780ef3adac33cc2906763d10': f75,
+    '0152575e72d10c266e2866cf24569b04': f76,
+    '35fee24391e9995bcaa0c50b2c9feb2f': f77,
+    'b48fced2e6503ef970e1c3aad533c802': f78,
+    '72bacbbde4867e6754e4da9946cc7624': f79,
+    'fdf8fe8b5f88d67eea75bcf257b46ea6': f80,
+    'd9f0900d66d97eb741e08bf7dde2ccac': f81,
+    'b367a9b390e24ba2a28917e5f58a2f95': f82,
+    '24182d6ec7a010bacd6730f4746f5870': f83,
+    '3b48c8f272ff6e7358c0ab78b586f6df': f84,
+    '127883c04b8ee34653fc61ffec2c0018': f85,
+}
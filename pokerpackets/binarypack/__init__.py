@@ -1,15 +1,62 @@
 
+"""
+binary codec of the packets
+
+a packet is encoded as a head (type id: unsigned byte, length of the
+content: unsigned short) followed by its content, the fields of its
+binarypack_info encoded one after the other with a fixed width for the
+integers.
+
+the compact encoding (compact=True) uses the same head and layout but
+encodes the integer fields as varints (see _codegen.binarypack_compact_pack),
+e.g. a serial below 16384 takes 2 bytes instead of 4 and a chips amount
+below 2097152 takes 3 bytes instead of 8. it is negotiated per
+connection with PacketCompactRequest / PacketCompact: Encoder and
+StreamDecoder(negotiate=True) switch to it after a PacketCompact. lazy decoding,
+extract and the pack_into buffer encoders only use the fixed encoding.
+"""
+
+import sys
+
 import _binarypack
+from pokerpackets import _codegen
+from pokerpackets._codegen import reserve
+from pokerpackets.packets import PACKET_COMPACT
+from _binarypack import type_id2type, S_B, S_PACKET_HEAD, S_TYPE2UNPACK, as_buffer
+
+class CompactPackers(dict):
+    "maps a packet class to its compiled compact encoder, see _codegen.binarypack_compact_pack"
+
+    def __missing__(self, packet_type):
+        if packet_type in _codegen.PROXIES:
+            packer = self[packet_type] = _codegen.proxy_pack(packet_type, self)
+        else:
+            packer = self[packet_type] = _codegen.binarypack_compact_pack(packet_type, packet_type.type, self)
+        return packer
 
-def pack(packet):
+class CompactUnpackers(dict):
+    "maps a type id to the compiled compact decoder of its class, see _codegen.binarypack_compact_unpack"
+
+    def __missing__(self, type_id):
+        unpacker = self[type_id] = _codegen.binarypack_compact_unpack(type_id2type[type_id], self)
+        return unpacker
+
+compact_packers = CompactPackers()
+compact_unpackers = CompactUnpackers()
+
+def pack(packet, compact=False):
     """
     pack a packet
 
     packet: subclass of Packet
+    compact: use the compact encoding
 
     returns: head + content of packet as binary data (string)
     """
 
+    if compact:
+        return compact_packers[packet.__class__](packet)
+
     if 'binarypack_fast_pack' in packet.__class__.__dict__:
         # print 'fast pack', packet.info
         return packet.binarypack_fast_pack()
@@ -18,14 +65,326 @@ def pack(packet):
     _binarypack.pack(packet, buf)
     return b''.join(buf)
 
-def unpack(data, offset=0):
+def pack_many(packets, compact=False):
+    """
+    pack a sequence of packets
+
+    packets: iterable of Packet subclasses
+    compact: use the compact encoding
+
+    returns: the packed packets, one after the other, as binary data (string)
+    """
+
+    if compact:
+        return b''.join([pack(packet, True) for packet in packets])
+
+    parts = []
+    append = parts.append
+    for packet in packets:
+        fast_pack = packet.__class__.__dict__.get('binarypack_fast_pack')
+        append(fast_pack(packet) if fast_pack else pack(packet))
+    return b''.join(parts)
+
+def pack_into(packet, buf, offset=0):
+    """
+    pack a packet into a buffer
+
+    packet: subclass of Packet
+    buf: writable buffer (bytearray, memoryview, ...), a bytearray is grown
+        if it is too small (possibly beyond the returned offset)
+    offset: position in buf where the packet is written
+
+    returns: offset following the packed packet
+    """
+
+    if 'binarypack_fast_pack_into' in packet.__class__.__dict__:
+        return packet.binarypack_fast_pack_into(buf, offset)
+
+    data = pack(packet)
+    end = offset + len(data)
+    if len(buf) < end:
+        reserve(buf, end)
+    buf[offset:end] = data
+    return end
+
+def pack_many_into(packets, buf, offset=0):
+    """
+    pack a sequence of packets into a buffer, one after the other
+
+    see pack_into, returns: offset following the last packed packet
+    """
+
+    for packet in packets:
+        offset = pack_into(packet, buf, offset)
+    return offset
+
+def unpack(data, offset=0, compact=False):
     """
     unpack a binary packed packet
 
-    data: head + content of packet as binary data (string)
+    data: head + content of packet as binary data (str or any object
+        supporting the buffer protocol, e.g. bytearray, memoryview, mmap)
+    compact: data uses the compact encoding
 
     returns: packet
     """
 
-    return _binarypack.unpack(data, offset)[1]
+    data = as_buffer(data)
+    type_id, _length = S_PACKET_HEAD.unpack_from(data, offset)
+    if compact:
+        return compact_unpackers[type_id](data, offset + S_PACKET_HEAD.size)[1]
+    return type_id2type[type_id].binarypack_fast_unpack(data, offset + S_PACKET_HEAD.size)[1]
+
+
+def unpack_lazy(data, offset=0):
+    """
+    unpack a binary packed packet lazily
+
+    data: see unpack
+
+    returns: LazyPacket holding the frame of the packet
+    """
+
+    data = as_buffer(data)
+    type_id, length = S_PACKET_HEAD.unpack_from(data, offset)
+    frame = data[offset:offset + S_PACKET_HEAD.size + length]
+    if frame.__class__ is memoryview: frame = frame.tobytes()
+    return LazyPacket(type_id2type[type_id], frame)
+
+class LazyPacket(object):
+    """
+    read only proxy of a packet holding its binary frame
+
+    the fields with a static position in the frame (see
+    Packet.binarypack_offsets) are decoded on each access, accessing any
+    other attribute decodes the whole packet once. packing a LazyPacket
+    returns the original frame unchanged.
+    """
+
+    __slots__ = ('packet_type', 'frame', 'packet')
+
+    def __init__(self, packet_type, frame):
+        self.packet_type = packet_type
+        self.frame = frame
+        self.packet = None
+
+    @property
+    def type(self):
+        return self.packet_type.type
+
+    def __getattr__(self, attr):
+        try:
+            offset, s_type = self.packet_type.binarypack_offsets[attr]
+        except KeyError:
+            return getattr(self.decode(), attr)
+        return S_TYPE2UNPACK[s_type](self.frame, offset)[1]
+
+    def decode(self):
+        "return the decoded packet"
+        if self.packet is None:
+            self.packet = self.packet_type.binarypack_fast_unpack(self.frame, S_PACKET_HEAD.size)[1]
+        return self.packet
+
+    def binarypack_fast_pack(self):
+        return self.frame
+
+    def binarypack_fast_pack_into(self, buf, offset):
+        end = offset + len(self.frame)
+        if len(buf) < end:
+            reserve(buf, end)
+        buf[offset:end] = self.frame
+        return end
+
+    def __eq__(self, other):
+        if isinstance(other, LazyPacket):
+            return self.frame == other.frame or self.decode() == other.decode()
+        return self.decode() == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return 'LazyPacket(%s)' % (repr(self.decode()),)
+
+_codegen.PROXIES[LazyPacket] = LazyPacket.decode
+
+def peek(data, offset=0):
+    """
+    read the head of a binary packed packet
+
+    data: see unpack
+
+    returns: (type_id, length), the packet content is length bytes long
+    """
+
+    return S_PACKET_HEAD.unpack_from(data, offset)
+
+def extract(data, attr, offset=0):
+    """
+    read a single field of a binary packed packet
+
+    data: see unpack
+    attr: name of the field, e.g. 'game_id'
+
+    returns: value of the field. fields with a static position in the frame
+        (see Packet.binarypack_offsets) are read directly from data, the
+        packet is decoded otherwise. AttributeError is raised if the packet
+        has no such field.
+    """
+
+    data = as_buffer(data)
+    type_id, = S_B.unpack_from(data, offset)
+    packet_type = type_id2type[type_id]
+    try:
+        field_offset, s_type = packet_type.binarypack_offsets[attr]
+    except KeyError:
+        return getattr(unpack(data, offset), attr)
+    return S_TYPE2UNPACK[s_type](data, offset + field_offset)[1]
+
+def unpack_all(data, offset=0, lazy=False, type_ids=None, compact=False):
+    """
+    unpack all binary packed packets of data
+
+    data: complete packets (head + content) one after the other, see unpack
+    lazy: return LazyPacket objects, see unpack_lazy
+    type_ids: if not None, only the packets whose type id is in type_ids are
+        unpacked, the others are skipped using the length of their head
+    compact: data uses the compact encoding, can not be lazy
+
+    returns: list of packets
+    """
+
+    if lazy and compact:
+        raise ValueError('lazy unpacking requires the fixed encoding')
+    data = as_buffer(data)
+    end = len(data)
+    head_size = S_PACKET_HEAD.size
+    head_unpack_from = S_PACKET_HEAD.unpack_from
+    types = type_id2type
+    packets = []
+    append = packets.append
+    while offset < end:
+        type_id, length = head_unpack_from(data, offset)
+        frame_start = offset + head_size
+        offset = frame_start + length
+        if offset > end:
+            raise ValueError('truncated packet at offset %d' % (frame_start - head_size,))
+        if type_ids is not None and type_id not in type_ids:
+            continue
+        if lazy:
+            frame = data[frame_start - head_size:offset]
+            append(LazyPacket(types[type_id], frame.tobytes() if frame.__class__ is memoryview else frame))
+        elif compact:
+            append(compact_unpackers[type_id](data, frame_start)[1])
+        else:
+            append(types[type_id].binarypack_fast_unpack(data, frame_start)[1])
+    return packets
+
+class StreamDecoder(object):
+    """
+    incremental decoder of a stream of binary packed packets (e.g. TCP)
+
+    data is accumulated in a bytearray receive buffer, frames may be split
+    at any byte and a single chunk may contain many frames. complete
+    frames are decoded in place and removed from the buffer.
+
+    lazy: return LazyPacket objects, see unpack_lazy. frames using the
+        compact encoding are decoded
+    type_ids: if not None, only the packets whose type id is in type_ids are
+        returned, the others are skipped without being decoded
+    compact: the frames use the compact encoding
+    negotiate: switch to the compact encoding after a PacketCompact (see
+        Encoder)
+    """
+
+    def __init__(self, lazy=False, type_ids=None, compact=False, negotiate=False):
+        self.buffer = bytearray()
+        self.lazy = lazy
+        self.type_ids = type_ids
+        self.compact = compact
+        self.negotiate = negotiate
+
+    def __len__(self):
+        "number of buffered bytes not yet decoded"
+        return len(self.buffer)
+
+    def feed(self, data):
+        """
+        feed received data to the decoder
+
+        data: str or any object supporting the buffer protocol
+
+        returns: list of the packets completed by data. frames which can
+            not be decoded are discarded and the error of the first one
+            (e.g. KeyError for an unknown type) is raised once every
+            complete frame is decoded, with the list of the decoded
+            packets as its packets attribute.
+        """
+
+        buf = self.buffer
+        buf += data
+        lazy = self.lazy
+        type_ids = self.type_ids
+        compact = self.compact
+        negotiate = self.negotiate and not compact
+        view = buffer(buf)
+        end = len(buf)
+        offset = 0
+        packets = []
+        error = None
+        try:
+            while end - offset >= S_PACKET_HEAD.size:
+                type_id, length = S_PACKET_HEAD.unpack_from(view, offset)
+                frame_start = offset + S_PACKET_HEAD.size
+                frame_end = frame_start + length
+                if frame_end > end:
+                    break
+                try:
+                    if type_ids is not None and type_id not in type_ids:
+                        pass
+                    elif compact:
+                        packets.append(compact_unpackers[type_id](view, frame_start)[1])
+                    elif lazy:
+                        packets.append(LazyPacket(type_id2type[type_id], view[offset:frame_end]))
+                    else:
+                        packets.append(type_id2type[type_id].binarypack_fast_unpack(view, frame_start)[1])
+                except Exception:
+                    if error is None:
+                        error = sys.exc_info()
+                offset = frame_end
+                if negotiate and type_id == PACKET_COMPACT:
+                    compact = self.compact = True
+                    negotiate = False
+        finally:
+            del view
+            del buf[:offset]
+
+        if error is not None:
+            error[1].packets = packets
+            raise error[0], error[1], error[2]
+        return packets
+
+class Encoder(object):
+    """
+    encoder of the packets sent on a connection
+
+    packets are packed with the fixed encoding until a PacketCompact is
+    packed, with the compact encoding after it, the peer decodes them
+    with StreamDecoder(negotiate=True).
+
+    compact: use the compact encoding from the start
+    """
+
+    def __init__(self, compact=False):
+        self.compact = compact
+
+    def pack(self, packet):
+        "return packet as binary data, see pack"
+        data = pack(packet, self.compact)
+        if packet.type == PACKET_COMPACT:
+            self.compact = True
+        return data
 
+    def pack_many(self, packets):
+        "return the packed packets, one after the other, see pack_many"
+        return b''.join([self.pack(packet) for packet in packets])
@@ -1,11 +1,11 @@
 
 from pokerpackets.packets import type2type_id, type_id2type
-import pokerpackets.networkpackets # pylint: disable=W0611
-import pokerpackets.clientpackets # pylint: disable=W0611
 
-import simplejson
 from struct import Struct
 
+from pokerpackets.jsonbackend import backend as json_backend
+from pokerpackets._codegen import LIST_STRUCTS, StructCache
+
 # pylint: disable=C0111
 
 def pack(packet, buf):
@@ -22,7 +22,21 @@ def pack(packet, buf):
 
     return S_PACKET_HEAD.size + length
 
+def as_buffer(data):
+    """
+    return a view on data suitable for unpacking without copying it
+
+    str, buffer and memoryview objects are returned as is, other objects
+    supporting the buffer protocol (bytearray, mmap, ...) are wrapped in
+    a buffer object, slicing it returns a str.
+    """
+    if data.__class__ is str or data.__class__ is buffer or data.__class__ is memoryview:
+        return data
+    return buffer(data)
+
 def unpack(data, offset=0):
+    data = as_buffer(data)
+
     # parse packet head
     type_id, _length = S_PACKET_HEAD.unpack_from(data, offset)
 
@@ -87,45 +101,33 @@ def pack_bstring(val, buf):
     return S_H.size + val_len
 
 def pack_j(val, buf):
-    val = simplejson.dumps(val)
+    val = json_backend.dumps(val)
     val_len = len(val)
     buf.append(S_H.pack(val_len))
     buf.append(val)
     return S_H.size + val_len
 
-def pack_Bl(_list, buf, __cache={}): # pylint: disable=W0102
+def pack_Bl(_list, buf):
     list_len = len(_list)
-    try:
-        struct = __cache[list_len]
-    except KeyError:
-        struct = __cache[list_len] = Struct('!B'+str(list_len)+'B')
+    struct = LIST_PACK_STRUCTS['Bl'][list_len]
     buf.append(struct.pack(list_len, *_list))
     return struct.size
 
-def pack_Hl(_list, buf, __cache={}): # pylint: disable=W0102
+def pack_Hl(_list, buf):
     list_len = len(_list)
-    try:
-        struct = __cache[list_len]
-    except KeyError:
-        struct = __cache[list_len] = Struct('!B'+str(list_len)+'H')
+    struct = LIST_PACK_STRUCTS['Hl'][list_len]
     buf.append(struct.pack(list_len, *_list))
     return struct.size
 
-def pack_Il(_list, buf, __cache={}): # pylint: disable=W0102
+def pack_Il(_list, buf):
     list_len = len(_list)
-    try:
-        struct = __cache[list_len]
-    except KeyError:
-        struct = __cache[list_len] = Struct('!B'+str(list_len)+'I')
+    struct = LIST_PACK_STRUCTS['Il'][list_len]
     buf.append(struct.pack(list_len, *_list))
     return struct.size
 
-def pack_il(_list, buf, __cache={}): # pylint: disable=W0102
+def pack_il(_list, buf):
     list_len = len(_list)
-    try:
-        struct = __cache[list_len]
-    except KeyError:
-        struct = __cache[list_len] = Struct('!B'+str(list_len)+'i')
+    struct = LIST_PACK_STRUCTS['il'][list_len]
     buf.append(struct.pack(list_len, *_list))
     return struct.size
 
@@ -196,62 +198,47 @@ def unpack_H(data, offset):
 
 def unpack_string(data, offset):
     length, = S_H.unpack_from(data, offset)
-    return (offset + S_H.size + length, data[offset + S_H.size:offset + S_H.size + length])
+    value = data[offset + S_H.size:offset + S_H.size + length]
+    if value.__class__ is memoryview: value = value.tobytes()
+    return (offset + S_H.size + length, value)
 
 def unpack_bstring(data, offset):
-    length, = S_H.unpack_from(data, offset)
-    value = data[offset + S_H.size:offset + S_H.size + length]
+    offset, value = unpack_string(data, offset)
     if value == '_TRUE': value = True
     elif value == '_FALSE': value = False
-    return (offset + S_H.size + length, value)
+    return (offset, value)
 
 def unpack_json(data, offset):
-    length, = S_H.unpack_from(data, offset)
-    return(offset + S_H.size + length, simplejson.loads(data[offset + S_H.size:offset + S_H.size + length]))
+    offset, value = unpack_string(data, offset)
+    return (offset, json_backend.loads(value))
 
-def unpack_Bl(data, offset, __cache={}): # pylint: disable=W0102
+def unpack_Bl(data, offset):
     list_len, = S_B.unpack_from(data, offset)
-    struct_format = '!%dB' % (list_len,)
-    try:
-        struct = __cache[list_len]
-    except KeyError:
-        __cache[list_len] = struct = Struct(struct_format)
+    struct = LIST_STRUCTS['Bl'][list_len]
     return(
         offset + S_B.size + struct.size,
         list(struct.unpack_from(data, offset + S_B.size)) if list_len else []
     )
 
-def unpack_Hl(data, offset, __cache={}): # pylint: disable=W0102
+def unpack_Hl(data, offset):
     list_len, = S_B.unpack_from(data, offset)
-    struct_format = '!%dH' % (list_len,)
-    try:
-        struct = __cache[list_len]
-    except KeyError:
-        __cache[list_len] = struct = Struct(struct_format)
+    struct = LIST_STRUCTS['Hl'][list_len]
     return(
         offset + S_B.size + struct.size,
         list(struct.unpack_from(data, offset + S_B.size)) if list_len else []
     )
 
-def unpack_Il(data, offset, __cache={}): # pylint: disable=W0102
+def unpack_Il(data, offset):
     list_len, = S_B.unpack_from(data, offset)
-    struct_format = '!%dI' % (list_len,)
-    try:
-        struct = __cache[list_len]
-    except KeyError:
-        __cache[list_len] = struct = Struct(struct_format)
+    struct = LIST_STRUCTS['Il'][list_len]
     return(
         offset + S_B.size + struct.size,
         list(struct.unpack_from(data, offset + S_B.size)) if list_len else []
     )
 
-def unpack_il(data, offset, __cache={}): # pylint: disable=W0102
+def unpack_il(data, offset):
     list_len, = S_B.unpack_from(data, offset)
-    struct_format = '!%di' % (list_len,)
-    try:
-        struct = __cache[list_len]
-    except KeyError:
-        __cache[list_len] = struct = Struct(struct_format)
+    struct = LIST_STRUCTS['il'][list_len]
     return(
         offset + S_B.size + struct.size,
         list(struct.unpack_from(data, offset + S_B.size)) if list_len else []
@@ -298,6 +285,15 @@ S_IB = Struct('!IB')
 S_PACKET_HEAD = Struct("!BH")
 S_MONEY = Struct('!IQQQ')
 
+# structs of the packed lists: their length byte and items, by length (the
+# structs of the items alone are _codegen.LIST_STRUCTS)
+LIST_PACK_STRUCTS = {
+    'Bl': StructCache('B', 'B'),
+    'Hl': StructCache('H', 'B'),
+    'Il': StructCache('I', 'B'),
+    'il': StructCache('i', 'B'),
+}
+
 S_TYPE2PACK = {
     'I': pack_I,
     'Q': pack_Q,
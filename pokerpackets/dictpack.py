@@ -1,43 +1,55 @@
 
 from traceback import format_exc
 
-from pokerpackets.packets import type2type_id, name2type, type_id2type, PacketError, type2name
-import pokerpackets.networkpackets # pylint: disable=W0611
-import pokerpackets.clientpackets # pylint: disable=W0611
+from pokerpackets import _codegen
+from pokerpackets.packets import type2type_id, name2type, type_id2type, Packet, PacketError, type2name
 
 from numbers import Integral
 
+def pack_money(money):
+    return dict([('X' + str(k) if isinstance(k, Integral) else k, v) for k, v in money.items()])
+
+def unpack_money(money):
+    return dict([(int(k[1:]) if k.startswith('X') else k, v) for k, v in money.items()])
+
+class Packers(dict):
+    "maps a packet class to its compiled encoder, see _codegen.dictpack_pack"
+
+    def __missing__(self, packet_type):
+        packer = self[packet_type] = _codegen.dictpack_pack(
+            packet_type, type2type_id[packet_type], type2name[packet_type], pack, pack_money
+        )
+        return packer
+
+class Unpackers(dict):
+    "maps a packet class to its compiled decoder, see _codegen.dictpack_unpack"
+
+    def __missing__(self, packet_type):
+        unpacker = self[packet_type] = _codegen.dictpack_unpack(
+            packet_type, unpack, unpack_money, Packet.__dict__['__init__']
+        )
+        return unpacker
+
+packers = Packers()
+unpackers = Unpackers()
+
 def pack(packet, numeric_type=True):
     "Pack a packet into a dictionary"
     try:
-        packet_dict = {
-            'type': type2type_id[packet.__class__] if numeric_type else type2name[packet.__class__]
-        }
+        packer = packers[packet.__class__]
     except KeyError:
+        if packet.__class__ in _codegen.PROXIES:
+            return pack(_codegen.PROXIES[packet.__class__](packet), numeric_type)
         return packet2dict(PacketError(
             message="Error converting packet to dict %s: %s" % (repr(packet), format_exc())
         ), numeric_type)
 
-    for attr, _default, s_type in packet.__class__.info:
-        if s_type is 'no net' or attr is 'type':
-            continue
-
-        elif s_type is 'pl':
-            packet_dict[attr] = [packet2dict(p, numeric_type) for p in getattr(packet, attr)]
-
-        elif s_type is 'money':
-            money = getattr(packet, attr)
-            packet_dict[attr] = dict([('X' + str(k) if isinstance(k, Integral) else k, v) for k, v in money.items()])
-
-        else:
-            packet_dict[attr] = getattr(packet, attr)
-
-    return packet_dict
+    return packer(packet, numeric_type)
 
 def unpack(dict_packet):
-    "Unpack a packet from a dictionary"
+    "Unpack a packet from a dictionary, dict_packet is not modified"
     try:
-        packet_type_mixed = dict_packet.pop('type')
+        packet_type_mixed = dict_packet['type']
     except KeyError:
         return PacketError(message="packet type not set"), False
 
@@ -48,24 +60,13 @@ def unpack(dict_packet):
     except KeyError:
         return PacketError(message="Invalid packet type_id/name: " + repr(packet_type_mixed)), numeric_type
 
-    # recurse for packetlists, check for format erros
-    for attr, _default, s_type in packet_type.info:
-        if attr not in dict_packet:
-            continue
-
-        elif s_type == 'pl':
-            dict_packet[attr] = [dict2packet(d)[0] for d in dict_packet[attr]]
-
-        elif s_type == 'money':
-            dict_packet[attr] = dict([(int(k[1:]) if k.startswith('X') else k, v) for k, v in dict_packet[attr].items()])
-
     try:
-        return packet_type(**dict_packet), numeric_type
+        return unpackers[packet_type](dict_packet), numeric_type
     except:
         return PacketError(
             message="Unable to instantiate %s(%s): %s" % (packet_type_mixed, dict_packet, format_exc()),
             other_type = type2type_id[packet_type] if numeric_type else type2name[packet_type]
-        )
+        ), numeric_type
 
 # compat old names
 dict2packet = unpack # pylint: disable=C0103
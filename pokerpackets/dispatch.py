@@ -0,0 +1,91 @@
+"""
+dispatch of packets to handlers by type id
+
+a Dispatcher maps the type id of a packet to its handler with a list of
+256 slots (type ids are encoded as an unsigned byte). a handler
+registered for a class also handles its subclasses, unless a handler is
+registered for a more specific class, according to the precomputed
+ancestry of the packet classes.
+"""
+
+from inspect import getmro
+
+from pokerpackets import packets
+
+TYPE_IDS = 256
+
+def build_ancestry():
+    "return a list mapping every type id to the classes its packets are instances of"
+    packets.load_all()
+    ancestry = [()] * TYPE_IDS
+    for type_id, packet_type in packets.type_id2type.iteritems():
+        if 0 <= type_id < TYPE_IDS:
+            ancestry[type_id] = getmro(packet_type)
+    return ancestry
+
+def ancestry(__cache={}): # pylint: disable=W0102
+    """
+    return the ancestry of the packet classes by type id (see
+    build_ancestry), rebuilt when packet classes are declared
+    """
+    declared = len(packets.type_id2type)
+    if __cache.get('declared') != declared:
+        __cache['ancestry'] = build_ancestry()
+        __cache['declared'] = len(packets.type_id2type)
+    return __cache['ancestry']
+
+class Dispatcher(object):
+    """
+    call the handler of the class of a packet
+
+    dispatch(packet, *args) returns handler(packet, *args) where handler
+    is the handler registered for the class of the packet or its closest
+    base class. default(packet, *args) is called for packets without
+    handler, by default it raises KeyError.
+    """
+
+    def __init__(self, default=None):
+        self.handlers = {}
+        self.default = default or self.missing
+        self.table = [self.default] * TYPE_IDS
+
+    def missing(self, packet, *_args):
+        raise KeyError('no handler for %s' % packet.__class__.__name__)
+
+    def register(self, packet_type, handler):
+        "register handler for the instances of packet_type and its subclasses"
+        self.handlers[packet_type] = handler
+        self.update()
+
+    def unregister(self, packet_type):
+        "remove the handler of packet_type"
+        del self.handlers[packet_type]
+        self.update()
+
+    def handler(self, packet_type):
+        "decorator registering a function as the handler of packet_type"
+        def decorator(function):
+            self.register(packet_type, function)
+            return function
+        return decorator
+
+    def update(self):
+        "rebuild the table from the registered handlers"
+        handlers = self.handlers
+        table = self.table
+        for type_id, classes in enumerate(ancestry()):
+            table[type_id] = self.default
+            for cls in classes:
+                if cls in handlers:
+                    table[type_id] = handlers[cls]
+                    break
+
+    def lookup(self, type_id):
+        "return the handler of the packets of type_id"
+        return self.table[type_id]
+
+    def dispatch(self, packet, *args):
+        "call the handler of packet with args, returns its result"
+        return self.table[packet.type](packet, *args)
+
+    __call__ = dispatch
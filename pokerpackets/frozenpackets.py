@@ -0,0 +1,15 @@
+"""
+the frozen packet classes, by name (see packets.frozen)
+
+a frozen class has the name of the packet class it is the variant of and
+belongs to this module, where pickle finds it: the attribute PacketLogin
+of the module is frozen(PacketLogin), created on first access. the
+module declaring the packet class is imported if needed (see
+packets.name2type).
+"""
+
+import sys
+
+from pokerpackets.packets import FrozenPackets
+
+sys.modules[__name__] = FrozenPackets(__name__, __doc__)
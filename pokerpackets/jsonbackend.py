@@ -0,0 +1,152 @@
+"""
+pluggable JSON implementation
+
+every JSON encoding and decoding of the package goes through backend:
+
+ * backend.encode(obj): JSON text of obj (str or unicode, non ASCII
+   characters are not escaped except by the json module, see
+   ASCII_TEXT_MODULES), used by Packet.JSON
+ * backend.dumps(obj): ASCII JSON str of obj, used by the 'j' fields
+ * backend.loads(string): object of the JSON string
+
+encoders use compact separators and are built once per backend. the
+available backends are simplejson and the json module of the standard
+library (with its C accelerator if present), simplejson is used by
+default. use(name) switches to a backend, select() switches each
+function to the fastest backend whose results are identical (same values
+of the same types) to the ones of the default backend. the json module
+of python 2 can only be selected for dumps: its decoder returns every
+string as unicode and its text encoder escapes the non ASCII characters,
+so encode and loads keep using simplejson.
+"""
+
+from timeit import default_timer
+
+MODULES = ('simplejson', 'json')
+
+SEPARATORS = (',', ':')
+
+# modules whose encoder returns the UTF-8 str values unchanged when
+# ensure_ascii is false (the json module of python 2), which fails on a
+# mix of non ASCII str and unicode values: their text is ASCII JSON
+ASCII_TEXT_MODULES = ('json',)
+
+# values used to compare the backends, see select
+SAMPLE = [
+    None,
+    {'type': 73, 'id': 5, 'seats': 10, 'name': 'table', 'variant': 'holdem', 'betting_structure': '1-2_20-200_limit'},
+    {'type': 'PacketPokerPlayerArrive', 'serial': 1, 'name': 'player', 'blind': True, 'seat': None, 'url': 'http://example.com/'},
+    {'type': 'PacketList', 'packets': [{'type': 5}, {'type': 10, 'name': u'\xe9t\xe9', 'password': 'quote"back\\slash\n'}]},
+    {'money': {'X1': [10, 11, 12], 'X2': [0, 0, 1]}, 'cards': [1, 2, 255], 'ratio': 0.25},
+    {'type': 10, 'name': '\xc3\xa9t\xc3\xa9', 'password': u'\xe9t\xe9'},
+    '\xc3\xa9t\xc3\xa9',
+    [[1, 30, 5, 2], [], {}],
+]
+
+class Implementation(object):
+    "the cached encoders and decoder of a JSON module"
+
+    def __init__(self, name):
+        module = __import__(name)
+        self.name = name
+        self.encoder = module.JSONEncoder(ensure_ascii=name in ASCII_TEXT_MODULES, separators=SEPARATORS)
+        self.ascii_encoder = module.JSONEncoder(separators=SEPARATORS)
+        self.decoder = module.JSONDecoder()
+
+class Backend(object):
+    """
+    JSON functions used by the package, see the module documentation
+
+    names maps encode, dumps and loads to the name of the backend
+    providing them. encoder and decoder are the encoder of encode and the
+    decoder of loads.
+    """
+
+    def __init__(self):
+        self.names = {}
+        self.encode = self.dumps = self.loads = None
+        self.encoder = self.decoder = None
+
+    def set(self, function, implementation):
+        "use implementation for function ('encode', 'dumps' or 'loads')"
+        if function == 'encode':
+            self.encoder = implementation.encoder
+            self.encode = implementation.encoder.encode
+        elif function == 'dumps':
+            self.dumps = implementation.ascii_encoder.encode
+        elif function == 'loads':
+            self.decoder = implementation.decoder
+            self.loads = implementation.decoder.decode
+        else:
+            raise ValueError('unknown JSON function %r' % (function,))
+        self.names[function] = implementation.name
+
+backend = Backend()
+
+def available():
+    "return the implementations of the importable JSON modules, by name"
+    implementations = {}
+    for name in MODULES:
+        try:
+            implementations[name] = Implementation(name)
+        except ImportError:
+            pass
+    return implementations
+
+def default():
+    "return the name of the default backend"
+    implementations = available()
+    return [name for name in MODULES if name in implementations][0]
+
+def use(name):
+    "use the backend `name` for all the functions"
+    implementation = Implementation(name)
+    for function in ('encode', 'dumps', 'loads'):
+        backend.set(function, implementation)
+
+def measure(function, values, number):
+    "return the time taken to call function with each of values number times"
+    start = default_timer()
+    for _i in xrange(number):
+        for value in values:
+            function(value)
+    return default_timer() - start
+
+def select(sample=SAMPLE, number=200):
+    """
+    benchmark the available backends on sample and use the fastest one
+    for each function, among those returning the same results as the
+    default backend. backends failing on the sample are not selected.
+    e.g. the json module of python 2 decodes all the strings as unicode
+    where simplejson decodes ASCII strings as str, and its text escapes
+    the non ASCII characters (see ASCII_TEXT_MODULES).
+
+    returns a dict mapping the functions to the name of the selected
+    backend and the time it took for each backend
+    """
+    implementations = available()
+    reference = implementations[default()]
+    encoded = [reference.ascii_encoder.encode(value) for value in sample]
+    candidates = {
+        'encode': (lambda implementation: implementation.encoder.encode, sample, repr),
+        'dumps': (lambda implementation: implementation.ascii_encoder.encode, sample, repr),
+        'loads': (lambda implementation: implementation.decoder.decode, encoded, repr),
+    }
+
+    results = {}
+    for function, (getter, values, key) in candidates.iteritems():
+        expected = [key(getter(reference)(value)) for value in values]
+        timings = {}
+        for name, implementation in implementations.iteritems():
+            try:
+                results_match = [key(getter(implementation)(value)) for value in values] == expected
+            except Exception:
+                results_match = False
+            if results_match:
+                timings[name] = measure(getter(implementation), values, number)
+        selected = min(timings, key=timings.get)
+        backend.set(function, implementations[selected])
+        results[function] = (selected, timings)
+    return results
+
+use(default())
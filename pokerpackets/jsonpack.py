@@ -0,0 +1,79 @@
+"""
+direct JSON encoding of the packets
+
+pack(packet) returns the UTF-8 JSON encoding of dictpack.pack(packet),
+as Packet.JSON would encode it, without building the dict: the encoder
+of each class joins pre-rendered key fragments with the encoded values.
+pack_list and write_list encode a list of packets as a JSON array.
+"""
+
+import re
+
+from pokerpackets import _codegen
+from pokerpackets.jsonbackend import backend as json_backend
+from pokerpackets.packets import type2type_id, type2name
+from pokerpackets.dictpack import pack_money
+import pokerpackets.dictpack
+
+# characters of a str which are escaped or decoded by the JSON encoder
+RE_UNSAFE = re.compile(r'[\x00-\x1f"\\\x7f-\xff]')
+
+def dumps(value):
+    "return the UTF-8 JSON encoding of value"
+    encoded = json_backend.encode(value)
+    return encoded.encode('utf-8') if encoded.__class__ is unicode else encoded
+
+def string(value):
+    "return the UTF-8 JSON encoding of value, optimized for strings"
+    if value.__class__ is str and not RE_UNSAFE.search(value):
+        return '"' + value + '"'
+    return dumps(value)
+
+class Packers(dict):
+    "maps a packet class to its compiled JSON encoder, see _codegen.json_pack"
+
+    def __missing__(self, packet_type):
+        packer = self[packet_type] = _codegen.json_pack(
+            packet_type, type2type_id[packet_type], type2name[packet_type], pack, string, dumps, pack_money
+        )
+        return packer
+
+packers = Packers()
+
+def pack(packet, numeric_type=True):
+    """
+    pack a packet
+
+    numeric_type: the type of the packet is its type id if true, its
+        class name otherwise (see dictpack.pack)
+
+    returns: the packet as UTF-8 JSON (string)
+    """
+    try:
+        packer = packers[packet.__class__]
+    except KeyError:
+        if packet.__class__ in _codegen.PROXIES:
+            return pack(_codegen.PROXIES[packet.__class__](packet), numeric_type)
+        return dumps(pokerpackets.dictpack.pack(packet, numeric_type))
+    return packer(packet, numeric_type)
+
+def pack_list(packets, numeric_type=True):
+    """
+    pack a sequence of packets
+
+    returns: the JSON array of the packets as UTF-8 JSON (string)
+    """
+    return b'[' + b','.join([pack(packet, numeric_type) for packet in packets]) + b']'
+
+def write_list(packets, write, numeric_type=True):
+    """
+    pack a sequence of packets as a JSON array, calling write with each
+    fragment of UTF-8 JSON (e.g. the write method of a file or the extend
+    method of a bytearray)
+    """
+    separator = b'['
+    for packet in packets:
+        write(separator)
+        write(pack(packet, numeric_type))
+        separator = b','
+    write(b']' if separator == b',' else b'[]')
@@ -0,0 +1,128 @@
+"""
+msgpack codec of the packets (requires the msgpack package)
+
+a packet is packed as a msgpack array: its type id followed by the value
+of each attribute of its msgpack_info, in info order. values are packed
+as msgpack values, except:
+
+ * bool: true/false
+ * cbool: true/false for 'y'/'n'
+ * c: the amount of the chips (decoded as [1, amount] like binarypack)
+ * j: the JSON text of the value, like binarypack (unicode strings of
+   the value are decoded as unicode)
+ * pl: array of packed packets
+ * money: map of currency serial to [money, in_game, points]
+ * players: array of [name, chips, flags]
+
+strings are packed as msgpack raw (str) values, unicode strings are
+encoded in UTF-8. packets are unpacked as their declared class.
+"""
+
+import sys
+
+import msgpack
+
+from pokerpackets import _codegen
+from pokerpackets.packets import type_id2type
+
+PACK_OPTIONS = {'use_bin_type': False}
+UNPACK_OPTIONS = {'raw': True, 'use_list': True}
+if msgpack.version >= (1, 0, 0):
+    UNPACK_OPTIONS['strict_map_key'] = False
+
+class Packers(dict):
+    "maps a packet class to its compiled msgpack encoder, see _codegen.msgpack_pack"
+
+    def __missing__(self, packet_type):
+        if packet_type in _codegen.PROXIES:
+            packer = self[packet_type] = _codegen.proxy_pack(packet_type, self)
+        else:
+            packer = self[packet_type] = _codegen.msgpack_pack(packet_type, self)
+        return packer
+
+class Unpackers(dict):
+    "maps a type id to the compiled msgpack decoder of its class, see _codegen.msgpack_unpack"
+
+    def __missing__(self, type_id):
+        unpacker = self[type_id] = _codegen.msgpack_unpack(type_id2type[type_id], unpack_array)
+        return unpacker
+
+packers = Packers()
+unpackers = Unpackers()
+
+def pack_array(packet):
+    "return the array packed for packet"
+    return packers[packet.__class__](packet)
+
+def unpack_array(array):
+    "return the packet of an array packed by pack_array"
+    return unpackers[array[0]](array)
+
+def pack(packet):
+    """
+    pack a packet
+
+    returns: the packet as msgpack data (string)
+    """
+    return msgpack.packb(packers[packet.__class__](packet), **PACK_OPTIONS)
+
+def pack_many(packets):
+    """
+    pack a sequence of packets
+
+    returns: the packed packets, one after the other, as msgpack data (string)
+    """
+    packer = msgpack.Packer(**PACK_OPTIONS)
+    return b''.join([packer.pack(packers[packet.__class__](packet)) for packet in packets])
+
+def unpack(data):
+    """
+    unpack a msgpack packed packet
+
+    data: a single packed packet (str or any object supporting the buffer
+        protocol)
+
+    returns: packet
+    """
+    array = msgpack.unpackb(data, **UNPACK_OPTIONS)
+    return unpackers[array[0]](array)
+
+def unpack_all(data):
+    """
+    unpack packed packets, one after the other
+
+    returns: list of packets
+    """
+    unpacker = msgpack.Unpacker(**UNPACK_OPTIONS)
+    unpacker.feed(data)
+    return [unpackers[array[0]](array) for array in unpacker]
+
+class StreamDecoder(object):
+    """
+    incremental decoder of a stream of msgpack packed packets
+
+    feed(data) buffers data and returns the packets completed by it.
+    packets which can not be decoded are discarded and the error of the
+    first one (e.g. KeyError for an unknown type) is raised once every
+    complete packet is decoded, with the list of the decoded packets as
+    its packets attribute.
+    """
+
+    def __init__(self):
+        self.unpacker = msgpack.Unpacker(**UNPACK_OPTIONS)
+
+    def feed(self, data):
+        "buffer data, returns the list of the packets completed by it"
+        self.unpacker.feed(data)
+        packets = []
+        error = None
+        for array in self.unpacker:
+            try:
+                packets.append(unpackers[array[0]](array))
+            except Exception:
+                if error is None:
+                    error = sys.exc_info()
+        if error is not None:
+            error[1].packets = packets
+            raise error[0], error[1], error[2]
+        return packets
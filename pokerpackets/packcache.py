@@ -0,0 +1,119 @@
+"""
+memoization of packed packets
+
+a PackCache wraps a pack function (binarypack.pack, dictpack.pack, ...)
+and returns the previous result when the same packet instance is packed
+again, e.g. a packet broadcast to every observer of a table.
+"""
+
+from collections import deque
+from operator import attrgetter
+
+from pokerpackets._codegen import PROXIES
+from pokerpackets.packets import FrozenPacket
+
+DEFAULT_SIZE = 4096
+
+def state_getter(packet_type, __cache={}): # pylint: disable=W0102
+    """
+    return a function returning the tuple of the info attributes of a
+    packet, or of the packet of a proxy (see _codegen.PROXIES)
+    """
+    try:
+        return __cache[packet_type]
+    except KeyError:
+        if packet_type in PROXIES:
+            packet_of = PROXIES[packet_type]
+            def getter(proxy):
+                packet = packet_of(proxy)
+                return state_getter(packet.__class__)(packet)
+        else:
+            attrs = [attr for attr, _default, _s_type in packet_type.info]
+            getter = attrgetter(*attrs) if len(attrs) > 1 else lambda packet: tuple(getattr(packet, attr) for attr in attrs)
+        __cache[packet_type] = getter
+        return getter
+
+class PackCache(object):
+    """
+    memoizes pack_function(packet, *args) for packet instances
+
+    an entry is reused while the packet attributes are the same objects
+    (or equal to) the ones it was packed with; frozen packets are never
+    checked. changes made inside a list or dict attribute are not seen:
+    call invalidate(packet) after such a change, or invalidate() to drop
+    every entry. at most size entries are kept, the oldest are evicted.
+    values returned by the cache are shared and must not be modified.
+    """
+
+    def __init__(self, pack_function, size=DEFAULT_SIZE):
+        self.pack_function = pack_function
+        self.size = size
+        self.version = 0
+        self.entries = {}
+        self.order = deque()
+        self.serial = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def pack(self, packet, *args):
+        "return pack_function(packet, *args), from the cache if possible"
+        key = (id(packet),) + args
+        entry = self.entries.get(key)
+        frozen = isinstance(packet, FrozenPacket)
+        state = None if frozen else state_getter(packet.__class__)(packet)
+        if entry is not None:
+            entry_packet, version, entry_state, _serial, packed = entry
+            if entry_packet is packet and version == self.version and (frozen or entry_state == state):
+                self.hits += 1
+                return packed
+
+        self.misses += 1
+        packed = self.pack_function(packet, *args)
+
+        self.serial += 1
+        self.entries[key] = (packet, self.version, state, self.serial, packed)
+        self.order.append((key, self.serial))
+        while len(self.entries) > self.size:
+            self.evict()
+        if len(self.order) > 2 * self.size:
+            self.compact()
+        return packed
+
+    __call__ = pack
+
+    def evict(self):
+        "drop the oldest entry"
+        while self.order:
+            key, serial = self.order.popleft()
+            entry = self.entries.get(key)
+            if entry is not None and entry[3] == serial:
+                del self.entries[key]
+                self.evictions += 1
+                return
+
+    def compact(self):
+        "drop the eviction order items of replaced entries"
+        self.order = deque(sorted([(key, entry[3]) for key, entry in self.entries.iteritems()], key=lambda item: item[1]))
+
+    def invalidate(self, packet=None, *args):
+        """
+        drop the entry of packet packed with args, or bump the version of
+        the cache (dropping every entry) if packet is None
+        """
+        if packet is None:
+            self.version += 1
+            self.entries.clear()
+            self.order.clear()
+        else:
+            self.entries.pop((id(packet),) + args, None)
+
+    def stats(self):
+        "return the statistics of the cache as a dict"
+        lookups = self.hits + self.misses
+        return {
+            'size': self.size,
+            'entries': len(self.entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': float(self.hits) / lookups if lookups else 0.0,
+        }
@@ -1,4 +1,7 @@
-from pokerpackets.packets import type_id2type, PacketNames
+import os
+
+from pokerpackets import _codegen
+from pokerpackets.packets import type_id2type, PacketNames, Packet, hashable
 import pokerpackets.networkpackets
 import pokerpackets.clientpackets
 
@@ -13,8 +16,135 @@ def packetToExport(ptype):
 def exportPackets():
     return [(type_id, packetToExport(type_id)) for type_id in type_id2type.iterkeys()]
 
+def exportTypeTable():
+    """
+    return the source of the pokerpackets._packettable module, mapping the
+    type ids and class names of the declared packets to the module that
+    declares them (see packets.LazyRegistry)
+    """
+    type_id2module = sorted((type_id, type_id2type[type_id].__module__) for type_id, _export in exportPackets())
+    name2module = sorted((type_id2type[type_id].__name__, module) for type_id, module in type_id2module)
+    lines = [
+        '# generated by python -m pokerpackets.packetexport --type-table, do not edit',
+        '',
+        'TYPE_ID2MODULE = {',
+    ] + ['    %d: %r,' % item for item in type_id2module] + [
+        '}',
+        '',
+        'NAME2MODULE = {',
+    ] + ['    %r: %r,' % item for item in name2module] + [
+        '}',
+    ]
+    return '\n'.join(lines) + '\n'
+
+
+def generateFunctions(packet_type):
+    "generate the functions of packet_type compiled by infoDeclare, frozen and slotted"
+    _codegen.eq(packet_type, Packet.__dict__['__eq__'])
+    _codegen.eq(packet_type, Packet.__dict__['network_eq'], network_only=True)
+    _codegen.str_(packet_type, Packet.__dict__['__str__'])
+    _codegen.str_(packet_type, Packet.__dict__['__repr__'])
+    _codegen.make(packet_type)
+    _codegen.make(packet_type, slotted=True)
+    _codegen.slotted_init(packet_type)
+    _codegen.binarypack_pack(packet_type, packet_type.type)
+    _codegen.binarypack_pack_into(packet_type, packet_type.type)
+    _codegen.binarypack_unpack(packet_type, type_id2type)
+    _codegen.hash_(packet_type, hashable)
+
+def exportSnapshot():
+    """
+    return the sources of the modules of the pokerpackets._snapshot
+    package by packet module name: the fields tables of the exported
+    packets of the module and a factory for each of their generated
+    functions, built instead of compiling the source at import (see
+    _codegen.compile_function)
+    """
+    module2types = {}
+    for type_id, _export in sorted(exportPackets()):
+        packet_type = type_id2type[type_id]
+        module2types.setdefault(packet_type.__module__, []).append(packet_type)
+
+    snapshots = {}
+    for module, packet_types in module2types.iteritems():
+        lines = [
+            '# generated by python -m pokerpackets.packetexport --snapshot, do not edit',
+            '# pylint: skip-file',
+            '',
+            'FIELDS = {',
+        ]
+        for packet_type in packet_types:
+            offsets = '{%s}' % ', '.join('%r: %r' % item for item in sorted(packet_type.binarypack_offsets.iteritems()))
+            lines.append('    (%r, %r): (%r, %r, %r, %s),' % (
+                module, packet_type.__name__,
+                packet_type.info, packet_type.binarypack_info, packet_type.msgpack_info, offsets
+            ))
+        lines.extend(['}', ''])
+
+        _codegen.recording = recording = []
+        try:
+            for packet_type in packet_types:
+                generateFunctions(packet_type)
+        finally:
+            _codegen.recording = None
+
+        factories = []
+        seen = set()
+        for name, source, names in recording:
+            key = _codegen.snapshot_key(source, names)
+            if key in seen:
+                continue
+            seen.add(key)
+            factory_name = 'f%d' % len(factories)
+            factories.append((key, factory_name))
+            lines.extend(_codegen.snapshot_factory(factory_name, name, source, names) + [''])
+
+        lines.append('FACTORIES = {')
+        lines.extend('    %r: %s,' % factory for factory in factories)
+        lines.append('}')
+        snapshots[module.rpartition('.')[2]] = '\n'.join(lines) + '\n'
+    return snapshots
+
+def snapshotDirectory():
+    return os.path.join(os.path.dirname(os.path.abspath(_codegen.__file__)), '_snapshot')
+
+def writeSnapshot():
+    "write the modules of the pokerpackets._snapshot package"
+    for name, source in exportSnapshot().iteritems():
+        open(os.path.join(snapshotDirectory(), name + '.py'), 'w').write(source)
+
+def checkSnapshot():
+    """
+    check that the snapshot matches the declared packets, returns a list
+    of the differences (empty if the snapshot is up to date)
+    """
+    errors = []
+    for type_id, _export in sorted(exportPackets()):
+        packet_type = type_id2type[type_id]
+        fields = _codegen.SNAPSHOT_FIELDS.get((packet_type.__module__, packet_type.__name__))
+        if fields is None:
+            errors.append('%s: missing' % packet_type.__name__)
+        elif fields != (packet_type.info, packet_type.binarypack_info, packet_type.msgpack_info, packet_type.binarypack_offsets):
+            errors.append('%s: fields differ' % packet_type.__name__)
+    for name, source in sorted(exportSnapshot().iteritems()):
+        path = os.path.join(snapshotDirectory(), name + '.py')
+        if not os.path.exists(path) or open(path).read() != source:
+            errors.append('%s: not generated from the current packets' % path)
+    return errors
 
 if __name__ == '__main__':
+    import sys
+    if sys.argv[1:] == ['--type-table']:
+        sys.stdout.write(exportTypeTable())
+        sys.exit(0)
+    if sys.argv[1:] == ['--snapshot']:
+        writeSnapshot()
+        sys.exit(0)
+    if sys.argv[1:] == ['--check-snapshot']:
+        errors = checkSnapshot()
+        for error in errors:
+            print error
+        sys.exit(1 if errors else 0)
     import json
     encoder = json.JSONEncoder(separators=(',', ':'))
     exp = exportPackets()
@@ -24,17 +24,62 @@
 #
 
 import re
-from struct import Struct
+from types import ClassType, InstanceType, ModuleType
+
+from pokerpackets import _codegen
+from pokerpackets._packettable import TYPE_ID2MODULE, NAME2MODULE
 
 from pokerpackets import log as packets_log
 log = packets_log.get_child('packets')
 
-name2type = {}
+class LazyRegistry(dict):
+    """
+    registry of the declared packets, a missing key is looked up in
+    key2module and the module declaring it is imported on first use.
+
+    lookups ([], get, in, has_key) import the module of a missing key.
+    only the packets of the modules imported so far are listed when
+    iterating, call load_all() first to list all the packets.
+    """
+
+    def __init__(self, key2module):
+        dict.__init__(self)
+        self.key2module = key2module
+
+    def load(self, key):
+        "import the module declaring key, returns True if key is declared"
+        module = self.key2module.get(key)
+        if module is not None:
+            __import__(module)
+        return dict.__contains__(self, key)
+
+    def __missing__(self, key):
+        if self.load(key):
+            return dict.__getitem__(self, key)
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or self.load(key)
+
+    has_key = __contains__
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+def load_all():
+    "import all the modules declaring packets"
+    for module in sorted(set(TYPE_ID2MODULE.itervalues())):
+        __import__(module)
+
+name2type = LazyRegistry(NAME2MODULE)
 type2name = {}
 type2type_id = {}
-type_id2type = {}
-PacketFactory = {}
-PacketNames = {}
+type_id2type = LazyRegistry(TYPE_ID2MODULE)
+PacketFactory = LazyRegistry(TYPE_ID2MODULE)
+PacketNames = LazyRegistry(TYPE_ID2MODULE)
 
 PACKET_NONE = 0
 
@@ -44,20 +89,28 @@ def find(f, seq):
         if f(item): return item
 
 
-import simplejson
-class JSON:
+from pokerpackets.jsonbackend import backend as json_backend
+class JSON(object):
     """
-    JSON implementation used for packet en/decoding
+    JSON implementation used for packet en/decoding (see jsonbackend)
     """
-    encoder = simplejson.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
-    decoder = simplejson.JSONDecoder()
+
+    @property
+    def encoder(self):
+        "the JSON encoder of the backend"
+        return json_backend.encoder
+
+    @property
+    def decoder(self):
+        "the JSON decoder of the backend"
+        return json_backend.decoder
 
     def encode(self, obj):
         """encode an object, returning a utf8 encoded string (not a unicode string!)"""
-        return self.encoder.encode(obj).encode('utf-8')
+        return json_backend.encode(obj).encode('utf-8')
 
     def decode(self, string):
-        return self.decoder.decode(string)
+        return json_backend.loads(string)
         
 class Packet:
     """
@@ -84,9 +137,45 @@ class Packet:
 
     def __eq__(self, other):
         return \
-            self.__class__ is other.__class__ and \
+            self.__class__.__dict__.get('variant_of', self.__class__) is other.__class__.__dict__.get('variant_of', other.__class__) and \
             not any(getattr(self, attr) != getattr(other, attr) for attr, _default, _s_info in self.__class__.info)
 
+    def network_eq(self, other):
+        "like ==, ignoring the attributes which are not sent over the network"
+        return \
+            self.__class__.__dict__.get('variant_of', self.__class__) is other.__class__.__dict__.get('variant_of', other.__class__) and \
+            not any(getattr(self, attr) != getattr(other, attr) for attr, _default, s_type in self.__class__.info if s_type != 'no net')
+
+    def freeze(self):
+        """
+        make the packet immutable in place (see frozen), returns the packet.
+        lists and dicts held by the packet are not frozen.
+        """
+        if not isinstance(self, FrozenPacket):
+            self.__class__ = frozen(self.__class__)
+        return self
+
+    def replace(self, **changes):
+        """
+        return a copy of the packet with the attributes in changes set,
+        other attributes are shared with the packet. the copy is of the
+        same class, i.e. frozen if the packet is frozen.
+        """
+        packet_type = self.__class__
+        if '__slots__' in packet_type.__dict__:
+            values = dict((attr, getattr(self, attr)) for attr, _default, _s_type in packet_type.info)
+            values.update(self.__dict__)
+            values.update(changes)
+            return packet_type(**values)
+
+        values = self.__dict__.copy()
+        values.update(changes)
+        if isinstance(packet_type, ClassType):
+            return InstanceType(packet_type, values)
+        packet = packet_type.__new__(packet_type)
+        packet.__dict__.update(values)
+        return packet
+
     @staticmethod
     def infoDeclare(dictionary, packet_type, base_type, name, index):
         # setup dictionary
@@ -103,35 +192,36 @@ class Packet:
             setattr(packet_type, attr, default)
 
         # binpack info
-        packet_type.binarypack_info = [(attr, s_type) for attr, _default, s_type in packet_type.info if s_type != 'no net']
-        packet_type.msgpack_info = [(attr, s_type) for attr, _default, s_type in packet_type.info if s_type not in ('no net', 'type')]
+        _codegen.load_snapshot(packet_type.__module__)
+        fields = _codegen.snapshot_fields(packet_type)
+        if fields is not None:
+            packet_type.binarypack_info, packet_type.msgpack_info, packet_type.binarypack_offsets = fields
+        else:
+            packet_type.binarypack_info = [(attr, s_type) for attr, _default, s_type in packet_type.info if s_type != 'no net']
+            packet_type.msgpack_info = [(attr, s_type) for attr, _default, s_type in packet_type.info if s_type not in ('no net', 'type')]
+            packet_type.binarypack_offsets = _codegen.binarypack_offsets(packet_type)
 
-        # fast pack
-        struct_format = '!BH'
-        attr_names = []
-        for attr, default, s_type in packet_type.info:
+        # comparison and formatting
+        packet_type.__eq__ = _codegen.eq(packet_type, Packet.__dict__['__eq__'])
+        packet_type.network_eq = _codegen.eq(packet_type, Packet.__dict__['network_eq'], network_only=True)
+        if '__str__' not in packet_type.__dict__:
+            packet_type.__str__ = _codegen.str_(packet_type, Packet.__dict__['__str__'])
+            if '__repr__' not in packet_type.__dict__:
+                packet_type.__repr__ = _codegen.str_(packet_type, Packet.__dict__['__repr__'])
 
-            # skip 'no net' attributes
-            if s_type == 'no net':
-                continue
+        # positional constructor
+        packet_type.make = classmethod(_codegen.make(packet_type))
 
-            # break if type is not fixed length and no other evaluation is needed
-            if s_type not in ('B', 'H', 'I', 'Q'):
-                break
+        # fast pack
+        packet_type.binarypack_fast_pack = _codegen.binarypack_pack(packet_type, index)
+        packet_type.binarypack_fast_pack_into = _codegen.binarypack_pack_into(packet_type, index)
 
-            # 
-            struct_format += s_type
-            attr_names.append(attr)
+        # shared immutable instance of packets without network fields
+        if not packet_type.binarypack_info:
+            packet_type.singleton = frozen(packet_type)()
 
-        else:
-            if attr_names:
-                fast_struct = Struct(struct_format)
-                fast_struct_size = fast_struct.size - 3 # 3 is the size of the packet head
-                packet_type.binarypack_fast_pack = lambda p: fast_struct.pack(
-                    index,
-                    fast_struct_size,
-                    *[getattr(p, attr) for attr in attr_names]
-                )
+        # fast unpack
+        packet_type.binarypack_fast_unpack = staticmethod(_codegen.binarypack_unpack(packet_type, dictionary['type_id2type']))
 
         # insert type into dictionary
         dictionary['type2type_id'][packet_type] = index
@@ -142,6 +232,126 @@ class Packet:
         dictionary['PacketFactory'][index] = packet_type
         dictionary['PACKET_' + name] = index
 
+type2slotted = {}
+
+def slotted(packet_type):
+    """
+    return the slotted variant of a declared packet type
+
+    the slotted class is a subclass of packet_type with a slot for each
+    attribute of info, its instances do not allocate a dictionary unless
+    attributes not in info are set. attributes not given to the
+    constructor are set to the class default, list and dict defaults are
+    copied. the class is created on first use and packed like packet_type.
+    slotted packets are pickled as slotted(packet_type) and the values of
+    their attributes, see unpickle_slotted.
+    """
+    try:
+        return type2slotted[packet_type]
+    except KeyError:
+        pass
+
+    bases = (packet_type,) if isinstance(packet_type, type) else (packet_type, object)
+    slotted_type = type(packet_type.__name__, bases, {
+        '__slots__': tuple(attr for attr, _default, _s_type in packet_type.info),
+        '__module__': packet_type.__module__,
+        '__doc__': packet_type.__doc__,
+        '__init__': _codegen.slotted_init(packet_type),
+        'variant_of': packet_type,
+        '__reduce__': reduce_slotted,
+        'make': classmethod(_codegen.make(packet_type, slotted=True)),
+        'binarypack_fast_pack': packet_type.__dict__['binarypack_fast_pack'],
+        'binarypack_fast_pack_into': packet_type.__dict__['binarypack_fast_pack_into'],
+    })
+
+    type2type_id[slotted_type] = type2type_id[packet_type]
+    type2name[slotted_type] = type2name[packet_type]
+    type2slotted[packet_type] = slotted_type
+    return slotted_type
+
+def reduce_slotted(self):
+    "__reduce__ of the slotted packets"
+    values = dict((attr, getattr(self, attr)) for attr, _default, _s_type in self.info)
+    values.update(self.__dict__)
+    return (unpickle_slotted, (self.variant_of, values))
+
+def unpickle_slotted(packet_type, values):
+    "return the slotted packet of packet_type with values, see reduce_slotted"
+    return slotted(packet_type)(**values)
+
+class FrozenPacket:
+    """
+    base class of the frozen packet classes, see frozen
+    """
+
+    def __init__(self, **kw):
+        self.__dict__.update(kw)
+
+    def __setattr__(self, attr, value):
+        raise AttributeError("can't set attribute %s of frozen %s" % (attr, self.__class__.__name__))
+
+    def __delattr__(self, attr):
+        raise AttributeError("can't delete attribute %s of frozen %s" % (attr, self.__class__.__name__))
+
+    def __hash__(self):
+        return hash(tuple([hashable(getattr(self, attr)) for attr, _default, _s_type in self.__class__.info]))
+
+def hashable(value):
+    "return value, or a hashable equivalent if value is a list or a dict"
+    if isinstance(value, list):
+        return tuple([hashable(item) for item in value])
+    if isinstance(value, dict):
+        return frozenset([(key, hashable(item)) for key, item in value.iteritems()])
+    return value
+
+type2frozen = {}
+
+def frozen(packet_type):
+    """
+    return the frozen variant of a declared packet type
+
+    the frozen class is a subclass of FrozenPacket and packet_type whose
+    instances can not be modified: setting or deleting an attribute raises
+    AttributeError. the class is created on first use and packed like
+    packet_type. it belongs to the pokerpackets.frozenpackets module,
+    which pickle uses to find it (see FrozenPackets).
+    """
+    try:
+        return type2frozen[packet_type]
+    except KeyError:
+        pass
+
+    if '__slots__' in packet_type.__dict__:
+        raise TypeError('slotted packet classes can not be frozen')
+
+    frozen_type = type(packet_type)(packet_type.__name__, (FrozenPacket, packet_type), {
+        '__module__': FROZEN_MODULE,
+        '__doc__': packet_type.__doc__,
+        'variant_of': packet_type,
+        '__hash__': _codegen.hash_(packet_type, hashable),
+        'binarypack_fast_pack': packet_type.__dict__['binarypack_fast_pack'],
+        'binarypack_fast_pack_into': packet_type.__dict__['binarypack_fast_pack_into'],
+    })
+
+    type2type_id[frozen_type] = packet_type.type
+    type2name[frozen_type] = packet_type.__name__
+    type2frozen[packet_type] = frozen_type
+    return frozen_type
+
+FROZEN_MODULE = 'pokerpackets.frozenpackets'
+
+class FrozenPackets(ModuleType):
+    """
+    type of the pokerpackets.frozenpackets module: its attribute named
+    after a declared packet class is the frozen variant of the class
+    """
+
+    def __getattr__(self, name):
+        try:
+            return frozen(name2type[name])
+        except KeyError:
+            raise AttributeError("'module' object has no attribute '%s'" % name)
+
 class PacketString(Packet):
     """
     Packet containing a single string
@@ -354,6 +564,30 @@ class PacketMessage(PacketString):
 
 Packet.infoDeclare(globals(), PacketMessage, Packet, "MESSAGE", 16) # 16 #
 
+
+class PacketCompactRequest(Packet):
+    """
+    client => server
+    Ask the server to use the compact binary encoding (see
+    binarypack) on the connection. A server accepting it answers
+    with PacketCompact, otherwise the encoding does not change.
+    """
+
+Packet.infoDeclare(globals(), PacketCompactRequest, Packet, "COMPACT_REQUEST", 17) # 17 #
+
+
+class PacketCompact(Packet):
+    """
+    server <=> client
+    The packets following this one in the same direction use the
+    compact binary encoding. The server sends it to accept a
+    PacketCompactRequest, the client sends it when it receives it.
+    binarypack.Encoder and binarypack.StreamDecoder(negotiate=True)
+    switch to the compact encoding after it.
+    """
+
+Packet.infoDeclare(globals(), PacketCompact, Packet, "COMPACT", 18) # 18 #
+
 _TYPES = range(0,39)
 
 ### !!!!!! NO SERIAL >= 50 !!!!!! ####
@@ -0,0 +1,104 @@
+"""
+free lists of packet instances
+
+a pool recycles the instances of a packet type (and their dictionaries)
+to avoid short lived allocations. once enabled for a packet type, the
+binary decoder of the type and PacketPool.make draw instances from the
+pool, release() gives an instance back when it has been sent or
+handled. a released packet must not be used anymore.
+"""
+
+from pokerpackets import _codegen
+from pokerpackets.packets import type_id2type
+from pokerpackets.networkpackets import PacketPokerPlayerChips, PacketPokerPosition, PacketPokerCall, \
+    PacketPokerRaise, PacketPokerFold
+
+# packets without network fields (e.g. PacketPing) are not pooled: they
+# are decoded to their shared singleton
+DEFAULT_TYPES = (
+    PacketPokerPlayerChips,
+    PacketPokerPosition,
+    PacketPokerCall,
+    PacketPokerRaise,
+    PacketPokerFold,
+)
+
+DEFAULT_SIZE = 1024
+
+pools = {}
+
+class PacketPool(object):
+    """
+    bounded free list of instances of packet_type
+
+    make: build a packet like packet_type.make, reusing a released instance
+    hits/misses: number of instances taken from the pool / newly allocated
+    releases/discards: number of instances given back / dropped because
+        the pool was full
+    """
+
+    def __init__(self, packet_type, size=DEFAULT_SIZE):
+        self.packet_type = packet_type
+        self.size = size
+        self.free = []
+        self.hits = self.misses = self.releases = self.discards = 0
+        self.make = _codegen.make(packet_type, pool=self)
+
+    def release(self, packet):
+        "give packet back to the pool"
+        if packet.__class__ is not self.packet_type:
+            raise ValueError('%r is not a %s' % (packet, self.packet_type.__name__))
+        if len(self.free) < self.size:
+            packet.__dict__.clear()
+            self.free.append(packet)
+            self.releases += 1
+        else:
+            self.discards += 1
+
+    def stats(self):
+        "return the statistics of the pool as a dict"
+        return {
+            'size': self.size,
+            'free': len(self.free),
+            'hits': self.hits,
+            'misses': self.misses,
+            'releases': self.releases,
+            'discards': self.discards,
+        }
+
+def enable(packet_types=DEFAULT_TYPES, size=DEFAULT_SIZE):
+    """
+    enable pooling for packet_types, keeping at most size free instances
+    per type. the binary decoders of the types draw from their pool.
+    """
+    for packet_type in packet_types:
+        if packet_type in pools:
+            pool = pools[packet_type]
+            pool.size = size
+            del pool.free[size:]
+            continue
+        pool = pools[packet_type] = PacketPool(packet_type, size)
+        packet_type.binarypack_fast_unpack = staticmethod(_codegen.binarypack_unpack(packet_type, type_id2type, pool))
+
+def disable(packet_types=None):
+    "disable pooling for packet_types (default: all pooled types)"
+    for packet_type in list(pools if packet_types is None else packet_types):
+        if pools.pop(packet_type, None) is not None:
+            packet_type.binarypack_fast_unpack = staticmethod(_codegen.binarypack_unpack(packet_type, type_id2type))
+
+def make(packet_type, *args, **kw):
+    "build a packet_type like packet_type.make, from its pool if any"
+    pool = pools.get(packet_type)
+    if pool is None:
+        return packet_type.make(*args, **kw)
+    return pool.make(*args, **kw)
+
+def release(packet):
+    "give packet back to the pool of its type, if any"
+    pool = pools.get(packet.__class__)
+    if pool is not None:
+        pool.release(packet)
+
+def stats():
+    "return the statistics of all pools, by packet type name"
+    return dict((packet_type.__name__, pool.stats()) for packet_type, pool in pools.iteritems())
@@ -0,0 +1,49 @@
+"""
+preparation of a process about to fork workers
+
+workers forked from a prepared process share the packet classes, their
+generated functions and the struct caches with it instead of building
+their own copy on first use (see packets.LazyRegistry, slotted, frozen).
+"""
+
+import gc
+
+from pokerpackets import _codegen, packets
+from pokerpackets.binarypack import _binarypack
+import pokerpackets.binarypack # pylint: disable=W0611
+import pokerpackets.dictpack # pylint: disable=W0611
+
+# list lengths are encoded as an unsigned byte
+MAX_LIST_LENGTH = 255
+
+def fill_struct_caches(max_list_length=MAX_LIST_LENGTH):
+    "build the list structs of lengths 0 to max_list_length"
+    for caches in (_codegen.LIST_STRUCTS, _binarypack.LIST_PACK_STRUCTS):
+        for cache in caches.itervalues():
+            for length in xrange(max_list_length + 1):
+                cache[length]
+
+def prepare_for_fork(max_list_length=MAX_LIST_LENGTH, slotted=False, frozen=False):
+    """
+    load every packet class and build what is otherwise built on first use
+
+    max_list_length: the list structs of the binary codecs are built up to
+        this length
+    slotted, frozen: also build the slotted / frozen variant of every
+        packet class
+
+    garbage is collected, and if the gc module supports it (gc.freeze)
+    the remaining objects are moved to the permanent generation so that
+    the collections of the workers do not write to their pages.
+    """
+    packets.load_all()
+    for packet_type in packets.PacketFactory.values():
+        if slotted:
+            packets.slotted(packet_type)
+        if frozen:
+            packets.frozen(packet_type)
+    fill_struct_caches(max_list_length)
+
+    gc.collect()
+    if hasattr(gc, 'freeze'):
+        gc.freeze()
@@ -6,5 +6,5 @@ from distutils.core import setup
 setup(
     name = 'poker-packets',
     version = '2.2.3',
-    packages = ['pokerpackets', 'pokerpackets.binarypack'],
+    packages = ['pokerpackets', 'pokerpackets.binarypack', 'pokerpackets._snapshot'],
 )
@@ -1,12 +1,18 @@
 # -*- coding: utf-8 -*-
 
-from pokerpackets import binarypack, packets
+import mmap
+import struct
+
+from pokerpackets import _codegen, binarypack, packets
 from pokerpackets.binarypack import _binarypack
 
+from nose.tools import nottest
+
 from test_packets import generate_test_packets
 
 # import networkpackets so they get tested as well
 import pokerpackets.networkpackets
+import pokerpackets.clientpackets
 
 # public functions
 
@@ -16,9 +22,451 @@ def test_pack_unpack():
         packed = binarypack.pack(packet)
         assert binarypack.unpack(packed) == packet
 
-    for packet in generate_test_packets():
+    for packet in generate_codec_test_packets():
         yield check_pack_unpack, packet
 
+@nottest
+def generate_codec_test_packets():
+    "test packets plus packets with non default values for every s_type"
+    for packet in generate_test_packets():
+        yield packet
+
+    yield packets.PacketError(message='error', code=5, other_type=10)
+    yield packets.PacketList(packets=[packets.PacketLogin(name='name'), packets.PacketPing()])
+    yield pokerpackets.networkpackets.PacketPokerPlayerChips(serial=1, game_id=2, bet=3, money=4)
+    yield pokerpackets.networkpackets.PacketPokerPosition(serial=1, game_id=2, position=-1)
+    yield pokerpackets.networkpackets.PacketPokerSeats(seats=[0, 1, 2, 0], game_id=3)
+    yield pokerpackets.networkpackets.PacketPokerPlayerArrive(name='name', blind=True, seat=None, sit_out=False)
+    yield pokerpackets.networkpackets.PacketPokerPlayerArrive(name='name', blind='big', seat=3, auto=True)
+    yield pokerpackets.networkpackets.PacketPokerUserInfo(money={1: (10, 11, 12), 2: (0, 0, 1)})
+    yield pokerpackets.networkpackets.PacketPokerPlayersList(players=[('a', 10, 1), ('bb', 20, 0)])
+    yield pokerpackets.clientpackets.PacketPokerPotChips(game_id=1, index=2, bet=[1, 30])
+    yield pokerpackets.clientpackets.PacketPokerShowdown(showdown_stack=[{'a': 1}])
+    yield pokerpackets.networkpackets.PacketPokerUpdateMoney(game_id=1, serials=[5, 70000], chips=[-1, 0, 300, -70000], absolute=False)
+
+def test_singleton():
+    for packet_type in (packets.PacketPing, packets.PacketAck, pokerpackets.networkpackets.PacketPokerLongPollReturn):
+        packed = binarypack.pack(packet_type())
+        assert packed == chr(packet_type.type) + b'\x00\x00'
+        assert binarypack.pack(packet_type.singleton) == packed
+        assert binarypack.unpack(packed) is packet_type.singleton
+        assert binarypack.unpack_all(packed * 2) == [packet_type.singleton] * 2
+
+def test_unpack_buffers():
+    def check_unpack_buffers(packet):
+        packed = binarypack.pack(packet)
+        for data in (bytearray(packed), memoryview(packed), buffer(packed), memoryview(bytearray(packed))):
+            unpacked = binarypack.unpack(data)
+            assert unpacked == packet
+            for attr, _s_type in unpacked.binarypack_info:
+                assert not isinstance(getattr(unpacked, attr), (bytearray, buffer, memoryview))
+
+    for packet in generate_codec_test_packets():
+        yield check_unpack_buffers, packet
+
+def test_unpack_mmap():
+    packet = packets.PacketLogin(name='name', password='password')
+    packed = binarypack.pack(packet)
+    data = mmap.mmap(-1, len(packed) + 2)
+    data[2:] = packed
+    assert binarypack.unpack(data, 2) == packet
+
+def test_pack_many_unpack_all():
+    _packets = list(generate_codec_test_packets())
+    packed = binarypack.pack_many(_packets)
+    assert packed == b''.join(binarypack.pack(packet) for packet in _packets)
+    assert binarypack.unpack_all(packed) == _packets
+    assert binarypack.unpack_all(bytearray(packed)) == _packets
+    assert binarypack.pack_many([]) == b''
+    assert binarypack.unpack_all(b'') == []
+
+    try:
+        binarypack.unpack_all(packed[:-1])
+    except ValueError:
+        pass
+    else:
+        assert False, 'unpack_all should raise ValueError on truncated packets'
+
+def test_unpack_lazy():
+    def check_unpack_lazy(packet):
+        packed = binarypack.pack(packet)
+        lazy = binarypack.unpack_lazy(bytearray(packed))
+        assert lazy.type == packet.type
+        assert lazy.packet is None
+        for attr in packet.binarypack_offsets:
+            assert getattr(lazy, attr) == binarypack.unpack(packed).__dict__[attr]
+        assert lazy.packet is None, 'fields with static offsets should not decode the packet'
+        assert binarypack.pack(lazy) == packed
+        assert binarypack.pack_many([lazy, lazy]) == packed * 2
+        assert lazy == packet
+        assert packet == lazy
+        assert not packet != lazy
+        assert packet.network_eq(lazy)
+        for attr, _s_type in packet.binarypack_info:
+            getattr(lazy, attr)
+        assert lazy.decode() == packet
+
+    for packet in generate_codec_test_packets():
+        yield check_unpack_lazy, packet
+
+def test_unpack_lazy_read_only():
+    lazy = binarypack.unpack_lazy(binarypack.pack(packets.PacketSerial(serial=5)))
+    assert lazy.serial == 5
+    try:
+        lazy.serial = 6
+    except AttributeError:
+        pass
+    else:
+        assert False, 'LazyPacket attributes should be read only'
+
+def test_unpack_all_lazy():
+    _packets = list(generate_codec_test_packets())
+    packed = binarypack.pack_many(_packets)
+    lazy_packets = binarypack.unpack_all(packed, lazy=True)
+    assert all(isinstance(packet, binarypack.LazyPacket) for packet in lazy_packets)
+    assert lazy_packets == _packets
+    assert binarypack.pack_many(lazy_packets) == packed
+
+    decoder = binarypack.StreamDecoder(lazy=True)
+    decoded = []
+    for i in xrange(0, len(packed), 7):
+        decoded.extend(decoder.feed(packed[i:i + 7]))
+    assert decoded == _packets
+    assert binarypack.pack_many(decoded) == packed
+
+def test_peek():
+    packed = binarypack.pack(packets.PacketLogin(name='name'))
+    assert binarypack.peek(packed) == (packets.PACKET_LOGIN, len(packed) - 3)
+    assert binarypack.peek(bytearray(b'#' + packed), 1) == (packets.PACKET_LOGIN, len(packed) - 3)
+
+def test_extract():
+    def check_extract(packet):
+        packed = binarypack.pack(packet)
+        unpacked = binarypack.unpack(packed)
+        for attr, _s_type in packet.binarypack_info:
+            assert binarypack.extract(packed, attr) == getattr(unpacked, attr)
+            assert binarypack.extract(bytearray(b'##' + packed), attr, 2) == getattr(unpacked, attr)
+
+    for packet in generate_codec_test_packets():
+        yield check_extract, packet
+
+def test_extract_offsets():
+    packed = binarypack.pack(pokerpackets.networkpackets.PacketPokerPlayerChips(serial=1, game_id=2, bet=3, money=4))
+    assert pokerpackets.networkpackets.PacketPokerPlayerChips.binarypack_offsets == {
+        'serial': (3, 'I'), 'game_id': (7, 'I'), 'bet': (11, 'Q'), 'money': (19, 'Q'),
+    }
+    assert binarypack.extract(packed, 'game_id') == 2
+    assert binarypack.extract(packed, 'money') == 4
+    try:
+        binarypack.extract(packed, 'pewpew')
+    except AttributeError:
+        pass
+    else:
+        assert False, 'extract should raise AttributeError for unknown fields'
+
+def test_unpack_all_type_ids():
+    _packets = list(generate_codec_test_packets())
+    packed = binarypack.pack_many(_packets)
+    type_ids = set([packets.PACKET_LOGIN, packets.PACKET_LIST, pokerpackets.networkpackets.PACKET_POKER_PLAYER_ARRIVE])
+    wanted = [packet for packet in _packets if packet.type in type_ids]
+    assert len(wanted) > 3
+    assert binarypack.unpack_all(packed, type_ids=type_ids) == wanted
+    assert binarypack.unpack_all(packed, type_ids=type_ids, lazy=True) == wanted
+    assert binarypack.unpack_all(packed, type_ids=()) == []
+
+    decoder = binarypack.StreamDecoder(type_ids=type_ids)
+    decoded = []
+    for i in xrange(0, len(packed), 5):
+        decoded.extend(decoder.feed(packed[i:i + 5]))
+    assert decoded == wanted
+    assert len(decoder) == 0
+
+def test_stream_decoder():
+    _packets = list(generate_codec_test_packets())
+    data = b''.join(binarypack.pack(packet) for packet in _packets)
+
+    # all frames at once
+    decoder = binarypack.StreamDecoder()
+    assert decoder.feed(data) == _packets
+    assert len(decoder) == 0
+
+    # frames split at every byte
+    decoder = binarypack.StreamDecoder()
+    decoded = []
+    for i in xrange(len(data)):
+        decoded.extend(decoder.feed(data[i]))
+    assert decoded == _packets
+    assert len(decoder) == 0
+
+    # chunks not aligned to frames
+    for chunk_size in (2, 3, 7, 100):
+        decoder = binarypack.StreamDecoder()
+        decoded = []
+        for i in xrange(0, len(data), chunk_size):
+            decoded.extend(decoder.feed(bytearray(data[i:i + chunk_size])))
+        assert decoded == _packets
+
+def test_stream_decoder_partial():
+    packed = binarypack.pack(packets.PacketLogin(name='name'))
+    decoder = binarypack.StreamDecoder()
+    assert decoder.feed(packed + packed[:5]) == [packets.PacketLogin(name='name')]
+    assert len(decoder) == 5
+    assert decoder.feed(packed[5:]) == [packets.PacketLogin(name='name')]
+    assert len(decoder) == 0
+
+def test_stream_decoder_unknown_type():
+    decoder = binarypack.StreamDecoder()
+    try:
+        decoder.feed(b'\xFF\x00\x01\x00' + binarypack.pack(packets.PacketPing()))
+    except KeyError, error:
+        assert error.packets == [packets.PacketPing()]
+    else:
+        assert False, 'feed should raise KeyError on unknown packet types'
+    assert len(decoder) == 0
+    assert decoder.feed(b'') == []
+
+def test_stream_decoder_error_between_packets():
+    login = packets.PacketLogin(name='name')
+    serial = packets.PacketSerial(serial=5)
+    bad = b'\xFE\x00\x00'
+    data = binarypack.pack(login) + bad + binarypack.pack(serial) + bad + binarypack.pack(login)
+    decoder = binarypack.StreamDecoder()
+    try:
+        decoder.feed(data + binarypack.pack(serial)[:2])
+    except KeyError, error:
+        # every complete frame after the bad ones is decoded by the same call
+        assert error.packets == [login, serial, login]
+    else:
+        assert False, 'feed should raise KeyError on the unknown packet type'
+    assert len(decoder) == 2
+    assert decoder.feed(binarypack.pack(serial)[2:]) == [serial]
+
+def test_pack_into():
+    def check_pack_into(packet):
+        packed = binarypack.pack(packet)
+
+        buf = bytearray()
+        end = binarypack.pack_into(packet, buf)
+        assert end == len(packed)
+        assert buf[:end] == packed
+
+        buf = bytearray(b'#' * 1024)
+        end = binarypack.pack_into(packet, buf, 5)
+        assert end == 5 + len(packed)
+        assert buf[5:end] == packed
+        assert buf[:5] == b'#####'
+
+    for packet in generate_codec_test_packets():
+        yield check_pack_into, packet
+
+def test_pack_into_memoryview():
+    packet = pokerpackets.networkpackets.PacketPokerPlayerChips(serial=1, game_id=2, bet=3, money=4)
+    packed = binarypack.pack(packet)
+
+    buf = bytearray(len(packed))
+    assert binarypack.pack_into(packet, memoryview(buf), 0) == len(packed)
+    assert buf == packed
+
+    try:
+        binarypack.pack_into(packet, memoryview(buf), 1)
+    except ValueError:
+        pass
+    else:
+        assert False, 'pack_into should raise ValueError if the buffer can not grow'
+
+def test_pack_many_into():
+    _packets = list(generate_codec_test_packets())
+    buf = bytearray()
+    end = binarypack.pack_many_into(_packets, buf)
+    assert buf[:end] == b''.join(binarypack.pack(packet) for packet in _packets)
+
+def test_pack_slotted():
+    def check_pack_slotted(packet):
+        slotted_packet = packets.slotted(packet.__class__)(**packet.__dict__)
+        assert binarypack.pack(slotted_packet) == binarypack.pack(packet)
+
+    for packet in generate_codec_test_packets():
+        yield check_pack_slotted, packet
+
+def test_fast_pack():
+    def check_fast_pack(packet):
+        buf = []
+        _binarypack.pack(packet, buf)
+        assert packet.binarypack_fast_pack() == b''.join(buf)
+
+    for packet in generate_codec_test_packets():
+        yield check_fast_pack, packet
+
+def test_fast_unpack():
+    def check_fast_unpack(packet):
+        packed = binarypack.pack(packet)
+        offset, fast_packet = packet.binarypack_fast_unpack(packed, _binarypack.S_PACKET_HEAD.size)
+        assert offset == len(packed)
+        assert (offset, fast_packet) == _binarypack.unpack(packed)
+
+    for packet in generate_codec_test_packets():
+        yield check_fast_unpack, packet
+
+def test_compact_pack_unpack():
+    def check_compact_pack_unpack(packet):
+        packed = binarypack.pack(packet, compact=True)
+        assert binarypack.peek(packed) == (packet.type, len(packed) - _binarypack.S_PACKET_HEAD.size)
+        assert binarypack.unpack(packed, compact=True) == packet
+        assert binarypack.unpack(memoryview(bytearray(packed)), compact=True) == packet
+        slotted_packet = packets.slotted(packet.__class__)(**packet.__dict__)
+        assert binarypack.pack(slotted_packet, compact=True) == packed
+
+    for packet in generate_codec_test_packets():
+        yield check_compact_pack_unpack, packet
+
+def test_compact_format():
+    packet = pokerpackets.networkpackets.PacketPokerPlayerChips(game_id=3, serial=1000, bet=150, money=12345)
+    assert binarypack.pack(packet, compact=True) == b'\x40\x00\x07\xe8\x07\x03\x96\x01\xb9\x60'
+    assert len(binarypack.pack(packet)) == 27
+    packet = pokerpackets.networkpackets.PacketPokerUpdateMoney(game_id=1, serials=[5], chips=[-1, 1], absolute=False)
+    assert binarypack.pack(packet, compact=True) == chr(packet.type) + b'\x00\x07\x01\x01\x05\x02\x01\x02\x00'
+    assert binarypack.pack(packets.PacketPing(), compact=True) == binarypack.pack(packets.PacketPing())
+
+def test_compact_unpack_singleton():
+    packed = binarypack.pack(packets.PacketPing(), compact=True)
+    assert binarypack.unpack(packed, compact=True) is packets.PacketPing.singleton
+
+def test_compact_pack_lazy():
+    packet = pokerpackets.networkpackets.PacketPokerPlayerChips(serial=1, game_id=2, bet=3, money=4)
+    lazy_packet = binarypack.unpack_lazy(binarypack.pack(packet))
+    assert binarypack.pack(lazy_packet, compact=True) == binarypack.pack(packet, compact=True)
+    # lazy packets nested in a list
+    packed = binarypack.pack(packets.PacketList(packets=[lazy_packet, packet]), compact=True)
+    assert packed == binarypack.pack(packets.PacketList(packets=[packet, packet]), compact=True)
+    assert binarypack.pack_many([lazy_packet], compact=True) == binarypack.pack(packet, compact=True)
+
+def test_compact_pack_many_unpack_all():
+    _packets = list(generate_codec_test_packets())
+    data = binarypack.pack_many(_packets, compact=True)
+    assert data == b''.join(binarypack.pack(packet, compact=True) for packet in _packets)
+    assert binarypack.unpack_all(data, compact=True) == _packets
+    try:
+        binarypack.unpack_all(data, lazy=True, compact=True)
+    except ValueError:
+        pass
+    else:
+        assert False, 'unpack_all should raise ValueError for lazy compact unpacking'
+
+def test_varint():
+    for value, encoded in ((0, b'\x00'), (127, b'\x7f'), (128, b'\x80\x01'), (300, b'\xac\x02'), (2 ** 64 - 1, b'\xff' * 9 + b'\x01')):
+        assert _codegen.varint(value) == encoded
+        assert _codegen.unpack_varint(b'#' + encoded, 1) == (1 + len(encoded), value)
+    try:
+        _codegen.varint(-1)
+    except struct.error:
+        pass
+    else:
+        assert False, 'varint should raise struct.error for negative values'
+    try:
+        _codegen.unpack_varint(b'\x80' * 11, 0)
+    except struct.error:
+        pass
+    else:
+        assert False, 'unpack_varint should raise struct.error for varints of more than 10 bytes'
+    assert _codegen.varint(0xffff, 0xffff) == b'\xff\xff\x03'
+    assert _codegen.unpack_varint(b'\xff\xff\x03', 0, 0xffff) == (3, 0xffff)
+    try:
+        _codegen.varint(0x10000, 0xffff)
+    except struct.error:
+        pass
+    else:
+        assert False, 'varint should raise struct.error for values greater than maximum'
+    try:
+        _codegen.unpack_varint(b'\x80\x80\x04', 0, 0xffff)
+    except struct.error:
+        pass
+    else:
+        assert False, 'unpack_varint should raise struct.error for values greater than maximum'
+
+def test_compact_field_widths():
+    networkpackets = pokerpackets.networkpackets
+    def check_rejected(packet):
+        for compact in (False, True):
+            try:
+                binarypack.pack(packet, compact=compact)
+            except struct.error:
+                pass
+            else:
+                assert False, '%r should not be packed (compact=%r)' % (packet, compact)
+
+    for packet in (
+        networkpackets.PacketPokerPlayerChips(serial=2 ** 32),
+        networkpackets.PacketPokerPlayerChips(bet=2 ** 64),
+        pokerpackets.clientpackets.PacketPokerPotChips(bet=[2 ** 16, 2 ** 16]),
+        networkpackets.PacketPokerTable(observers=70000),
+        networkpackets.PacketPokerSeats(seats=[2 ** 32]),
+        networkpackets.PacketPokerUpdateMoney(chips=[2 ** 31]),
+        networkpackets.PacketPokerUpdateMoney(chips=[-2 ** 31 - 1]),
+        networkpackets.PacketPokerUserInfo(money={2 ** 32: (1, 2, 3)}),
+        networkpackets.PacketPokerUserInfo(money={1: (2 ** 64, 2, 3)}),
+        networkpackets.PacketPokerPlayersList(players=[('name', 2 ** 32, 0)]),
+    ):
+        yield check_rejected, packet
+
+    # the limits of the struct formats are accepted by both encodings
+    for packet in (
+        networkpackets.PacketPokerTable(observers=0xffff, hands_per_hour=300),
+        networkpackets.PacketPokerSeats(seats=[70000, 2 ** 32 - 1]),
+        networkpackets.PacketPokerUpdateMoney(serials=[1, 2], chips=[2 ** 31 - 1, -2 ** 31]),
+        networkpackets.PacketPokerUserInfo(money={2 ** 32 - 1: (2 ** 64 - 1, 0, 1)}),
+        networkpackets.PacketPokerPlayersList(players=[('name', 2 ** 32 - 1, 0)]),
+    ):
+        assert binarypack.unpack(binarypack.pack(packet, compact=True), compact=True) == binarypack.unpack(binarypack.pack(packet))
+
+def test_compact_unpack_field_widths():
+    # a varint greater than the range of its field is rejected
+    chips = pokerpackets.networkpackets.PacketPokerPlayerChips(serial=2 ** 32 - 1)
+    data = binarypack.pack(chips, compact=True)
+    assert data[3:8] == b'\xff\xff\xff\xff\x0f'
+    data = data[:3] + b'\xff\xff\xff\xff\x1f' + data[8:]
+    data = data[:1] + struct.pack('!H', len(data) - 3) + data[3:]
+    try:
+        binarypack.unpack(data, compact=True)
+    except struct.error:
+        pass
+    else:
+        assert False, 'unpack should raise struct.error for a serial greater than 2 ** 32 - 1'
+
+def test_encoder_stream_decoder_compact():
+    chips = pokerpackets.networkpackets.PacketPokerPlayerChips(serial=1, game_id=2, bet=3, money=4)
+    _packets = [chips, packets.PacketCompact(), chips, packets.PacketLogin(name='name')]
+
+    encoder = binarypack.Encoder()
+    data = encoder.pack_many(_packets)
+    assert encoder.compact
+    assert data == binarypack.pack_many(_packets[:2]) + binarypack.pack_many(_packets[2:], compact=True)
+
+    decoder = binarypack.StreamDecoder(negotiate=True)
+    assert decoder.feed(data) == _packets
+    assert decoder.compact
+
+    # without negotiation the encoding does not change
+    decoder = binarypack.StreamDecoder()
+    assert decoder.feed(binarypack.pack(packets.PacketCompact()) + binarypack.pack(chips)) == [packets.PacketCompact(), chips]
+    assert not decoder.compact
+
+    # switch inside a frame split at every byte, with the frames filtered
+    decoder = binarypack.StreamDecoder(type_ids=set([chips.type]), negotiate=True)
+    decoded = []
+    for i in xrange(len(data)):
+        decoded.extend(decoder.feed(data[i]))
+    assert decoded == [chips, chips]
+    assert decoder.compact
+
+def test_compact_request():
+    # a request does not change the encoding
+    encoder = binarypack.Encoder()
+    data = encoder.pack(packets.PacketCompactRequest())
+    assert not encoder.compact
+    decoder = binarypack.StreamDecoder(negotiate=True)
+    assert decoder.feed(data) == [packets.PacketCompactRequest()]
+    assert not decoder.compact
+
 # private functions
 
 def test_pack_I():
@@ -74,7 +522,7 @@ def test_pack_bstring():
 
 def test_pack_j():
     buf = [] ; assert _binarypack.pack_j(None, buf) == 6 ; assert "".join(buf) == b"\x00\x04null"
-    buf = [] ; assert _binarypack.pack_j({'test': 1}, buf) == 13 ; assert "".join(buf) == b"\x00\x0B{\"test\": 1}"
+    buf = [] ; assert _binarypack.pack_j({'test': 1}, buf) == 12 ; assert "".join(buf) == b"\x00\x0A{\"test\":1}"
 
 def test_pack_Bl():
     buf = [] ; assert _binarypack.pack_Bl([], buf) == 1 ; assert "".join(buf) == b"\x00"
@@ -154,6 +602,8 @@ def test_unpack_string():
     assert _binarypack.unpack_string(b"\x00\x00", 0) == (2, '')
     assert _binarypack.unpack_string(b"\x00\x04test", 0) == (6, 'test')
     assert _binarypack.unpack_string(b"\xFF\xFF" + "#"*65535, 0) == (65537, '#'*65535)
+    assert _binarypack.unpack_string(memoryview(b"\x00\x04test"), 0) == (6, 'test')
+    assert _binarypack.unpack_string(_binarypack.as_buffer(bytearray(b"\x00\x04test")), 0) == (6, 'test')
 
 def test_unpack_bstring():
     assert _binarypack.unpack_bstring(b"\x00\x00", 0) == (2, '')
@@ -165,6 +615,7 @@ def test_unpack_bstring():
 def test_unpack_json():
     assert _binarypack.unpack_json(b"\x00\x04null", 0) == (6, None)
     assert _binarypack.unpack_json(b"\x00\x0B{\"test\": 1}", 0) == (13, {'test': 1})
+    assert _binarypack.unpack_json(b"\x00\x0A{\"test\":1}", 0) == (12, {'test': 1})
 
 def test_unpack_Bl():
     assert _binarypack.unpack_Bl(b"\x00", 0) == (1, [])
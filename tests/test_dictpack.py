@@ -20,6 +20,14 @@ def test_pack_unpack():
         yield check_pack_unpack, packet, True
         yield check_pack_unpack, packet, False
 
+def test_pack_slotted():
+    def check_pack_slotted(packet):
+        slotted_packet = packets.slotted(packet.__class__)(**packet.__dict__)
+        assert dictpack.pack(slotted_packet) == dictpack.pack(packet)
+
+    for packet in generate_test_packets():
+        yield check_pack_slotted, packet
+
 def test_unpack_errors():
     # test type not specified
     unpack_packet, unpack_numeric = dictpack.unpack({})
@@ -46,3 +54,52 @@ def test_pack_errors():
     unpack_packet, unpack_numeric = dictpack.unpack(packed)
     assert isinstance(unpack_packet, packets.PacketError), 'unpack should return PacketError'
     assert unpack_numeric == True, 'unpack should return numeric type False'
+
+def test_unpack_non_destructive():
+    import copy
+    from pokerpackets.networkpackets import PacketPokerUserInfo
+    for packet in (
+        packets.PacketList(packets=[packets.PacketLogin(name='name'), packets.PacketPing()]),
+        PacketPokerUserInfo(serial=1, money={1: (10, 11, 12)}),
+        packets.PacketError(message='error', code=5),
+    ):
+        for numeric_type in (True, False):
+            packed = dictpack.pack(packet, numeric_type)
+            original = copy.deepcopy(packed)
+            unpack_packet, _numeric = dictpack.unpack(packed)
+            assert packed == original
+            assert unpack_packet == packet
+            assert unpack_packet.__dict__ is not packed
+
+def test_pack_format():
+    from pokerpackets.networkpackets import PacketPokerUserInfo
+    packed = dictpack.pack(PacketPokerUserInfo(serial=1, money={1: (10, 11, 12), 'y': (1, 2, 3)}))
+    assert packed['money'] == {'X1': (10, 11, 12), 'y': (1, 2, 3)}
+    assert packed['type'] == PacketPokerUserInfo.type
+    assert dictpack.pack(PacketPokerUserInfo(), False)['type'] == 'PacketPokerUserInfo'
+
+    packed = dictpack.pack(packets.PacketList(packets=[packets.PacketPing()]), False)
+    assert packed == {'type': 'PacketList', 'packets': [{'type': 'PacketPing'}]}
+
+    # 'no net' attributes are packed too
+    from pokerpackets.networkpackets import PacketPokerTable
+    table = PacketPokerTable(player_seated=1)
+    assert dictpack.pack(table)['player_seated'] == 1
+    assert dictpack.unpack(dictpack.pack(table))[0] == table
+
+def test_pack_lazy():
+    from pokerpackets import binarypack
+    packet = packets.PacketLogin(name='name')
+    lazy = binarypack.unpack_lazy(binarypack.pack(packet))
+    assert dictpack.pack(lazy) == dictpack.pack(packet)
+    assert dictpack.pack(lazy, False) == dictpack.pack(packet, False)
+
+def test_pack_variants():
+    packet = packets.PacketLogin(name='name')
+    assert dictpack.pack(packet.replace().freeze()) == dictpack.pack(packet)
+    assert dictpack.pack(packets.PacketPing.singleton, False) == {'type': 'PacketPing'}
+
+def test_unpack_instantiate_error():
+    unpack_packet, unpack_numeric = dictpack.unpack({'type': 'PacketPokerUserInfo', 'money': {1: (1, 2, 3)}})
+    assert isinstance(unpack_packet, packets.PacketError)
+    assert unpack_numeric == False
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+from pokerpackets import binarypack, packets
+from pokerpackets.dispatch import Dispatcher, ancestry
+from pokerpackets.networkpackets import PacketPokerId, PacketPokerInt, PacketPokerBlind, PacketPokerBlindRequest, \
+    PacketPokerCall, PacketPokerTable
+
+def test_ancestry():
+    classes = ancestry()[PacketPokerBlindRequest.type]
+    assert classes[:5] == (PacketPokerBlindRequest, PacketPokerBlind, PacketPokerInt, PacketPokerId, packets.PacketSerial)
+    assert packets.Packet in classes
+    assert ancestry()[255] == ()
+
+def test_dispatch():
+    dispatcher = Dispatcher()
+    dispatcher.register(PacketPokerId, lambda packet, *args: ('id', args))
+    dispatcher.register(PacketPokerBlind, lambda packet, *args: ('blind', args))
+
+    assert dispatcher(PacketPokerBlindRequest()) == ('blind', ())
+    assert dispatcher.dispatch(PacketPokerInt(), 1, 2) == ('id', (1, 2))
+    assert dispatcher(PacketPokerCall()) == ('id', ())
+
+    dispatcher.unregister(PacketPokerBlind)
+    assert dispatcher(PacketPokerBlindRequest()) == ('id', ())
+
+    try:
+        dispatcher(PacketPokerTable())
+    except KeyError:
+        pass
+    else:
+        assert False, 'KeyError expected'
+
+def test_dispatch_default():
+    handled = []
+    dispatcher = Dispatcher(default=lambda packet: 'default')
+
+    @dispatcher.handler(packets.Packet)
+    def handle_packet(packet):
+        handled.append(packet)
+        return 'packet'
+
+    assert dispatcher(PacketPokerTable()) == 'packet'
+    dispatcher.unregister(packets.Packet)
+    assert dispatcher(PacketPokerTable()) == 'default'
+    assert dispatcher.lookup(PacketPokerTable.type)(None) == 'default'
+    assert len(handled) == 1
+
+def test_dispatch_variants():
+    dispatcher = Dispatcher()
+    dispatcher.register(PacketPokerBlind, lambda packet: packet.amount)
+    frame = binarypack.pack(PacketPokerBlindRequest(amount=5))
+    assert dispatcher(binarypack.unpack_lazy(frame)) == 5
+    assert dispatcher(packets.slotted(PacketPokerBlindRequest)(amount=6)) == 6
+    assert dispatcher(PacketPokerBlindRequest(amount=7).freeze()) == 7
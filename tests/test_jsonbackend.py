@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+from pokerpackets import jsonbackend, jsonpack, packets
+from pokerpackets.binarypack import _binarypack
+import pokerpackets.binarypack
+import pokerpackets.dictpack
+
+from test_binarypack import generate_codec_test_packets
+
+def restore():
+    jsonbackend.use(jsonbackend.default())
+
+def test_default():
+    assert jsonbackend.default() == 'simplejson'
+    assert jsonbackend.backend.names == {'encode': 'simplejson', 'dumps': 'simplejson', 'loads': 'simplejson'}
+
+def test_compact():
+    for name in jsonbackend.available():
+        jsonbackend.use(name)
+        try:
+            assert jsonbackend.backend.dumps({'a': [1, 2]}) == '{"a":[1,2]}'
+            assert jsonbackend.backend.dumps(u'\xe9') == '"\\u00e9"'
+            assert jsonbackend.backend.dumps('\xc3\xa9') == '"\\u00e9"'
+            assert jsonbackend.backend.loads('{"a": [1, 2]}') == {'a': [1, 2]}
+            for value in ({'name': u'\xe9'}, {'name': '\xc3\xa9t\xc3\xa9', 'password': u'\xe9t\xe9'}, '\xc3\xa9', [u'\xe9', '\xc3\xa9']):
+                encoded = packets.Packet.JSON.encode(value)
+                assert encoded.__class__ is str
+                assert packets.Packet.JSON.decode(encoded) == packets.Packet.JSON.decode(jsonbackend.backend.dumps(value))
+            if name not in jsonbackend.ASCII_TEXT_MODULES:
+                assert jsonbackend.backend.encode(u'\xe9') == u'"\xe9"'
+                assert packets.Packet.JSON.encode({'name': u'\xe9'}) == '{"name":"\xc3\xa9"}'
+                assert packets.Packet.JSON.encode({'name': '\xc3\xa9'}) == '{"name":"\xc3\xa9"}'
+        finally:
+            restore()
+
+def test_use():
+    if 'json' not in jsonbackend.available():
+        return
+    jsonbackend.use('json')
+    try:
+        assert jsonbackend.backend.names == {'encode': 'json', 'dumps': 'json', 'loads': 'json'}
+        assert packets.Packet.JSON.decode('"a"').__class__ is unicode
+        assert _binarypack.unpack_json(b'\x00\x03"a"', 0)[1].__class__ is unicode
+        login = pokerpackets.dictpack.pack(packets.PacketLogin(name='\xc3\xa9t\xc3\xa9'))
+        assert packets.Packet.JSON.decode(packets.Packet.JSON.encode(login))['name'] == u'\xe9t\xe9'
+        assert packets.Packet.JSON.decode(jsonpack.pack(packets.PacketLogin(name='\xc3\xa9t\xc3\xa9')))['name'] == u'\xe9t\xe9'
+    finally:
+        restore()
+    assert packets.Packet.JSON.decode('"a"').__class__ is str
+
+def test_encoder_decoder():
+    import simplejson
+    assert isinstance(packets.Packet.JSON.encoder, simplejson.JSONEncoder)
+    assert isinstance(packets.Packet.JSON.decoder, simplejson.JSONDecoder)
+    assert packets.Packet.JSON.encoder.encode({'a': 1}) == '{"a":1}'
+    if 'json' not in jsonbackend.available():
+        return
+    import json
+    jsonbackend.use('json')
+    try:
+        assert isinstance(packets.Packet.JSON.encoder, json.JSONEncoder)
+        assert packets.Packet.JSON.decoder.decode('"a"').__class__ is unicode
+    finally:
+        restore()
+    assert packets.Packet.JSON.decoder is jsonbackend.backend.decoder
+
+def test_use_unknown():
+    try:
+        jsonbackend.use('nojson')
+    except ImportError:
+        pass
+    else:
+        assert False, 'ImportError not raised'
+    assert jsonbackend.backend.names['encode'] == 'simplejson'
+
+def test_select():
+    try:
+        results = jsonbackend.select(number=2)
+        assert sorted(results) == ['dumps', 'encode', 'loads']
+        for function, (selected, timings) in results.iteritems():
+            assert selected in timings
+            assert jsonbackend.backend.names[function] == selected
+        # json decodes every string as unicode and escapes non ASCII
+        # characters of the text, unlike simplejson
+        assert 'json' not in results['loads'][1]
+        assert 'json' not in results['encode'][1]
+        assert packets.Packet.JSON.decode('"a"').__class__ is str
+    finally:
+        restore()
+
+def test_codecs():
+    def check_codecs(packet):
+        expected = (pokerpackets.binarypack.pack(packet), jsonpack.pack(packet), packets.Packet.JSON.encode(packet.__class__.__name__))
+        for name in jsonbackend.available():
+            jsonbackend.use(name)
+            try:
+                packed = pokerpackets.binarypack.pack(packet)
+                assert (packed, jsonpack.pack(packet), packets.Packet.JSON.encode(packet.__class__.__name__)) == expected
+                assert pokerpackets.binarypack.unpack(packed) == packet
+            finally:
+                restore()
+
+    for packet in generate_codec_test_packets():
+        yield check_codecs, packet
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+import simplejson
+
+from pokerpackets import dictpack, jsonpack, packets
+
+from test_binarypack import generate_codec_test_packets
+
+def test_pack():
+    def check_pack(packet, numeric_type):
+        packed = jsonpack.pack(packet, numeric_type)
+        assert packed.__class__ is str
+        assert simplejson.loads(packed) == simplejson.loads(packets.Packet.JSON.encode(dictpack.pack(packet, numeric_type)))
+
+    for packet in generate_codec_test_packets():
+        yield check_pack, packet, True
+        yield check_pack, packet, False
+
+def test_pack_format():
+    assert jsonpack.pack(packets.PacketPing()) == '{"type":%d}' % packets.PACKET_PING
+    assert jsonpack.pack(packets.PacketPing(), False) == '{"type":"PacketPing"}'
+    assert jsonpack.pack(packets.PacketError(message='error', code=5, other_type=10)) == \
+        '{"type":%d,"message":"error","code":5,"other_type":10}' % packets.PACKET_ERROR
+
+def test_pack_lazy():
+    from pokerpackets import binarypack
+    packet = packets.PacketLogin(name='name')
+    lazy = binarypack.unpack_lazy(binarypack.pack(packet))
+    assert jsonpack.pack(lazy) == jsonpack.pack(packet)
+    assert jsonpack.pack_list([lazy, packet], False) == jsonpack.pack_list([packet, packet], False)
+
+def test_pack_no_net():
+    from pokerpackets.networkpackets import PacketPokerTable
+    table = PacketPokerTable(player_seated=1)
+    assert simplejson.loads(jsonpack.pack(table)) == simplejson.loads(packets.Packet.JSON.encode(dictpack.pack(table)))
+    assert simplejson.loads(jsonpack.pack(table))['player_seated'] == 1
+
+def test_pack_strings():
+    for name in ('name', 'quote"back\\slash', 'new\nline', '\xc3\xa9t\xc3\xa9', u'\xe9t\xe9', u' ', '\x7f'):
+        packed = jsonpack.pack(packets.PacketLogin(name=name))
+        assert simplejson.loads(packed) == simplejson.loads(packets.Packet.JSON.encode(dictpack.pack(packets.PacketLogin(name=name))))
+        assert simplejson.loads(packed)['name'] == (name.decode('utf-8') if isinstance(name, str) else name)
+
+def test_pack_values():
+    packed = jsonpack.pack(packets.PacketLogin(name=None, bserial=5L))
+    assert simplejson.loads(packed)['name'] is None
+
+def test_pack_unknown():
+    class PacketUnknown(packets.Packet): pass
+    packet, _numeric_type = dictpack.unpack(simplejson.loads(jsonpack.pack(PacketUnknown())))
+    assert isinstance(packet, packets.PacketError)
+
+def test_pack_list():
+    packet_list = list(generate_codec_test_packets())
+    packed = jsonpack.pack_list(packet_list)
+    assert simplejson.loads(packed) == [simplejson.loads(jsonpack.pack(packet)) for packet in packet_list]
+    assert jsonpack.pack_list([]) == '[]'
+
+    buf = bytearray()
+    jsonpack.write_list(packet_list, buf.extend)
+    assert str(buf) == packed
+
+    parts = []
+    jsonpack.write_list([], parts.append)
+    assert ''.join(parts) == '[]'
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+from nose.plugins.skip import SkipTest
+
+try:
+    from pokerpackets import msgpackpack
+except ImportError:
+    raise SkipTest('msgpack is not installed')
+
+import simplejson
+
+from pokerpackets import binarypack, dictpack, packets
+import pokerpackets.networkpackets
+import pokerpackets.clientpackets
+
+from test_binarypack import generate_codec_test_packets
+
+def test_pack_unpack():
+    def check_pack_unpack(packet):
+        packed = msgpackpack.pack(packet)
+        unpacked = msgpackpack.unpack(packed)
+        assert isinstance(unpacked, packet.__class__)
+        assert unpacked == binarypack.unpack(binarypack.pack(packet))
+        assert msgpackpack.pack(unpacked) == packed
+
+    for packet in generate_codec_test_packets():
+        yield check_pack_unpack, packet
+
+def test_format():
+    packet = pokerpackets.networkpackets.PacketPokerPlayerChips(serial=1, game_id=2, bet=3, money=4)
+    assert msgpackpack.pack_array(packet) == [packet.type] + [getattr(packet, attr) for attr, _s_type in packet.msgpack_info]
+    assert msgpackpack.pack_array(packet)[1:] == [1, 2, 3, 4]
+
+    packet = packets.PacketList(packets=[packets.PacketPing()])
+    assert msgpackpack.pack_array(packet) == [packet.type, [[packets.PacketPing.type]]]
+
+    packet = pokerpackets.clientpackets.PacketPokerPotChips(game_id=1, index=2, bet=[1, 30, 5, 2])
+    assert msgpackpack.pack_array(packet) == [packet.type, 1, 2, 40]
+    assert msgpackpack.unpack(msgpackpack.pack(packet)).bet == [1, 40]
+
+    packet = pokerpackets.networkpackets.PacketPokerUserInfo(money={1: (10, 11, 12)})
+    assert msgpackpack.unpack(msgpackpack.pack(packet)).money == {1: (10, 11, 12)}
+
+def test_smaller_than_json():
+    for packet in generate_codec_test_packets():
+        assert len(msgpackpack.pack(packet)) < len(simplejson.dumps(dictpack.pack(packet))), packet
+
+def test_variants():
+    packet = packets.PacketLogin(name='name', password='password')
+    packed = msgpackpack.pack(packet)
+    assert msgpackpack.pack(packets.slotted(packets.PacketLogin)(name='name', password='password')) == packed
+    assert msgpackpack.pack(packet.replace().freeze()) == packed
+    assert msgpackpack.unpack(msgpackpack.pack(packets.PacketPing())) is packets.PacketPing.singleton
+
+def test_pack_lazy():
+    packet = pokerpackets.networkpackets.PacketPokerPlayerChips(serial=1, game_id=2, bet=3, money=4)
+    lazy_packet = binarypack.unpack_lazy(binarypack.pack(packet))
+    assert msgpackpack.pack(lazy_packet) == msgpackpack.pack(packet)
+    assert msgpackpack.pack(packets.PacketList(packets=[lazy_packet])) == msgpackpack.pack(packets.PacketList(packets=[packet]))
+    assert msgpackpack.pack_many([lazy_packet, packet]) == msgpackpack.pack_many([packet, packet])
+
+def test_unicode():
+    packet = packets.PacketLogin(name=u'\xe9t\xe9')
+    assert msgpackpack.unpack(msgpackpack.pack(packet)).name == '\xc3\xa9t\xc3\xa9'
+
+def test_json_field():
+    packet = pokerpackets.clientpackets.PacketPokerShowdown(showdown_stack=[{u'\xe9': u'\xe9', 'serial': 1}])
+    unpacked = msgpackpack.unpack(msgpackpack.pack(packet))
+    assert unpacked == packet
+    assert unpacked.showdown_stack == binarypack.unpack(binarypack.pack(packet)).showdown_stack
+    assert unpacked.showdown_stack[0][u'\xe9'].__class__ is unicode
+
+def test_unpack_invalid():
+    for array in ([packets.PacketLogin.type, 'name'], [packets.PacketPing.type, 1]):
+        try:
+            msgpackpack.unpack_array(array)
+        except ValueError:
+            pass
+        else:
+            assert False, 'ValueError expected'
+
+def test_pack_many_unpack_all():
+    packet_list = list(generate_codec_test_packets())
+    data = msgpackpack.pack_many(packet_list)
+    assert data == b''.join([msgpackpack.pack(packet) for packet in packet_list])
+    assert msgpackpack.unpack_all(data) == [msgpackpack.unpack(msgpackpack.pack(packet)) for packet in packet_list]
+    assert msgpackpack.unpack_all(bytearray(data)) == msgpackpack.unpack_all(data)
+
+def test_stream_decoder():
+    packet_list = list(generate_codec_test_packets())
+    data = msgpackpack.pack_many(packet_list)
+    decoder = msgpackpack.StreamDecoder()
+    decoded = []
+    for i in xrange(0, len(data), 7):
+        decoded.extend(decoder.feed(data[i:i + 7]))
+    assert decoded == msgpackpack.unpack_all(data)
+
+def test_stream_decoder_unknown_type():
+    decoder = msgpackpack.StreamDecoder()
+    data = msgpackpack.pack(packets.PacketLogin(name='a'))
+    try:
+        decoder.feed(msgpackpack.msgpack.packb([250, 1]) + data)
+    except KeyError, error:
+        assert error.packets == [packets.PacketLogin(name='a')]
+    else:
+        assert False, 'KeyError expected'
+    assert decoder.feed('') == []
+
+def test_stream_decoder_error_between_packets():
+    decoder = msgpackpack.StreamDecoder()
+    login = packets.PacketLogin(name='a')
+    serial = packets.PacketSerial(serial=5)
+    bad = msgpackpack.msgpack.packb([250, 1])
+    try:
+        decoder.feed(msgpackpack.pack(login) + bad + msgpackpack.pack(serial) + bad + msgpackpack.pack(login))
+    except KeyError, error:
+        # every complete packet after the bad ones is decoded by the same call
+        assert error.packets == [login, serial, login]
+    else:
+        assert False, 'KeyError expected'
+    assert decoder.feed('') == []
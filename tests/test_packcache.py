@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+from pokerpackets import binarypack, dictpack, packets
+from pokerpackets.packcache import PackCache
+from pokerpackets.networkpackets import PacketPokerTable, PacketPokerSeats
+
+def test_pack():
+    cache = PackCache(binarypack.pack)
+    packet = PacketPokerTable(id=1, name='table')
+    packed = cache.pack(packet)
+    assert packed == binarypack.pack(packet)
+    assert cache.pack(packet) is packed
+    assert cache(packet) is packed
+    assert cache.stats()['hits'] == 2
+    assert cache.stats()['misses'] == 1
+    assert cache.stats()['hit_rate'] == 2.0 / 3
+
+def test_pack_args():
+    cache = PackCache(dictpack.pack)
+    packet = PacketPokerTable(id=1)
+    assert cache.pack(packet, True) == dictpack.pack(packet, True)
+    assert cache.pack(packet, False) == dictpack.pack(packet, False)
+    assert cache.pack(packet, True)['type'] == packet.type
+    assert cache.stats()['misses'] == 2
+
+def test_invalidate_on_mutation():
+    cache = PackCache(binarypack.pack)
+    packet = PacketPokerTable(id=1, name='table')
+    cache.pack(packet)
+    packet.name = 'other'
+    assert cache.pack(packet) == binarypack.pack(PacketPokerTable(id=1, name='other'))
+    packet.reason = PacketPokerTable.REASON_TABLE_LIST
+    assert binarypack.unpack(cache.pack(packet)).reason == PacketPokerTable.REASON_TABLE_LIST
+    assert cache.stats()['hits'] == 0
+
+def test_invalidate():
+    cache = PackCache(binarypack.pack)
+    packet = PacketPokerSeats(seats=[0, 1])
+    cache.pack(packet)
+    packet.seats.append(2)
+    cache.invalidate(packet)
+    assert binarypack.unpack(cache.pack(packet)).seats == [0, 1, 2]
+
+    packet.seats.append(3)
+    cache.invalidate()
+    assert binarypack.unpack(cache.pack(packet)).seats == [0, 1, 2, 3]
+    assert cache.stats()['hits'] == 0
+
+def test_frozen():
+    cache = PackCache(binarypack.pack)
+    packet = packets.frozen(PacketPokerTable)(id=1)
+    assert cache.pack(packet) is cache.pack(packet)
+    assert cache.pack(packets.PacketPing.singleton) == binarypack.pack(packets.PacketPing())
+
+def test_lazy():
+    packet = PacketPokerTable(id=1, name='table')
+    lazy_packet = binarypack.unpack_lazy(binarypack.pack(packet))
+    for pack_function in (binarypack.pack, dictpack.pack):
+        cache = PackCache(pack_function)
+        packed = cache.pack(lazy_packet)
+        assert packed == pack_function(packet)
+        assert cache.pack(lazy_packet) is packed
+        # the state of the decoded packet is checked
+        lazy_packet.decode().name = 'other'
+        assert cache.stats()['hits'] == 1
+        cache.pack(lazy_packet)
+        assert cache.stats()['misses'] == 2
+        lazy_packet.decode().name = 'table'
+
+def test_evict():
+    cache = PackCache(binarypack.pack, size=2)
+    _packets = [PacketPokerTable(id=i) for i in xrange(3)]
+    for packet in _packets:
+        cache.pack(packet)
+    assert cache.stats()['entries'] == 2
+    assert cache.stats()['evictions'] == 1
+    cache.pack(_packets[2])
+    assert cache.stats()['hits'] == 1
+    cache.pack(_packets[0])
+    assert cache.stats()['misses'] == 4
+
+    # replaced entries do not grow the eviction order
+    packet = _packets[0]
+    for i in xrange(10):
+        packet.id = i
+        cache.pack(packet)
+    assert len(cache.order) <= 4
@@ -1,5 +1,9 @@
 # -*- coding: utf-8 -*-
 
+import copy as copy_module
+import cPickle
+import pickle
+
 from pokerpackets import packets
 from nose.tools import nottest
 
@@ -54,3 +58,289 @@ def test_infoDeclare():
     assert _dict['PacketNames'][-1] == 'Packet'
     assert _dict['PacketFactory'][-1] == packets.Packet
     assert _dict['PACKET_Packet'] == -1
+
+def test_slotted():
+    Slotted = packets.slotted(packets.PacketLogin)
+    assert packets.slotted(packets.PacketLogin) is Slotted
+    assert issubclass(Slotted, packets.PacketLogin)
+
+    packet = Slotted(name='name')
+    assert packet.name == 'name'
+    assert packet.password == 'unknown'
+    assert vars(packet) == {}, 'slotted packets should not use their instance dictionary'
+    assert packet.type == packets.PACKET_LOGIN
+    assert packets.type2type_id[Slotted] == packets.PACKET_LOGIN
+
+def test_slotted_pickle():
+    Slotted = packets.slotted(packets.PacketList)
+    packet = Slotted(packets=[packets.PacketPing(), packets.slotted(packets.PacketLogin)(name='name')])
+    packet.extra = 1
+    for module in (pickle, cPickle):
+        for protocol in xrange(pickle.HIGHEST_PROTOCOL + 1):
+            copy = module.loads(module.dumps(packet, protocol))
+            assert copy.__class__ is Slotted
+            assert copy == packet
+            assert copy.packets[1].__class__ is packets.slotted(packets.PacketLogin)
+            assert copy.extra == 1
+    copy = copy_module.copy(packet)
+    assert copy.__class__ is Slotted
+    assert copy.packets is packet.packets
+
+def test_slotted_mutable_defaults():
+    Slotted = packets.slotted(packets.PacketList)
+    a, b = Slotted(), Slotted()
+    a.packets.append(packets.PacketPing())
+    assert b.packets == []
+    assert packets.PacketList.packets == []
+
+def test_slotted_all():
+    for type_id, Packet in packets.PacketFactory.iteritems():
+        packet = packets.slotted(Packet)()
+        for attr, default, _s_type in Packet.info:
+            assert getattr(packet, attr) == default
+        str(packet)
+
+def test_make():
+    packet = packets.PacketError.make('message', 5)
+    assert packet == packets.PacketError(message='message', code=5)
+    assert packet.other_type == 3
+    assert packets.PacketError.make(code=5) == packets.PacketError(code=5)
+
+    a, b = packets.PacketList.make(), packets.PacketList.make()
+    a.packets.append(packets.PacketPing())
+    assert b.packets == []
+
+def test_make_all():
+    for type_id, Packet in packets.PacketFactory.iteritems():
+        values = [default for attr, default, s_type in Packet.info if s_type != 'no net']
+        assert Packet.make(*values) == Packet()
+        assert Packet.make() == Packet()
+
+        Slotted = packets.slotted(Packet)
+        packet = Slotted.make(*values)
+        assert isinstance(packet, Slotted)
+        assert vars(packet) == {}
+        for attr, default, _s_type in Packet.info:
+            assert getattr(packet, attr) == default
+
+def test_frozen():
+    Frozen = packets.frozen(packets.PacketLogin)
+    assert packets.frozen(packets.PacketLogin) is Frozen
+    assert issubclass(Frozen, packets.PacketLogin)
+
+    packet = Frozen(name='name')
+    assert packet.name == 'name'
+    assert packet == packets.PacketLogin(name='name')
+    assert packets.PacketLogin(name='name') == packet
+    assert packets.type2type_id[Frozen] == packets.PACKET_LOGIN
+    for action in (lambda: setattr(packet, 'name', 'test'), lambda: delattr(packet, 'name')):
+        try:
+            action()
+        except AttributeError:
+            pass
+        else:
+            assert False, 'frozen packets should not be modifiable'
+    assert packet.name == 'name'
+
+def test_frozen_pickle():
+    packet = packets.PacketList(packets=[packets.PacketPing(), packets.PacketLogin(name='name').freeze()]).freeze()
+    for module in (pickle, cPickle):
+        for protocol in xrange(pickle.HIGHEST_PROTOCOL + 1):
+            copy = module.loads(module.dumps(packet, protocol))
+            assert copy.__class__ is packets.frozen(packets.PacketList)
+            assert copy == packet
+            assert copy.packets[0].__class__ is packets.PacketPing
+            assert copy.packets[1].__class__ is packets.frozen(packets.PacketLogin)
+            assert hash(copy.packets[1]) == hash(packet.packets[1])
+    assert packets.PacketPing.singleton.__class__.__module__ == 'pokerpackets.frozenpackets'
+
+def test_frozen_pickle_import():
+    import subprocess, sys
+    from pokerpackets import networkpackets
+    data = pickle.dumps(networkpackets.PacketPokerTable(name='table').freeze(), pickle.HIGHEST_PROTOCOL)
+    # the module declaring the packet is imported by the unpickler
+    script = '''
+import pickle, sys
+data = sys.stdin.read()
+packet = pickle.loads(data)
+from pokerpackets import packets
+assert packet.__class__ is packets.frozen(packets.name2type['PacketPokerTable'])
+assert packet.name == 'table'
+'''
+    process = subprocess.Popen([sys.executable, '-c', script], stdin=subprocess.PIPE)
+    process.communicate(data)
+    assert process.returncode == 0
+
+def test_frozen_packets_module():
+    from pokerpackets import frozenpackets
+    assert frozenpackets.PacketLogin is packets.frozen(packets.PacketLogin)
+    assert not hasattr(frozenpackets, 'PacketUnknown')
+
+def test_singleton():
+    for type_id, Packet in packets.PacketFactory.iteritems():
+        if Packet.binarypack_info:
+            assert 'singleton' not in Packet.__dict__
+        else:
+            assert isinstance(Packet.singleton, packets.FrozenPacket)
+            assert Packet.singleton == Packet()
+
+def test_freeze():
+    packet = packets.PacketLogin(name='name')
+    assert packet.freeze() is packet
+    assert isinstance(packet, packets.FrozenPacket)
+    assert packet == packets.PacketLogin(name='name')
+    try:
+        packet.name = 'test'
+    except AttributeError:
+        pass
+    else:
+        assert False, 'frozen packets should not be modifiable'
+    assert packet.freeze() is packet
+
+    error = packets.PacketError(message='message').freeze()
+    assert isinstance(error, packets.PacketError)
+    assert error.message == 'message'
+
+def test_hash():
+    a = packets.PacketList(packets=[packets.PacketPing.singleton]).freeze()
+    b = packets.frozen(packets.PacketList)(packets=[packets.PacketPing.singleton])
+    assert hash(a) == hash(b)
+    assert len(set([a, b])) == 1
+    assert hash(packets.PacketLogin(name='a').freeze()) != hash(packets.PacketLogin(name='b').freeze())
+
+    from pokerpackets.clientpackets import PacketPokerPotChips
+    chips = PacketPokerPotChips(game_id=1, index=2, bet=[1, 30]).freeze()
+    assert hash(chips) == hash(packets.frozen(PacketPokerPotChips)(game_id=1, index=2, bet=[1, 30]))
+    assert hash(chips) != hash(PacketPokerPotChips(game_id=1, index=2, bet=[1, 31]).freeze())
+
+def test_replace():
+    packet = packets.PacketLogin(name='name', password='password')
+    copy = packet.replace(name='other')
+    assert copy.__class__ is packets.PacketLogin
+    assert copy == packets.PacketLogin(name='other', password='password')
+    assert packet.name == 'name'
+
+    frozen = packet.freeze().replace(password='secret')
+    assert isinstance(frozen, packets.FrozenPacket)
+    assert frozen == packets.PacketLogin(name='name', password='secret')
+
+    error = packets.PacketError(message='message', code=1).freeze().replace(code=2)
+    assert isinstance(error, packets.FrozenPacket)
+    assert error == packets.PacketError(message='message', code=2)
+
+    slotted = packets.slotted(packets.PacketLogin)(name='name').replace(password='secret')
+    assert slotted.__class__ is packets.slotted(packets.PacketLogin)
+    assert (slotted.name, slotted.password) == ('name', 'secret')
+
+def test_compiled_str():
+    for packet in generate_test_packets():
+        if packet.__class__.__name__ != 'PacketPokerTableTourneyBreakBegin': # formats resume_time
+            assert str(packet) == packets.Packet.__dict__['__str__'](packet)
+        assert repr(packet) == str(packet)
+    packet = packets.PacketLogin(name='name').freeze()
+    assert str(packet) == "PacketLogin(10) name: 'name' password: 'unknown'"
+
+def test_compiled_eq():
+    generic_eq = packets.Packet.__dict__['__eq__']
+    for packet in generate_test_packets():
+        other = packet.__class__(**packet.__dict__)
+        assert packet == other
+        assert generic_eq(packet, other)
+        assert packet.network_eq(other)
+        assert not packet == packets.PacketPing() or packet.__class__ is packets.PacketPing
+
+    a = packets.PacketLogin(name='a')
+    assert a == packets.PacketLogin(name='a')
+    assert a != packets.PacketLogin(name='b')
+    assert a != packets.PacketString(string='a')
+
+def test_network_eq():
+    from pokerpackets.networkpackets import PacketPokerPlayerArrive
+    a = PacketPokerPlayerArrive(serial=1, player_seated=1)
+    b = PacketPokerPlayerArrive(serial=1, player_seated=0)
+    assert a != b
+    assert a.network_eq(b)
+    assert not a.network_eq(PacketPokerPlayerArrive(serial=2, player_seated=1))
+
+def test_compiled_fallback():
+    class PacketSub(packets.PacketString):
+        info = packets.PacketString.info + (('other', 0, 'I'),)
+    assert PacketSub(other=1) != PacketSub(other=2)
+    assert PacketSub(other=1) == PacketSub(other=1)
+    assert str(PacketSub(other=1)).endswith('other: 1')
+
+def test_lazy_registry():
+    import subprocess, sys
+    script = '''
+import sys
+from pokerpackets import binarypack, dictpack, packets
+assert 'pokerpackets.networkpackets' not in sys.modules
+assert 'pokerpackets.clientpackets' not in sys.modules
+assert packets.name2type['PacketPokerSit'].__name__ == 'PacketPokerSit'
+assert 'pokerpackets.networkpackets' in sys.modules
+assert 'pokerpackets.clientpackets' not in sys.modules
+assert packets.PacketNames[171] == 'POKER_POT_CHIPS'
+assert 'pokerpackets.clientpackets' in sys.modules
+'''
+    assert subprocess.call([sys.executable, '-c', script]) == 0
+
+    # get, in and has_key import the module too
+    for lookup, module in (
+        ('packets.type_id2type.get(73).__name__ == "PacketPokerTable"', 'networkpackets'),
+        ('73 in packets.type_id2type', 'networkpackets'),
+        ('packets.name2type.get("PacketPokerTable").__name__ == "PacketPokerTable"', 'networkpackets'),
+        ('"PacketPokerTable" in packets.name2type', 'networkpackets'),
+        ('packets.PacketFactory.has_key(171)', 'clientpackets'),
+        ('packets.PacketNames.get(171) == "POKER_POT_CHIPS"', 'clientpackets'),
+    ):
+        script = '''
+import sys
+from pokerpackets import packets
+assert 'pokerpackets.%s' not in sys.modules
+assert %s
+assert 'pokerpackets.%s' in sys.modules
+''' % (module, lookup, module)
+        assert subprocess.call([sys.executable, '-c', script]) == 0, lookup
+
+def test_lazy_registry_missing():
+    for registry, key in ((packets.type_id2type, 255), (packets.name2type, 'PacketUnknown')):
+        assert registry.get(key) is None
+        assert registry.get(key, 1) == 1
+        assert key not in registry
+        assert not registry.has_key(key)
+        try:
+            registry[key]
+        except KeyError:
+            pass
+        else:
+            assert False, 'KeyError expected'
+
+def test_type_table():
+    import os
+    from pokerpackets import _packettable, packetexport
+    packets.load_all()
+    path = os.path.splitext(_packettable.__file__)[0] + '.py'
+    assert packetexport.exportTypeTable() == open(path).read(), 'run python -m pokerpackets.packetexport --type-table > %s' % path
+
+def test_snapshot():
+    from pokerpackets import packetexport
+    assert packetexport.checkSnapshot() == [], 'run python -m pokerpackets.packetexport --snapshot'
+
+def test_snapshot_functions():
+    import subprocess, sys
+    script = '''
+from pokerpackets import packets, _codegen
+packets.load_all()
+for packet_type in packets.PacketFactory.values():
+    packets.slotted(packet_type)
+    packets.frozen(packet_type)
+assert _codegen.compile_stats['compiled'] == 0, _codegen.compile_stats
+'''
+    assert subprocess.call([sys.executable, '-c', script]) == 0
+
+def test_snapshot_fallback():
+    from pokerpackets import _codegen
+    compiled = _codegen.compile_stats['compiled']
+    function = _codegen.compile_function('f', ['def f():', '    return X'], {'X': 1})
+    assert function() == 1
+    assert _codegen.compile_stats['compiled'] == compiled + 1
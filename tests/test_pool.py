@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+from pokerpackets import binarypack, packets, pool
+from pokerpackets.networkpackets import PacketPokerPlayerChips, PacketPokerCall
+
+def test_make_release():
+    pool.enable([PacketPokerPlayerChips], size=2)
+    try:
+        a = pool.make(PacketPokerPlayerChips, 1, 2, 3, 4)
+        assert a == PacketPokerPlayerChips(serial=1, game_id=2, bet=3, money=4)
+        pool.release(a)
+        b = pool.make(PacketPokerPlayerChips, 5, 6)
+        assert b is a
+        assert b == PacketPokerPlayerChips(serial=5, game_id=6)
+        assert pool.stats()['PacketPokerPlayerChips'] == {
+            'size': 2, 'free': 0, 'hits': 1, 'misses': 1, 'releases': 1, 'discards': 0,
+        }
+    finally:
+        pool.disable()
+
+def test_release_bounded():
+    pool.enable([PacketPokerCall], size=1)
+    try:
+        pool.release(PacketPokerCall())
+        pool.release(PacketPokerCall())
+        stats = pool.stats()['PacketPokerCall']
+        assert stats['free'] == 1
+        assert stats['releases'] == 1
+        assert stats['discards'] == 1
+    finally:
+        pool.disable()
+
+def test_release_wrong_type():
+    pool.enable([PacketPokerCall])
+    try:
+        pool.pools[PacketPokerCall].release(PacketPokerPlayerChips())
+    except ValueError:
+        pass
+    else:
+        assert False, 'release should raise ValueError for packets of other types'
+    finally:
+        pool.disable()
+
+def test_release_not_pooled():
+    # packets of types without a pool are left alone
+    pool.release(packets.PacketLogin())
+    assert pool.make(packets.PacketLogin, 'name') == packets.PacketLogin(name='name')
+
+def test_unpack():
+    packet = PacketPokerPlayerChips(serial=1, game_id=2, bet=3, money=4)
+    packed = binarypack.pack(packet)
+    pool.enable()
+    try:
+        a = binarypack.unpack(packed)
+        assert a == packet
+        pool.release(a)
+        b = binarypack.unpack(binarypack.pack(PacketPokerPlayerChips(serial=7)))
+        assert b is a
+        assert b == PacketPokerPlayerChips(serial=7)
+        assert binarypack.unpack_all(packed * 3) == [packet] * 3
+    finally:
+        pool.disable()
+    assert binarypack.unpack(packed) is not a
+
+def test_default_types():
+    for packet_type in pool.DEFAULT_TYPES:
+        assert packet_type.binarypack_info, packet_type
+        assert 'singleton' not in packet_type.__dict__, packet_type
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+import os
+import subprocess
+import sys
+
+from nose.plugins.skip import SkipTest
+
+from pokerpackets import _codegen, binarypack, packets, prefork
+from pokerpackets.binarypack import _binarypack
+
+WORKERS = 4
+
+# forks WORKERS workers which use every packet class and lists of every
+# length, prints their PSS and private memory (kB) once they are all done
+MEMORY_SCRIPT = '''
+import os, sys
+from pokerpackets import binarypack, packets, prefork
+if sys.argv[1] == 'loaded':
+    packets.load_all()
+elif sys.argv[1] == 'prepared':
+    prefork.prepare_for_fork()
+
+def memory():
+    sizes = {}
+    for line in open('/proc/self/smaps_rollup'):
+        fields = line.split()
+        if len(fields) == 3 and fields[2] == 'kB':
+            sizes[fields[0]] = int(fields[1])
+    return sizes['Pss:'], sizes['Private_Clean:'] + sizes['Private_Dirty:']
+
+ready_r, ready_w = os.pipe()
+go_r, go_w = os.pipe()
+pids = []
+for _i in xrange(%(workers)d):
+    pid = os.fork()
+    if pid == 0:
+        packets.load_all()
+        for packet_type in packets.PacketFactory.values():
+            binarypack.unpack(binarypack.pack(packet_type()))
+        from pokerpackets.networkpackets import PacketPokerSeats, PacketPokerUpdateMoney
+        for length in xrange(prefork.MAX_LIST_LENGTH + 1):
+            binarypack.unpack(binarypack.pack(PacketPokerSeats(seats=range(length))))
+            binarypack.unpack(binarypack.pack(PacketPokerUpdateMoney(serials=range(length), chips=range(length))))
+        os.write(ready_w, 'r')
+        os.read(go_r, 1)
+        os.write(ready_w, '%%8d%%8d' %% memory())
+        os._exit(0)
+    pids.append(pid)
+for _i in xrange(%(workers)d):
+    os.read(ready_r, 1)
+os.write(go_w, 'g' * %(workers)d)
+for _i in xrange(%(workers)d):
+    sizes = os.read(ready_r, 16)
+    print sizes[:8], sizes[8:]
+for pid in pids:
+    os.waitpid(pid, 0)
+''' % {'workers': WORKERS}
+
+def workers_memory(mode):
+    "return the mean PSS and private memory of the workers (kB)"
+    output = subprocess.check_output([sys.executable, '-c', MEMORY_SCRIPT, mode])
+    sizes = [map(int, line.split()) for line in output.splitlines()]
+    return tuple(sum(column) / WORKERS for column in zip(*sizes))
+
+def test_prepare_for_fork_memory():
+    if not hasattr(os, 'fork') or not os.path.exists('/proc/self/smaps_rollup'):
+        raise SkipTest('needs fork and /proc/self/smaps_rollup')
+    # both parents load every packet class, preparing also builds the
+    # list structs. PSS also depends on the pages shared between the
+    # workers and the parent, the private memory of the workers is what
+    # preparing saves
+    _loaded_pss, loaded_private = workers_memory('loaded')
+    _prepared_pss, prepared_private = workers_memory('prepared')
+    assert prepared_private < loaded_private
+
+def test_fill_struct_caches():
+    prefork.fill_struct_caches(20)
+    for cache in _codegen.LIST_STRUCTS.itervalues():
+        assert all(length in cache for length in xrange(21))
+    for cache in _binarypack.LIST_PACK_STRUCTS.itervalues():
+        assert all(length in cache for length in xrange(21))
+    assert _binarypack.LIST_PACK_STRUCTS['Hl'][20].format == '!B20H'
+    assert _codegen.LIST_STRUCTS['Hl'][20].format == '!20H'
+
+    from pokerpackets.networkpackets import PacketPokerSeats
+    packet = PacketPokerSeats(seats=range(20))
+    assert binarypack.unpack(binarypack.pack(packet)) == packet
+    buf = []
+    _binarypack.pack(packet, buf)
+    assert _binarypack.unpack(''.join(buf))[1] == packet